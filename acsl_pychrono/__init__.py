@@ -26,10 +26,30 @@ def get_cli_args():
     choices=["PID", "MRAC", "TwoLayerMRAC"],
     help="Instantiate controller from available type."
   )
+  parser.add_argument(
+    "--controller_kernel",
+    choices=["reference", "flat"],
+    help="Execution kernel of the MRAC controllers (\"flat\": preallocated views into the ODE state)."
+  )
+  parser.add_argument(
+    "--controller_integrator",
+    choices=["held_rk4", "euler", "rk4", "exact_filters"],
+    help="Integrator of the ODE of the controller (\"exact_filters\": exact discretization of the roll/pitch reference "
+    "differentiators only, no more accurate motor thrusts than \"euler\" for the MRAC controllers)."
+  )
 
   # Simulation options
   parser.add_argument("--simulation_duration", type=float, help="Total simulation duration in seconds.")
+  parser.add_argument(
+    "--plant_backend",
+    choices=["chrono", "numpy"],
+    help="Plant simulated: Chrono multibody system or NumPy rigid-body surrogate (\"numpy\")."
+  )
   parser.add_argument("--no_visualize", action="store_true", help="Disable real-time rendering of the simulation with Irrlicht.")
+  parser.add_argument(
+    "--logging_profile",
+    help="Logging profile (path relative to 'params/logging_profiles') selecting the logged channel groups and their rates."
+  )
 
   # Camera options
   parser.add_argument(
@@ -72,6 +92,11 @@ def get_cli_args():
     type=float,
     help="Time in seconds to hover after executing the trajectory before landing."
   )
+  parser.add_argument(
+    "--no_precompute_trajectory",
+    action="store_true",
+    help="Evaluate the piecewise polynomial trajectory at every control step instead of precomputing it."
+  )
 
   # Motor failure
   parser.add_argument("--apply_motor_failure", action="store_true", help="Trigger a motor failure event.")
@@ -86,6 +111,15 @@ def get_cli_args():
     metavar=("Fx", "Fy", "Fz"),
     help="Wind force vector components [N] in global coordinate system (e.g., --wind_force_vector 0.5 0.0 0.0)."
   )
+  parser.add_argument("--wind_model", choices=["constant", "dryden", "von_karman"], help="Turbulent wind model.")
+  parser.add_argument("--wind_seed", type=int, help="Seed of the turbulent wind.")
+  parser.add_argument(
+    "--wind_mean_velocity",
+    type=float,
+    nargs=3,
+    metavar=("Vx", "Vy", "Vz"),
+    help="Mean wind velocity components [m/s] in global coordinate system (e.g., --wind_mean_velocity 2.0 0.0 0.0)."
+  )
 
   # Environment options
   parser.add_argument("--include_environment", action='store_true', help="Include external environment in the simulation.")
@@ -112,6 +146,12 @@ def update_cfg_from_cli_args(sim_cfg: Cfg.SimulationConfig, cli_args):
     
   if cli_args.controller:
     sim_cfg.mission_config.controller_type = cli_args.controller
+
+  if cli_args.controller_kernel:
+    sim_cfg.mission_config.controller_kernel = cli_args.controller_kernel
+
+  if cli_args.controller_integrator:
+    sim_cfg.mission_config.controller_integrator = cli_args.controller_integrator
     
   # Payload options
   if cli_args.add_payload:
@@ -140,9 +180,15 @@ def update_cfg_from_cli_args(sim_cfg: Cfg.SimulationConfig, cli_args):
   if cli_args.simulation_duration is not None:
     sim_cfg.mission_config.simulation_duration_seconds = cli_args.simulation_duration
 
+  if cli_args.plant_backend:
+    sim_cfg.mission_config.plant_backend = cli_args.plant_backend
+
   if cli_args.no_visualize:
     sim_cfg.mission_config.visualization_flag = not cli_args.no_visualize
 
+  if cli_args.logging_profile:
+    sim_cfg.mission_config.logging_profile = cli_args.logging_profile
+
   # Camera settings
   if cli_args.camera_mode:
     sim_cfg.mission_config.camera_mode = cli_args.camera_mode
@@ -157,6 +203,9 @@ def update_cfg_from_cli_args(sim_cfg: Cfg.SimulationConfig, cli_args):
   if cli_args.hover_after_trajectory is not None:
     sim_cfg.mission_config.hover_after_trajectory_time_seconds = cli_args.hover_after_trajectory
 
+  if cli_args.no_precompute_trajectory:
+    sim_cfg.mission_config.precompute_trajectory = not cli_args.no_precompute_trajectory
+
   # Motor failure
   if cli_args.apply_motor_failure:
     sim_cfg.mission_config.apply_motor_failure = cli_args.apply_motor_failure
@@ -170,6 +219,15 @@ def update_cfg_from_cli_args(sim_cfg: Cfg.SimulationConfig, cli_args):
 
   if cli_args.wind_force_vector is not None:
     sim_cfg.mission_config.wind_force_vector = tuple(cli_args.wind_force_vector)
+
+  if cli_args.wind_model:
+    sim_cfg.mission_config.wind_model = cli_args.wind_model
+
+  if cli_args.wind_seed is not None:
+    sim_cfg.mission_config.wind_seed = cli_args.wind_seed
+
+  if cli_args.wind_mean_velocity is not None:
+    sim_cfg.mission_config.wind_mean_velocity = tuple(cli_args.wind_mean_velocity)
     
   # Environment inclusion
   if cli_args.include_environment:
@@ -1,5 +1,5 @@
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 @dataclass
 class MissionConfig:
@@ -18,7 +18,80 @@ class MissionConfig:
   # "fpv"
   camera_mode: str = "fixed"
   # Simulation timestep used by Chrono
-  timestep: float = 0.005 
+  timestep: float = 0.005
+
+  # Periods [s] of the subsystems run after the steps of the plant, integer multiples of 'timestep'
+  # (0: every step of the plant). E.g., with timestep 0.0005 (physics at 2 kHz): control_period 0.0025 (400 Hz),
+  # logging_period 0.01 (100 Hz), render_period 0.0335 (~30 Hz), console_period 0.5 (2 Hz).
+  # The motor thrusts are held between two control steps (zero-order hold)
+  control_period: float = 0.0
+  logging_period: float = 0.0
+  render_period: float = 0.0
+  console_period: float = 0.0
+
+  # Chrono system types (contact method):
+  # "NSC", # Non-smooth contacts (complementarity)
+  # "SMC", # Smooth (penalty) contacts: the floor and the payload get SMC contact materials,
+  #        # the CAD models of the vehicle and environment must be exported with SMC contact materials too
+  chrono_system: str = "NSC"
+  # Chrono solvers:
+  # "PSOR", # Projected SOR (same solver as 'demo_MBS_collisionNSC')
+  # "APGD", # Accelerated projected gradient descent
+  # "BB",   # Barzilai-Borwein (default solver set by the SolidWorks pychrono module)
+  chrono_solver: str = "PSOR"
+  # Threads of each simulation process used by Chrono, by the collision detection and by Eigen (0: Chrono defaults).
+  # In "wrapper" mode every worker uses them: 'wrapper_max_parallel' x 'chrono_num_threads' should not exceed the CPUs
+  chrono_num_threads: int = 0
+
+  # Propeller modes (UAVs with propeller CAD models):
+  # "dynamic",   # Propeller bodies spun by a motor link on the drone frame (bodies and constraints in the solver)
+  # "kinematic", # EXPERIMENTAL: propeller masses and inertias merged into the drone frame, no propeller bodies nor
+  #              # motor links: the propellers are only posed and spun on the drone frame when rendering. Not compared
+  #              # with "dynamic" yet (benchmarks/bench_propeller_mode.py)
+  propeller_mode: str = "dynamic"
+
+  # Iteration budget of the solver of the Chrono plant:
+  # "fixed",         # 'solver_max_iterations' at every step
+  # "contact_aware", # EXPERIMENTAL: 'solver_max_iterations' within 'solver_event_window_seconds' of a contact event
+  #                  # (takeoff, payload drops, motor failure, change of the number of contacts, residual above
+  #                  # 'solver_residual_tolerance'), 'solver_min_iterations' only when airborne with no contacts
+  #                  # and no payload aboard. Its deviation from "fixed" after the payload release is not measured
+  #                  # yet (benchmarks/bench_solver_policy.py): keep "fixed" for results to be compared
+  # The iterations used at every step are saved in the "solver" group of the MATLAB workspace
+  solver_policy: str = "fixed"
+  solver_max_iterations: int = 1000
+  solver_min_iterations: int = 50
+  solver_event_window_seconds: float = 0.2
+  solver_residual_tolerance: float = 1e-4
+
+  # Plant backends:
+  # "chrono", # Chrono multibody system (CAD model, contacts, payload, environment)
+  # "numpy",  # 6-DOF rigid-body surrogate of the vehicle integrated in NumPy (see 'RigidBodyPlant'),
+  #           # for early-stage gain screening: no contacts, payload, environment nor visualization
+  plant_backend: str = "chrono"
+
+  # Logging profile: channel groups to be logged and their logging rate (e.g., "monte_carlo.yaml").
+  # Path relative to 'current_working_directory/params/logging_profiles'.
+  # Leave blank to log every channel at every control step
+  logging_profile: str = ""
+
+  # Log sink:
+  # "memory" -> the whole log is kept in memory and saved as a MATLAB workspace at the end of the run
+  # "npz"    -> chunks of 'log_chunk_rows' rows are written during the run as '.npz' files
+  # "hdf5"   -> chunks of 'log_chunk_rows' rows are appended during the run to a '.h5' file (requires h5py)
+  # With "npz" and "hdf5", the log survives a crash or a kill of the run (up to the last flushed chunk)
+  log_sink: str = "memory"
+  log_chunk_rows: int = 2000
+  # Also save the MATLAB workspace at the end of the run with the "npz" and "hdf5" sinks
+  log_export_mat: bool = True
+
+  # Time each phase of the simulation step (plant step, COM and pixhawk state update, trajectory, controller,
+  # force application, logging, ...): summary table at the end of the run (also aggregated over the runs of
+  # a wrapper batch) and Chrome trace-event JSON next to the log (open in chrome://tracing or ui.perfetto.dev).
+  # No cost when False
+  profile_flag: bool = False
+  # Maximum number of timed calls written to the trace (the summary covers all of them). Set to 0 for no trace
+  profile_trace_max_events: int = 200000
 
   # Controller types:
   # "PID",
@@ -26,6 +99,29 @@ class MissionConfig:
   # "TwoLayerMRAC",
   controller_type: str = "TwoLayerMRAC"
 
+  # Controller execution kernels ("MRAC" and "TwoLayerMRAC" only):
+  # "reference", # np.matrix implementation
+  # "flat",      # Same algorithm on preallocated views into the flat ODE state (no per-step allocation)
+  controller_kernel: str = "reference"
+
+  # Integrators of the ODE of the controller (see 'acsl_pychrono.control.control.INTEGRATORS'):
+  # "held_rk4",      # RK4 with the derivative held over the step (same result as explicit Euler)
+  # "euler",         # Explicit Euler, slightly cheaper than "held_rk4" (same result)
+  # "rk4",           # Classic RK4, re-evaluating the control algorithm at each stage
+  # "exact_filters", # Exact discretization of the roll/pitch reference differentiators, explicit Euler for the others
+  #                  # (no more accurate motor thrusts than "euler" for the MRAC controllers)
+  controller_integrator: str = "held_rk4"
+
+  # Controller gains replacing those of the gains YAML file of the UAV, with the same nesting, e.g.
+  # {"KP_tran": {"scaling_factor": 1.2}, "use_projection_operator": False}.
+  # In a parameter sweep, each gain is addressed as "controller_gains.<gain>[.<key>]"
+  controller_gains_overrides: dict = field(default_factory=dict)
+
+  # Folder where the compiled controller gains (YAML parsed, Lyapunov equations solved, block matrices built)
+  # are cached across runs, keyed by a hash of their inputs. Path relative to 'current_working_directory'.
+  # Leave blank to only cache them in memory, within each process
+  gains_cache_dir: str = "cache/gains"
+
   # User-defined trajectory types:
   # "circular_trajectory",
   # "hover_trajectory",
@@ -42,6 +138,10 @@ class MissionConfig:
   # the vehicle is hovering before starting the landing phase
   hover_after_trajectory_time_seconds: float = 5.0
 
+  # If the trajectory_type is "piecewise_polynomial_trajectory", evaluate the whole reference once at the start
+  # of the run (batched over all the control steps) instead of at every control step
+  precompute_trajectory: bool = True
+
   # Flag to add or remove the payload from the simulation
   add_payload_flag: bool = True
   # Payload types: 
@@ -68,12 +168,58 @@ class MissionConfig:
   apply_wind_force: bool = False
   wind_force_vector: tuple[float, float, float] = (0.5, 0.0, 0.0) # [N] in global pychrono coordinate system
 
+  # Wind models (wind velocity entering the aerodynamic drag, computed from the velocity relative to the wind):
+  # "constant",   # Still air: only the constant wind forces of 'apply_wind_force' and of the "wind" mission events
+  # "dryden",     # Mean wind plus a turbulence with the Dryden spectra (MIL-HDBK-1797)
+  # "von_karman", # Mean wind plus a turbulence with the von Karman spectra (MIL-HDBK-1797)
+  # The turbulence is generated once at the start of the mission, seeded by 'wind_seed', into a table of
+  # 'wind_table_timestep' samples, then interpolated at every step (see 'TurbulentWindField')
+  wind_model: str = "constant"
+  wind_seed: int = 0
+  wind_mean_velocity: tuple[float, float, float] = (2.0, 0.0, 0.0) # [m/s] in global pychrono coordinate system
+  # RMS [m/s] and length scales [m] of the longitudinal (along the mean wind), lateral and vertical turbulence
+  wind_turbulence_intensity: tuple[float, float, float] = (1.0, 1.0, 0.5)
+  wind_turbulence_length_scale: tuple[float, float, float] = (65.0, 65.0, 10.0)
+  wind_table_timestep: float = 0.01
+  # Frozen turbulence carried by the mean wind: the wind also varies with the position along the mean wind
+  wind_spatial_variation: bool = False
+
+  # Additional timed events of the mission, each one fired once at the first step at or after its "time" [s]
+  # (e.g., several motor failures, staged payload drops, wind steps). Event types:
+  # {"type": "drop_balls", "time": 3.0, "balls": [0, 1], "disable_duration": 0.15} # Balls of the payload (indices) dropped
+  #                                                                                  # ("balls" omitted: all of them)
+  # {"type": "motor_failure", "time": 4.5, "motor": 2, "efficiency": 0.5}          # Efficiency of a motor
+  #                                                                                  # ("motor" omitted: the failure of the UAV params)
+  # {"type": "wind", "time": 5.0, "force": (0.5, 0.0, 0.0)}                        # Constant wind force [N] from then on,
+  #                                                                                  # in global pychrono coordinate system
+  # The payload dropping, motor failure and wind parameters above are scheduled as such events too
+  mission_events: list = field(default_factory=list)
+
   # Unique wrapper batch folder passed to the function used for running many parallel wrapper simulations 
   wrapper_batch_dir: str = "" # LEAVE BLANK!!!
 
+  # Content-hashed ID of the run within the wrapper batch, set by the wrapper
+  wrapper_run_id: str = "" # LEAVE BLANK!!!
+
   # Number of parallel simulations (one per CPU) to be run in "wrapper" mode
   wrapper_max_parallel: int = 20
 
+  # In "wrapper" mode, every run adds a row of summary metrics to the 'results.sqlite' table of the batch.
+  # Set to True to also save the full log of every run (MATLAB workspace and/or 'log_sink' files)
+  wrapper_save_full_logs: bool = False
+
+  # Parameter sweep run in "wrapper" mode (grid, Latin hypercube or random sampling of any config field)
+  # Path relative to 'current_working_directory/params/sweeps'
+  wrapper_sweep_file: str = "ball_density_sweep.yaml"
+
+  # Folder of an interrupted wrapper batch to be resumed (e.g., "logs/wrapper/2025/06/ws_20250612_101500").
+  # The runs recorded as done in its manifest are skipped. Leave blank to start a new batch
+  wrapper_resume_batch_dir: str = ""
+
+  # Reuse, within each wrapper worker, the Chrono system built for a previous run with the same vehicle,
+  # environment and payload: the CAD import, meshes and collision shapes are built once, then only reset
+  reuse_simulation_template: bool = True
+
   def __post_init__(self):
     if self.wrapper_flag and self.visualization_flag:
       warnings.warn("Visualization is disabled because wrapper mode is enabled.")
@@ -103,8 +249,8 @@ class WrapperParams: # Add here the params to be sweeped by the wrapper with the
 
 @dataclass
 class SimulationConfig:
-  mission_config: MissionConfig = MissionConfig()
-  vehicle_config: VehicleConfig = VehicleConfig()
-  environment_config: EnvironmentConfig = EnvironmentConfig()
-  wrapper_params: WrapperParams = WrapperParams()
+  mission_config: MissionConfig = field(default_factory=MissionConfig)
+  vehicle_config: VehicleConfig = field(default_factory=VehicleConfig)
+  environment_config: EnvironmentConfig = field(default_factory=EnvironmentConfig)
+  wrapper_params: WrapperParams = field(default_factory=WrapperParams)
   
@@ -1,5 +1,7 @@
 # acsl_pychrono/control/MRAC/__init__.py
 
 from .mrac import MRAC
+from .mrac_flat import MRACFlat
+from .mrac_batch import MRACBatch
 from .mrac_gains import MRACGains
 from .mrac_logger import MRACLogger
\ No newline at end of file
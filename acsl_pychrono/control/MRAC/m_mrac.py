@@ -1,7 +1,11 @@
-import math
 import numpy as np  
+from acsl_pychrono.control.control import Control
 
 class M_MRAC:
+  """
+  Equations of the MRAC laws. They are array-generic (see 'Control'): the gains, vectors and matrices
+  may have a leading batch dimension N, with the scalar parameters of shape (N,).
+  """
   @staticmethod
   def computeControlLaw(
     K_hat_x: np.ndarray,
@@ -15,9 +19,9 @@ class M_MRAC:
     Compute the classical MRAC control law.
     """
     control_input = (
-      K_hat_x.T * x
-      + K_hat_r.T * r
-      - Theta_hat.T * Phi
+      Control.transpose(K_hat_x) @ x
+      + Control.transpose(K_hat_r) @ r
+      - Control.transpose(Theta_hat) @ Phi
     )
 
     return control_input
@@ -31,11 +35,11 @@ class M_MRAC:
     """
     Compute the classical MRAC adaptive law.
     """
-    K_hat_state_dot = Gamma_gain * pi_vector * eTranspose_P_B
+    K_hat_state_dot = Gamma_gain @ pi_vector @ eTranspose_P_B
     return K_hat_state_dot
 
   @staticmethod
-  def compute_eTransposePB(e: np.ndarray, P: np.ndarray, B: np.ndarray) -> tuple[np.ndarray, float]:
+  def compute_eTransposePB(e: np.ndarray, P: np.ndarray, B: np.ndarray) -> tuple[np.ndarray, float | np.ndarray]:
     """
     Compute eᵀ * P * B and its norm.
 
@@ -47,10 +51,10 @@ class M_MRAC:
     Returns:
       tuple:
         - eTranspose_P_B (np.ndarray): The product eᵀ * P * B (1 x m vector if B has m columns).
-        - eTranspose_P_B_norm (float): The Euclidean norm (2-norm) of eᵀ * P * B.
+        - eTranspose_P_B_norm (float, or (N,) for N errors): The Euclidean norm (2-norm) of eᵀ * P * B.
     """
-    eTranspose_P_B = e.T * P * B
-    eTranspose_P_B_norm = float(np.linalg.norm(eTranspose_P_B))
+    eTranspose_P_B = Control.transpose(e) @ P @ B
+    eTranspose_P_B_norm = Control.matrixNorm(eTranspose_P_B)
     return eTranspose_P_B, eTranspose_P_B_norm
 
   @staticmethod
@@ -77,7 +81,7 @@ class M_MRAC:
     return (K_hat_x_dot, K_hat_r_dot, Theta_hat_dot)
   
   @staticmethod
-  def deadZoneModulationFunction(e_vector: np.ndarray, delta: float, e_0: float, use_deadzone: bool) -> float:
+  def deadZoneModulationFunction(e_vector: np.ndarray, delta, e_0, use_deadzone: bool) -> float | np.ndarray:
     """
     Smooth dead-zone modulation function for MRAC.
 
@@ -91,14 +95,14 @@ class M_MRAC:
       - use_deadzone (bool): If False, the function returns 1.0 (i.e., no dead-zone effect).
 
     Returns:
-      float: Modulation coefficient between 0.0 and 1.0.
+      float: Modulation coefficient between 0.0 and 1.0 (one per error vector for N error vectors).
     """
     if not use_deadzone:
       return 1.0
 
-    norm_e = np.linalg.norm(e_vector)
+    norm_e = Control.matrixNorm(e_vector)
     coeff = (norm_e - delta * e_0) / ((1.0 - delta) * e_0)
-    result = float(max(0.0, min(1.0, coeff)))
+    result = np.clip(coeff, 0.0, 1.0)
     return result
   
   @staticmethod
@@ -117,15 +121,15 @@ class M_MRAC:
     Compute the MRAC adaptive law with OPTIONAL dead-zone modification and e-modification capabilities.
     """
     modulation_factor = dead_zone_value if use_deadzone else 1.0
-    classic_term = pi_vector * eTranspose_P_B
+    classic_term = pi_vector @ eTranspose_P_B
 
     if use_emodification:
-      emod_term = sigma_gain * eTranspose_P_B_norm * K_hat_state
+      emod_term = Control.column(sigma_gain * eTranspose_P_B_norm) * K_hat_state
       update_term = classic_term - emod_term
     else:
       update_term = classic_term
 
-    K_hat_state_dot = Gamma_gain * modulation_factor * update_term
+    K_hat_state_dot = (Gamma_gain * Control.column(modulation_factor)) @ update_term
     return K_hat_state_dot
   
   @staticmethod
@@ -0,0 +1,7 @@
+from acsl_pychrono.control.batch_control import BatchControl
+from acsl_pychrono.control.MRAC.mrac import MRAC
+
+class MRACBatch(BatchControl, MRAC):
+  """
+  Batched form of 'MRAC': N instances, one per gain set of 'gains_list', advanced by the same NumPy calls.
+  """
@@ -0,0 +1,9 @@
+from acsl_pychrono.control.base_flat_mrac import BaseFlatMRAC
+from acsl_pychrono.control.MRAC.mrac import MRAC
+
+class MRACFlat(BaseFlatMRAC, MRAC):
+  """
+  'MRAC' on preallocated ndarray views into one state vector and one derivative vector (see 'BaseFlatMRAC').
+  Selected by 'controller_kernel = "flat"'.
+  """
+  two_layer = False
@@ -1,347 +1,403 @@
 import numpy as np  
 from acsl_pychrono.control.MRAC.mrac_gains import MRACGains
 from acsl_pychrono.control.MRAC.mrac import MRAC
+from acsl_pychrono.control.log_buffer import LogBuffer
+from acsl_pychrono.control.base_logger import BaseLogger
+from acsl_pychrono.control.logging_profile import LoggingProfile
+from acsl_pychrono.control.log_sinks import BaseLogSink
 
-class MRACLogger:
-  def __init__(self, gains: MRACGains) -> None:
+class MRACLogger(BaseLogger):
+  # Column layout of a logged row: scalars are column indices, vectors and matrices are slices
+  COLUMNS = {
+    "time_now": 0,
+    "simulation_time": 1,
+    "position": slice(2, 5),
+    "velocity": slice(5, 8),
+    "roll": 8,
+    "pitch": 9,
+    "yaw": 10,
+    "angular_velocity": slice(11, 14),
+    "x_ref_tran": slice(14, 20),
+    "roll_ref": 20,
+    "pitch_ref": 21,
+    "yaw_ref": 22,
+    "angular_position_ref_dot": slice(23, 26),
+    "angular_position_ref_ddot": slice(26, 29),
+    "omega_ref": slice(29, 32),
+    "user_defined_position": slice(32, 35),
+    "user_defined_velocity": slice(35, 38),
+    "user_defined_acceleration": slice(38, 41),
+    "mu_x": 41,
+    "mu_y": 42,
+    "mu_z": 43,
+    "u1": 44,
+    "u2": 45,
+    "u3": 46,
+    "u4": 47,
+    "motor_thrusts": slice(48, 56),
+    # Columns 56:59 are unused and stay zero
+    "mu_adaptive_tran": slice(59, 62),
+    "mu_PD_baseline_tran": slice(62, 65),
+    "Moment_baseline": slice(65, 68),
+    "Moment_adaptive": slice(68, 71),
+    "Moment_baseline_PI": slice(71, 74),
+    "angular_position_dot": slice(74, 77),
+    "omega_cmd": slice(77, 80),
+    "omega_cmd_dot": slice(80, 83),
+    "omega_ref_dot": slice(83, 86),
+    "r_tran": slice(86, 89),
+    "r_rot": slice(89, 92),
+    "proj_op_activated_K_hat_x_tran": 92,
+    "proj_op_activated_K_hat_r_tran": 93,
+    "proj_op_activated_Theta_hat_tran": 94,
+    "proj_op_activated_K_hat_x_rot": 95,
+    "proj_op_activated_K_hat_r_rot": 96,
+    "proj_op_activated_Theta_hat_rot": 97,
+    "K_hat_x_tran": slice(98, 116),
+    "K_hat_r_tran": slice(116, 125),
+    "Theta_hat_tran": slice(125, 143),
+    "K_hat_x_rot": slice(143, 152),
+    "K_hat_r_rot": slice(152, 161),
+    "Theta_hat_rot": slice(161, 179),
+    "dead_zone_value_tran": 179,
+    "dead_zone_value_rot": 180,
+  }
+
+  def __init__(
+    self,
+    gains: MRACGains,
+    timestep: float,
+    expected_rows: int = 0,
+    logging_profile: LoggingProfile | None = None,
+    log_sink: BaseLogSink | None = None
+  ) -> None:
     self.gains = gains
-    self.data_list = []
     # Length of the array vector that will be exported 
-    self.size_DATA = 181
+    super().__init__(181, timestep, expected_rows, logging_profile, log_sink)
 
   def collectData(self, controller: MRAC, simulation_time: float, number_of_propellers: int):
-    DATA_vector = np.zeros((self.size_DATA, 1))
-    
-    # Pad the motor thrusts with zeros if fewer than 8 propellers
-    if number_of_propellers < 8:
-      motor_thrusts = controller.motor_thrusts.reshape(number_of_propellers, 1)
-      motor_thrusts = motor_thrusts.flatten() # Flatten to 1D
-      motor_thrusts = np.pad(motor_thrusts, (0, 8 - number_of_propellers), 'constant')
-    else:
-      motor_thrusts = controller.motor_thrusts
-
+    C = MRACLogger.COLUMNS
+    row = self.nextRow()
+    if row is None:
+      return
+    # (size_DATA x 1) view of the row, so that column vectors are written as they are
+    DATA_vector = row[:, np.newaxis]
 
-    DATA_vector[0] = controller.odein.time_now
-    DATA_vector[1] = simulation_time
-    DATA_vector[2:5] = controller.odein.translational_position_in_I
-    DATA_vector[5:8] = controller.odein.translational_velocity_in_I
-    DATA_vector[8] = controller.odein.roll
-    DATA_vector[9] = controller.odein.pitch
-    DATA_vector[10] = controller.odein.yaw
-    DATA_vector[11:14] = controller.odein.angular_velocity
-    DATA_vector[14:20] = controller.x_ref_tran 
-    DATA_vector[20] = controller.roll_ref
-    DATA_vector[21] = controller.pitch_ref
-    DATA_vector[22] = controller.odein.yaw_ref
-    DATA_vector[23] = controller.angular_position_ref_dot[0]
-    DATA_vector[24] = controller.angular_position_ref_dot[1]
-    DATA_vector[25] = controller.angular_position_ref_dot[2]
-    DATA_vector[26] = controller.angular_position_ref_ddot[0]
-    DATA_vector[27] = controller.angular_position_ref_ddot[1]
-    DATA_vector[28] = controller.angular_position_ref_ddot[2]
-    DATA_vector[29:32] = controller.omega_ref
-    DATA_vector[32:35] = controller.odein.translational_position_in_I_user
-    DATA_vector[35:38] = controller.odein.translational_velocity_in_I_user
-    DATA_vector[38:41] = controller.odein.translational_acceleration_in_I_user
-    DATA_vector[41] = controller.mu_x
-    DATA_vector[42] = controller.mu_y
-    DATA_vector[43] = controller.mu_z
-    DATA_vector[44] = controller.u1
-    DATA_vector[45] = controller.u2
-    DATA_vector[46] = controller.u3
-    DATA_vector[47] = controller.u4
-    DATA_vector[48:56] = motor_thrusts.reshape(8,1)
-    DATA_vector[56:59] = np.zeros((3, 1))
-    DATA_vector[59:62] = controller.mu_adaptive_tran
-    DATA_vector[62:65] = controller.mu_PD_baseline_tran
-    DATA_vector[65:68] = controller.Moment_baseline
-    DATA_vector[68:71] = controller.Moment_adaptive
-    DATA_vector[71:74] = controller.Moment_baseline_PI
-    DATA_vector[74:77] = controller.angular_position_dot
-    DATA_vector[77:80] = controller.omega_cmd
-    DATA_vector[80:83] = controller.omega_cmd_dot
-    DATA_vector[83:86] = controller.omega_ref_dot
-    DATA_vector[86:89] = controller.r_tran
-    DATA_vector[89:92] = controller.r_rot
+    DATA_vector[C["time_now"]] = controller.odein.time_now
+    DATA_vector[C["simulation_time"]] = simulation_time
+    DATA_vector[C["position"]] = controller.odein.translational_position_in_I
+    DATA_vector[C["velocity"]] = controller.odein.translational_velocity_in_I
+    DATA_vector[C["roll"]] = controller.odein.roll
+    DATA_vector[C["pitch"]] = controller.odein.pitch
+    DATA_vector[C["yaw"]] = controller.odein.yaw
+    DATA_vector[C["angular_velocity"]] = controller.odein.angular_velocity
+    DATA_vector[C["x_ref_tran"]] = controller.x_ref_tran 
+    DATA_vector[C["roll_ref"]] = controller.roll_ref
+    DATA_vector[C["pitch_ref"]] = controller.pitch_ref
+    DATA_vector[C["yaw_ref"]] = controller.odein.yaw_ref
+    DATA_vector[C["angular_position_ref_dot"]] = controller.angular_position_ref_dot
+    DATA_vector[C["angular_position_ref_ddot"]] = controller.angular_position_ref_ddot
+    DATA_vector[C["omega_ref"]] = controller.omega_ref
+    DATA_vector[C["user_defined_position"]] = controller.odein.translational_position_in_I_user
+    DATA_vector[C["user_defined_velocity"]] = controller.odein.translational_velocity_in_I_user
+    DATA_vector[C["user_defined_acceleration"]] = controller.odein.translational_acceleration_in_I_user
+    DATA_vector[C["mu_x"]] = controller.mu_x
+    DATA_vector[C["mu_y"]] = controller.mu_y
+    DATA_vector[C["mu_z"]] = controller.mu_z
+    DATA_vector[C["u1"]] = controller.u1
+    DATA_vector[C["u2"]] = controller.u2
+    DATA_vector[C["u3"]] = controller.u3
+    DATA_vector[C["u4"]] = controller.u4
+    # The thrusts of missing propellers (fewer than 8) stay zero
+    DATA_vector[C["motor_thrusts"].start:C["motor_thrusts"].start + number_of_propellers] = controller.motor_thrusts
+    DATA_vector[C["mu_adaptive_tran"]] = controller.mu_adaptive_tran
+    DATA_vector[C["mu_PD_baseline_tran"]] = controller.mu_PD_baseline_tran
+    DATA_vector[C["Moment_baseline"]] = controller.Moment_baseline
+    DATA_vector[C["Moment_adaptive"]] = controller.Moment_adaptive
+    DATA_vector[C["Moment_baseline_PI"]] = controller.Moment_baseline_PI
+    DATA_vector[C["angular_position_dot"]] = controller.angular_position_dot
+    DATA_vector[C["omega_cmd"]] = controller.omega_cmd
+    DATA_vector[C["omega_cmd_dot"]] = controller.omega_cmd_dot
+    DATA_vector[C["omega_ref_dot"]] = controller.omega_ref_dot
+    DATA_vector[C["r_tran"]] = controller.r_tran
+    DATA_vector[C["r_rot"]] = controller.r_rot
 
+    # Projection operator flags stay zero (False) if the projection operator is not used
     if self.gains.use_projection_operator:
-      DATA_vector[92] = controller.proj_op_activated_K_hat_x_tran
-      DATA_vector[93] = controller.proj_op_activated_K_hat_r_tran
-      DATA_vector[94] = controller.proj_op_activated_Theta_hat_tran
-      DATA_vector[95] = controller.proj_op_activated_K_hat_x_rot
-      DATA_vector[96] = controller.proj_op_activated_K_hat_r_rot
-      DATA_vector[97] = controller.proj_op_activated_Theta_hat_rot
-    else:
-      DATA_vector[92:98] = False
+      DATA_vector[C["proj_op_activated_K_hat_x_tran"]] = controller.proj_op_activated_K_hat_x_tran
+      DATA_vector[C["proj_op_activated_K_hat_r_tran"]] = controller.proj_op_activated_K_hat_r_tran
+      DATA_vector[C["proj_op_activated_Theta_hat_tran"]] = controller.proj_op_activated_Theta_hat_tran
+      DATA_vector[C["proj_op_activated_K_hat_x_rot"]] = controller.proj_op_activated_K_hat_x_rot
+      DATA_vector[C["proj_op_activated_K_hat_r_rot"]] = controller.proj_op_activated_K_hat_r_rot
+      DATA_vector[C["proj_op_activated_Theta_hat_rot"]] = controller.proj_op_activated_Theta_hat_rot
 
-    DATA_vector[98:116] = controller.K_hat_x_tran.flatten(order='F').reshape(-1, 1)
-    DATA_vector[116:125] = controller.K_hat_r_tran.flatten(order='F').reshape(-1, 1)
-    DATA_vector[125:143] = controller.Theta_hat_tran.flatten(order='F').reshape(-1, 1)
+    # Adaptive gains are written in column-major order directly into the row
+    LogBuffer.writeColumnMajor(row[C["K_hat_x_tran"]], controller.K_hat_x_tran)
+    LogBuffer.writeColumnMajor(row[C["K_hat_r_tran"]], controller.K_hat_r_tran)
+    LogBuffer.writeColumnMajor(row[C["Theta_hat_tran"]], controller.Theta_hat_tran)
 
-    DATA_vector[143:152] = controller.K_hat_x_rot.flatten(order='F').reshape(-1, 1)
-    DATA_vector[152:161] = controller.K_hat_r_rot.flatten(order='F').reshape(-1, 1)
-    DATA_vector[161:179] = controller.Theta_hat_rot.flatten(order='F').reshape(-1, 1)
+    LogBuffer.writeColumnMajor(row[C["K_hat_x_rot"]], controller.K_hat_x_rot)
+    LogBuffer.writeColumnMajor(row[C["K_hat_r_rot"]], controller.K_hat_r_rot)
+    LogBuffer.writeColumnMajor(row[C["Theta_hat_rot"]], controller.Theta_hat_rot)
 
-    DATA_vector[179] = controller.dead_zone_value_tran
-    DATA_vector[180] = controller.dead_zone_value_rot
-    
-    self.data_list.append(DATA_vector.flatten())
+    DATA_vector[C["dead_zone_value_tran"]] = controller.dead_zone_value_tran
+    DATA_vector[C["dead_zone_value_rot"]] = controller.dead_zone_value_rot
 
-  def toDictionary(self):
-    DATA_np = np.array(self.data_list)
+    self.storeRow(row)
 
+  def buildDictionary(self, column) -> dict:
     log_dict = {
-      "time": DATA_np[:, 0].reshape(-1, 1),
+      "time": column(0),
       "position": {
-        "x": DATA_np[:, 2].reshape(-1, 1),
-        "y": DATA_np[:, 3].reshape(-1, 1),
-        "z": DATA_np[:, 4].reshape(-1, 1),
+        "x": column(2),
+        "y": column(3),
+        "z": column(4),
       },
       "velocity": {
-        "x": DATA_np[:, 5].reshape(-1, 1),
-        "y": DATA_np[:, 6].reshape(-1, 1),
-        "z": DATA_np[:, 7].reshape(-1, 1),
+        "x": column(5),
+        "y": column(6),
+        "z": column(7),
       },
       "euler_angles": {
-        "roll": DATA_np[:, 8].reshape(-1, 1),
-        "pitch": DATA_np[:, 9].reshape(-1, 1),
-        "yaw": DATA_np[:, 10].reshape(-1, 1),
+        "roll": column(8),
+        "pitch": column(9),
+        "yaw": column(10),
       },
       "angular_velocity": {
-        "x": DATA_np[:, 11].reshape(-1, 1),
-        "y": DATA_np[:, 12].reshape(-1, 1),
-        "z": DATA_np[:, 13].reshape(-1, 1),
+        "x": column(11),
+        "y": column(12),
+        "z": column(13),
       },
       "outer_loop": {
         "reference_model": {
           "position": {
-            "x": DATA_np[:, 14].reshape(-1, 1),
-            "y": DATA_np[:, 15].reshape(-1, 1),
-            "z": DATA_np[:, 16].reshape(-1, 1),
+            "x": column(14),
+            "y": column(15),
+            "z": column(16),
           },
           "velocity": {
-            "x": DATA_np[:, 17].reshape(-1, 1),
-            "y": DATA_np[:, 18].reshape(-1, 1),
-            "z": DATA_np[:, 19].reshape(-1, 1),
+            "x": column(17),
+            "y": column(18),
+            "z": column(19),
           }
         },
         "mu_adaptive": {
-          "x": DATA_np[:, 59].reshape(-1, 1),
-          "y": DATA_np[:, 60].reshape(-1, 1),
-          "z": DATA_np[:, 61].reshape(-1, 1),
+          "x": column(59),
+          "y": column(60),
+          "z": column(61),
         },
         "mu_PID_baseline": {
-          "x": DATA_np[:, 62].reshape(-1, 1),
-          "y": DATA_np[:, 63].reshape(-1, 1),
-          "z": DATA_np[:, 64].reshape(-1, 1),
+          "x": column(62),
+          "y": column(63),
+          "z": column(64),
         },
         "r_cmd": {
-          "x": DATA_np[:, 86].reshape(-1, 1),
-          "y": DATA_np[:, 87].reshape(-1, 1),
-          "z": DATA_np[:, 88].reshape(-1, 1),
+          "x": column(86),
+          "y": column(87),
+          "z": column(88),
         },
-        "proj_op_activated_K_hat_x": DATA_np[:, 92].reshape(-1, 1),
-        "proj_op_activated_K_hat_r": DATA_np[:, 93].reshape(-1, 1),
-        "proj_op_activated_Theta_hat": DATA_np[:, 94].reshape(-1, 1),
+        "proj_op_activated_K_hat_x": column(92),
+        "proj_op_activated_K_hat_r": column(93),
+        "proj_op_activated_Theta_hat": column(94),
         "K_hat_x": {
-          "ind00": DATA_np[:, 98].reshape(-1, 1),
-          "ind10": DATA_np[:, 99].reshape(-1, 1),
-          "ind20": DATA_np[:, 100].reshape(-1, 1),
-          "ind30": DATA_np[:, 101].reshape(-1, 1),
-          "ind40": DATA_np[:, 102].reshape(-1, 1),
-          "ind50": DATA_np[:, 103].reshape(-1, 1),
-          "ind01": DATA_np[:, 104].reshape(-1, 1),
-          "ind11": DATA_np[:, 105].reshape(-1, 1),
-          "ind21": DATA_np[:, 106].reshape(-1, 1),
-          "ind31": DATA_np[:, 107].reshape(-1, 1),
-          "ind41": DATA_np[:, 108].reshape(-1, 1),
-          "ind51": DATA_np[:, 109].reshape(-1, 1),
-          "ind02": DATA_np[:, 110].reshape(-1, 1),
-          "ind12": DATA_np[:, 111].reshape(-1, 1),
-          "ind22": DATA_np[:, 112].reshape(-1, 1),
-          "ind32": DATA_np[:, 113].reshape(-1, 1),
-          "ind42": DATA_np[:, 114].reshape(-1, 1),
-          "ind52": DATA_np[:, 115].reshape(-1, 1),
+          "ind00": column(98),
+          "ind10": column(99),
+          "ind20": column(100),
+          "ind30": column(101),
+          "ind40": column(102),
+          "ind50": column(103),
+          "ind01": column(104),
+          "ind11": column(105),
+          "ind21": column(106),
+          "ind31": column(107),
+          "ind41": column(108),
+          "ind51": column(109),
+          "ind02": column(110),
+          "ind12": column(111),
+          "ind22": column(112),
+          "ind32": column(113),
+          "ind42": column(114),
+          "ind52": column(115),
         },
         "K_hat_r": {
-          "ind00": DATA_np[:, 116].reshape(-1, 1),
-          "ind10": DATA_np[:, 117].reshape(-1, 1),
-          "ind20": DATA_np[:, 118].reshape(-1, 1),
-          "ind01": DATA_np[:, 119].reshape(-1, 1),
-          "ind11": DATA_np[:, 120].reshape(-1, 1),
-          "ind21": DATA_np[:, 121].reshape(-1, 1),
-          "ind02": DATA_np[:, 122].reshape(-1, 1),
-          "ind12": DATA_np[:, 123].reshape(-1, 1),
-          "ind22": DATA_np[:, 124].reshape(-1, 1),
+          "ind00": column(116),
+          "ind10": column(117),
+          "ind20": column(118),
+          "ind01": column(119),
+          "ind11": column(120),
+          "ind21": column(121),
+          "ind02": column(122),
+          "ind12": column(123),
+          "ind22": column(124),
         },
         "Theta_hat": {
-          "ind00": DATA_np[:, 125].reshape(-1, 1),
-          "ind10": DATA_np[:, 126].reshape(-1, 1),
-          "ind20": DATA_np[:, 127].reshape(-1, 1),
-          "ind30": DATA_np[:, 128].reshape(-1, 1),
-          "ind40": DATA_np[:, 129].reshape(-1, 1),
-          "ind50": DATA_np[:, 130].reshape(-1, 1),
-          "ind01": DATA_np[:, 131].reshape(-1, 1),
-          "ind11": DATA_np[:, 132].reshape(-1, 1),
-          "ind21": DATA_np[:, 133].reshape(-1, 1),
-          "ind31": DATA_np[:, 134].reshape(-1, 1),
-          "ind41": DATA_np[:, 135].reshape(-1, 1),
-          "ind51": DATA_np[:, 136].reshape(-1, 1),
-          "ind02": DATA_np[:, 137].reshape(-1, 1),
-          "ind12": DATA_np[:, 138].reshape(-1, 1),
-          "ind22": DATA_np[:, 139].reshape(-1, 1),
-          "ind32": DATA_np[:, 140].reshape(-1, 1),
-          "ind42": DATA_np[:, 141].reshape(-1, 1),
-          "ind52": DATA_np[:, 142].reshape(-1, 1),
+          "ind00": column(125),
+          "ind10": column(126),
+          "ind20": column(127),
+          "ind30": column(128),
+          "ind40": column(129),
+          "ind50": column(130),
+          "ind01": column(131),
+          "ind11": column(132),
+          "ind21": column(133),
+          "ind31": column(134),
+          "ind41": column(135),
+          "ind51": column(136),
+          "ind02": column(137),
+          "ind12": column(138),
+          "ind22": column(139),
+          "ind32": column(140),
+          "ind42": column(141),
+          "ind52": column(142),
         },
-        "dead_zone_value": DATA_np[:, 179].reshape(-1, 1),
+        "dead_zone_value": column(179),
       },
       "desired_euler_angles": {
-        "roll": DATA_np[:, 20].reshape(-1, 1),
-        "pitch": DATA_np[:, 21].reshape(-1, 1),
-        "roll_dot": DATA_np[:, 23].reshape(-1, 1),
-        "pitch_dot": DATA_np[:, 24].reshape(-1, 1),
-        "roll_dot_dot": DATA_np[:, 26].reshape(-1, 1),
-        "pitch_dot_dot": DATA_np[:, 27].reshape(-1, 1),
+        "roll": column(20),
+        "pitch": column(21),
+        "roll_dot": column(23),
+        "pitch_dot": column(24),
+        "roll_dot_dot": column(26),
+        "pitch_dot_dot": column(27),
       },
-      "user_defined_yaw": DATA_np[:, 22].reshape(-1, 1),
-      "user_defined_yaw_dot": DATA_np[:, 25].reshape(-1, 1),
-      "user_defined_yaw_dot_dot": DATA_np[:, 28].reshape(-1, 1),
+      "user_defined_yaw": column(22),
+      "user_defined_yaw_dot": column(25),
+      "user_defined_yaw_dot_dot": column(28),
       "inner_loop": {
         "reference_model": {
           "angular_velocity": {
-            "x": DATA_np[:, 29].reshape(-1, 1),
-            "y": DATA_np[:, 30].reshape(-1, 1),
-            "z": DATA_np[:, 31].reshape(-1, 1),
+            "x": column(29),
+            "y": column(30),
+            "z": column(31),
           }
         },
         "tau_adaptive": {
-          "x": DATA_np[:, 68].reshape(-1, 1),
-          "y": DATA_np[:, 69].reshape(-1, 1),
-          "z": DATA_np[:, 70].reshape(-1, 1),
+          "x": column(68),
+          "y": column(69),
+          "z": column(70),
         },
         "tau_PID_baseline": {
-          "x": DATA_np[:, 71].reshape(-1, 1),
-          "y": DATA_np[:, 72].reshape(-1, 1),
-          "z": DATA_np[:, 73].reshape(-1, 1),
+          "x": column(71),
+          "y": column(72),
+          "z": column(73),
         },
         "omega_cmd": {
-          "x": DATA_np[:, 77].reshape(-1, 1),
-          "y": DATA_np[:, 78].reshape(-1, 1),
-          "z": DATA_np[:, 79].reshape(-1, 1),
+          "x": column(77),
+          "y": column(78),
+          "z": column(79),
         },
         "omega_cmd_dot": {
-          "x": DATA_np[:, 80].reshape(-1, 1),
-          "y": DATA_np[:, 81].reshape(-1, 1),
-          "z": DATA_np[:, 82].reshape(-1, 1),
+          "x": column(80),
+          "y": column(81),
+          "z": column(82),
         },
         "omega_ref_dot": {
-          "x": DATA_np[:, 83].reshape(-1, 1),
-          "y": DATA_np[:, 84].reshape(-1, 1),
-          "z": DATA_np[:, 85].reshape(-1, 1),
+          "x": column(83),
+          "y": column(84),
+          "z": column(85),
         },
         "r_cmd": {
-          "x": DATA_np[:, 89].reshape(-1, 1),
-          "y": DATA_np[:, 90].reshape(-1, 1),
-          "z": DATA_np[:, 91].reshape(-1, 1),
+          "x": column(89),
+          "y": column(90),
+          "z": column(91),
         },
-        "proj_op_activated_K_hat_x": DATA_np[:, 95].reshape(-1, 1),
-        "proj_op_activated_K_hat_r": DATA_np[:, 96].reshape(-1, 1),
-        "proj_op_activated_Theta_hat": DATA_np[:, 97].reshape(-1, 1),
+        "proj_op_activated_K_hat_x": column(95),
+        "proj_op_activated_K_hat_r": column(96),
+        "proj_op_activated_Theta_hat": column(97),
         "K_hat_x": {
-          "ind00": DATA_np[:, 143].reshape(-1, 1),
-          "ind10": DATA_np[:, 144].reshape(-1, 1),
-          "ind20": DATA_np[:, 145].reshape(-1, 1),
-          "ind01": DATA_np[:, 146].reshape(-1, 1),
-          "ind11": DATA_np[:, 147].reshape(-1, 1),
-          "ind21": DATA_np[:, 148].reshape(-1, 1),
-          "ind02": DATA_np[:, 149].reshape(-1, 1),
-          "ind12": DATA_np[:, 150].reshape(-1, 1),
-          "ind22": DATA_np[:, 151].reshape(-1, 1),
+          "ind00": column(143),
+          "ind10": column(144),
+          "ind20": column(145),
+          "ind01": column(146),
+          "ind11": column(147),
+          "ind21": column(148),
+          "ind02": column(149),
+          "ind12": column(150),
+          "ind22": column(151),
         },
         "K_hat_r": {
-          "ind00": DATA_np[:, 152].reshape(-1, 1),
-          "ind10": DATA_np[:, 153].reshape(-1, 1),
-          "ind20": DATA_np[:, 154].reshape(-1, 1),
-          "ind01": DATA_np[:, 155].reshape(-1, 1),
-          "ind11": DATA_np[:, 156].reshape(-1, 1),
-          "ind21": DATA_np[:, 157].reshape(-1, 1),
-          "ind02": DATA_np[:, 158].reshape(-1, 1),
-          "ind12": DATA_np[:, 159].reshape(-1, 1),
-          "ind22": DATA_np[:, 160].reshape(-1, 1),
+          "ind00": column(152),
+          "ind10": column(153),
+          "ind20": column(154),
+          "ind01": column(155),
+          "ind11": column(156),
+          "ind21": column(157),
+          "ind02": column(158),
+          "ind12": column(159),
+          "ind22": column(160),
         },
         "Theta_hat": {
-          "ind00": DATA_np[:, 161].reshape(-1, 1),
-          "ind10": DATA_np[:, 162].reshape(-1, 1),
-          "ind20": DATA_np[:, 163].reshape(-1, 1),
-          "ind30": DATA_np[:, 164].reshape(-1, 1),
-          "ind40": DATA_np[:, 165].reshape(-1, 1),
-          "ind50": DATA_np[:, 166].reshape(-1, 1),
-          "ind01": DATA_np[:, 167].reshape(-1, 1),
-          "ind11": DATA_np[:, 168].reshape(-1, 1),
-          "ind21": DATA_np[:, 169].reshape(-1, 1),
-          "ind31": DATA_np[:, 170].reshape(-1, 1),
-          "ind41": DATA_np[:, 171].reshape(-1, 1),
-          "ind51": DATA_np[:, 172].reshape(-1, 1),
-          "ind02": DATA_np[:, 173].reshape(-1, 1),
-          "ind12": DATA_np[:, 174].reshape(-1, 1),
-          "ind22": DATA_np[:, 175].reshape(-1, 1),
-          "ind32": DATA_np[:, 176].reshape(-1, 1),
-          "ind42": DATA_np[:, 177].reshape(-1, 1),
-          "ind52": DATA_np[:, 178].reshape(-1, 1),
+          "ind00": column(161),
+          "ind10": column(162),
+          "ind20": column(163),
+          "ind30": column(164),
+          "ind40": column(165),
+          "ind50": column(166),
+          "ind01": column(167),
+          "ind11": column(168),
+          "ind21": column(169),
+          "ind31": column(170),
+          "ind41": column(171),
+          "ind51": column(172),
+          "ind02": column(173),
+          "ind12": column(174),
+          "ind22": column(175),
+          "ind32": column(176),
+          "ind42": column(177),
+          "ind52": column(178),
         },
-        "dead_zone_value": DATA_np[:, 180].reshape(-1, 1),
+        "dead_zone_value": column(180),
       },
       "user_defined_position": {
-        "x": DATA_np[:, 32].reshape(-1, 1),
-        "y": DATA_np[:, 33].reshape(-1, 1),
-        "z": DATA_np[:, 34].reshape(-1, 1),
+        "x": column(32),
+        "y": column(33),
+        "z": column(34),
       },
       "user_defined_velocity": {
-        "x": DATA_np[:, 35].reshape(-1, 1),
-        "y": DATA_np[:, 36].reshape(-1, 1),
-        "z": DATA_np[:, 37].reshape(-1, 1),
+        "x": column(35),
+        "y": column(36),
+        "z": column(37),
       },
       "user_defined_acceleration": {
-        "x": DATA_np[:, 38].reshape(-1, 1),
-        "y": DATA_np[:, 39].reshape(-1, 1),
-        "z": DATA_np[:, 40].reshape(-1, 1),
+        "x": column(38),
+        "y": column(39),
+        "z": column(40),
       },
       "mu_translational": {
-        "x": DATA_np[:, 41].reshape(-1, 1),
-        "y": DATA_np[:, 42].reshape(-1, 1),
-        "z": DATA_np[:, 43].reshape(-1, 1),
+        "x": column(41),
+        "y": column(42),
+        "z": column(43),
       },
       "control_input": {
-        "U1": DATA_np[:, 44].reshape(-1, 1),
-        "U2": DATA_np[:, 45].reshape(-1, 1),
-        "U3": DATA_np[:, 46].reshape(-1, 1),
-        "U4": DATA_np[:, 47].reshape(-1, 1),
+        "U1": column(44),
+        "U2": column(45),
+        "U3": column(46),
+        "U4": column(47),
       },
       "thrust_motors_N": {
-        "T1": DATA_np[:, 48].reshape(-1, 1),
-        "T2": DATA_np[:, 49].reshape(-1, 1),
-        "T3": DATA_np[:, 50].reshape(-1, 1),
-        "T4": DATA_np[:, 51].reshape(-1, 1),
-        "T5": DATA_np[:, 52].reshape(-1, 1),
-        "T6": DATA_np[:, 53].reshape(-1, 1),
-        "T7": DATA_np[:, 54].reshape(-1, 1),
-        "T8": DATA_np[:, 55].reshape(-1, 1),
+        "T1": column(48),
+        "T2": column(49),
+        "T3": column(50),
+        "T4": column(51),
+        "T5": column(52),
+        "T6": column(53),
+        "T7": column(54),
+        "T8": column(55),
       },
       "euler_angles_dot": {
-        "roll_dot": DATA_np[:, 74].reshape(-1, 1),
-        "pitch_dot": DATA_np[:, 75].reshape(-1, 1),
-        "yaw_dot": DATA_np[:, 76].reshape(-1, 1),
+        "roll_dot": column(74),
+        "pitch_dot": column(75),
+        "yaw_dot": column(76),
       },
       "omega_cmd": {
-        "x": DATA_np[:, 77].reshape(-1, 1),
-        "y": DATA_np[:, 78].reshape(-1, 1),
-        "z": DATA_np[:, 79].reshape(-1, 1),
+        "x": column(77),
+        "y": column(78),
+        "z": column(79),
       },
       "omega_cmd_dot": {
-        "x": DATA_np[:, 77].reshape(-1, 1),
-        "y": DATA_np[:, 78].reshape(-1, 1),
-        "z": DATA_np[:, 79].reshape(-1, 1),
+        "x": column(77),
+        "y": column(78),
+        "z": column(79),
       }
     }
 
@@ -1,5 +1,6 @@
 # acsl_pychrono/control/PID/__init__.py
 
 from .pid import PID
+from .pid_batch import PIDBatch
 from .pid_gains import PIDGains
 from .pid_logger import PIDLogger
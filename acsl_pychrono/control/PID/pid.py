@@ -1,4 +1,3 @@
-import math
 import numpy as np  
 from acsl_pychrono.control.outerloop_safetymech import OuterLoopSafetyMechanism
 from acsl_pychrono.control.PID.pid_gains import PIDGains
@@ -25,10 +24,10 @@ class PID(Control):
     self.odein = ode_input
     
     # ODE state
-    self.state_phi_ref_diff = self.y[0:2]
-    self.state_theta_ref_diff = self.y[2:4]
-    self.integral_position_tracking = self.y[4:7]
-    self.integral_angular_error = self.y[7:10]
+    self.state_phi_ref_diff = self.y[..., 0:2, :]
+    self.state_theta_ref_diff = self.y[..., 2:4, :]
+    self.integral_position_tracking = self.y[..., 4:7, :]
+    self.integral_angular_error = self.y[..., 7:10, :]
  
     # Compute translational position error
     self.translational_position_error = Control.computeTranslationalPositionError(
@@ -94,10 +93,10 @@ class PID(Control):
     Function called by RK4. Assumes `computeControlAlgorithm` was called
     at the beginning of the integration step to update internal state.
     """
-    self.dy[0:2] = self.internal_state_differentiator_phi_ref_diff
-    self.dy[2:4] = self.internal_state_differentiator_theta_ref_diff
-    self.dy[4:7] = self.translational_position_error
-    self.dy[7:10] = self.angular_error
+    self.dy[..., 0:2, :] = self.internal_state_differentiator_phi_ref_diff
+    self.dy[..., 2:4, :] = self.internal_state_differentiator_theta_ref_diff
+    self.dy[..., 4:7, :] = self.translational_position_error
+    self.dy[..., 7:10, :] = self.angular_error
 
     return np.array(self.dy)
   
@@ -112,28 +111,28 @@ class PID(Control):
      R_from_glob_to_loc
     ) = Control.computeRotationMatrices(self.odein.roll, self.odein.pitch, self.odein.yaw)
     
-    translational_velocity_in_J = R_from_glob_to_loc * self.odein.translational_velocity_in_I
-    translational_velocity_in_J_norm = np.linalg.norm(R_from_glob_to_loc * self.odein.translational_velocity_in_I)
+    translational_velocity_in_J = R_from_glob_to_loc @ self.odein.translational_velocity_in_I
+    translational_velocity_in_J_norm = Control.matrixNorm(translational_velocity_in_J)
 
     # Aerodynamic drag force compensation
     drag_force_in_body = (
-      -0.5 * self.gains.air_density_estimated * self.gains.surface_area_estimated *
-      self.gains.drag_coefficient_matrix_estimated * translational_velocity_in_J * translational_velocity_in_J_norm
+      (Control.column(-0.5 * self.gains.air_density_estimated * self.gains.surface_area_estimated) *
+      self.gains.drag_coefficient_matrix_estimated) @ translational_velocity_in_J * Control.column(translational_velocity_in_J_norm)
     )
-    drag_force_in_inertial = R_from_loc_to_glob * drag_force_in_body
+    drag_force_in_inertial = R_from_loc_to_glob @ drag_force_in_body
 
     # Dynamic inversion term
     dynamic_inversion = -drag_force_in_inertial 
 
     self.mu_tran_raw = (
-      self.gains.mass_total_estimated * (
-        - self.gains.KP_tran * self.translational_position_error
-        - self.gains.KD_tran * velocity_error
-        - self.gains.KI_tran * self.integral_position_tracking
+      Control.column(self.gains.mass_total_estimated) * (
+        - self.gains.KP_tran @ self.translational_position_error
+        - self.gains.KD_tran @ velocity_error
+        - self.gains.KI_tran @ self.integral_position_tracking
         + self.odein.translational_acceleration_in_I_user
       )
       + dynamic_inversion
-    ).reshape(3, 1)
+    )
 
   def computeInnerLoop(self):
     """
@@ -141,23 +140,24 @@ class PID(Control):
     """
     # Compute gyroscopic term
     gyro_term = np.cross(
-      self.odein.angular_velocity.ravel(),
-      (self.gains.I_matrix_estimated * self.odein.angular_velocity).ravel()
-    ).reshape(3,1)
+      np.asarray(self.odein.angular_velocity),
+      np.asarray(self.gains.I_matrix_estimated @ self.odein.angular_velocity),
+      axis=-2
+    )
 
     # Compute feedback term
-    feedback_term = self.gains.I_matrix_estimated * (
-      - self.gains.KP_rot * self.angular_error
-      - self.gains.KD_rot * self.angular_error_dot
-      - self.gains.KI_rot * self.integral_angular_error
+    feedback_term = self.gains.I_matrix_estimated @ (
+      - self.gains.KP_rot @ self.angular_error
+      - self.gains.KD_rot @ self.angular_error_dot
+      - self.gains.KI_rot @ self.integral_angular_error
       + self.angular_position_ref_ddot
-    ).reshape(3,1)
+    )
     
     self.Moment = gyro_term + feedback_term
 
-    self.u2 = self.Moment[0].item()
-    self.u3 = self.Moment[1].item()
-    self.u4 = self.Moment[2].item()
+    self.u2 = self.Moment[..., 0, 0]
+    self.u3 = self.Moment[..., 1, 0]
+    self.u4 = self.Moment[..., 2, 0]
 
   def computePostIntegrationAlgorithm(self):
     pass
\ No newline at end of file
@@ -0,0 +1,7 @@
+from acsl_pychrono.control.batch_control import BatchControl
+from acsl_pychrono.control.PID.pid import PID
+
+class PIDBatch(BatchControl, PID):
+  """
+  Batched form of 'PID': N instances, one per gain set of 'gains_list', advanced by the same NumPy calls.
+  """
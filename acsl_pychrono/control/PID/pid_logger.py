@@ -1,136 +1,166 @@
 import numpy as np  
 from acsl_pychrono.control.PID.pid import PID
 from acsl_pychrono.control.PID.pid_gains import PIDGains
+from acsl_pychrono.control.base_logger import BaseLogger
+from acsl_pychrono.control.logging_profile import LoggingProfile
+from acsl_pychrono.control.log_sinks import BaseLogSink
 import math
 from acsl_pychrono.simulation.ode_input import OdeInput
 from acsl_pychrono.simulation.flight_params import FlightParams
 
-class PIDLogger:
-  def __init__(self, gains: PIDGains) -> None:
+class PIDLogger(BaseLogger):
+  # Column layout of a logged row: scalars are column indices, vectors are slices
+  COLUMNS = {
+    "time_now": 0,
+    "simulation_time": 1,
+    "position": slice(2, 5),
+    "velocity": slice(5, 8),
+    "roll": 8,
+    "pitch": 9,
+    "yaw": 10,
+    "angular_velocity": slice(11, 14),
+    "roll_ref": 14,
+    "pitch_ref": 15,
+    "yaw_ref": 16,
+    "angular_position_ref_dot": slice(17, 20),
+    "angular_position_ref_ddot": slice(20, 23),
+    "user_defined_position": slice(23, 26),
+    "user_defined_velocity": slice(26, 29),
+    "user_defined_acceleration": slice(29, 32),
+    "mu_x": 32,
+    "mu_y": 33,
+    "mu_z": 34,
+    "u1": 35,
+    "u2": 36,
+    "u3": 37,
+    "u4": 38,
+    "motor_thrusts": slice(39, 47),
+    "angular_position_dot": slice(47, 50),
+  }
+
+  def __init__(
+    self,
+    gains: PIDGains,
+    timestep: float,
+    expected_rows: int = 0,
+    logging_profile: LoggingProfile | None = None,
+    log_sink: BaseLogSink | None = None
+  ) -> None:
     self.gains = gains
-    self.data_list = []
     # Length of the array vector that will be exported 
-    self.size_DATA = 50  # Ensure size_DATA is set
+    super().__init__(50, timestep, expected_rows, logging_profile, log_sink)
 
   def collectData(self, controller: PID, simulation_time: float, number_of_propellers: int):
-    DATA_vector = np.zeros((self.size_DATA, 1))
-    
-    # Pad the motor thrusts with zeros if fewer than 8 propellers
-    if number_of_propellers < 8:
-      motor_thrusts = controller.motor_thrusts.reshape(number_of_propellers, 1)
-      motor_thrusts = motor_thrusts.flatten() # Flatten to 1D
-      motor_thrusts = np.pad(motor_thrusts, (0, 8 - number_of_propellers), 'constant')
-    else:
-      motor_thrusts = controller.motor_thrusts
+    C = PIDLogger.COLUMNS
+    row = self.nextRow()
+    if row is None:
+      return
+    # (size_DATA x 1) view of the row, so that column vectors are written as they are
+    DATA_vector = row[:, np.newaxis]
 
-    DATA_vector[0] = controller.odein.time_now
-    DATA_vector[1] = simulation_time
-    DATA_vector[2:5] = controller.odein.translational_position_in_I
-    DATA_vector[5:8] = controller.odein.translational_velocity_in_I
-    DATA_vector[8] = controller.odein.roll
-    DATA_vector[9] = controller.odein.pitch
-    DATA_vector[10] = controller.odein.yaw
-    DATA_vector[11:14] = controller.odein.angular_velocity
-    DATA_vector[14] = controller.roll_ref
-    DATA_vector[15] = controller.pitch_ref
-    DATA_vector[16] = controller.odein.yaw_ref
-    DATA_vector[17] = controller.angular_position_ref_dot[0]
-    DATA_vector[18] = controller.angular_position_ref_dot[1]
-    DATA_vector[19] = controller.angular_position_ref_dot[2]
-    DATA_vector[20] = controller.angular_position_ref_ddot[0]
-    DATA_vector[21] = controller.angular_position_ref_ddot[1]
-    DATA_vector[22] = controller.angular_position_ref_ddot[2]
-    DATA_vector[23:26] = controller.odein.translational_position_in_I_user
-    DATA_vector[26:29] = controller.odein.translational_velocity_in_I_user
-    DATA_vector[29:32] = controller.odein.translational_acceleration_in_I_user
-    DATA_vector[32] = controller.mu_x
-    DATA_vector[33] = controller.mu_y
-    DATA_vector[34] = controller.mu_z
-    DATA_vector[35] = controller.u1
-    DATA_vector[36] = controller.u2
-    DATA_vector[37] = controller.u3
-    DATA_vector[38] = controller.u4
-    DATA_vector[39:47] = motor_thrusts.reshape(8, 1)
-    DATA_vector[47:50] = controller.angular_position_dot
-    
-    self.data_list.append(DATA_vector.flatten())
+    DATA_vector[C["time_now"]] = controller.odein.time_now
+    DATA_vector[C["simulation_time"]] = simulation_time
+    DATA_vector[C["position"]] = controller.odein.translational_position_in_I
+    DATA_vector[C["velocity"]] = controller.odein.translational_velocity_in_I
+    DATA_vector[C["roll"]] = controller.odein.roll
+    DATA_vector[C["pitch"]] = controller.odein.pitch
+    DATA_vector[C["yaw"]] = controller.odein.yaw
+    DATA_vector[C["angular_velocity"]] = controller.odein.angular_velocity
+    DATA_vector[C["roll_ref"]] = controller.roll_ref
+    DATA_vector[C["pitch_ref"]] = controller.pitch_ref
+    DATA_vector[C["yaw_ref"]] = controller.odein.yaw_ref
+    DATA_vector[C["angular_position_ref_dot"]] = controller.angular_position_ref_dot
+    DATA_vector[C["angular_position_ref_ddot"]] = controller.angular_position_ref_ddot
+    DATA_vector[C["user_defined_position"]] = controller.odein.translational_position_in_I_user
+    DATA_vector[C["user_defined_velocity"]] = controller.odein.translational_velocity_in_I_user
+    DATA_vector[C["user_defined_acceleration"]] = controller.odein.translational_acceleration_in_I_user
+    DATA_vector[C["mu_x"]] = controller.mu_x
+    DATA_vector[C["mu_y"]] = controller.mu_y
+    DATA_vector[C["mu_z"]] = controller.mu_z
+    DATA_vector[C["u1"]] = controller.u1
+    DATA_vector[C["u2"]] = controller.u2
+    DATA_vector[C["u3"]] = controller.u3
+    DATA_vector[C["u4"]] = controller.u4
+    # The thrusts of missing propellers (fewer than 8) stay zero
+    DATA_vector[C["motor_thrusts"].start:C["motor_thrusts"].start + number_of_propellers] = controller.motor_thrusts
+    DATA_vector[C["angular_position_dot"]] = controller.angular_position_dot
 
-  def toDictionary(self):
-    DATA_np = np.array(self.data_list)
+    self.storeRow(row)
 
+  def buildDictionary(self, column) -> dict:
     log_dict = {
-      "time": DATA_np[:, 0].reshape(-1, 1),
+      "time": column(0),
       "position": {
-        "x": DATA_np[:, 2].reshape(-1, 1),
-        "y": DATA_np[:, 3].reshape(-1, 1),
-        "z": DATA_np[:, 4].reshape(-1, 1),
+        "x": column(2),
+        "y": column(3),
+        "z": column(4),
       },
       "velocity": {
-        "x": DATA_np[:, 5].reshape(-1, 1),
-        "y": DATA_np[:, 6].reshape(-1, 1),
-        "z": DATA_np[:, 7].reshape(-1, 1),
+        "x": column(5),
+        "y": column(6),
+        "z": column(7),
       },
       "euler_angles": {
-        "roll": DATA_np[:, 8].reshape(-1, 1),
-        "pitch": DATA_np[:, 9].reshape(-1, 1),
-        "yaw": DATA_np[:, 10].reshape(-1, 1),
+        "roll": column(8),
+        "pitch": column(9),
+        "yaw": column(10),
       },
       "angular_velocity": {
-        "x": DATA_np[:, 11].reshape(-1, 1),
-        "y": DATA_np[:, 12].reshape(-1, 1),
-        "z": DATA_np[:, 13].reshape(-1, 1),
+        "x": column(11),
+        "y": column(12),
+        "z": column(13),
       },
       "desired_euler_angles": {
-        "roll": DATA_np[:, 14].reshape(-1, 1),
-        "pitch": DATA_np[:, 15].reshape(-1, 1),
-        "roll_dot": DATA_np[:, 17].reshape(-1, 1),
-        "pitch_dot": DATA_np[:, 18].reshape(-1, 1),
-        "roll_dot_dot": DATA_np[:, 20].reshape(-1, 1),
-        "pitch_dot_dot": DATA_np[:, 21].reshape(-1, 1),
+        "roll": column(14),
+        "pitch": column(15),
+        "roll_dot": column(17),
+        "pitch_dot": column(18),
+        "roll_dot_dot": column(20),
+        "pitch_dot_dot": column(21),
       },
-      "user_defined_yaw": DATA_np[:, 16].reshape(-1, 1),
-      "user_defined_yaw_dot": DATA_np[:, 19].reshape(-1, 1),
-      "user_defined_yaw_dot_dot": DATA_np[:, 22].reshape(-1, 1),
+      "user_defined_yaw": column(16),
+      "user_defined_yaw_dot": column(19),
+      "user_defined_yaw_dot_dot": column(22),
       "user_defined_position": {
-        "x": DATA_np[:, 23].reshape(-1, 1),
-        "y": DATA_np[:, 24].reshape(-1, 1),
-        "z": DATA_np[:, 25].reshape(-1, 1),
+        "x": column(23),
+        "y": column(24),
+        "z": column(25),
       },
       "user_defined_velocity": {
-        "x": DATA_np[:, 26].reshape(-1, 1),
-        "y": DATA_np[:, 27].reshape(-1, 1),
-        "z": DATA_np[:, 28].reshape(-1, 1),
+        "x": column(26),
+        "y": column(27),
+        "z": column(28),
       },
       "user_defined_acceleration": {
-        "x": DATA_np[:, 29].reshape(-1, 1),
-        "y": DATA_np[:, 30].reshape(-1, 1),
-        "z": DATA_np[:, 31].reshape(-1, 1),
+        "x": column(29),
+        "y": column(30),
+        "z": column(31),
       },
       "mu_translational": {
-        "x": DATA_np[:, 32].reshape(-1, 1),
-        "y": DATA_np[:, 33].reshape(-1, 1),
-        "z": DATA_np[:, 34].reshape(-1, 1),
+        "x": column(32),
+        "y": column(33),
+        "z": column(34),
       },
       "control_input": {
-        "U1": DATA_np[:, 35].reshape(-1, 1),
-        "U2": DATA_np[:, 36].reshape(-1, 1),
-        "U3": DATA_np[:, 37].reshape(-1, 1),
-        "U4": DATA_np[:, 38].reshape(-1, 1),
+        "U1": column(35),
+        "U2": column(36),
+        "U3": column(37),
+        "U4": column(38),
       },
       "thrust_motors_N": {
-        "T1": DATA_np[:, 39].reshape(-1, 1),
-        "T2": DATA_np[:, 40].reshape(-1, 1),
-        "T3": DATA_np[:, 41].reshape(-1, 1),
-        "T4": DATA_np[:, 42].reshape(-1, 1),
-        "T5": DATA_np[:, 43].reshape(-1, 1),
-        "T6": DATA_np[:, 44].reshape(-1, 1),
-        "T7": DATA_np[:, 45].reshape(-1, 1),
-        "T8": DATA_np[:, 46].reshape(-1, 1),
+        "T1": column(39),
+        "T2": column(40),
+        "T3": column(41),
+        "T4": column(42),
+        "T5": column(43),
+        "T6": column(44),
+        "T7": column(45),
+        "T8": column(46),
       },
       "euler_angles_dot": {
-        "roll_dot": DATA_np[:, 47].reshape(-1, 1),
-        "pitch_dot": DATA_np[:, 48].reshape(-1, 1),
-        "yaw_dot": DATA_np[:, 49].reshape(-1, 1),
+        "roll_dot": column(47),
+        "pitch_dot": column(48),
+        "yaw_dot": column(49),
       }
     }
 
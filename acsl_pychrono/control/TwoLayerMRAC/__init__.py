@@ -1,5 +1,7 @@
 # acsl_pychrono/control/TwoLayerMRAC/__init__.py
 
 from .two_layer_mrac import TwoLayerMRAC
+from .two_layer_mrac_flat import TwoLayerMRACFlat
+from .two_layer_mrac_batch import TwoLayerMRACBatch
 from .two_layer_mrac_gains import TwoLayerMRACGains
 from .two_layer_mrac_logger import TwoLayerMRACLogger
\ No newline at end of file
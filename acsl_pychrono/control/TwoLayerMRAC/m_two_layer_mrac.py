@@ -1,8 +1,11 @@
-import math
 import numpy as np  
+from acsl_pychrono.control.control import Control
 from acsl_pychrono.control.MRAC.m_mrac import M_MRAC
 
 class M_TwoLayerMRAC:
+  """
+  Equations of the Two-Layer MRAC laws, array-generic as those of 'M_MRAC'.
+  """
   @staticmethod
   def computeControlLaw(
     K_hat_x: np.ndarray,
@@ -18,10 +21,8 @@ class M_TwoLayerMRAC:
     Compute the classical MRAC control law.
     """
     control_input = (
-      K_hat_x.T * x
-      + K_hat_r.T * r
-      - Theta_hat.T * Phi
-      + K_hat_g.T * e
+      M_MRAC.computeControlLaw(K_hat_x, x, K_hat_r, r, Theta_hat, Phi)
+      + Control.transpose(K_hat_g) @ e
     )
 
     return control_input
@@ -29,22 +29,22 @@ class TwoLayerMRAC(BaseMRAC, Control):
     self.odein = ode_input
     
     # ODE state            
-    self.state_phi_ref_diff = self.y[0:2] # State of the differentiator for phi_ref (roll_ref)
-    self.state_theta_ref_diff = self.y[2:4] # State of the differentiator for theta_ref (pitch_ref)
-    self.x_ref_tran = self.y[4:10] # Reference model state
-    self.integral_position_tracking_ref = self.y[10:13] # Integral of ('translational_position_in_I_ref' - 'translational_position_in_I_user')
-    self.K_hat_x_tran = self.y[13:31] # \hat{K}_x (translational)
-    self.K_hat_r_tran = self.y[31:40] # \hat{K}_r (translational)
-    self.Theta_hat_tran = self.y[40:58] # \hat{\Theta} (translational)
-    self.omega_ref = self.y[58:61] # Reference model rotational dynamics
-    self.K_hat_x_rot = self.y[61:70] # \hat{K}_x (rotational)
-    self.K_hat_r_rot = self.y[70:79] # \hat{K}_r (rotational)
-    self.Theta_hat_rot = self.y[79:97] # \hat{\Theta} (rotational)
-    self.integral_e_rot = self.y[97:100] # Integral of 'e_rot' = (angular_velocity - omega_ref) 
-    self.integral_angular_error = self.y[100:103] # Integral of angular_error = attitude - attitude_ref
-    self.integral_e_omega_ref_cmd = self.y[103:106] # Integral of (omega_ref - omega_cmd)
-    self.K_hat_g_tran = self.y[106:124] # \hat{K}_g translational (Two-layer)
-    self.K_hat_g_rot = self.y[124:133] # \hat{K}_g rotational (Two-layer)
+    self.state_phi_ref_diff = self.y[..., 0:2, :] # State of the differentiator for phi_ref (roll_ref)
+    self.state_theta_ref_diff = self.y[..., 2:4, :] # State of the differentiator for theta_ref (pitch_ref)
+    self.x_ref_tran = self.y[..., 4:10, :] # Reference model state
+    self.integral_position_tracking_ref = self.y[..., 10:13, :] # Integral of ('translational_position_in_I_ref' - 'translational_position_in_I_user')
+    self.K_hat_x_tran = self.y[..., 13:31, :] # \hat{K}_x (translational)
+    self.K_hat_r_tran = self.y[..., 31:40, :] # \hat{K}_r (translational)
+    self.Theta_hat_tran = self.y[..., 40:58, :] # \hat{\Theta} (translational)
+    self.omega_ref = self.y[..., 58:61, :] # Reference model rotational dynamics
+    self.K_hat_x_rot = self.y[..., 61:70, :] # \hat{K}_x (rotational)
+    self.K_hat_r_rot = self.y[..., 70:79, :] # \hat{K}_r (rotational)
+    self.Theta_hat_rot = self.y[..., 79:97, :] # \hat{\Theta} (rotational)
+    self.integral_e_rot = self.y[..., 97:100, :] # Integral of 'e_rot' = (angular_velocity - omega_ref) 
+    self.integral_angular_error = self.y[..., 100:103, :] # Integral of angular_error = attitude - attitude_ref
+    self.integral_e_omega_ref_cmd = self.y[..., 103:106, :] # Integral of (omega_ref - omega_cmd)
+    self.K_hat_g_tran = self.y[..., 106:124, :] # \hat{K}_g translational (Two-layer)
+    self.K_hat_g_rot = self.y[..., 124:133, :] # \hat{K}_g rotational (Two-layer)
 
     # Reshapes all adaptive gains to their correct (row, col) shape as matrices
     self.reshapeAdaptiveGainsToMatricesTwoLayerMRAC()
@@ -160,22 +160,23 @@ class TwoLayerMRAC(BaseMRAC, Control):
     Function called by RK4. Assumes `computeControlAlgorithm` was called
     at the beginning of the integration step to update internal state.
     """
-    self.dy[0:2] = self.internal_state_differentiator_phi_ref_diff
-    self.dy[2:4] = self.internal_state_differentiator_theta_ref_diff
-    self.dy[4:10] = self.x_ref_tran_dot
-    self.dy[10:13] = self.translational_position_in_I_ref - self.odein.translational_position_in_I_user
-    self.dy[13:31] = self.K_hat_x_tran_dot.reshape(18,1)
-    self.dy[31:40] = self.K_hat_r_tran_dot.reshape(9,1)
-    self.dy[40:58] = self.Theta_hat_tran_dot.reshape(18,1)
-    self.dy[58:61] = self.omega_ref_dot
-    self.dy[61:70] = self.K_hat_x_rot_dot.reshape(9,1)
-    self.dy[70:79] = self.K_hat_r_rot_dot.reshape(9,1)
-    self.dy[79:97] = self.Theta_hat_rot_dot.reshape(18,1)
-    self.dy[97:100] = self.odein.angular_velocity - self.omega_ref
-    self.dy[100:103] = self.angular_error
-    self.dy[103:106] = self.omega_ref - self.omega_cmd
-    self.dy[106:124] = self.K_hat_g_tran_dot.reshape(18,1)
-    self.dy[124:133] = self.K_hat_g_rot_dot.reshape(9,1)
+    batch_shape = self.dy.shape[:-2]
+    self.dy[..., 0:2, :] = self.internal_state_differentiator_phi_ref_diff
+    self.dy[..., 2:4, :] = self.internal_state_differentiator_theta_ref_diff
+    self.dy[..., 4:10, :] = self.x_ref_tran_dot
+    self.dy[..., 10:13, :] = self.translational_position_in_I_ref - self.odein.translational_position_in_I_user
+    self.dy[..., 13:31, :] = self.K_hat_x_tran_dot.reshape(batch_shape + (18, 1))
+    self.dy[..., 31:40, :] = self.K_hat_r_tran_dot.reshape(batch_shape + (9, 1))
+    self.dy[..., 40:58, :] = self.Theta_hat_tran_dot.reshape(batch_shape + (18, 1))
+    self.dy[..., 58:61, :] = self.omega_ref_dot
+    self.dy[..., 61:70, :] = self.K_hat_x_rot_dot.reshape(batch_shape + (9, 1))
+    self.dy[..., 70:79, :] = self.K_hat_r_rot_dot.reshape(batch_shape + (9, 1))
+    self.dy[..., 79:97, :] = self.Theta_hat_rot_dot.reshape(batch_shape + (18, 1))
+    self.dy[..., 97:100, :] = self.odein.angular_velocity - self.omega_ref
+    self.dy[..., 100:103, :] = self.angular_error
+    self.dy[..., 103:106, :] = self.omega_ref - self.omega_cmd
+    self.dy[..., 106:124, :] = self.K_hat_g_tran_dot.reshape(batch_shape + (18, 1))
+    self.dy[..., 124:133, :] = self.K_hat_g_rot_dot.reshape(batch_shape + (9, 1))
 
     return np.array(self.dy)
   
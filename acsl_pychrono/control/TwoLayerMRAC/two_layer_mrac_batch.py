@@ -0,0 +1,7 @@
+from acsl_pychrono.control.batch_control import BatchControl
+from acsl_pychrono.control.TwoLayerMRAC.two_layer_mrac import TwoLayerMRAC
+
+class TwoLayerMRACBatch(BatchControl, TwoLayerMRAC):
+  """
+  Batched form of 'TwoLayerMRAC': N instances, one per gain set of 'gains_list', advanced by the same NumPy calls.
+  """
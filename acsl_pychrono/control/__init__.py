@@ -1,7 +1,10 @@
 # acsl_pychrono/control/__init__.py
 from pathlib import Path
+import copy
 import importlib
 import pkgutil
+from acsl_pychrono.control.log_buffer import LogBuffer
+import acsl_pychrono.control.gains_cache as GainsCache
 
 # Discover available controller modules dynamically
 _package_path = Path(__file__).parent
@@ -11,10 +14,30 @@ _discovered_controllers = {
   if not m.name.startswith("_")
 }
 
-def instantiateController(controller_type: str, ode_input, flight_params, timestep):
+def instantiateController(
+  controller_type: str,
+  ode_input,
+  flight_params,
+  timestep,
+  simulation_duration_seconds: float = 0.0,
+  logging_profile=None,
+  log_sink=None,
+  controller_kernel: str = "reference",
+  controller_integrator: str = "held_rk4",
+  gains_cache_dir: str = "",
+  logging_period: float = 0.0
+):
   """
   Dynamically import and instantiate the specified controller.
   Only the chosen controller module is loaded.
+  The log buffer of the logger is preallocated for 'simulation_duration_seconds' of data,
+  and records the groups selected by 'logging_profile' (every group if None).
+  If 'log_sink' is given, the logger flushes its rows to it in chunks during the run.
+  'controller_kernel' selects the "reference" controller class or its "flat" kernel (<ControllerType>Flat).
+  'controller_integrator' selects the integrator of the ODE of the controller (see 'control.INTEGRATORS').
+  The gains are compiled once per content of their inputs (see 'gains_cache'), and also cached on disk
+  in 'gains_cache_dir' if given.
+  The controller is stepped every 'timestep', the logger every 'logging_period' ('timestep' if 0).
   """
   if controller_type not in _discovered_controllers:
     raise ValueError(f"Unknown controller type: {controller_type}")
@@ -26,6 +49,7 @@ def instantiateController(controller_type: str, ode_input, flight_params, timest
   #   Gains class:   <ControllerType>Gains
   #   Main class:    <ControllerType>
   #   Logger class:  <ControllerType>Logger
+  #   Flat kernel:   <ControllerType>Flat (optional)
   class_prefix = controller_type
 
   try:
@@ -37,9 +61,57 @@ def instantiateController(controller_type: str, ode_input, flight_params, timest
       f"[ERROR] {controller_type} module missing required class: {e}"
     )
 
+  if controller_kernel == "flat":
+    if hasattr(module, f"{class_prefix}Flat"):
+      ControllerClass = getattr(module, f"{class_prefix}Flat")
+    else:
+      print(f"[INFO] {controller_type} has no flat kernel, using the reference implementation.")
+  elif controller_kernel != "reference":
+    raise ValueError(f"Unknown controller kernel: {controller_kernel}")
+
   # Instantiate dynamically
-  gains = GainsClass(flight_params)
+  gains = GainsCache.getGains(GainsClass, flight_params, gains_cache_dir)
   controller = ControllerClass(gains, ode_input, flight_params, timestep)
-  logger = LoggerClass(gains)
+  controller.setIntegrator(controller_integrator)
+  logging_period = logging_period or timestep
+  expected_rows = LogBuffer.expectedRows(simulation_duration_seconds, logging_period)
+  logger = LoggerClass(gains, logging_period, expected_rows, logging_profile, log_sink)
+
+  return gains, controller, logger
+
+def instantiateBatchController(
+  controller_type: str,
+  ode_input,
+  flight_params,
+  timestep,
+  gains_list: list | None = None,
+  batch_size: int = 1,
+  controller_integrator: str = "held_rk4",
+  gains_cache_dir: str = ""
+):
+  """
+  Dynamically import and instantiate the batched form of the specified controller (<ControllerType>Batch):
+  one instance per gain set of 'gains_list', advanced by the same NumPy calls.
+  If 'gains_list' is None, 'batch_size' copies of the gains of the UAV are used (to be modified before the first step).
+  """
+  if controller_type not in _discovered_controllers:
+    raise ValueError(f"Unknown controller type: {controller_type}")
+
+  module = importlib.import_module(f".{_discovered_controllers[controller_type]}", package=__name__)
+
+  try:
+    GainsClass = getattr(module, f"{controller_type}Gains")
+    BatchControllerClass = getattr(module, f"{controller_type}Batch")
+  except AttributeError as e:
+    raise ImportError(
+      f"[ERROR] {controller_type} module missing required class: {e}"
+    )
+
+  if gains_list is None:
+    gains = GainsCache.getGains(GainsClass, flight_params, gains_cache_dir)
+    gains_list = [gains] + [copy.deepcopy(gains) for _ in range(batch_size - 1)]
+
+  controller = BatchControllerClass(gains_list, ode_input, flight_params, timestep)
+  controller.setIntegrator(controller_integrator)
 
-  return gains, controller, logger
\ No newline at end of file
+  return gains_list, controller
\ No newline at end of file
@@ -0,0 +1,766 @@
+import math
+import numpy as np
+
+from acsl_pychrono.simulation.ode_input import OdeInput
+
+class FlatEllipsoidProjection:
+  """
+  'ProjectionOperator.Ellipsoid.projectionMatrix' applied in place to the derivative of an adaptive
+  gain matrix, with preallocated work arrays. The operations are the same, so is the result.
+  """
+  def __init__(self, shape: tuple[int, int], x_e: np.ndarray, S: np.ndarray, epsilon: float):
+    total_elements = shape[0] * shape[1]
+    self.shape = shape
+    self.x_e = np.asarray(x_e)
+    self.S = np.asarray(S)
+    self.epsilon = epsilon
+    self.x = np.zeros((total_elements, 1))
+    self.x_d = np.zeros((total_elements, 1))
+    self.x_diff = np.zeros((total_elements, 1))
+    self.x_diff_T_S = np.zeros((1, total_elements))
+    self.dh_dx_jacobian = np.zeros((1, total_elements))
+    self.numerator = np.zeros((total_elements, 1))
+    self.scalar = np.zeros((1, 1))
+
+  def apply(self, matrix: np.ndarray, matrix_d: np.ndarray) -> bool:
+    """Project 'matrix_d' in place. Returns True if the projection was activated."""
+    # Column-major (Fortran) flattening, as in 'projectionMatrix'
+    np.copyto(self.x.reshape(self.shape[1], self.shape[0]), matrix.T)
+    np.copyto(self.x_d.reshape(self.shape[1], self.shape[0]), matrix_d.T)
+
+    # Convex function
+    np.subtract(self.x, self.x_e, out=self.x_diff)
+    np.matmul(self.x_diff.T, self.S, out=self.x_diff_T_S)
+    np.matmul(self.x_diff_T_S, self.x_diff, out=self.scalar)
+    h_function = ((1.0 + self.epsilon) * float(self.scalar[0, 0]) - 1.0) / self.epsilon
+    np.multiply((2.0 * (1.0 + self.epsilon) / self.epsilon), self.x_diff_T_S, out=self.dh_dx_jacobian)
+
+    np.matmul(self.dh_dx_jacobian, self.x_d, out=self.scalar)
+    dh_dx_times_x_d = self.scalar[0, 0]
+    if not (h_function > 0 and dh_dx_times_x_d > 0):
+      return False
+
+    np.multiply(h_function, self.dh_dx_jacobian.T, out=self.numerator)
+    self.numerator *= dh_dx_times_x_d
+    np.matmul(self.dh_dx_jacobian, self.dh_dx_jacobian.T, out=self.scalar)
+    self.numerator /= self.scalar[0, 0]
+    self.x_d -= self.numerator
+
+    np.copyto(matrix_d.T, self.x_d.reshape(self.shape[1], self.shape[0]))
+    return True
+
+class BaseFlatMRAC:
+  """
+  Execution path of 'MRAC' and 'TwoLayerMRAC' working on preallocated ndarray views.
+  The ODE state 'y' and its derivative 'dy' are single flat vectors: every state and derivative
+  (e.g., 'K_hat_x_tran', 'K_hat_x_tran_dot') is a view into them, so that no np.matrix reshape,
+  np.block or copy of 'dy' is made at every step. Products are computed in place with 'np.dot'/'np.matmul'
+  and 'out=' into preallocated work arrays, in the same order as in the reference classes, so that
+  the results are identical.
+
+  The state is double buffered: the integration writes the next state into the other buffer,
+  so that the views of the state used in the step (read by the logger) stay valid until the next step.
+  The scalar helpers of the reference classes (outer-loop safety mechanism, 'computeU1RollPitchRef',
+  dead-zone modulation) have flat versions here, and the scalar outputs (e.g., 'u1', 'mu_x') are Python floats,
+  so that no array or NumPy scalar allocated during a step is kept after it.
+
+  Subclasses inherit from 'BaseFlatMRAC' first and from the reference controller class, e.g.
+  'class MRACFlat(BaseFlatMRAC, MRAC)', and are selected by 'controller_kernel = "flat"'.
+  """
+  # Name and shape of the views into 'y', in the order of the states of the reference classes
+  STATE_LAYOUT = [
+    ("state_phi_ref_diff", (2, 1)),             # State of the differentiator for phi_ref (roll_ref)
+    ("state_theta_ref_diff", (2, 1)),           # State of the differentiator for theta_ref (pitch_ref)
+    ("x_ref_tran", (6, 1)),                     # Reference model state
+    ("integral_position_tracking_ref", (3, 1)), # Integral of ('translational_position_in_I_ref' - 'translational_position_in_I_user')
+    ("K_hat_x_tran", (6, 3)),                   # \hat{K}_x (translational)
+    ("K_hat_r_tran", (3, 3)),                   # \hat{K}_r (translational)
+    ("Theta_hat_tran", (6, 3)),                 # \hat{\Theta} (translational)
+    ("omega_ref", (3, 1)),                      # Reference model rotational dynamics
+    ("K_hat_x_rot", (3, 3)),                    # \hat{K}_x (rotational)
+    ("K_hat_r_rot", (3, 3)),                    # \hat{K}_r (rotational)
+    ("Theta_hat_rot", (6, 3)),                  # \hat{\Theta} (rotational)
+    ("integral_e_rot", (3, 1)),                 # Integral of 'e_rot' = (angular_velocity - omega_ref)
+    ("integral_angular_error", (3, 1)),         # Integral of angular_error = attitude - attitude_ref
+    ("integral_e_omega_ref_cmd", (3, 1)),       # Integral of (omega_ref - omega_cmd)
+  ]
+  TWO_LAYER_STATE_LAYOUT = [
+    ("K_hat_g_tran", (6, 3)),                   # \hat{K}_g translational (Two-layer)
+    ("K_hat_g_rot", (3, 3)),                    # \hat{K}_g rotational (Two-layer)
+  ]
+  # True for the two-layer MRAC ('K_hat_g' adaptive gains)
+  two_layer = False
+
+  def __init__(self, gains, ode_input: OdeInput, flight_params, timestep: float):
+    super().__init__(gains, ode_input, flight_params, timestep)
+    self.layout = self.STATE_LAYOUT + (self.TWO_LAYER_STATE_LAYOUT if self.two_layer else [])
+    if sum(rows * cols for _, (rows, cols) in self.layout) != self.gains.number_of_states:
+      raise ValueError(f"The flat state layout does not match the {self.gains.number_of_states} states of the controller.")
+
+    # Double-buffered state, with the views of each buffer
+    self.y_buffers = [self.y, np.zeros_like(self.y)]
+    self.current_buffer = 0
+    self.state_views = [self.createViews(y, "") for y in self.y_buffers]
+    for views in self.state_views:
+      views["translational_position_in_I_ref"] = views["x_ref_tran"][0:3]
+      views["x_ref_tran_velocity"] = views["x_ref_tran"][3:6]
+
+    # Views of the derivative, named after the quantities of the reference classes written into 'dy'
+    derivative_views = self.createViews(self.dy, "_dot")
+    self.internal_state_differentiator_phi_ref_diff = derivative_views["state_phi_ref_diff_dot"]
+    self.internal_state_differentiator_theta_ref_diff = derivative_views["state_theta_ref_diff_dot"]
+    self.x_ref_tran_dot = derivative_views["x_ref_tran_dot"]
+    self.x_ref_tran_dot_velocity = self.x_ref_tran_dot[3:6]
+    self.integral_position_tracking_ref_dot = derivative_views["integral_position_tracking_ref_dot"]
+    self.K_hat_x_tran_dot = derivative_views["K_hat_x_tran_dot"]
+    self.K_hat_r_tran_dot = derivative_views["K_hat_r_tran_dot"]
+    self.Theta_hat_tran_dot = derivative_views["Theta_hat_tran_dot"]
+    self.omega_ref_dot = derivative_views["omega_ref_dot"]
+    self.K_hat_x_rot_dot = derivative_views["K_hat_x_rot_dot"]
+    self.K_hat_r_rot_dot = derivative_views["K_hat_r_rot_dot"]
+    self.Theta_hat_rot_dot = derivative_views["Theta_hat_rot_dot"]
+    self.e_rot = derivative_views["integral_e_rot_dot"]
+    self.angular_error = derivative_views["integral_angular_error_dot"]
+    self.integral_e_omega_ref_cmd_dot = derivative_views["integral_e_omega_ref_cmd_dot"]
+    if self.two_layer:
+      self.K_hat_g_tran_dot = derivative_views["K_hat_g_tran_dot"]
+      self.K_hat_g_rot_dot = derivative_views["K_hat_g_rot_dot"]
+
+    self.allocateWorkArrays()
+    self.prepareGains()
+
+  def createViews(self, vector: np.ndarray, suffix: str) -> dict[str, np.ndarray]:
+    """Views of the flat (number_of_states x 1) vector, following 'self.layout'."""
+    views = {}
+    start = 0
+    for name, (rows, cols) in self.layout:
+      views[name + suffix] = vector[start:start + rows * cols].reshape(rows, cols)
+      start += rows * cols
+    return views
+
+  def allocateWorkArrays(self):
+    # Outer loop
+    self.x_tran = np.zeros((6, 1))
+    self.e_tran = np.zeros((6, 1))
+    self.r_tran = np.zeros((3, 1))
+    # Regressor vector: [mu_PD_baseline_tran; Phi_adaptive_tran]
+    self.Phi_adaptive_tran_augmented = np.zeros((6, 1))
+    self.mu_PD_baseline_tran = self.Phi_adaptive_tran_augmented[0:3]
+    self.Phi_adaptive_tran = self.Phi_adaptive_tran_augmented[3:6]
+    self.mu_adaptive_tran = np.zeros((3, 1))
+    self.mu_tran_raw = np.zeros((3, 1))
+    self.R3 = np.identity(3)
+    self.R2 = np.identity(3)
+    self.R1 = np.identity(3)
+    self.R3_R2 = np.zeros((3, 3))
+    self.R_from_loc_to_glob = np.zeros((3, 3))
+    self.translational_velocity_in_J = np.zeros((3, 1))
+    self.translational_velocity_in_J_flat = self.translational_velocity_in_J.reshape(3)
+
+    # Thrust and attitude reference: [sin(yaw_ref)], [cos(yaw_ref)], arctan2 outputs
+    self.sin_yaw_ref = np.zeros(1)
+    self.cos_yaw_ref = np.zeros(1)
+    self.arctan2_output = np.zeros(1)
+
+    # Inner loop
+    self.angular_velocity = np.zeros((3, 1))
+    self.one_by_one = np.zeros((1, 1))
+    self.differentiator_input = np.zeros((2, 1))
+    self.angular_position_ref_dot = np.zeros((3, 1))
+    self.angular_position_ref_ddot = np.zeros((3, 1))
+    self.Jacobian_matrix_inverse = np.identity(3)
+    self.Jacobian_matrix = np.identity(3)
+    self.Jacobian_matrix_dot = np.zeros((3, 3))
+    self.angular_position_dot = np.zeros((3, 1))
+    self.angular_error_dot = np.zeros((3, 1))
+    self.omega_cmd_input = np.zeros((3, 1))
+    self.omega_cmd_dot_input = np.zeros((3, 1))
+    self.omega_cmd = np.zeros((3, 1))
+    self.omega_cmd_dot = np.zeros((3, 1))
+    self.omega_error = np.zeros((3, 1))
+    self.r_rot = np.zeros((3, 1))
+    # Regressor vector: [Moment_baseline_PI; Phi_adaptive_rot]
+    self.Phi_adaptive_rot_augmented = np.zeros((6, 1))
+    self.Moment_baseline_PI = self.Phi_adaptive_rot_augmented[0:3]
+    self.Phi_adaptive_rot = self.Phi_adaptive_rot_augmented[3:6]
+    self.I_times_angular_velocity = np.zeros((3, 1))
+    self.Moment_baseline = np.zeros((3, 1))
+    self.Moment_adaptive = np.zeros((3, 1))
+    self.Moment = np.zeros((3, 1))
+    self.U = np.zeros(4)
+    self.motor_thrusts_buffer = np.zeros(self.fp.uav.number_of_propellers)
+    self.motor_thrusts_column = self.motor_thrusts_buffer.reshape(-1, 1)
+
+    # Products, shared by the computations of a loop
+    self.product_3 = np.zeros((3, 1))
+    self.product_3_b = np.zeros((3, 1))
+    self.product_6 = np.zeros((6, 1))
+    self.product_6_b = np.zeros((6, 1))
+
+    # Adaptive laws of each loop (e^T*P*B and classic/update terms of each adaptive gain)
+    self.eT_P = {"tran": np.zeros((1, 6)), "rot": np.zeros((1, 3))}
+    self.eTranspose_P_B = {"tran": np.zeros((1, 3)), "rot": np.zeros((1, 3))}
+    self.eTranspose_P_B_flat = {loop: vector.reshape(-1) for loop, vector in self.eTranspose_P_B.items()}
+    self.e_tran_flat = self.e_tran.reshape(-1)
+    self.e_rot_flat = self.e_rot.reshape(-1)
+    self.mu_tran_raw_flat = self.mu_tran_raw.reshape(-1)
+    self.scaled_Gamma = {}
+    self.update_term = {}
+    self.emod_term = {}
+
+    # Rk4 sums of the (held) derivative, and derivatives of the stages of the classic RK4 ("rk4")
+    self.twice_dy = np.zeros_like(self.dy)
+    self.rk4_increment = np.zeros_like(self.dy)
+    self.rk4_stage_derivatives = [np.zeros_like(self.dy) for _ in range(4)]
+
+  def prepareGains(self):
+    """ndarray copies of the gains used at every step, with the adaptive rates of the laws as in 'M_MRAC'."""
+    g = self.gains
+    self.KP_tran = np.asarray(g.KP_tran)
+    self.KD_tran = np.asarray(g.KD_tran)
+    self.KI_tran = np.asarray(g.KI_tran)
+    self.KP_tran_PD_baseline = np.asarray(g.KP_tran_PD_baseline)
+    self.KD_tran_PD_baseline = np.asarray(g.KD_tran_PD_baseline)
+    self.KP_rot = np.asarray(g.KP_rot)
+    self.KI_rot = np.asarray(g.KI_rot)
+    self.KP_rot_PI_baseline = np.asarray(g.KP_rot_PI_baseline)
+    self.KI_rot_PI_baseline = np.asarray(g.KI_rot_PI_baseline)
+    self.K_P_omega_ref = np.asarray(g.K_P_omega_ref)
+    self.K_I_omega_ref = np.asarray(g.K_I_omega_ref)
+    self.A_ref_tran = np.asarray(g.A_ref_tran)
+    self.B_ref_tran = np.asarray(g.B_ref_tran)
+    self.I_matrix_estimated = np.asarray(g.I_matrix_estimated)
+    self.P = {"tran": np.asarray(g.P_tran), "rot": np.asarray(g.P_rot)}
+    self.B = {"tran": np.asarray(g.B_tran), "rot": np.asarray(g.B_rot)}
+
+    uc = self.fp.uav_controller
+    self.A_phi_ref = np.asarray(uc.A_phi_ref)
+    self.B_phi_ref = np.asarray(uc.B_phi_ref)
+    self.C_phi_ref = np.asarray(uc.C_phi_ref)
+    self.A_theta_ref = np.asarray(uc.A_theta_ref)
+    self.B_theta_ref = np.asarray(uc.B_theta_ref)
+    self.C_theta_ref = np.asarray(uc.C_theta_ref)
+    self.U_mat_inv = np.asarray(self.fp.uav.U_mat_inv)
+
+    # Adaptive laws: (adaptive gain, loop, rate, sign of the rate, e-modification gain)
+    # The signs are those of 'M_MRAC.computeAllRobustAdaptiveLaws' and 'M_TwoLayerMRAC.computeAllRobustAdaptiveLaws'
+    self.adaptive_laws = [
+      ("K_hat_x_tran", "tran", g.Gamma_x_tran, -1, g.sigma_x_tran),
+      ("K_hat_r_tran", "tran", g.Gamma_r_tran, -1, g.sigma_r_tran),
+      ("Theta_hat_tran", "tran", g.Gamma_Theta_tran, 1, g.sigma_Theta_tran),
+      ("K_hat_x_rot", "rot", g.Gamma_x_rot, -1, g.sigma_x_rot),
+      ("K_hat_r_rot", "rot", g.Gamma_r_rot, -1, g.sigma_r_rot),
+      ("Theta_hat_rot", "rot", g.Gamma_Theta_rot, 1, g.sigma_Theta_rot),
+    ]
+    if self.two_layer:
+      self.adaptive_laws += [
+        ("K_hat_g_tran", "tran", g.Gamma_g_tran, -1, g.sigma_g_tran),
+        ("K_hat_g_rot", "rot", g.Gamma_g_rot, -1, g.sigma_g_rot),
+      ]
+
+    self.signed_Gamma = {}
+    self.projections = {}
+    for name, _, Gamma, sign, _ in self.adaptive_laws:
+      shape = getattr(self, name + "_dot").shape
+      self.signed_Gamma[name] = np.asarray(-Gamma if sign < 0 else Gamma)
+      self.scaled_Gamma[name] = np.zeros(self.signed_Gamma[name].shape)
+      self.update_term[name] = np.zeros(shape)
+      self.emod_term[name] = np.zeros(shape)
+      if g.use_projection_operator:
+        suffix = name.replace("K_hat_", "").replace("_hat", "")
+        self.projections[name] = FlatEllipsoidProjection(
+          shape, getattr(g, f"x_e_{suffix}"), getattr(g, f"S_{suffix}"), getattr(g, f"epsilon_{suffix}")
+        )
+
+    # Adaptive laws of each loop, with their regressor (pi) vectors and preallocated terms:
+    # (adaptive gain, name of its projection flag, derivative view, pi vector, update term, e-modification term,
+    #  scaled rate, signed rate, e-modification gain, projection or None)
+    pi_vectors = {
+      "K_hat_x_tran": self.x_tran,
+      "K_hat_r_tran": self.r_tran,
+      "Theta_hat_tran": self.Phi_adaptive_tran_augmented,
+      "K_hat_g_tran": self.e_tran,
+      "K_hat_x_rot": self.angular_velocity,
+      "K_hat_r_rot": self.r_rot,
+      "Theta_hat_rot": self.Phi_adaptive_rot_augmented,
+      "K_hat_g_rot": self.e_rot,
+    }
+    self.loop_laws = {"tran": [], "rot": []}
+    for name, loop, _, _, sigma in self.adaptive_laws:
+      self.loop_laws[loop].append((
+        name, "proj_op_activated_" + name, getattr(self, name + "_dot"), pi_vectors[name],
+        self.update_term[name], self.emod_term[name], self.scaled_Gamma[name], self.signed_Gamma[name],
+        sigma, self.projections.get(name)
+      ))
+
+    # Dead-zone modulation of each loop: (delta, e_0)
+    self.dead_zone = {
+      "tran": (g.dead_zone_delta_tran, g.dead_zone_e0_tran),
+      "rot": (g.dead_zone_delta_rot, g.dead_zone_e0_rot),
+    }
+
+    # Constants of 'OuterLoopSafetyMechanism.apply' and 'Control.computeU1RollPitchRef'
+    self.weight = g.mass_total_estimated * self.fp.uav.G_acc
+    if g.use_safety_mechanism:
+      self.thrust_margin = g.maximumThrust**2 - self.weight**2
+      self.tan_maximum_pitch_angle = np.tan(g.maximumPitchAngle)
+      self.tan_maximum_roll_angle = np.tan(g.maximumRollAngle)
+
+  def bindStateViews(self):
+    """Point the state attributes (e.g., 'self.K_hat_x_tran') to the views of the current state buffer."""
+    if self.y is not self.y_buffers[self.current_buffer]:
+      # The state was replaced from outside (e.g., initial conditions): copy it into the current buffer
+      np.copyto(self.y_buffers[self.current_buffer], self.y)
+      self.y = self.y_buffers[self.current_buffer]
+    for name, view in self.state_views[self.current_buffer].items():
+      setattr(self, name, view)
+
+  def computeControlAlgorithm(self, ode_input: OdeInput):
+    """
+    Same algorithm as the reference classes, writing the derivative of the state into 'dy' directly.
+    """
+    self.odein = ode_input
+    odein = ode_input
+    g = self.gains
+
+    self.bindStateViews()
+    np.copyto(self.angular_velocity, odein.angular_velocity)
+
+    # Trajectory tracking errors
+    self.x_tran[0:3] = odein.translational_position_in_I
+    self.x_tran[3:6] = odein.translational_velocity_in_I
+    np.subtract(self.x_tran, self.x_ref_tran, out=self.e_tran)
+    np.subtract(odein.angular_velocity, self.omega_ref, out=self.e_rot)
+
+    # Reference command input outer loop
+    np.dot(self.KI_tran, self.integral_position_tracking_ref, out=self.product_3)
+    np.subtract(odein.translational_acceleration_in_I_user, self.product_3, out=self.r_tran)
+    np.dot(self.KP_tran, odein.translational_position_in_I_user, out=self.product_3)
+    self.r_tran += self.product_3
+    np.dot(self.KD_tran, odein.translational_velocity_in_I_user, out=self.product_3)
+    self.r_tran += self.product_3
+    np.multiply(g.mass_total_estimated, self.r_tran, out=self.r_tran)
+
+    # Reference model outer loop
+    np.dot(self.A_ref_tran, self.x_ref_tran, out=self.x_ref_tran_dot)
+    np.dot(self.B_ref_tran, self.r_tran, out=self.product_6)
+    self.x_ref_tran_dot += self.product_6
+
+    # PD baseline outer loop
+    np.subtract(odein.translational_position_in_I, self.translational_position_in_I_ref, out=self.product_3_b)
+    np.dot(self.KP_tran_PD_baseline, self.product_3_b, out=self.mu_PD_baseline_tran)
+    np.subtract(odein.translational_velocity_in_I, self.x_ref_tran_velocity, out=self.product_3_b)
+    np.dot(self.KD_tran_PD_baseline, self.product_3_b, out=self.product_3)
+    self.mu_PD_baseline_tran += self.product_3
+    self.mu_PD_baseline_tran -= self.x_ref_tran_dot_velocity
+    np.multiply(-g.mass_total_estimated, self.mu_PD_baseline_tran, out=self.mu_PD_baseline_tran)
+
+    self.computeRegressorVectorOuterLoop()
+
+    # Adaptive control law outer loop
+    self.computeAdaptiveControlLaw(
+      self.mu_adaptive_tran,
+      self.K_hat_x_tran, self.x_tran,
+      self.K_hat_r_tran, self.r_tran,
+      self.Theta_hat_tran, self.Phi_adaptive_tran_augmented,
+      self.K_hat_g_tran if self.two_layer else None, self.e_tran
+    )
+    if self.two_layer:
+      self.mu_adaptive_mrac_tran = self.mu_adaptive_tran
+    np.add(self.mu_PD_baseline_tran, self.mu_adaptive_tran, out=self.mu_tran_raw)
+
+    # Adaptive laws outer loop
+    self.dead_zone_value_tran = self.deadZoneModulation("tran", self.e_tran_flat)
+    self.updateAdaptiveLaws("tran", self.e_tran, self.dead_zone_value_tran)
+
+    # Outer Loop Safety Mechanism
+    self.applySafetyMechanism()
+
+    # Compute total thrust, desired roll angle, desired pitch angle
+    self.computeU1RollPitchRef(odein.yaw_ref)
+
+    self.computeAngularReferenceSignals()
+    self.computeAngularErrorAndDerivative()
+    self.computeOmegaCmdAndOmegaCmdDotInnerLoop()
+
+    # Reference model inner loop
+    np.subtract(self.omega_ref, self.omega_cmd, out=self.omega_error)
+    np.dot(self.K_P_omega_ref, self.omega_error, out=self.product_3)
+    np.dot(self.K_I_omega_ref, self.integral_e_omega_ref_cmd, out=self.product_3_b)
+    self.product_3 += self.product_3_b
+    np.subtract(self.omega_cmd_dot, self.product_3, out=self.omega_ref_dot)
+
+    # Reference command input inner loop
+    np.dot(self.K_P_omega_ref, self.omega_cmd, out=self.r_rot)
+    self.r_rot -= self.product_3_b
+    self.r_rot += self.omega_cmd_dot
+
+    # PI baseline inner loop
+    np.dot(self.KP_rot_PI_baseline, self.e_rot, out=self.product_3)
+    np.dot(self.KI_rot_PI_baseline, self.integral_e_rot, out=self.product_3_b)
+    self.product_3 += self.product_3_b
+    self.product_3 -= self.omega_ref_dot
+    np.dot(self.I_matrix_estimated, self.product_3, out=self.Moment_baseline_PI)
+    np.negative(self.Moment_baseline_PI, out=self.Moment_baseline_PI)
+
+    # Regressor vector inner loop
+    angular_velocity = self.angular_velocity
+    w0 = angular_velocity[0, 0]
+    w1 = angular_velocity[1, 0]
+    w2 = angular_velocity[2, 0]
+    self.Phi_adaptive_rot[0, 0] = w1 * w2
+    self.Phi_adaptive_rot[1, 0] = w0 * w2
+    self.Phi_adaptive_rot[2, 0] = w0 * w1
+
+    # Adaptive laws inner loop
+    self.dead_zone_value_rot = self.deadZoneModulation("rot", self.e_rot_flat)
+    self.updateAdaptiveLaws("rot", self.e_rot, self.dead_zone_value_rot)
+
+    # Moment baseline: angular_velocity x (I * angular_velocity), as in 'np.cross'
+    np.dot(self.I_matrix_estimated, angular_velocity, out=self.I_times_angular_velocity)
+    Iw0 = self.I_times_angular_velocity[0, 0]
+    Iw1 = self.I_times_angular_velocity[1, 0]
+    Iw2 = self.I_times_angular_velocity[2, 0]
+    self.Moment_baseline[0, 0] = w1 * Iw2 - w2 * Iw1
+    self.Moment_baseline[1, 0] = w2 * Iw0 - w0 * Iw2
+    self.Moment_baseline[2, 0] = w0 * Iw1 - w1 * Iw0
+
+    # Adaptive control law inner loop
+    self.computeAdaptiveControlLaw(
+      self.Moment_adaptive,
+      self.K_hat_x_rot, angular_velocity,
+      self.K_hat_r_rot, self.r_rot,
+      self.Theta_hat_rot, self.Phi_adaptive_rot_augmented,
+      self.K_hat_g_rot if self.two_layer else None, self.e_rot
+    )
+    if self.two_layer:
+      self.Moment_adaptive_mrac = self.Moment_adaptive
+
+    np.add(self.Moment_baseline_PI, self.Moment_baseline, out=self.Moment)
+    self.Moment += self.Moment_adaptive
+    self.u2 = self.Moment.item(0)
+    self.u3 = self.Moment.item(1)
+    self.u4 = self.Moment.item(2)
+
+    # Compute individual motor thrusts
+    self.U[0] = self.u1
+    self.U[1] = self.u2
+    self.U[2] = self.u3
+    self.U[3] = self.u4
+    np.matmul(self.U_mat_inv, self.U, out=self.motor_thrusts_buffer)
+    self.motor_thrusts = self.motor_thrusts_column
+
+    # Remaining derivatives of the state
+    np.subtract(self.translational_position_in_I_ref, odein.translational_position_in_I_user, out=self.integral_position_tracking_ref_dot)
+    np.subtract(self.omega_ref, self.omega_cmd, out=self.integral_e_omega_ref_cmd_dot)
+
+  def computeRegressorVectorOuterLoop(self):
+    odein = self.odein
+    cos_roll = math.cos(odein.roll)
+    sin_roll = math.sin(odein.roll)
+    cos_pitch = math.cos(odein.pitch)
+    sin_pitch = math.sin(odein.pitch)
+    cos_yaw = math.cos(odein.yaw)
+    sin_yaw = math.sin(odein.yaw)
+
+    # Rotation matrices, as in 'Control.computeRotationMatrices'
+    self.R3[0, 0] = cos_yaw
+    self.R3[0, 1] = -sin_yaw
+    self.R3[1, 0] = sin_yaw
+    self.R3[1, 1] = cos_yaw
+    self.R2[0, 0] = cos_pitch
+    self.R2[0, 2] = sin_pitch
+    self.R2[2, 0] = -sin_pitch
+    self.R2[2, 2] = cos_pitch
+    self.R1[1, 1] = cos_roll
+    self.R1[1, 2] = -sin_roll
+    self.R1[2, 1] = sin_roll
+    self.R1[2, 2] = cos_roll
+    np.dot(self.R3, self.R2, out=self.R3_R2)
+    np.dot(self.R3_R2, self.R1, out=self.R_from_loc_to_glob)
+
+    np.dot(self.R_from_loc_to_glob.T, odein.translational_velocity_in_I, out=self.translational_velocity_in_J)
+    translational_velocity_in_J_norm = math.sqrt(np.dot(self.translational_velocity_in_J_flat, self.translational_velocity_in_J_flat))
+    np.multiply(-0.5, self.translational_velocity_in_J, out=self.Phi_adaptive_tran)
+    self.Phi_adaptive_tran *= translational_velocity_in_J_norm
+
+  def computeAdaptiveControlLaw(self, out, K_hat_x, x, K_hat_r, r, Theta_hat, Phi, K_hat_g, e):
+    """'M_MRAC.computeControlLaw' (and 'M_TwoLayerMRAC.computeControlLaw' if 'K_hat_g' is given) into 'out'."""
+    np.dot(K_hat_x.T, x, out=out)
+    np.dot(K_hat_r.T, r, out=self.product_3)
+    out += self.product_3
+    np.dot(Theta_hat.T, Phi, out=self.product_3)
+    out -= self.product_3
+    if K_hat_g is not None:
+      np.dot(K_hat_g.T, e, out=self.product_3)
+      out += self.product_3
+
+  def updateAdaptiveLaws(self, loop: str, e: np.ndarray, dead_zone_value: float):
+    """
+    Robust adaptive laws of a loop ('M_MRAC.computeRobustAdaptiveLaw'), written into the views of 'dy',
+    followed by the projection operator (if enabled).
+    """
+    g = self.gains
+    eT_P = self.eT_P[loop]
+    eTranspose_P_B = self.eTranspose_P_B[loop]
+    np.dot(e.T, self.P[loop], out=eT_P)
+    np.dot(eT_P, self.B[loop], out=eTranspose_P_B)
+    eTranspose_P_B_flat = self.eTranspose_P_B_flat[loop]
+    eTranspose_P_B_norm = math.sqrt(np.dot(eTranspose_P_B_flat, eTranspose_P_B_flat))
+
+    modulation_factor = dead_zone_value if g.use_dead_zone_modification else 1.0
+
+    for (name, projection_flag, K_hat_state_dot, pi_vector, update_term, emod_term,
+         scaled_Gamma, signed_Gamma, sigma, projection) in self.loop_laws[loop]:
+      np.dot(pi_vector, eTranspose_P_B, out=update_term)
+      if g.use_e_modification:
+        np.multiply(sigma * eTranspose_P_B_norm, getattr(self, name), out=emod_term)
+        update_term -= emod_term
+      np.multiply(signed_Gamma, modulation_factor, out=scaled_Gamma)
+      np.dot(scaled_Gamma, update_term, out=K_hat_state_dot)
+
+      if projection is not None:
+        setattr(self, projection_flag, projection.apply(getattr(self, name), K_hat_state_dot))
+
+  def deadZoneModulation(self, loop: str, e_flat: np.ndarray) -> float:
+    """'M_MRAC.deadZoneModulationFunction' of the flat error vector of a loop, as a float."""
+    if not self.gains.use_dead_zone_modification:
+      return 1.0
+    delta, e_0 = self.dead_zone[loop]
+    norm_e = math.sqrt(np.dot(e_flat, e_flat))
+    coeff = (norm_e - delta * e_0) / ((1.0 - delta) * e_0)
+    # np.clip(coeff, 0.0, 1.0), NaN kept
+    if coeff < 0.0:
+      return 0.0
+    if coeff > 1.0:
+      return 1.0
+    return float(coeff)
+
+  def applySafetyMechanism(self):
+    """
+    'OuterLoopSafetyMechanism.apply' on 'mu_tran_raw' without the candidate arrays: the smallest non-negative
+    intersection (sphere, elliptic cone, plane) is kept as it is found. Sets 'mu_x', 'mu_y', 'mu_z' (floats).
+    """
+    g = self.gains
+    mu_x_raw = self.mu_tran_raw[0, 0]
+    mu_y_raw = self.mu_tran_raw[1, 0]
+    mu_z_raw = self.mu_tran_raw[2, 0]
+
+    if not g.use_safety_mechanism:
+      self.mu_x = float(mu_x_raw)
+      self.mu_y = float(mu_y_raw)
+      self.mu_z = float(mu_z_raw)
+      return
+
+    weight = self.weight
+    t_value = math.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+      # Mu - sphere intersection
+      mu_norm = math.sqrt(np.dot(self.mu_tran_raw_flat, self.mu_tran_raw_flat))
+      if mu_norm >= g.sphereEpsilon:
+        sphere_root = np.sqrt((mu_z_raw * weight)**2 + mu_norm**2 * self.thrust_margin)
+        t_value = self.smallestIntersection(t_value, (mu_z_raw * weight + sphere_root) / mu_norm**2)
+        t_value = self.smallestIntersection(t_value, (mu_z_raw * weight - sphere_root) / mu_norm**2)
+
+      # Mu - elliptic cone intersection
+      cone_root = np.sqrt((mu_x_raw / self.tan_maximum_pitch_angle)**2 + (mu_y_raw / self.tan_maximum_roll_angle)**2)
+      if abs(mu_z_raw + cone_root) >= g.EllipticConeEpsilon:
+        t_value = self.smallestIntersection(t_value, weight / (mu_z_raw + cone_root))
+      if abs(-mu_z_raw + cone_root) >= g.EllipticConeEpsilon:
+        t_value = self.smallestIntersection(t_value, -weight / (-mu_z_raw + cone_root))
+
+      # Mu - plane intersection
+      if abs(mu_z_raw) >= g.planeEpsilon:
+        t_value = self.smallestIntersection(t_value, g.alphaPlane * weight / mu_z_raw)
+
+    # No intersection: mu_tran_raw is left unscaled
+    if not t_value <= 1:
+      t_value = 1.0
+    self.mu_x = float(t_value * mu_x_raw)
+    self.mu_y = float(t_value * mu_y_raw)
+    self.mu_z = float(t_value * mu_z_raw)
+
+  @staticmethod
+  def smallestIntersection(t_value, candidate):
+    """Smaller of 't_value' and 'candidate', skipping the negative and NaN candidates (as 'np.fmin.reduce')."""
+    if candidate >= 0 and not t_value <= candidate:
+      return candidate
+    return t_value
+
+  def computeU1RollPitchRef(self, yaw_ref: float):
+    """
+    'Control.computeU1RollPitchRef' on 'mu_x', 'mu_y', 'mu_z' with the trigonometric functions written into
+    preallocated arrays. Sets 'u1', 'roll_ref', 'pitch_ref' (floats).
+    """
+    mu_x = self.mu_x
+    mu_y = self.mu_y
+    vertical = self.weight - self.mu_z
+    np.sin(yaw_ref, out=self.sin_yaw_ref)
+    np.cos(yaw_ref, out=self.cos_yaw_ref)
+    sin_yaw_ref = self.sin_yaw_ref.item(0)
+    cos_yaw_ref = self.cos_yaw_ref.item(0)
+
+    self.u1 = math.sqrt(mu_x ** 2 + mu_y ** 2 + vertical ** 2)
+
+    calculation_var_A = -(1 / self.u1) * (mu_x * sin_yaw_ref - mu_y * cos_yaw_ref)
+    np.arctan2(calculation_var_A, math.sqrt(1 - calculation_var_A ** 2), out=self.arctan2_output)
+    self.roll_ref = self.arctan2_output.item(0)
+
+    np.arctan2(-(mu_x * cos_yaw_ref + mu_y * sin_yaw_ref), vertical, out=self.arctan2_output)
+    self.pitch_ref = self.arctan2_output.item(0)
+
+  def computeAngularReferenceSignals(self):
+    """'Control.computeAngularReferenceSignals' with the internal states written into 'dy'."""
+    np.dot(self.A_phi_ref, self.state_phi_ref_diff, out=self.internal_state_differentiator_phi_ref_diff)
+    np.multiply(self.B_phi_ref, self.roll_ref, out=self.differentiator_input)
+    self.internal_state_differentiator_phi_ref_diff += self.differentiator_input
+    np.dot(self.A_theta_ref, self.state_theta_ref_diff, out=self.internal_state_differentiator_theta_ref_diff)
+    np.multiply(self.B_theta_ref, self.pitch_ref, out=self.differentiator_input)
+    self.internal_state_differentiator_theta_ref_diff += self.differentiator_input
+
+    np.dot(self.C_phi_ref, self.state_phi_ref_diff, out=self.one_by_one)
+    self.angular_position_ref_dot[0, 0] = self.one_by_one[0, 0]
+    np.dot(self.C_theta_ref, self.state_theta_ref_diff, out=self.one_by_one)
+    self.angular_position_ref_dot[1, 0] = self.one_by_one[0, 0]
+    self.angular_position_ref_dot[2, 0] = self.odein.yaw_ref_dot
+
+    np.dot(self.C_phi_ref, self.internal_state_differentiator_phi_ref_diff, out=self.one_by_one)
+    self.angular_position_ref_ddot[0, 0] = self.one_by_one[0, 0]
+    np.dot(self.C_theta_ref, self.internal_state_differentiator_theta_ref_diff, out=self.one_by_one)
+    self.angular_position_ref_ddot[1, 0] = self.one_by_one[0, 0]
+    self.angular_position_ref_ddot[2, 0] = self.odein.yaw_ref_ddot
+
+  def computeAngularErrorAndDerivative(self):
+    """'Control.computeAngularErrorAndDerivative' with the angular error written into 'dy'."""
+    odein = self.odein
+    yaw_error = ((odein.yaw - odein.yaw_ref + math.pi) % (2 * math.pi)) - math.pi
+    self.angular_error[0, 0] = odein.roll - self.roll_ref
+    self.angular_error[1, 0] = odein.pitch - self.pitch_ref
+    self.angular_error[2, 0] = yaw_error
+
+    cos_pitch = math.cos(odein.pitch)
+    if abs(cos_pitch) < 1e-6:
+      raise ValueError("Pitch angle too close to ±90°, Jacobian is singular.")
+    sin_roll = math.sin(odein.roll)
+    cos_roll = math.cos(odein.roll)
+    sin_pitch = math.sin(odein.pitch)
+
+    J_inv = self.Jacobian_matrix_inverse
+    J_inv[0, 1] = (sin_roll * sin_pitch) / cos_pitch
+    J_inv[0, 2] = (cos_roll * sin_pitch) / cos_pitch
+    J_inv[1, 1] = cos_roll
+    J_inv[1, 2] = -sin_roll
+    J_inv[2, 1] = sin_roll / cos_pitch
+    J_inv[2, 2] = cos_roll / cos_pitch
+
+    np.dot(J_inv, odein.angular_velocity, out=self.angular_position_dot)
+    np.subtract(self.angular_position_dot, self.angular_position_ref_dot, out=self.angular_error_dot)
+
+  def computeOmegaCmdAndOmegaCmdDotInnerLoop(self):
+    """'BaseMRAC.computeOmegaCmdAndOmegaCmdDotInnerLoop' with preallocated Jacobians."""
+    odein = self.odein
+    sin_roll = math.sin(odein.roll)
+    cos_roll = math.cos(odein.roll)
+    sin_pitch = math.sin(odein.pitch)
+    cos_pitch = math.cos(odein.pitch)
+    roll_dot = self.angular_position_dot[0, 0]
+    pitch_dot = self.angular_position_dot[1, 0]
+
+    J = self.Jacobian_matrix
+    J[0, 2] = -sin_pitch
+    J[1, 1] = cos_roll
+    J[1, 2] = sin_roll * cos_pitch
+    J[2, 1] = -sin_roll
+    J[2, 2] = cos_roll * cos_pitch
+
+    J_dot = self.Jacobian_matrix_dot
+    J_dot[0, 2] = -cos_pitch * pitch_dot
+    J_dot[1, 1] = -sin_roll * roll_dot
+    J_dot[1, 2] = cos_roll * cos_pitch * roll_dot - sin_roll * sin_pitch * pitch_dot
+    J_dot[2, 1] = -cos_roll * roll_dot
+    J_dot[2, 2] = -cos_pitch * sin_roll * roll_dot - cos_roll * sin_pitch * pitch_dot
+
+    # -KP_rot * angular_error - KI_rot * integral_angular_error + angular_position_ref_dot
+    np.dot(self.KP_rot, self.angular_error, out=self.product_3)
+    np.dot(self.KI_rot, self.integral_angular_error, out=self.product_3_b)
+    self.product_3 += self.product_3_b
+    np.subtract(self.angular_position_ref_dot, self.product_3, out=self.omega_cmd_input)
+
+    # -KP_rot * angular_error_dot - KI_rot * angular_error + angular_position_ref_ddot
+    np.dot(self.KP_rot, self.angular_error_dot, out=self.product_3)
+    np.dot(self.KI_rot, self.angular_error, out=self.product_3_b)
+    self.product_3 += self.product_3_b
+    np.subtract(self.angular_position_ref_ddot, self.product_3, out=self.omega_cmd_dot_input)
+
+    np.dot(J, self.omega_cmd_input, out=self.omega_cmd)
+    np.dot(J_dot, self.omega_cmd_input, out=self.omega_cmd_dot)
+    np.dot(J, self.omega_cmd_dot_input, out=self.product_3)
+    self.omega_cmd_dot += self.product_3
+
+  def ode(self, t, y):
+    """The derivative is written into 'dy' by 'computeControlAlgorithm' (no copy is returned)."""
+    return self.dy
+
+  def integrateODEOneStepRK4(self):
+    """
+    "held_rk4": same update as 'rk4singlestep' with the derivative held over the step,
+    y + (dt/6) * (dy + 2*dy + 2*dy + dy), and "euler": y + dt * dy, both written into the other state buffer.
+    The other integrators are those of 'Control'.
+    """
+    if self.integrator == "held_rk4":
+      np.multiply(2, self.dy, out=self.twice_dy)
+      np.add(self.dy, self.twice_dy, out=self.rk4_increment)
+      self.rk4_increment += self.twice_dy
+      self.rk4_increment += self.dy
+      self.rk4_increment *= (self.timestep / 6)
+    elif self.integrator == "euler":
+      np.multiply(self.timestep, self.dy, out=self.rk4_increment)
+    else:
+      super().integrateODEOneStepRK4()
+      return
+
+    next_buffer = 1 - self.current_buffer
+    np.add(self.y, self.rk4_increment, out=self.y_buffers[next_buffer])
+    self.current_buffer = next_buffer
+    self.y = self.y_buffers[next_buffer]
+
+  def integrateRK4Stages(self):
+    """
+    Classic RK4 ("rk4"), in the order of operations of 'rk4singlestep', with preallocated stage derivatives:
+    each stage is evaluated on the other state buffer, so that the state of the start of the step is kept.
+    """
+    dt = self.timestep
+    y_start = self.y
+    k1, k2, k3, k4 = self.rk4_stage_derivatives
+    np.copyto(k1, self.dy)
+    self.evaluateStage(y_start, dt / 2, k1, k2)
+    self.evaluateStage(y_start, dt / 2, k2, k3)
+    self.evaluateStage(y_start, dt, k3, k4)
+
+    # (dt / 6) * (k1 + 2 * k2 + 2 * k3 + k4)
+    np.multiply(2, k2, out=self.twice_dy)
+    np.add(k1, self.twice_dy, out=self.rk4_increment)
+    np.multiply(2, k3, out=self.twice_dy)
+    self.rk4_increment += self.twice_dy
+    self.rk4_increment += k4
+    np.multiply((dt / 6), self.rk4_increment, out=self.rk4_increment)
+
+    # The quantities of the start of the step (motor thrusts, logged values) were overwritten by the stages
+    self.computeControlAlgorithm(self.odein)
+
+    next_buffer = 1 - self.current_buffer
+    np.add(y_start, self.rk4_increment, out=self.y_buffers[next_buffer])
+    self.current_buffer = next_buffer
+    self.y = self.y_buffers[next_buffer]
+
+  def evaluateStage(self, y_start: np.ndarray, step: float, k_previous: np.ndarray, k_stage: np.ndarray):
+    """Derivative of the RK4 stage at 'y_start + step * k_previous', written into 'k_stage'."""
+    stage_buffer = 1 - self.current_buffer
+    np.multiply(step, k_previous, out=self.rk4_increment)
+    np.add(y_start, self.rk4_increment, out=self.y_buffers[stage_buffer])
+    self.current_buffer = stage_buffer
+    self.y = self.y_buffers[stage_buffer]
+    self.computeControlAlgorithm(self.odein)
+    np.copyto(k_stage, self.dy)
+    self.current_buffer = 1 - stage_buffer
+    self.y = y_start
@@ -0,0 +1,137 @@
+from abc import ABC, abstractmethod
+import numpy as np
+from acsl_pychrono.control.log_buffer import LogBuffer
+from acsl_pychrono.control.log_sinks import BaseLogSink
+from acsl_pychrono.control.logging_profile import LoggingProfile, TIME_GROUP
+
+class BaseLogger(ABC):
+  """
+  Common storage of the controller loggers.
+  The layout of the log dictionary is defined once by 'buildDictionary', which is given an accessor
+  that maps a column index of the logged row to the exported data. The same method is used to find
+  the columns of each top-level group, so that a 'LoggingProfile' can store only the selected groups,
+  each one decimated to its own rate.
+  If a 'log_sink' is given, the rows are flushed to it in chunks during the run.
+  """
+  def __init__(
+    self,
+    size_DATA: int,
+    timestep: float,
+    expected_rows: int = 0,
+    logging_profile: LoggingProfile | None = None,
+    log_sink: BaseLogSink | None = None
+  ):
+    # Length of the array vector that will be exported
+    self.size_DATA = size_DATA
+    self.logging_profile = logging_profile if logging_profile is not None else LoggingProfile()
+    # Number of calls of 'nextRow', i.e. of control steps
+    self.step_count = 0
+
+    # Nested dictionary of the column indices of the logged row, i.e. the layout of the log dictionary
+    layout = self.buildDictionary(lambda column: column)
+
+    if self.logging_profile.logsEverything:
+      self.buffer = LogBuffer(size_DATA, expected_rows, sink=log_sink)
+      self.openSink(log_sink, layout, list(range(size_DATA)))
+      return
+
+    # Columns of the logged row used by each top-level group of the log dictionary
+    group_columns = {group: sorted(set(BaseLogger.leaves(value))) for group, value in layout.items()}
+    for group in self.logging_profile.group_rates:
+      if group not in group_columns:
+        raise ValueError(f"Unknown logging group: {group}. Available groups: {list(group_columns)}")
+
+    self.groups = [group for group in self.logging_profile.group_rates if group != TIME_GROUP]
+    self.decimation_steps = np.array(
+      [self.logging_profile.decimationSteps(group, timestep) for group in self.groups], dtype=int
+    )
+
+    # Only the columns of the selected groups are stored
+    stored_columns = set(group_columns[TIME_GROUP])
+    for group in self.groups:
+      stored_columns.update(group_columns[group])
+    self.stored_columns = np.array(sorted(stored_columns), dtype=int)
+    self.stored_index = {column: i for i, column in enumerate(self.stored_columns.tolist())}
+
+    # Stored columns written by each group, to blank (NaN) the groups that are not due in a stored row
+    self.group_masks = np.zeros((len(self.groups), self.stored_columns.size), dtype=bool)
+    for i, group in enumerate(self.groups):
+      self.group_masks[i, [self.stored_index[column] for column in group_columns[group]]] = True
+    self.time_mask = np.zeros(self.stored_columns.size, dtype=bool)
+    self.time_mask[[self.stored_index[column] for column in group_columns[TIME_GROUP]]] = True
+    self.due_groups = np.ones(len(self.groups), dtype=bool)
+
+    # Full-width row reused at every step, from which the stored columns are picked
+    self.scratch_row = np.zeros(size_DATA)
+    fastest = int(self.decimation_steps.min()) if self.groups else 1
+    self.buffer = LogBuffer(self.stored_columns.size, expected_rows // fastest + 1, sink=log_sink)
+    self.openSink(log_sink, self.logging_profile.filterDictionary(layout), self.stored_columns.tolist())
+
+  def openSink(self, log_sink: BaseLogSink | None, layout: dict, columns: list[int]):
+    """Give the sink the layout needed to rebuild the log dictionary from the stored columns."""
+    if log_sink is None:
+      return
+    log_sink.open(len(columns), {"logger": type(self).__name__, "layout": layout, "columns": columns})
+
+  def nextRow(self) -> np.ndarray | None:
+    """
+    Return the full-width row to be filled at the current control step,
+    or None if no group of the logging profile is due at this step.
+    """
+    step = self.step_count
+    self.step_count += 1
+    if self.logging_profile.logsEverything:
+      return self.buffer.nextRow()
+
+    np.equal(step % self.decimation_steps, 0, out=self.due_groups)
+    if self.groups and not self.due_groups.any():
+      return None
+    return self.scratch_row
+
+  def storeRow(self, row: np.ndarray):
+    """Store the columns of the selected groups of a filled row (no-op when every group is logged)."""
+    if self.logging_profile.logsEverything:
+      return
+    stored_row = self.buffer.nextRow()
+    np.take(row, self.stored_columns, out=stored_row)
+    if not self.due_groups.all():
+      written = self.time_mask | self.group_masks[self.due_groups].any(axis=0)
+      stored_row[~written] = np.nan
+
+  def flush(self):
+    """Write the rows not yet flushed to the sink, e.g. before exiting (no-op without a sink)."""
+    self.buffer.flush()
+
+  def addFlushListener(self, listener):
+    """
+    Call 'listener(log_dict)' with the log dictionary of each chunk of rows flushed to the sink
+    (e.g., to accumulate summary metrics without reading the log back).
+    """
+    self.buffer.flush_listeners.append(lambda rows: listener(self.rowsToDictionary(rows)))
+
+  def toDictionary(self) -> dict:
+    return self.rowsToDictionary(self.buffer.getData())
+
+  def rowsToDictionary(self, DATA_np: np.ndarray) -> dict:
+    """Return the log dictionary of stored rows (all the rows of the run, or a chunk of them)."""
+    if self.logging_profile.logsEverything:
+      return self.buildDictionary(lambda column: DATA_np[:, column].reshape(-1, 1))
+
+    stored_index = self.stored_index
+    log_dict = self.buildDictionary(
+      lambda column: DATA_np[:, stored_index[column]].reshape(-1, 1) if column in stored_index else None
+    )
+    return self.logging_profile.filterDictionary(log_dict)
+
+  @abstractmethod
+  def buildDictionary(self, column) -> dict:
+    """Return the nested log dictionary, with 'column(index)' as leaves."""
+    pass
+
+  @staticmethod
+  def leaves(value):
+    if isinstance(value, dict):
+      for item in value.values():
+        yield from BaseLogger.leaves(item)
+    else:
+      yield value
@@ -1,6 +1,4 @@
-import math
 import numpy as np
-from numpy import linalg as LA
 
 from acsl_pychrono.simulation.ode_input import OdeInput
 from acsl_pychrono.simulation.flight_params import FlightParams
@@ -37,24 +35,26 @@ class BaseMRAC():
 
   def reshapeAdaptiveGainsToMatricesMRAC(self):
     """
-    Reshapes all gain parameters to their correct (row, col) shape and converts them to np.matrix.
+    Reshapes all gain parameters to their correct (row, col) shape.
     This is intended to be called once after loading or updating gains stored as flat arrays.
     """
-    self.K_hat_x_tran = np.matrix(self.K_hat_x_tran.reshape(6,3))
-    self.K_hat_r_tran = np.matrix(self.K_hat_r_tran.reshape(3,3))
-    self.Theta_hat_tran = np.matrix(self.Theta_hat_tran.reshape(6,3))
-    self.K_hat_x_rot = np.matrix(self.K_hat_x_rot.reshape(3,3))
-    self.K_hat_r_rot = np.matrix(self.K_hat_r_rot.reshape(3,3))
-    self.Theta_hat_rot = np.matrix(self.Theta_hat_rot.reshape(6,3))
+    batch_shape = self.y.shape[:-2]
+    self.K_hat_x_tran = self.K_hat_x_tran.reshape(batch_shape + (6, 3))
+    self.K_hat_r_tran = self.K_hat_r_tran.reshape(batch_shape + (3, 3))
+    self.Theta_hat_tran = self.Theta_hat_tran.reshape(batch_shape + (6, 3))
+    self.K_hat_x_rot = self.K_hat_x_rot.reshape(batch_shape + (3, 3))
+    self.K_hat_r_rot = self.K_hat_r_rot.reshape(batch_shape + (3, 3))
+    self.Theta_hat_rot = self.Theta_hat_rot.reshape(batch_shape + (6, 3))
 
   def reshapeAdaptiveGainsToMatricesTwoLayerMRAC(self):
     """
-    Reshapes all gain parameters to their correct (row, col) shape and converts them to np.matrix.
+    Reshapes all gain parameters to their correct (row, col) shape.
     This is intended to be called once after loading or updating gains stored as flat arrays.
     """
     self.reshapeAdaptiveGainsToMatricesMRAC()
-    self.K_hat_g_tran = np.matrix(self.K_hat_g_tran.reshape(6,3))
-    self.K_hat_g_rot = np.matrix(self.K_hat_g_rot.reshape(3,3))
+    batch_shape = self.y.shape[:-2]
+    self.K_hat_g_tran = self.K_hat_g_tran.reshape(batch_shape + (6, 3))
+    self.K_hat_g_rot = self.K_hat_g_rot.reshape(batch_shape + (3, 3))
 
   def computeTrajectoryTrackingErrors(self, odein: OdeInput):
     """
@@ -62,10 +62,9 @@ class BaseMRAC():
     Assumes self.odein and self.x_ref_tran / self.omega_ref are already set.
     """
     # State vector for translation: position + velocity
-    self.x_tran = np.append(
-      odein.translational_position_in_I,
-      odein.translational_velocity_in_I,
-      axis=0
+    self.x_tran = np.concatenate(
+      (odein.translational_position_in_I, odein.translational_velocity_in_I),
+      axis=-2
     )
     
     # Compute trajectory tracking errors
@@ -73,28 +72,28 @@ class BaseMRAC():
     self.e_rot = odein.angular_velocity - self.omega_ref
     
     # Extract reference position
-    self.translational_position_in_I_ref = self.x_ref_tran[0:3]
+    self.translational_position_in_I_ref = self.x_ref_tran[..., 0:3, :]
 
   def computeReferenceCommandInputOuterLoop(self):
-    r_tran = self.gains.mass_total_estimated * (
-      - self.gains.KI_tran * self.integral_position_tracking_ref
+    r_tran = Control.column(self.gains.mass_total_estimated) * (
+      - self.gains.KI_tran @ self.integral_position_tracking_ref
       + self.odein.translational_acceleration_in_I_user
-      + self.gains.KP_tran * self.odein.translational_position_in_I_user
-      + self.gains.KD_tran * self.odein.translational_velocity_in_I_user
+      + self.gains.KP_tran @ self.odein.translational_position_in_I_user
+      + self.gains.KD_tran @ self.odein.translational_velocity_in_I_user
     )
 
     return r_tran
   
   def computeReferenceModelOuterLoop(self):
-    x_ref_tran_dot = self.gains.A_ref_tran * self.x_ref_tran + self.gains.B_ref_tran * self.r_tran
+    x_ref_tran_dot = self.gains.A_ref_tran @ self.x_ref_tran + self.gains.B_ref_tran @ self.r_tran
 
     return x_ref_tran_dot
   
   def computeMuPDbaselineOuterLoop(self):
-    mu_PD_baseline_tran = -self.gains.mass_total_estimated * (
-      self.gains.KP_tran_PD_baseline * (self.odein.translational_position_in_I - self.translational_position_in_I_ref)
-      + self.gains.KD_tran_PD_baseline * (self.odein.translational_velocity_in_I - self.x_ref_tran[3:6])
-      - self.x_ref_tran_dot[3:6]
+    mu_PD_baseline_tran = -Control.column(self.gains.mass_total_estimated) * (
+      self.gains.KP_tran_PD_baseline @ (self.odein.translational_position_in_I - self.translational_position_in_I_ref)
+      + self.gains.KD_tran_PD_baseline @ (self.odein.translational_velocity_in_I - self.x_ref_tran[..., 3:6, :])
+      - self.x_ref_tran_dot[..., 3:6, :]
     )
 
     return mu_PD_baseline_tran
@@ -105,12 +104,11 @@ class BaseMRAC():
      R_from_glob_to_loc
     ) = Control.computeRotationMatrices(self.odein.roll, self.odein.pitch, self.odein.yaw)
     
-    translational_velocity_in_J = R_from_glob_to_loc * self.odein.translational_velocity_in_I
-    translational_velocity_in_J_norm = LA.norm(R_from_glob_to_loc * self.odein.translational_velocity_in_I)
-    self.Phi_adaptive_tran = -0.5 * translational_velocity_in_J * translational_velocity_in_J_norm 
+    translational_velocity_in_J = R_from_glob_to_loc @ self.odein.translational_velocity_in_I
+    translational_velocity_in_J_norm = Control.matrixNorm(translational_velocity_in_J)
+    self.Phi_adaptive_tran = -0.5 * translational_velocity_in_J * Control.column(translational_velocity_in_J_norm)
 
-    Phi_adaptive_tran_augmented = np.matrix(np.block([[self.mu_PD_baseline_tran],
-                                                      [self.Phi_adaptive_tran]]))
+    Phi_adaptive_tran_augmented = np.concatenate((self.mu_PD_baseline_tran, self.Phi_adaptive_tran), axis=-2)
     
     return Phi_adaptive_tran_augmented
   
@@ -128,24 +126,23 @@ class BaseMRAC():
     Jacobian_matrix_dot = Control.computeJacobianDot(
       self.odein.roll,
       self.odein.pitch,
-      self.angular_position_dot[0],
-      self.angular_position_dot[1]
+      self.angular_position_dot[..., 0, 0],
+      self.angular_position_dot[..., 1, 0]
     )
 
-    omega_cmd = Jacobian_matrix * (
-      - self.gains.KP_rot * self.angular_error 
-      - self.gains.KI_rot * self.integral_angular_error 
+    omega_cmd_input = (
+      - self.gains.KP_rot @ self.angular_error 
+      - self.gains.KI_rot @ self.integral_angular_error 
       + self.angular_position_ref_dot
     )
+
+    omega_cmd = Jacobian_matrix @ omega_cmd_input
     
     omega_cmd_dot = (
-      Jacobian_matrix_dot * (
-        - self.gains.KP_rot * self.angular_error 
-        - self.gains.KI_rot * self.integral_angular_error 
-        + self.angular_position_ref_dot)
-      + Jacobian_matrix * (
-        - self.gains.KP_rot * self.angular_error_dot 
-        - self.gains.KI_rot * self.angular_error 
+      Jacobian_matrix_dot @ omega_cmd_input
+      + Jacobian_matrix @ (
+        - self.gains.KP_rot @ self.angular_error_dot 
+        - self.gains.KI_rot @ self.angular_error 
         + self.angular_position_ref_ddot)
     )
 
@@ -153,8 +150,8 @@ class BaseMRAC():
   
   def computeReferenceModelInnerLoop(self):
     omega_ref_dot = (
-      - self.gains.K_P_omega_ref * (self.omega_ref - self.omega_cmd) 
-      - self.gains.K_I_omega_ref * self.integral_e_omega_ref_cmd
+      - self.gains.K_P_omega_ref @ (self.omega_ref - self.omega_cmd) 
+      - self.gains.K_I_omega_ref @ self.integral_e_omega_ref_cmd
       + self.omega_cmd_dot
     )
 
@@ -162,45 +159,48 @@ class BaseMRAC():
   
   def computeReferenceCommandInputInnerLoop(self):
     r_rot = (
-      self.gains.K_P_omega_ref * self.omega_cmd
-      - self.gains.K_I_omega_ref * self.integral_e_omega_ref_cmd
+      self.gains.K_P_omega_ref @ self.omega_cmd
+      - self.gains.K_I_omega_ref @ self.integral_e_omega_ref_cmd
       + self.omega_cmd_dot
     )
 
     return r_rot
   
   def computeMomentPIbaselineInnerLoop(self):
-    Moment_baseline_PI = -self.gains.I_matrix_estimated * (
-      self.gains.KP_rot_PI_baseline * self.e_rot
-      + self.gains.KI_rot_PI_baseline * self.integral_e_rot 
+    Moment_baseline_PI = -self.gains.I_matrix_estimated @ (
+      self.gains.KP_rot_PI_baseline @ self.e_rot
+      + self.gains.KI_rot_PI_baseline @ self.integral_e_rot 
       - self.omega_ref_dot
     )
 
     return Moment_baseline_PI
   
   def computeRegressorVectorInnerLoop(self):
-    Phi_adaptive_rot = np.array([[self.odein.angular_velocity[1].item() * self.odein.angular_velocity[2].item()],
-                                 [self.odein.angular_velocity[0].item() * self.odein.angular_velocity[2].item()],
-                                 [self.odein.angular_velocity[0].item() * self.odein.angular_velocity[1].item()]])
+    angular_velocity = self.odein.angular_velocity
+    Phi_adaptive_rot = np.concatenate((
+      angular_velocity[..., 1:2, :] * angular_velocity[..., 2:3, :],
+      angular_velocity[..., 0:1, :] * angular_velocity[..., 2:3, :],
+      angular_velocity[..., 0:1, :] * angular_velocity[..., 1:2, :]
+    ), axis=-2)
     
-    Phi_adaptive_rot_augmented = np.matrix(np.block([[self.Moment_baseline_PI],
-                                                     [Phi_adaptive_rot]]))
+    Phi_adaptive_rot_augmented = np.concatenate((self.Moment_baseline_PI, Phi_adaptive_rot), axis=-2)
     
     return Phi_adaptive_rot, Phi_adaptive_rot_augmented
   
   def computeMomentBaselineInnerLoop(self):
     Moment_baseline = np.cross(
-      self.odein.angular_velocity.ravel(),
-      (self.gains.I_matrix_estimated * self.odein.angular_velocity).ravel()
-    ).reshape(3,1)
+      np.asarray(self.odein.angular_velocity),
+      np.asarray(self.gains.I_matrix_estimated @ self.odein.angular_velocity),
+      axis=-2
+    )
 
     return Moment_baseline
   
   def computeU2_U3_U4(self):
     Moment = self.Moment_baseline_PI + self.Moment_baseline + self.Moment_adaptive
     
-    u2 = Moment[0].item()
-    u3 = Moment[1].item()
-    u4 = Moment[2].item()
+    u2 = Moment[..., 0, 0]
+    u3 = Moment[..., 1, 0]
+    u4 = Moment[..., 2, 0]
 
     return u2, u3, u4, Moment
@@ -0,0 +1,76 @@
+import numpy as np
+
+from acsl_pychrono.simulation.ode_input import OdeInput
+from acsl_pychrono.simulation.flight_params import FlightParams
+from acsl_pychrono.control.control import Control
+
+class BatchGains:
+  """
+  Gains of N instances of a controller, stacked along a leading batch dimension.
+  Reading an attribute stacks it over the gain sets (once, then it is cached):
+  - scalars become arrays of shape (N,)
+  - vectors and matrices become arrays of shape (N, rows, cols)
+  - flags (e.g., 'use_projection_operator') select code paths, so they must be the same for every gain set
+  Modify the gain sets before the first step of the batch controller.
+  """
+  def __init__(self, gains_list: list):
+    if not gains_list:
+      raise ValueError("A batch needs at least one gain set.")
+    self.gains_list = list(gains_list)
+    self.size = len(self.gains_list)
+
+  def __getattr__(self, name):
+    if name.startswith("__") or name == "gains_list":
+      raise AttributeError(name)
+    values = [getattr(gains, name) for gains in self.gains_list]
+
+    if all(isinstance(value, (bool, np.bool_)) for value in values):
+      if any(value != values[0] for value in values):
+        raise ValueError(f"The flag '{name}' must be the same for every gain set of a batch.")
+      stacked = bool(values[0])
+    elif all(isinstance(value, (int, np.integer)) for value in values) and name.startswith("number_of_"):
+      stacked = int(values[0])
+    else:
+      stacked = np.stack([np.asarray(value, dtype=float) for value in values])
+
+    setattr(self, name, stacked)
+    return stacked
+
+class BatchControl(Control):
+  """
+  Batched form of a controller: N instances, one per gain set of 'gains_list', advanced by the same NumPy calls.
+  It is mixed in before the class of the controller, e.g., 'class PIDBatch(BatchControl, PID)': the control
+  algorithm and the equations are those of the controller (they are array-generic, see 'Control'), evaluated
+  with the gains stacked by 'BatchGains'.
+  The state 'y' is (N x number_of_states x 1), vectors are (N x rows x 1), scalars are (N,).
+  The fields of the 'OdeInput' may have the leading batch dimension (one input per instance)
+  or not (the same input for every instance).
+  """
+  def __init__(self, gains_list: list, ode_input: OdeInput, flight_params: FlightParams, timestep: float):
+    gains = BatchGains(gains_list)
+    # The controller (next in the method resolution order) with the stacked gains
+    super().__init__(gains, ode_input, flight_params, timestep)
+    self.batch_size = gains.size
+
+    self.dy = np.zeros((self.batch_size, gains.number_of_states, 1))
+    # Initial conditions
+    self.y = np.zeros((self.batch_size, gains.number_of_states, 1))
+
+  def computeControlAlgorithm(self, ode_input: OdeInput):
+    """'computeControlAlgorithm' of the controller, with the fields of 'ode_input' broadcast to the instances."""
+    super().computeControlAlgorithm(BatchControl.broadcastOdeInput(ode_input, self.batch_size))
+
+  @staticmethod
+  def broadcastOdeInput(ode_input: OdeInput, batch_size: int) -> OdeInput:
+    """'OdeInput' whose fields all have the leading batch dimension (views, nothing is copied)."""
+    odein = OdeInput()
+    odein.time_now = ode_input.time_now
+    for name in (
+      "translational_position_in_I", "translational_velocity_in_I", "angular_velocity",
+      "translational_position_in_I_user", "translational_velocity_in_I_user", "translational_acceleration_in_I_user"
+    ):
+      value = np.asarray(getattr(ode_input, name), dtype=float)
+      setattr(odein, name, np.broadcast_to(value.reshape(value.shape[:-2] + (3, 1)), (batch_size, 3, 1)))
+    for name in ("roll", "pitch", "yaw", "yaw_ref", "yaw_ref_dot", "yaw_ref_ddot"):
+      setattr(odein, name, np.broadcast_to(np.asarray(getattr(ode_input, name), dtype=float).reshape(-1), (batch_size,)))
+    return odein
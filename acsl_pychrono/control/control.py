@@ -1,13 +1,27 @@
-import math
 import numpy as np
 from numpy.typing import NDArray
 from abc import ABC, abstractmethod
+from scipy.linalg import expm
 
 from acsl_pychrono.simulation.functions import rk4singlestep
 from acsl_pychrono.simulation.ode_input import OdeInput
 from acsl_pychrono.simulation.flight_params import FlightParams
 
+# Integrators of the ODE of the controller over a control step (the vehicle state and the reference are held over the step):
+# "held_rk4":      'rk4singlestep' with the derivative evaluated once at the start of the step (same result as explicit Euler)
+# "euler":         explicit Euler, without the RK4 sums of the held derivative (the cost of a step is mostly
+#                  that of 'computeControlAlgorithm', so a step is only slightly cheaper than with "held_rk4")
+# "rk4":           classic RK4, with the control algorithm re-evaluated at each stage
+# "exact_filters": exact (zero-order hold) discretization of the roll and pitch reference differentiators, explicit Euler
+#                  for the others. The reference models and adaptive laws of the MRAC controllers stay explicit Euler,
+#                  so that the tracking error driving the adaptive laws is discretized consistently; the motor thrusts
+#                  are not more accurate than with "euler" for the MRAC controllers (see 'benchmarks/bench_integrators.py')
+INTEGRATORS = ("held_rk4", "euler", "rk4", "exact_filters")
+
 class Control(ABC):
+  # Integrator of the ODE of the controller, set by 'setIntegrator'
+  integrator = "held_rk4"
+
   def __init__(self, odein: OdeInput) -> None:
     self.odein = odein
     self.y = None # Will be initialized in subclasses
@@ -34,12 +48,90 @@ class Control(ABC):
     """
     pass
 
+  def linearFilters(self) -> list[tuple[tuple, np.ndarray, np.ndarray, str]]:
+    """
+    Linear filter states of the ODE (the roll and pitch reference differentiators), discretized exactly by the
+    "exact_filters" integrator:
+    (index of the states in 'y', A, B, name of the attribute of the input), with state derivative A * y[index] + B * input.
+    The index also selects the states of every instance of a batched controller (see 'BatchControl'),
+    and A and B may have its leading batch dimension.
+    """
+    return [
+      ((..., slice(0, 2), slice(None)), self.fp.uav_controller.A_phi_ref, self.fp.uav_controller.B_phi_ref, "roll_ref"),
+      ((..., slice(2, 4), slice(None)), self.fp.uav_controller.A_theta_ref, self.fp.uav_controller.B_theta_ref, "pitch_ref"),
+    ]
+
+  def setIntegrator(self, integrator: str):
+    """Select the integrator of the ODE of the controller (see 'INTEGRATORS')."""
+    if integrator not in INTEGRATORS:
+      raise ValueError(f"Unknown integrator: {integrator}. Available integrators: {INTEGRATORS}")
+    self.integrator = integrator
+
+    if integrator == "exact_filters":
+      # Zero-order hold discretization over a control step: expm([[A, B], [0, 0]] * dt) = [[Ad, Bd], [0, I]]
+      self.discretized_filters = []
+      for state_index, A, B, input_name in self.linearFilters():
+        A = np.asarray(A, dtype=float)
+        B = np.asarray(B, dtype=float).reshape(A.shape[:-1] + (-1,))
+        n, m = B.shape[-2:]
+        M = np.zeros(A.shape[:-2] + (n + m, n + m))
+        M[..., :n, :n] = A
+        M[..., :n, n:] = B
+        M_d = np.stack([expm(M_k * self.timestep) for M_k in M.reshape(-1, n + m, n + m)]).reshape(M.shape)
+        self.discretized_filters.append((state_index, M_d[..., :n, :n], M_d[..., :n, n:], input_name))
+
   def integrateODEOneStepRK4(self):
     """
-    Perform a single RK4 integration step using the current state.
-    Updates self.y in place.
+    Integrate the ODE of the controller over one control step with the selected 'integrator'.
+    Updates self.y.
+    """
+    if self.integrator == "held_rk4":
+      self.y = rk4singlestep(self.ode, self.timestep, self.odein.time_now, self.y)
+    elif self.integrator == "euler":
+      self.y = self.y + self.timestep * self.ode(self.odein.time_now, self.y)
+    elif self.integrator == "rk4":
+      self.integrateRK4Stages()
+    elif self.integrator == "exact_filters":
+      y_start = self.y
+      self.y = y_start + self.timestep * self.ode(self.odein.time_now, y_start)
+      for state_index, A_d, B_d, input_name in self.discretized_filters:
+        batch_shape = y_start[state_index].shape[:-2]
+        filter_input = np.asarray(getattr(self, input_name), dtype=float).reshape(batch_shape + (-1, 1))
+        self.y[state_index] = A_d @ np.asarray(y_start[state_index]) + B_d @ filter_input
+    else:
+      raise ValueError(f"Unknown integrator: {self.integrator}. Available integrators: {INTEGRATORS}")
+
+  def integrateRK4Stages(self):
+    """
+    Classic RK4: the derivative of the stages 2-4 is given by the control algorithm evaluated at the stage state.
+    The quantities computed at the start of the step (e.g., motor thrusts, logged values) are restored afterwards.
     """
-    self.y = rk4singlestep(self.ode, self.timestep, self.odein.time_now, self.y)
+    y_start = self.y
+    time_now = self.odein.time_now
+    outputs = self.saveStageOutputs()
+
+    def stageDerivative(t, y):
+      if y is y_start:
+        return np.array(self.ode(t, y))
+      return self.evaluateStage(y)
+
+    y_next = rk4singlestep(stageDerivative, self.timestep, time_now, y_start)
+    self.restoreStageOutputs(outputs, y_start)
+    self.y = y_next
+
+  def evaluateStage(self, y: np.ndarray) -> np.ndarray:
+    """Derivative of the ODE at the state 'y' of an RK4 stage (with the vehicle state of the step)."""
+    self.y = y
+    self.computeControlAlgorithm(self.odein)
+    return np.array(self.ode(self.odein.time_now, y))
+
+  def saveStageOutputs(self):
+    # Each evaluation of the control algorithm rebinds its attributes, so a shallow copy keeps those of the start of the step
+    return dict(self.__dict__)
+
+  def restoreStageOutputs(self, outputs, y_start: np.ndarray):
+    self.__dict__.update(outputs)
+    self.y = y_start
 
   def run(self, ode_input: OdeInput) -> None:
     """
@@ -51,15 +143,46 @@ class Control(ABC):
     self.integrateODEOneStepRK4()
     self.computePostIntegrationAlgorithm()
 
+  # The equations below are array-generic: scalars may be arrays of shape (N,) and vectors and matrices
+  # may have the leading batch dimension N (see 'BatchControl'), so that the controllers and their batched
+  # forms share them. '*' only scales by scalars (see 'column'), matrix products are written with '@'.
+
+  @staticmethod
+  def column(scalars):
+    """Scalars (N,) -> (N x 1 x 1), to scale vectors and matrices with a leading batch dimension. A scalar is left as is."""
+    if np.ndim(scalars) == 0:
+      return scalars
+    return np.asarray(scalars)[..., np.newaxis, np.newaxis]
+
+  @staticmethod
+  def transpose(matrices: np.ndarray) -> np.ndarray:
+    """Transpose of the (rows x cols) matrices of the last two dimensions."""
+    return matrices.swapaxes(-1, -2)
+
+  @staticmethod
+  def stackVector(*components) -> np.ndarray:
+    """Scalar components -> (len(components) x 1) vector, (N,) components -> (N x len(components) x 1) vectors."""
+    return np.stack(np.broadcast_arrays(*components), axis=-1)[..., np.newaxis]
+
+  @staticmethod
+  def matrixNorm(matrices: np.ndarray):
+    """
+    Frobenius norm of the matrices of the last two dimensions: a float for a single matrix,
+    (N,) norms for (N x rows x cols) matrices.
+    """
+    if np.ndim(matrices) == 2:
+      return float(np.linalg.norm(matrices))
+    return np.linalg.norm(matrices, axis=(-2, -1))
+
   @staticmethod
   def computeU1RollPitchRef(mu_x, mu_y, mu_z, mass_total_estimated, G_acc, yaw_ref):
 
-    u1 = math.sqrt(mu_x ** 2 + mu_y ** 2 + (mass_total_estimated * G_acc - mu_z) ** 2)
+    u1 = np.sqrt(mu_x ** 2 + mu_y ** 2 + (mass_total_estimated * G_acc - mu_z) ** 2)
     
-    calculation_var_A = -(1/u1) * (mu_x * math.sin(yaw_ref) - mu_y * math.cos(yaw_ref))
-    roll_ref = math.atan2(calculation_var_A, math.sqrt(1 - calculation_var_A ** 2))
+    calculation_var_A = -(1/u1) * (mu_x * np.sin(yaw_ref) - mu_y * np.cos(yaw_ref))
+    roll_ref = np.arctan2(calculation_var_A, np.sqrt(1 - calculation_var_A ** 2))
     
-    pitch_ref = math.atan2(-(mu_x * math.cos(yaw_ref) + mu_y * math.sin(yaw_ref)),
+    pitch_ref = np.arctan2(-(mu_x * np.cos(yaw_ref) + mu_y * np.sin(yaw_ref)),
                             (mass_total_estimated * G_acc - mu_z))
     
     return u1, roll_ref, pitch_ref
@@ -78,18 +201,25 @@ class Control(ABC):
       state_phi_ref_diff,
       state_theta_ref_diff
     ):
-
-    internal_state_differentiator_phi_ref_diff = fp.uav_controller.A_phi_ref * state_phi_ref_diff + fp.uav_controller.B_phi_ref*roll_ref
-    internal_state_differentiator_theta_ref_diff = fp.uav_controller.A_theta_ref * state_theta_ref_diff + fp.uav_controller.B_theta_ref*pitch_ref
+    uav_controller = fp.uav_controller
+    A_phi_ref = np.asarray(uav_controller.A_phi_ref)
+    A_theta_ref = np.asarray(uav_controller.A_theta_ref)
+    B_phi_ref = np.asarray(uav_controller.B_phi_ref).reshape(-1, 1)
+    B_theta_ref = np.asarray(uav_controller.B_theta_ref).reshape(-1, 1)
+    C_phi_ref = np.asarray(uav_controller.C_phi_ref)
+    C_theta_ref = np.asarray(uav_controller.C_theta_ref)
+
+    internal_state_differentiator_phi_ref_diff = A_phi_ref @ state_phi_ref_diff + B_phi_ref * Control.column(roll_ref)
+    internal_state_differentiator_theta_ref_diff = A_theta_ref @ state_theta_ref_diff + B_theta_ref * Control.column(pitch_ref)
     
-    roll_ref_dot = np.asarray(fp.uav_controller.C_phi_ref*state_phi_ref_diff).item()
-    pitch_ref_dot = np.asarray(fp.uav_controller.C_theta_ref*state_theta_ref_diff).item()
+    roll_ref_dot = (C_phi_ref @ state_phi_ref_diff)[..., 0, 0]
+    pitch_ref_dot = (C_theta_ref @ state_theta_ref_diff)[..., 0, 0]
     
-    roll_ref_ddot = np.asarray(fp.uav_controller.C_phi_ref*internal_state_differentiator_phi_ref_diff).item()
-    pitch_ref_ddot = np.asarray(fp.uav_controller.C_theta_ref*internal_state_differentiator_theta_ref_diff).item()
+    roll_ref_ddot = (C_phi_ref @ internal_state_differentiator_phi_ref_diff)[..., 0, 0]
+    pitch_ref_ddot = (C_theta_ref @ internal_state_differentiator_theta_ref_diff)[..., 0, 0]
     
-    angular_position_ref_dot = np.array([roll_ref_dot, pitch_ref_dot, odein.yaw_ref_dot]).reshape(3,1)
-    angular_position_ref_ddot = np.array([roll_ref_ddot, pitch_ref_ddot, odein.yaw_ref_ddot]).reshape(3,1)
+    angular_position_ref_dot = Control.stackVector(roll_ref_dot, pitch_ref_dot, odein.yaw_ref_dot)
+    angular_position_ref_ddot = Control.stackVector(roll_ref_ddot, pitch_ref_ddot, odein.yaw_ref_ddot)
 
     return (
       internal_state_differentiator_phi_ref_diff,
@@ -99,30 +229,33 @@ class Control(ABC):
     )
   
   @staticmethod
-  def computeJacobianInverse(roll: float, pitch: float) -> np.matrix:
+  def computeJacobianInverse(roll, pitch) -> np.ndarray:
     """
     Compute the inverse of the Jacobian matrix (ZYX Euler angles) given roll and pitch.
     
     Args:
-        roll (float): Roll angle in radians.
-        pitch (float): Pitch angle in radians.
+        roll (float or (N,) np.ndarray): Roll angle in radians.
+        pitch (float or (N,) np.ndarray): Pitch angle in radians.
 
     Returns:
-        np.matrix: 3x3 inverse Jacobian matrix.
+        np.ndarray: 3x3 inverse Jacobian matrix (N x 3 x 3 for N angles).
     """
-    cos_pitch = math.cos(pitch)
-    if abs(cos_pitch) < 1e-6:
+    cos_pitch = np.cos(pitch)
+    if np.any(np.abs(cos_pitch) < 1e-6):
         raise ValueError("Pitch angle too close to ±90°, Jacobian is singular.")
 
-    sin_roll = math.sin(roll)
-    cos_roll = math.cos(roll)
-    sin_pitch = math.sin(pitch)
+    sin_roll = np.sin(roll)
+    cos_roll = np.cos(roll)
+    sin_pitch = np.sin(pitch)
 
-    J_inv = np.matrix([
-        [1, (sin_roll * sin_pitch) / cos_pitch, (cos_roll * sin_pitch) / cos_pitch],
-        [0,                           cos_roll,                          -sin_roll],
-        [0,               sin_roll / cos_pitch,               cos_roll / cos_pitch]
-    ])
+    J_inv = np.zeros(np.shape(roll) + (3, 3))
+    J_inv[..., 0, 0] = 1
+    J_inv[..., 0, 1] = (sin_roll * sin_pitch) / cos_pitch
+    J_inv[..., 0, 2] = (cos_roll * sin_pitch) / cos_pitch
+    J_inv[..., 1, 1] = cos_roll
+    J_inv[..., 1, 2] = -sin_roll
+    J_inv[..., 2, 1] = sin_roll / cos_pitch
+    J_inv[..., 2, 2] = cos_roll / cos_pitch
 
     return J_inv
 
@@ -140,15 +273,11 @@ class Control(ABC):
       yaw_ref (float): Desired yaw angle (rad)
 
     Returns:
-      np.ndarray: 3x1 angular error vector
+      np.ndarray: 3x1 angular error vector (N x 3 x 1 for (N,) angles)
     """
-    yaw_error = ((yaw - yaw_ref + math.pi) % (2 * math.pi)) - math.pi
+    yaw_error = ((yaw - yaw_ref + np.pi) % (2 * np.pi)) - np.pi
 
-    angular_error = np.array([
-      roll - roll_ref,
-      pitch - pitch_ref,
-      yaw_error
-    ]).reshape(3, 1)
+    angular_error = Control.stackVector(roll - roll_ref, pitch - pitch_ref, yaw_error)
 
     return angular_error
   
@@ -165,7 +294,7 @@ class Control(ABC):
 
     Jacobian_matrix_inverse = Control.computeJacobianInverse(odein.roll, odein.pitch)
 
-    angular_position_dot = Jacobian_matrix_inverse * odein.angular_velocity
+    angular_position_dot = Jacobian_matrix_inverse @ odein.angular_velocity
     angular_error_dot = angular_position_dot - angular_position_ref_dot
 
     return angular_error, angular_position_dot, angular_error_dot
@@ -175,10 +304,10 @@ class Control(ABC):
     """
     Compute motor thrusts 'motor_thrusts' from the control inputs (u1, u2, u3, u4) using the allocation matrix inverse.
     Returns:
-      T (number_of_propellers x 1 np.array): thrusts for arbitrary number of motors
+      T (number_of_propellers x 1 np.array): thrusts for arbitrary number of motors (N x number_of_propellers x 1 for (N,) inputs)
     """
-    U = np.array([u1, u2, u3, u4])
-    motor_thrusts = np.matmul(fp.uav.U_mat_inv, U).reshape(fp.uav.number_of_propellers,1) # array of thrust of each motor (T1, T2, T3, T4, ...)
+    U = Control.stackVector(u1, u2, u3, u4)
+    motor_thrusts = np.asarray(fp.uav.U_mat_inv) @ U # array of thrust of each motor (T1, T2, T3, T4, ...)
     return motor_thrusts
   
   @staticmethod
@@ -186,74 +315,86 @@ class Control(ABC):
     """
     Compute rotation matrices from local to global and global to local frames.
     """
-    R3 = np.matrix([[math.cos(yaw), -math.sin(yaw), 0],
-                    [math.sin(yaw),  math.cos(yaw), 0],
-                    [            0,              0, 1]])
-    
-    R2 = np.matrix([[ math.cos(pitch), 0, math.sin(pitch)],
-                    [               0, 1,               0],
-                    [-math.sin(pitch), 0, math.cos(pitch)]])
-    
-    R1 = np.matrix([[1,              0,               0],
-                    [0, math.cos(roll), -math.sin(roll)],
-                    [0, math.sin(roll),  math.cos(roll)]])
+    batch_shape = np.shape(roll)
+    R3 = np.zeros(batch_shape + (3, 3))
+    R3[..., 0, 0] = np.cos(yaw)
+    R3[..., 0, 1] = -np.sin(yaw)
+    R3[..., 1, 0] = np.sin(yaw)
+    R3[..., 1, 1] = np.cos(yaw)
+    R3[..., 2, 2] = 1
+
+    R2 = np.zeros(batch_shape + (3, 3))
+    R2[..., 0, 0] = np.cos(pitch)
+    R2[..., 0, 2] = np.sin(pitch)
+    R2[..., 1, 1] = 1
+    R2[..., 2, 0] = -np.sin(pitch)
+    R2[..., 2, 2] = np.cos(pitch)
+
+    R1 = np.zeros(batch_shape + (3, 3))
+    R1[..., 0, 0] = 1
+    R1[..., 1, 1] = np.cos(roll)
+    R1[..., 1, 2] = -np.sin(roll)
+    R1[..., 2, 1] = np.sin(roll)
+    R1[..., 2, 2] = np.cos(roll)
     
-    R_from_loc_to_glob = R3 * R2 * R1
-    R_from_glob_to_loc = R_from_loc_to_glob.transpose()
+    R_from_loc_to_glob = R3 @ R2 @ R1
+    R_from_glob_to_loc = Control.transpose(R_from_loc_to_glob)
 
     return R_from_loc_to_glob, R_from_glob_to_loc
   
   @staticmethod
-  def computeJacobianDot(roll: float, pitch: float, roll_dot: float, pitch_dot: float) -> np.matrix:
+  def computeJacobianDot(roll, pitch, roll_dot, pitch_dot) -> np.ndarray:
     """
     Compute the time derivative of the Jacobian matrix (ZYX Euler angles)
     based on current roll and pitch angles and their time derivatives.
 
     Args:
-        roll (float): Roll angle in radians.
-        pitch (float): Pitch angle in radians.
-        roll_dot (float): Time derivative of roll angle [rad/s].
-        pitch_dot (float): Time derivative of pitch angle [rad/s].
+        roll (float or (N,) np.ndarray): Roll angle in radians.
+        pitch (float or (N,) np.ndarray): Pitch angle in radians.
+        roll_dot (float or (N,) np.ndarray): Time derivative of roll angle [rad/s].
+        pitch_dot (float or (N,) np.ndarray): Time derivative of pitch angle [rad/s].
 
     Returns:
-        np.matrix: 3x3 time derivative of the Jacobian matrix.
+        np.ndarray: 3x3 time derivative of the Jacobian matrix (N x 3 x 3 for N angles).
     """
-    sin_roll = math.sin(roll)
-    cos_roll = math.cos(roll)
-    sin_pitch = math.sin(pitch)
-    cos_pitch = math.cos(pitch)
-
-    J_dot = np.matrix(np.zeros((3, 3)))
-    J_dot[0, 2] = -cos_pitch * pitch_dot
-    J_dot[1, 1] = -sin_roll * roll_dot
-    J_dot[1, 2] = cos_roll * cos_pitch * roll_dot - sin_roll * sin_pitch * pitch_dot
-    J_dot[2, 1] = -cos_roll * roll_dot
-    J_dot[2, 2] = -cos_pitch * sin_roll * roll_dot - cos_roll * sin_pitch * pitch_dot
+    sin_roll = np.sin(roll)
+    cos_roll = np.cos(roll)
+    sin_pitch = np.sin(pitch)
+    cos_pitch = np.cos(pitch)
+
+    J_dot = np.zeros(np.shape(roll) + (3, 3))
+    J_dot[..., 0, 2] = -cos_pitch * pitch_dot
+    J_dot[..., 1, 1] = -sin_roll * roll_dot
+    J_dot[..., 1, 2] = cos_roll * cos_pitch * roll_dot - sin_roll * sin_pitch * pitch_dot
+    J_dot[..., 2, 1] = -cos_roll * roll_dot
+    J_dot[..., 2, 2] = -cos_pitch * sin_roll * roll_dot - cos_roll * sin_pitch * pitch_dot
 
     return J_dot
   
   @staticmethod
-  def computeJacobian(roll: float, pitch: float) -> np.matrix:
+  def computeJacobian(roll, pitch) -> np.ndarray:
     """
     Compute the Jacobian matrix for ZYX Euler angles given roll and pitch.
 
     Args:
-        roll (float): Roll angle in radians.
-        pitch (float): Pitch angle in radians.
+        roll (float or (N,) np.ndarray): Roll angle in radians.
+        pitch (float or (N,) np.ndarray): Pitch angle in radians.
 
     Returns:
-        np.matrix: 3x3 Jacobian matrix.
+        np.ndarray: 3x3 Jacobian matrix (N x 3 x 3 for N angles).
     """
-    sin_pitch = math.sin(pitch)
-    cos_pitch = math.cos(pitch)
-    sin_roll = math.sin(roll)
-    cos_roll = math.cos(roll)
-
-    J = np.matrix([
-        [1,          0,             -sin_pitch],
-        [0,   cos_roll, sin_roll * cos_pitch],
-        [0,  -sin_roll, cos_roll * cos_pitch]
-    ])
+    sin_pitch = np.sin(pitch)
+    cos_pitch = np.cos(pitch)
+    sin_roll = np.sin(roll)
+    cos_roll = np.cos(roll)
+
+    J = np.zeros(np.shape(roll) + (3, 3))
+    J[..., 0, 0] = 1
+    J[..., 0, 2] = -sin_pitch
+    J[..., 1, 1] = cos_roll
+    J[..., 1, 2] = sin_roll * cos_pitch
+    J[..., 2, 1] = -sin_roll
+    J[..., 2, 2] = cos_roll * cos_pitch
 
     return J
 
@@ -0,0 +1,112 @@
+import os
+import sys
+import json
+import inspect
+import copy
+import pickle
+import hashlib
+import numpy as np
+
+from acsl_pychrono.simulation.flight_params import FlightParams
+
+# Compiled gains of this process (YAML parsed, Lyapunov equations solved, projection-operator ellipsoids
+# and block matrices built), keyed by 'computeGainsKey'
+_compiled_gains: dict[str, object] = {}
+
+# Hash of the source code compiling the gains, per gains class
+_gains_source_hashes: dict[type, str] = {}
+
+def computeGainsSourceHash(GainsClass: type) -> str:
+  """
+  Return a hash of the source code the gains are compiled by: the module of the gains class and the
+  'acsl_pychrono' modules it uses (base gains classes, projection operator, flight parameters),
+  so that pickled gains compiled by an older version of the code are not loaded.
+  """
+  source_hash = _gains_source_hashes.get(GainsClass)
+  if source_hash is None:
+    gains_module = sys.modules[GainsClass.__module__]
+    modules = {gains_module}
+    for value in vars(gains_module).values():
+      module = value if inspect.ismodule(value) else inspect.getmodule(value)
+      if module is not None and module.__name__.startswith("acsl_pychrono"):
+        modules.add(module)
+    hasher = hashlib.sha256()
+    for module in sorted(modules, key=lambda module: module.__name__):
+      hasher.update(module.__name__.encode())
+      hasher.update(inspect.getsource(module).encode())
+    source_hash = _gains_source_hashes[GainsClass] = hasher.hexdigest()
+  return source_hash
+
+def computeGainsKey(GainsClass: type, flight_params: FlightParams) -> str:
+  """
+  Return a content hash of everything the gains are compiled from: the gains class and its source code,
+  the gains YAML file, the vehicle estimates of 'UAV_Controller_Params' and the gains overrides.
+  """
+  uav_controller = flight_params.uav_controller
+  config_path = FlightParams.get_controller_config_path(uav_controller.controller_config_filename, flight_params.uav.name)
+  try:
+    with open(config_path, "rb") as f:
+      gains_file_hash = hashlib.sha256(f.read()).hexdigest()
+  except FileNotFoundError:
+    raise FileNotFoundError(f"Controller gains config file not found at {config_path}")
+
+  payload = json.dumps(
+    {
+      "gains_class": f"{GainsClass.__module__}.{GainsClass.__qualname__}",
+      "gains_source": computeGainsSourceHash(GainsClass),
+      "gains_file": gains_file_hash,
+      "I_matrix_estimated": np.asarray(uav_controller.I_matrix_estimated).tolist(),
+      "mass_total_estimated": uav_controller.mass_total_estimated,
+      "air_density_estimated": uav_controller.air_density_estimated,
+      "surface_area_estimated": uav_controller.surface_area_estimated,
+      "drag_coefficient_matrix_estimated": np.asarray(uav_controller.drag_coefficient_matrix_estimated).tolist(),
+      "overrides": flight_params.controller_gains_overrides,
+    },
+    sort_keys=True,
+    default=str
+  )
+  return hashlib.sha256(payload.encode()).hexdigest()
+
+def getGains(GainsClass: type, flight_params: FlightParams, cache_dir: str = ""):
+  """
+  Return the gains 'GainsClass(flight_params)', compiled once per content: in memory for the process,
+  and pickled in 'cache_dir' (if given) for the following runs and processes.
+  Each call returns a copy, which the caller (e.g., a sweep scaling some gains) can modify.
+  """
+  key = computeGainsKey(GainsClass, flight_params)
+  gains = _compiled_gains.get(key)
+
+  if gains is None and cache_dir:
+    gains = loadGains(os.path.join(cache_dir, f"{GainsClass.__name__}_{key[:16]}.pkl"))
+    if gains is not None:
+      print(f"[INFO] Loaded compiled {GainsClass.__name__} from {cache_dir}")
+
+  if gains is None:
+    gains = GainsClass(flight_params)
+    if cache_dir:
+      saveGains(gains, os.path.join(cache_dir, f"{GainsClass.__name__}_{key[:16]}.pkl"))
+
+  _compiled_gains[key] = gains
+  return copy.deepcopy(gains)
+
+def loadGains(path: str):
+  """Unpickle compiled gains, None if missing or unreadable (they are then compiled again)."""
+  try:
+    with open(path, "rb") as f:
+      return pickle.load(f)
+  except FileNotFoundError:
+    return None
+  except Exception as e:
+    print(f"[WARNING] Ignoring the unreadable compiled gains {path}: {e}")
+    return None
+
+def saveGains(gains, path: str):
+  """Pickle compiled gains; written to a temporary file first, as parallel workers may compile the same gains."""
+  os.makedirs(os.path.dirname(path), exist_ok=True)
+  tmp_path = f"{path}.{os.getpid()}.tmp"
+  with open(tmp_path, "wb") as f:
+    pickle.dump(gains, f, protocol=pickle.HIGHEST_PROTOCOL)
+  os.replace(tmp_path, path)
+
+def clearGainsCache():
+  _compiled_gains.clear()
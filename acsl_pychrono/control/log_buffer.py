@@ -0,0 +1,81 @@
+import numpy as np
+from acsl_pychrono.control.log_sinks import BaseLogSink
+
+class LogBuffer:
+  """
+  Preallocated 2D float buffer holding one logged row per control step.
+  Without a sink, the buffer is sized from the expected number of steps and grows in chunks
+  of 'chunk_rows' if the simulation logs more rows than expected.
+  With a sink, the buffer holds a single chunk of 'sink.chunk_rows' rows, which is flushed
+  to the sink whenever it is full, so that the memory used does not grow with the run.
+  """
+  DEFAULT_CHUNK_ROWS = 1024
+
+  def __init__(self, num_columns: int, expected_rows: int = 0, chunk_rows: int = DEFAULT_CHUNK_ROWS, sink: BaseLogSink | None = None):
+    self.num_columns = num_columns
+    self.sink = sink
+    self.chunk_rows = sink.chunk_rows if sink is not None else chunk_rows
+    # Rows in the buffer (not yet flushed to the sink)
+    self.num_rows = 0
+    # Rows already flushed to the sink
+    self.num_flushed_rows = 0
+    # Functions called with the rows of each chunk, before it is written to the sink
+    self.flush_listeners = []
+    capacity = self.chunk_rows if sink is not None else max(expected_rows, chunk_rows)
+    # Rows are zero-initialized, so columns that are not written in a step stay 0.0
+    self.data = np.zeros((capacity, num_columns))
+
+  @property
+  def capacity(self) -> int:
+    return self.data.shape[0]
+
+  def nextRow(self) -> np.ndarray:
+    """Return a writable view of the next row of the buffer."""
+    if self.num_rows == self.capacity:
+      if self.sink is not None:
+        self.flush()
+      else:
+        self.grow()
+    row = self.data[self.num_rows]
+    self.num_rows += 1
+    return row
+
+  def grow(self):
+    """Enlarge the buffer by one chunk, keeping the logged rows."""
+    data = np.zeros((self.capacity + self.chunk_rows, self.num_columns))
+    data[:self.num_rows] = self.data[:self.num_rows]
+    self.data = data
+
+  def flush(self):
+    """Write the rows in the buffer to the sink and empty the buffer (no-op without a sink)."""
+    if self.sink is None or self.num_rows == 0:
+      return
+    for listener in self.flush_listeners:
+      listener(self.data[:self.num_rows])
+    self.sink.write(self.data[:self.num_rows])
+    self.num_flushed_rows += self.num_rows
+    self.data[:self.num_rows] = 0.0
+    self.num_rows = 0
+
+  def getData(self) -> np.ndarray:
+    """
+    Return the logged rows (total rows x num_columns): a view of the buffer without a sink,
+    otherwise the rows read back from the sink.
+    """
+    if self.sink is None:
+      return self.data[:self.num_rows]
+    self.flush()
+    return self.sink.read()
+
+  @staticmethod
+  def writeColumnMajor(row_slice: np.ndarray, matrix):
+    """
+    Write a (n, m) matrix into a slice of n*m columns in column-major order,
+    i.e. the same layout as 'matrix.flatten(order='F')', without temporaries.
+    """
+    np.copyto(row_slice.reshape(matrix.shape[1], matrix.shape[0]), matrix.T)
+
+  @staticmethod
+  def expectedRows(simulation_duration_seconds: float, timestep: float) -> int:
+    """Number of control steps of a simulation, used to size the buffer."""
+    return int(np.ceil(simulation_duration_seconds / timestep)) + 1
@@ -0,0 +1,150 @@
+import os
+import glob
+import json
+from abc import ABC, abstractmethod
+import numpy as np
+
+# "memory": the whole log is kept in memory and exported at the end of the run
+# "npz":    fixed-size chunks are written during the run as separate '.npz' files
+# "hdf5":   fixed-size chunks are appended during the run to a resizable HDF5 dataset (requires h5py)
+LOG_SINKS = ("memory", "npz", "hdf5")
+
+class BaseLogSink(ABC):
+  """
+  Destination of the rows of a 'LogBuffer' flushed during the run.
+  Besides the rows, a sink stores the metadata needed to rebuild the log dictionary offline
+  ('layout': nested dictionary of column indices, 'columns': full-layout index of each stored column).
+  """
+  def __init__(self, base_path: str, chunk_rows: int, metadata: dict | None = None):
+    self.base_path = base_path
+    self.chunk_rows = chunk_rows
+    self.metadata = dict(metadata or {})
+    self.num_columns = 0
+
+  @abstractmethod
+  def open(self, num_columns: int, metadata: dict):
+    pass
+
+  @abstractmethod
+  def write(self, rows: np.ndarray):
+    pass
+
+  @abstractmethod
+  def read(self) -> np.ndarray:
+    pass
+
+  def close(self):
+    pass
+
+class NpzLogSink(BaseLogSink):
+  """Each chunk is written to its own '.npz' file in the '<base_path>_log' folder."""
+  METADATA_FILENAME = "metadata.json"
+
+  def __init__(self, base_path: str, chunk_rows: int, metadata: dict | None = None):
+    super().__init__(base_path, chunk_rows, metadata)
+    self.dir_path = f"{base_path}_log"
+    self.num_chunks = 0
+
+  def open(self, num_columns: int, metadata: dict):
+    self.num_columns = num_columns
+    self.metadata.update(metadata)
+    os.makedirs(self.dir_path, exist_ok=True)
+    with open(os.path.join(self.dir_path, NpzLogSink.METADATA_FILENAME), "w") as f:
+      json.dump(self.metadata, f, default=str)
+
+  def write(self, rows: np.ndarray):
+    path = os.path.join(self.dir_path, f"chunk_{self.num_chunks:06d}.npz")
+    # Written under a temporary name, so that a killed run never leaves a truncated chunk
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+      np.savez(f, data=rows)
+    os.replace(tmp_path, path)
+    self.num_chunks += 1
+
+  def read(self) -> np.ndarray:
+    return NpzLogSink.readRows(self.dir_path, self.num_columns)
+
+  @staticmethod
+  def readRows(dir_path: str, num_columns: int) -> np.ndarray:
+    chunks = []
+    for path in sorted(glob.glob(os.path.join(dir_path, "chunk_*.npz"))):
+      with np.load(path) as chunk:
+        chunks.append(chunk["data"])
+    if not chunks:
+      return np.zeros((0, num_columns))
+    return np.concatenate(chunks)
+
+class Hdf5LogSink(BaseLogSink):
+  """Chunks are appended to the resizable dataset 'data' of the file '<base_path>.h5'."""
+  def __init__(self, base_path: str, chunk_rows: int, metadata: dict | None = None):
+    super().__init__(base_path, chunk_rows, metadata)
+    self.path = f"{base_path}.h5"
+    self.file = None
+
+  def open(self, num_columns: int, metadata: dict):
+    try:
+      import h5py
+    except ImportError:
+      raise ImportError("The \"hdf5\" log sink requires h5py (pip install h5py). Use the \"npz\" log sink otherwise.")
+
+    self.num_columns = num_columns
+    self.metadata.update(metadata)
+    self.file = h5py.File(self.path, "w")
+    self.dataset = self.file.create_dataset(
+      "data",
+      shape=(0, num_columns),
+      maxshape=(None, num_columns),
+      chunks=(self.chunk_rows, num_columns),
+      dtype="f8"
+    )
+    self.file.attrs["metadata"] = json.dumps(self.metadata, default=str)
+    self.file.flush()
+
+  def write(self, rows: np.ndarray):
+    num_rows = self.dataset.shape[0]
+    self.dataset.resize(num_rows + rows.shape[0], axis=0)
+    self.dataset[num_rows:] = rows
+    self.file.flush()
+
+  def read(self) -> np.ndarray:
+    return self.dataset[:]
+
+  def close(self):
+    if self.file is not None:
+      self.file.close()
+      self.file = None
+
+def createLogSink(log_sink: str, base_path: str, chunk_rows: int, metadata: dict | None = None) -> BaseLogSink | None:
+  """Return the sink of the given type, or None for the "memory" sink (the log buffer keeps every row)."""
+  if log_sink == "memory":
+    return None
+  elif log_sink == "npz":
+    return NpzLogSink(base_path, chunk_rows, metadata)
+  elif log_sink == "hdf5":
+    return Hdf5LogSink(base_path, chunk_rows, metadata)
+  else:
+    raise ValueError(f"Unknown log sink: {log_sink}. Available sinks: {LOG_SINKS}")
+
+def loadLog(path: str) -> tuple[dict, dict]:
+  """
+  Rebuild the log dictionary from the output of a "npz" ('<name>_log' folder) or "hdf5" ('<name>.h5') sink,
+  also when the run was interrupted. Returns the log dictionary and the metadata of the run.
+  """
+  if os.path.isdir(path):
+    with open(os.path.join(path, NpzLogSink.METADATA_FILENAME), "r") as f:
+      metadata = json.load(f)
+    data = NpzLogSink.readRows(path, len(metadata["columns"]))
+  else:
+    import h5py
+    with h5py.File(path, "r") as f:
+      metadata = json.loads(f.attrs["metadata"])
+      data = f["data"][:]
+
+  stored_index = {column: i for i, column in enumerate(metadata["columns"])}
+
+  def rebuild(layout):
+    if isinstance(layout, dict):
+      return {key: rebuild(value) for key, value in layout.items()}
+    return data[:, stored_index[layout]].reshape(-1, 1)
+
+  return rebuild(metadata["layout"]), metadata
@@ -6,6 +6,8 @@ import numpy as np
 from scipy.io import savemat
 from dataclasses import is_dataclass
 import acsl_pychrono.config.config as Cfg
+from acsl_pychrono.control.logging_profile import LoggingProfile
+from acsl_pychrono.simulation.scheduler import subsystemPeriod
 
 class Logging:
   @staticmethod
@@ -74,7 +76,7 @@ class Logging:
       result = {}
       for key, value in obj.__dict__.items():
         # Filter to only include serializable fields
-        if isinstance(value, (int, float, str, bool, np.ndarray, np.matrix)) or is_dataclass(value):
+        if isinstance(value, (int, float, str, bool, dict, np.ndarray, np.matrix)) or is_dataclass(value):
           converted_value = Logging.dataclassToDict(value, truncate_keys=truncate_keys)
           key = key[:31] if truncate_keys else key
           if isinstance(converted_value, np.matrix):
@@ -135,21 +137,39 @@ class Logging:
     return git_info
 
   @staticmethod
-  def saveMatlabWorkspaceLog(log_dict, gains, sim_cfg: Cfg.SimulationConfig, git_info: dict | None = None):
+  def getLogFilePath(sim_cfg: Cfg.SimulationConfig, extension: str = "mat") -> str:
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     dir_path = Logging.getOutputDir(sim_cfg)
     os.makedirs(dir_path, exist_ok=True)
 
-    base_filename = f"workspace_log_{timestamp}"
-    full_path_log = Logging.generateUniqueFilename(
+    # Wrapper runs are named after their run ID, so a resumed batch overwrites the log of an interrupted run
+    run_id = sim_cfg.mission_config.wrapper_run_id
+    base_filename = f"workspace_log_{run_id}" if run_id else f"workspace_log_{timestamp}"
+    return Logging.generateUniqueFilename(
       base_filename,
-      "mat",
+      extension,
       dir_path,
-      Cfg.MissionConfig.wrapper_flag
+      Cfg.MissionConfig.wrapper_flag and not run_id
     )
 
+  @staticmethod
+  def saveMatlabWorkspaceLog(
+    log_dict,
+    gains,
+    sim_cfg: Cfg.SimulationConfig,
+    git_info: dict | None = None,
+    logging_profile: LoggingProfile | None = None,
+    full_path_log: str | None = None,
+    solver_log: dict | None = None
+  ):
+    if logging_profile is None:
+      logging_profile = LoggingProfile.fromFile(sim_cfg.mission_config.logging_profile)
+
+    if full_path_log is None:
+      full_path_log = Logging.getLogFilePath(sim_cfg, "mat")
+
     mat_dict = {
-      "log": log_dict,
+      "log": logging_profile.filterDictionary(log_dict),
       "gains": Logging.extractGainsDict(gains),
       "sim_cfg": Logging.dataclassToDict(sim_cfg)
     }
@@ -157,4 +177,16 @@ class Logging:
     if git_info is not None:
       mat_dict["git_info"] = git_info
 
-    savemat(full_path_log, mat_dict)
\ No newline at end of file
+    # Iterations of the solver of the Chrono plant at every step (see 'solver_policy')
+    if solver_log is not None:
+      mat_dict["solver"] = solver_log
+
+    # Rates of the logged groups, needed to interpret decimated logs (NaN where a group was not sampled)
+    if not logging_profile.logsEverything:
+      logging_period = subsystemPeriod(sim_cfg.mission_config, sim_cfg.mission_config.logging_period)
+      mat_dict["logging_profile"] = {
+        group: (rate if rate is not None else 1.0 / logging_period)
+        for group, rate in logging_profile.group_rates.items()
+      }
+
+    savemat(full_path_log, mat_dict, do_compression=logging_profile.compress)
\ No newline at end of file
@@ -0,0 +1,64 @@
+import os
+from dataclasses import dataclass, field
+import yaml
+
+# Group logged at every stored row, whatever the profile
+TIME_GROUP = "time"
+
+@dataclass
+class LoggingProfile:
+  # Top-level groups of the log dictionary to be recorded (e.g., "position", "euler_angles", "outer_loop"),
+  # mapped to their logging rate in Hz (None: every control step).
+  # An empty dictionary records every group at every control step
+  group_rates: dict[str, float | None] = field(default_factory=dict)
+  # Compress the exported MATLAB workspace
+  compress: bool = False
+
+  def __post_init__(self):
+    for group, rate in self.group_rates.items():
+      if rate is not None and rate <= 0:
+        raise ValueError(f"Logging rate of group '{group}' must be positive, got {rate}.")
+
+  @property
+  def logsEverything(self) -> bool:
+    return not self.group_rates
+
+  @classmethod
+  def fromDict(cls, profile_dict: dict) -> "LoggingProfile":
+    return cls(
+      group_rates=dict(profile_dict.get("groups") or {}),
+      compress=profile_dict.get("compress", False),
+    )
+
+  @classmethod
+  def fromFile(cls, profile_file: str) -> "LoggingProfile":
+    """
+    Load a logging profile from a YAML file.
+    Path relative to 'current_working_directory/params/logging_profiles'.
+    A blank file name returns the profile that records every group at every step.
+    """
+    if not profile_file:
+      return cls()
+    full_path = os.path.join(os.getcwd(), "params", "logging_profiles", profile_file)
+    try:
+      with open(full_path, "r") as f:
+        print(f"[INFO] Loading logging profile from file: {full_path}")
+        return cls.fromDict(yaml.safe_load(f) or {})
+    except FileNotFoundError:
+      raise FileNotFoundError(f"Logging profile file not found at {full_path}")
+
+  def decimationSteps(self, group: str, timestep: float) -> int:
+    """Number of control steps between two logged samples of a group."""
+    rate = self.group_rates[group]
+    if rate is None:
+      return 1
+    return max(1, round(1.0 / (rate * timestep)))
+
+  def filterDictionary(self, log_dict: dict) -> dict:
+    """Keep only the top-level groups of a log dictionary selected by the profile."""
+    if self.logsEverything:
+      return log_dict
+    return {
+      group: value for group, value in log_dict.items()
+      if group == TIME_GROUP or group in self.group_rates
+    }
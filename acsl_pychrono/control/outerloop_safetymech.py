@@ -1,6 +1,6 @@
 import numpy as np
 import math
-from numpy import linalg as LA
+from acsl_pychrono.control.control import Control
 
 class OuterLoopSafetyMechanism:
   """
@@ -20,63 +20,47 @@ class OuterLoopSafetyMechanism:
 
   def apply(self, mu_tran_raw):
     """
-    Apply the safety mechanism to a raw mu_tran vector.
+    Apply the safety mechanism to a raw mu_tran vector (3 x 1).
+    The vectors of a batched controller (N x 3 x 1) are processed at once, with the stacked gains of the
+    N instances (see 'BatchGains'); mu_x, mu_y, mu_z are then of shape (N,).
     """
-    mu_x_raw = mu_tran_raw[0].item()
-    mu_y_raw = mu_tran_raw[1].item()
-    mu_z_raw = mu_tran_raw[2].item()
+    mu_tran_raw = np.asarray(mu_tran_raw)
+    mu_x_raw = mu_tran_raw[..., 0, 0]
+    mu_y_raw = mu_tran_raw[..., 1, 0]
+    mu_z_raw = mu_tran_raw[..., 2, 0]
 
     if not self.use_safety_mechanism:
       return mu_x_raw, mu_y_raw, mu_z_raw
-    
-    else:
+
+    g = self.gains
+    weight = g.mass_total_estimated * self.G_acc
+    with np.errstate(divide="ignore", invalid="ignore"):
       # Mu - sphere intersection
-      tSphereVector = np.zeros((2,1))
-      if LA.norm(mu_tran_raw) >= self.gains.sphereEpsilon:
-        tSphereVector[0] = (mu_z_raw*self.gains.mass_total_estimated*self.G_acc + math.sqrt((mu_z_raw*self.gains.mass_total_estimated*self.G_acc)**2 +
-                            LA.norm(mu_tran_raw)**2 * (self.gains.maximumThrust**2 - (self.gains.mass_total_estimated*self.G_acc)**2)))/LA.norm(mu_tran_raw)**2
-        tSphereVector[1] = (mu_z_raw*self.gains.mass_total_estimated*self.G_acc - math.sqrt((mu_z_raw*self.gains.mass_total_estimated*self.G_acc)**2 +
-                            LA.norm(mu_tran_raw)**2 * (self.gains.maximumThrust**2 - (self.gains.mass_total_estimated*self.G_acc)**2)))/LA.norm(mu_tran_raw)**2
-      else:
-        tSphereVector[0] = math.nan
-        tSphereVector[1] = math.nan
-      
+      mu_norm = Control.matrixNorm(mu_tran_raw)
+      sphere_root = np.sqrt((mu_z_raw * weight)**2 + mu_norm**2 * (g.maximumThrust**2 - weight**2))
+      sphere_valid = mu_norm >= g.sphereEpsilon
+      tSphere0 = np.where(sphere_valid, (mu_z_raw * weight + sphere_root) / mu_norm**2, math.nan)
+      tSphere1 = np.where(sphere_valid, (mu_z_raw * weight - sphere_root) / mu_norm**2, math.nan)
+
       # Mu - elliptic cone intersection
-      tEllipticConeVector = np.zeros((2,1))
-      if abs(mu_z_raw + math.sqrt((mu_x_raw/math.tan(self.gains.maximumPitchAngle))**2 +
-                                  (mu_y_raw/math.tan(self.gains.maximumRollAngle))**2)) >= self.gains.EllipticConeEpsilon:
-        tEllipticConeVector[0] = (self.gains.mass_total_estimated*self.G_acc)/(mu_z_raw + 
-                                  math.sqrt((mu_x_raw/math.tan(self.gains.maximumPitchAngle))**2 + (mu_y_raw/math.tan(self.gains.maximumRollAngle))**2))
-      else:
-        tEllipticConeVector[0] = math.nan
-          
-      if abs(-mu_z_raw + math.sqrt((mu_x_raw/math.tan(self.gains.maximumPitchAngle))**2 +
-                                  (mu_y_raw/math.tan(self.gains.maximumRollAngle))**2)) >= self.gains.EllipticConeEpsilon:
-        tEllipticConeVector[1] = -(self.gains.mass_total_estimated*self.G_acc)/(-mu_z_raw + 
-                                  math.sqrt((mu_x_raw/math.tan(self.gains.maximumPitchAngle))**2 + (mu_y_raw/math.tan(self.gains.maximumRollAngle))**2))
-      else:
-        tEllipticConeVector[1] = math.nan
-          
+      cone_root = np.sqrt((mu_x_raw / np.tan(g.maximumPitchAngle))**2 + (mu_y_raw / np.tan(g.maximumRollAngle))**2)
+      tCone0 = np.where(np.abs(mu_z_raw + cone_root) >= g.EllipticConeEpsilon, weight / (mu_z_raw + cone_root), math.nan)
+      tCone1 = np.where(np.abs(-mu_z_raw + cone_root) >= g.EllipticConeEpsilon, -weight / (-mu_z_raw + cone_root), math.nan)
+
       # Mu - plane intersection
-      if abs(mu_z_raw) >= self.gains.planeEpsilon:
-        tPlane = self.gains.alphaPlane*self.gains.mass_total_estimated*self.G_acc/mu_z_raw
-      else:
-        tPlane = math.nan
-          
-      tVector = np.array([tSphereVector[0].item(),tSphereVector[1].item(),
-                          tEllipticConeVector[0].item(),tEllipticConeVector[1].item(),tPlane])
-      for i in range(0,tVector.size):
-        if tVector[i] < 0:
-          tVector[i] = math.nan
-              
-      tValue = min(tVector)
-      
-      if tValue > 1:
-        tValue = 1
+      tPlane = np.where(np.abs(mu_z_raw) >= g.planeEpsilon, g.alphaPlane * weight / mu_z_raw, math.nan)
+
+    tVector = np.stack([tSphere0, tSphere1, tCone0, tCone1, tPlane], axis=-1)
+    tVector[tVector < 0] = math.nan
+
+    # Smallest intersection, skipping the NaN candidates (e.g., |mu_tran_raw| below sphereEpsilon at hover).
+    # No intersection: mu_tran_raw is left unscaled
+    tValue = np.fmin.reduce(tVector, axis=-1)
+    tValue = np.where(np.isnan(tValue) | (tValue > 1), 1.0, tValue)
 
-      mu_tran = tValue * mu_tran_raw
-      mu_x = mu_tran[0].item()
-      mu_y = mu_tran[1].item()
-      mu_z = mu_tran[2].item()
+    mu_tran = tValue[..., np.newaxis, np.newaxis] * mu_tran_raw
+    mu_x = mu_tran[..., 0, 0]
+    mu_y = mu_tran[..., 1, 0]
+    mu_z = mu_tran[..., 2, 0]
 
-      return mu_x, mu_y, mu_z
+    return mu_x, mu_y, mu_z
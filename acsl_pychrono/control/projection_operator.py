@@ -6,6 +6,8 @@ class ProjectionOperator:
     Implementation of the projection operator to be used in the MRAC controllers.
     For reference: A. L'Afflitto, "Notes on Adaptive Control and Estimation", Springer, Sec. 3.5. or
     E. Lavretsky, K. Wise, "Robust and Adaptive Control", Springer 2013, Sec. 11.4
+    The 'Ellipsoid' functions also take a batch of points: arguments with a leading batch dimension
+    (the parameters of the ellipsoids too, with 'epsilon' of shape (batch size,)), as in the batched controllers.
   """
 
   class Types:
@@ -17,12 +19,12 @@ class ProjectionOperator:
       Attributes:
       -----------
       h_function : float
-        Scalar value of the convex set function.
+        Scalar value of the convex set function (one per point for a batch of points).
 
       dh_dx_jacobian : np.ndarray
         Row vector (1 x N) representing the Jacobian (derivative of h with respect to x).
       """
-      h_function: float
+      h_function: float | np.ndarray
       dh_dx_jacobian: np.ndarray
 
   @staticmethod
@@ -119,10 +121,11 @@ class ProjectionOperator:
       ConvexFunctionOutput
         Contains h_function and dh_dx_jacobian.
       """
-      x_diff = x - x_e
-      quadratic_term = float(x_diff.T @ S @ x_diff)
+      x_diff = np.asarray(x - x_e)
+      x_diff_T_S = x_diff.swapaxes(-1, -2) @ np.asarray(S)
+      quadratic_term = (x_diff_T_S @ x_diff)[..., 0, 0]
       h_function = ((1.0 + epsilon) * quadratic_term - 1.0) / epsilon
-      dh_dx_jacobian = (2.0 * (1.0 + epsilon) / epsilon) * (x_diff.T @ S)
+      dh_dx_jacobian = np.asarray(2.0 * (1.0 + epsilon) / epsilon)[..., np.newaxis, np.newaxis] * x_diff_T_S
       return ProjectionOperator.Types.ConvexFunctionOutput(h_function, dh_dx_jacobian)
     
     @staticmethod
@@ -156,22 +159,21 @@ class ProjectionOperator:
       Returns:
       --------
       VectorProjectionOutput
-        The projected vector and a flag indicating if projection was activated.
+        The projected vector and a flag indicating if projection was activated (one per vector for a batch of vectors).
       """
       cfo = ProjectionOperator.Ellipsoid.convexFunction(x, x_e, S, epsilon)
-      h_function = cfo.h_function
+      h_function = np.asarray(cfo.h_function)[..., np.newaxis, np.newaxis]
       dh_dx_jacobian = cfo.dh_dx_jacobian  # Shape (1, N)
 
-      projection_operator_activated = (h_function > 0 and (dh_dx_jacobian @ x_d) > 0)
+      dh_dx_times_x_d = dh_dx_jacobian @ x_d
+      projection_operator_activated = (h_function > 0) & (dh_dx_times_x_d > 0)
 
-      if projection_operator_activated:
-        dh_dx_jacobian_T = dh_dx_jacobian.T  # Shape (N, 1)
-        numerator = h_function * dh_dx_jacobian_T * (dh_dx_jacobian @ x_d)
-        denominator = (dh_dx_jacobian @ dh_dx_jacobian_T)[0, 0]
-        x_d_modified = x_d - numerator / denominator
-        return (x_d_modified, True)
-      else:
-        return (x_d, False)
+      dh_dx_jacobian_T = dh_dx_jacobian.swapaxes(-1, -2)  # Shape (N, 1)
+      numerator = h_function * dh_dx_jacobian_T * dh_dx_times_x_d
+      denominator = dh_dx_jacobian @ dh_dx_jacobian_T
+      with np.errstate(divide="ignore", invalid="ignore"):
+        x_d_modified = np.where(projection_operator_activated, x_d - numerator / denominator, x_d)
+      return (x_d_modified, projection_operator_activated[..., 0, 0])
       
     @staticmethod
     def projectionMatrix(
@@ -197,15 +199,17 @@ class ProjectionOperator:
 
       Note:
       - Uses column-major order (Fortran) for reshaping to align with Eigen layout.
+      - The matrices of a batched controller (N x rows x cols) are projected at once,
+        with x_e (N x rows*cols x 1), S (N x rows*cols x rows*cols) and epsilon (N,).
       """
       assert matrix.shape == matrix_d.shape, "Input matrices must have the same shape"
 
-      original_shape = matrix.shape
-      total_elements = matrix.size
+      batch_shape = matrix.shape[:-2]
+      rows, cols = matrix.shape[-2:]
 
       # Reshape matrices into vectors (column-major / Fortran order consistent with Eigen)
-      reshaped_matrix = matrix.reshape((total_elements, 1), order='F')
-      reshaped_matrix_d = matrix_d.reshape((total_elements, 1), order='F')
+      reshaped_matrix = np.asarray(matrix).swapaxes(-1, -2).reshape(batch_shape + (rows * cols, 1))
+      reshaped_matrix_d = np.asarray(matrix_d).swapaxes(-1, -2).reshape(batch_shape + (rows * cols, 1))
 
       # Apply projectionVector to the reshaped vectors
       (projected_vector, activated) = ProjectionOperator.Ellipsoid.projectionVector(
@@ -213,7 +217,7 @@ class ProjectionOperator:
       )
 
       # Reshape the projected vector back to original matrix shape (column-major)
-      projected_matrix = projected_vector.reshape(original_shape, order='F')
+      projected_matrix = projected_vector.reshape(batch_shape + (cols, rows)).swapaxes(-1, -2)
 
       return (projected_matrix, activated)
-  
+    
@@ -0,0 +1,130 @@
+import os
+import json
+import hashlib
+import datetime
+import dataclasses
+import numpy as np
+
+import acsl_pychrono.config.config as Cfg
+from acsl_pychrono.executor.parameter_sweep import CONTROLLER_GAINS_SECTION
+
+# Fields that depend on where/how a batch is run, not on what is simulated, so they are not hashed (nor sweepable)
+_UNHASHED_MISSION_FIELDS = ("wrapper_batch_dir", "wrapper_run_id", "profile_flag", "profile_trace_max_events")
+
+def _jsonValue(value):
+  """JSON conversion of the values 'json' does not handle natively (NumPy arrays and scalars)."""
+  if isinstance(value, (np.ndarray, np.generic)):
+    return value.tolist()
+  return str(value)
+
+class BatchManifest:
+  """
+  Append-only record (one JSON object per line) of the status of every run of a wrapper batch.
+  Each run is identified by a hash of its 'SimulationConfig' and of the git commit of the code,
+  so that re-launching an interrupted batch can skip the runs that already completed.
+  """
+  FILENAME = "manifest.jsonl"
+  SWEEP_FILENAME = "sweep.yaml"
+
+  def __init__(self, wrapper_batch_dir: str):
+    self.wrapper_batch_dir = wrapper_batch_dir
+    self.path = os.path.join(wrapper_batch_dir, BatchManifest.FILENAME)
+    # Latest record of each run, keyed by run ID
+    self.records: dict[str, dict] = {}
+
+    os.makedirs(wrapper_batch_dir, exist_ok=True)
+    if os.path.exists(self.path):
+      self.load()
+
+  @staticmethod
+  def hashedConfig(sim_cfg: Cfg.SimulationConfig) -> dict:
+    """
+    Return the JSON-normalized content of the simulation configuration that identifies a run:
+    every field (tuples, lists and None included) but the ones of '_UNHASHED_MISSION_FIELDS'.
+    """
+    cfg_dict = json.loads(json.dumps(dataclasses.asdict(sim_cfg), default=_jsonValue))
+    for key in _UNHASHED_MISSION_FIELDS:
+      cfg_dict["mission_config"].pop(key, None)
+    return cfg_dict
+
+  @staticmethod
+  def computeRunId(sim_cfg: Cfg.SimulationConfig, commit_hash: str) -> str:
+    """Return a content hash of the simulation configuration and of the git commit."""
+    payload = json.dumps(
+      {"sim_cfg": BatchManifest.hashedConfig(sim_cfg), "commit_hash": commit_hash},
+      sort_keys=True
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+  @staticmethod
+  def checkHashedPaths(sim_cfg: Cfg.SimulationConfig, paths: list[str]):
+    """
+    Check that the swept fields addressed by the dotted 'paths' are part of the run IDs,
+    so that runs differing only in them are not merged into one.
+    The fields of '_UNHASHED_MISSION_FIELDS' are rejected as well.
+    """
+    cfg_dict = BatchManifest.hashedConfig(sim_cfg)
+    for path in paths:
+      section_name, _, field_name = path.partition(".")
+      if section_name == CONTROLLER_GAINS_SECTION:
+        keys = ["mission_config", "controller_gains_overrides", *field_name.split(".")]
+      else:
+        keys = [section_name, field_name]
+      value = cfg_dict
+      for key in keys:
+        if not isinstance(value, dict) or key not in value:
+          raise ValueError(f"Sweep parameter '{path}' is not part of the run IDs: runs differing only in it would be merged.")
+        value = value[key]
+
+  def load(self):
+    with open(self.path, "r") as f:
+      for line in f:
+        line = line.strip()
+        if not line:
+          continue
+        try:
+          record = json.loads(line)
+        except json.JSONDecodeError:
+          # Last line truncated by a crash while writing
+          continue
+        self.records[record["run_id"]] = record
+
+    # Terminate a truncated last line so that new records start on their own line
+    with open(self.path, "rb+") as f:
+      f.seek(0, os.SEEK_END)
+      if f.tell() > 0:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+          f.write(b"\n")
+
+  def record(self, run_id: str, status: str, **info):
+    """Append the new status of a run. The file is flushed to disk immediately."""
+    self.recordMany([{"run_id": run_id, "status": status, **info}])
+
+  def recordMany(self, records: list[dict]):
+    """Append the new status of several runs with a single flush to disk."""
+    if not records:
+      return
+    timestamp = datetime.datetime.now().isoformat(timespec="seconds")
+    lines = []
+    for record in records:
+      record = {**record, "time": timestamp}
+      self.records[record["run_id"]] = record
+      lines.append(json.dumps(record, default=str) + "\n")
+    with open(self.path, "a") as f:
+      f.writelines(lines)
+      f.flush()
+      os.fsync(f.fileno())
+
+  def getStatus(self, run_id: str) -> str | None:
+    record = self.records.get(run_id)
+    return record["status"] if record is not None else None
+
+  def isDone(self, run_id: str) -> bool:
+    return self.getStatus(run_id) == "done"
+
+  def countByStatus(self) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for record in self.records.values():
+      counts[record["status"]] = counts.get(record["status"], 0) + 1
+    return counts
@@ -3,6 +3,10 @@ import acsl_pychrono.executor as Executor
 
 def launchSimulation(cli_args):
   if Cfg.MissionConfig.wrapper_flag: #and not cli_args.no_wrapper_mode:
-    Executor.runParallelBatch(max_parallel=Cfg.MissionConfig.wrapper_max_parallel)
+    Executor.runParallelBatch(
+      max_parallel=Cfg.MissionConfig.wrapper_max_parallel,
+      sweep_file=Cfg.MissionConfig.wrapper_sweep_file,
+      resume_batch_dir=Cfg.MissionConfig.wrapper_resume_batch_dir or None
+    )
   else:
     Executor.runSingleSimulation(cli_args)
\ No newline at end of file
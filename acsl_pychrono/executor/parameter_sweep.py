@@ -0,0 +1,203 @@
+import os
+import itertools
+from typing import get_origin
+from dataclasses import dataclass, field, fields, is_dataclass
+import numpy as np
+import yaml
+
+import acsl_pychrono.config.config as Cfg
+
+# Sections of 'SimulationConfig' that can be addressed by a sweep parameter path
+SWEEPABLE_SECTIONS = (
+  "mission_config",
+  "vehicle_config",
+  "environment_config",
+  "wrapper_params",
+)
+
+# Prefix of the sweep parameter paths addressing a controller gain: "controller_gains.<gain>[.<key>]",
+# stored in 'MissionConfig.controller_gains_overrides' (checked against the gains YAML file when the run starts)
+CONTROLLER_GAINS_SECTION = "controller_gains"
+
+SWEEP_MODES = ("grid", "latin_hypercube", "random")
+
+@dataclass
+class SweepAxis:
+  # Dotted path of the swept field: "<config_section>.<field_name>", e.g. "wrapper_params.my_ball_density"
+  path: str
+  # Explicit list of values to sweep (takes precedence over 'low'/'high')
+  values: list | None = None
+  # Bounds of a continuous range
+  low: float | None = None
+  high: float | None = None
+  # Number of equally spaced points between 'low' and 'high' (only used in "grid" mode)
+  num: int | None = None
+
+  def gridValues(self) -> list:
+    """Return the values visited by this axis in "grid" mode."""
+    if self.values is not None:
+      return list(self.values)
+    return [value.item() for value in np.linspace(self.low, self.high, self.num)]
+
+  def sampleFromUnit(self, u: np.ndarray) -> list:
+    """Map samples in [0, 1) to values of this axis (used by "latin_hypercube" and "random")."""
+    if self.values is not None:
+      indices = np.minimum((u * len(self.values)).astype(int), len(self.values) - 1)
+      return [self.values[i] for i in indices]
+    return [value.item() for value in self.low + u * (self.high - self.low)]
+
+@dataclass
+class SweepSpec:
+  # Sampling strategy: "grid", "latin_hypercube" or "random"
+  mode: str = "grid"
+  # Swept parameters
+  axes: list[SweepAxis] = field(default_factory=list)
+  # Number of samples drawn in "latin_hypercube" and "random" modes
+  num_samples: int = 10
+  # Seed of the random generator used by "latin_hypercube" and "random" modes
+  seed: int | None = None
+
+  def __post_init__(self):
+    if self.mode not in SWEEP_MODES:
+      raise ValueError(f"Unknown sweep mode: {self.mode}. Available modes: {SWEEP_MODES}")
+
+    default_cfg = Cfg.SimulationConfig()
+    for axis in self.axes:
+      # Raises if the path does not point to an existing config field
+      getConfigFieldType(default_cfg, axis.path)
+
+      if axis.values is not None:
+        if len(axis.values) == 0:
+          raise ValueError(f"Sweep parameter '{axis.path}' has an empty list of values.")
+      elif axis.low is None or axis.high is None:
+        raise ValueError(f"Sweep parameter '{axis.path}' needs either 'values' or both 'low' and 'high'.")
+      elif self.mode == "grid" and axis.num is None:
+        raise ValueError(f"Sweep parameter '{axis.path}' needs 'num' to be discretized in \"grid\" mode.")
+
+  @classmethod
+  def fromDict(cls, spec_dict: dict) -> "SweepSpec":
+    axes = [
+      SweepAxis(path=path, **(axis_dict or {}))
+      for path, axis_dict in spec_dict.get("parameters", {}).items()
+    ]
+    return cls(
+      mode=spec_dict.get("mode", "grid"),
+      axes=axes,
+      num_samples=spec_dict.get("num_samples", 10),
+      seed=spec_dict.get("seed"),
+    )
+
+  @classmethod
+  def fromFile(cls, sweep_file: str) -> "SweepSpec":
+    """
+    Load a sweep specification from a YAML file.
+    Path relative to 'current_working_directory/params/sweeps'.
+    """
+    return cls.fromPath(os.path.join(os.getcwd(), "params", "sweeps", sweep_file))
+
+  @classmethod
+  def fromPath(cls, full_path: str) -> "SweepSpec":
+    """Load a sweep specification from a YAML file given by its full path."""
+    try:
+      with open(full_path, "r") as f:
+        print(f"[INFO] Loading parameter sweep from file: {full_path}")
+        return cls.fromDict(yaml.safe_load(f) or {})
+    except FileNotFoundError:
+      raise FileNotFoundError(f"Parameter sweep file not found at {full_path}")
+
+  def generateSamples(self) -> list[dict]:
+    """
+    Return the list of runs of the sweep.
+    Each run is a dictionary mapping the parameter paths to the values to be used.
+    """
+    if not self.axes:
+      return [{}]
+
+    paths = [axis.path for axis in self.axes]
+
+    if self.mode == "grid":
+      grid = itertools.product(*(axis.gridValues() for axis in self.axes))
+      return [dict(zip(paths, point)) for point in grid]
+
+    rng = np.random.default_rng(self.seed)
+    n = self.num_samples
+    columns = []
+    for axis in self.axes:
+      if self.mode == "latin_hypercube":
+        # One sample in each of the 'n' equally probable strata, strata shuffled per axis
+        u = (rng.permutation(n) + rng.random(n)) / n
+      else:
+        u = rng.random(n)
+      columns.append(axis.sampleFromUnit(u))
+
+    return [dict(zip(paths, point)) for point in zip(*columns)]
+
+def getConfigFieldType(sim_cfg: Cfg.SimulationConfig, path: str):
+  """Return the annotated type of the 'SimulationConfig' field addressed by a dotted path."""
+  section_name, _, field_name = path.partition(".")
+  if section_name == CONTROLLER_GAINS_SECTION:
+    if not field_name:
+      raise ValueError(f"Missing gain name in sweep parameter '{path}'.")
+    return object
+  if section_name not in SWEEPABLE_SECTIONS:
+    raise ValueError(
+      f"Unknown config section '{section_name}' in sweep parameter '{path}'. "
+      f"Available sections: {SWEEPABLE_SECTIONS + (CONTROLLER_GAINS_SECTION,)}"
+    )
+  section_fields = {f.name: f.type for f in fields(getattr(sim_cfg, section_name))}
+  if field_name not in section_fields:
+    raise ValueError(f"Unknown field '{field_name}' of '{section_name}' in sweep parameter '{path}'.")
+  return section_fields[field_name]
+
+def setConfigField(sim_cfg: Cfg.SimulationConfig, path: str, value):
+  """
+  Set the 'SimulationConfig' field addressed by a dotted path,
+  casting the value to the annotated type of the field.
+  """
+  field_type = getConfigFieldType(sim_cfg, path)
+  section_name, _, field_name = path.partition(".")
+
+  if section_name == CONTROLLER_GAINS_SECTION:
+    # Nested entry of the overrides, e.g. "KP_tran.scaling_factor" -> {"KP_tran": {"scaling_factor": value}}
+    overrides = sim_cfg.mission_config.controller_gains_overrides
+    *keys, last_key = field_name.split(".")
+    for key in keys:
+      overrides = overrides.setdefault(key, {})
+    overrides[last_key] = value
+    return
+
+  if field_type is int:
+    value = int(round(value))
+  elif field_type in (bool, float, str):
+    value = field_type(value)
+  elif get_origin(field_type) is tuple:
+    value = tuple(value)
+
+  setattr(getattr(sim_cfg, section_name), field_name, value)
+
+def generateConfigFromOverrides(overrides: dict, wrapper_batch_dir: str) -> Cfg.SimulationConfig:
+  """Generate a 'SimulationConfig' with the default parameters replaced by the sweep overrides."""
+  mis_cfg = Cfg.MissionConfig()
+  veh_cfg = Cfg.VehicleConfig()
+  env_cfg = Cfg.EnvironmentConfig()
+  wrp_prms = Cfg.WrapperParams()
+
+  mis_cfg.wrapper_batch_dir = wrapper_batch_dir
+
+  sim_cfg = Cfg.SimulationConfig(
+    mission_config=mis_cfg,
+    vehicle_config=veh_cfg,
+    environment_config=env_cfg,
+    wrapper_params=wrp_prms
+  )
+
+  for path, value in overrides.items():
+    setConfigField(sim_cfg, path, value)
+
+  # Re-apply the consistency checks of the sections (e.g., no visualization in wrapper mode)
+  for section_name in SWEEPABLE_SECTIONS:
+    section = getattr(sim_cfg, section_name)
+    if is_dataclass(section) and hasattr(section, "__post_init__"):
+      section.__post_init__()
+
+  return sim_cfg
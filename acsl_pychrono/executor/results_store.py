@@ -0,0 +1,171 @@
+import os
+import json
+import sqlite3
+import numpy as np
+from typing import TYPE_CHECKING
+
+from acsl_pychrono.simulation.phase_profiler import PhaseProfiler
+
+if TYPE_CHECKING:
+  from acsl_pychrono.simulation.pixhawk_state import VehicleState
+
+# Summary metrics of a run, with their SQLite column types
+METRIC_COLUMNS = {
+  "crashed": "INTEGER",              # 1 if the simulation raised an exception or the vehicle crashed ('crashReason')
+  "rms_tracking_error_m": "REAL",    # RMS of the distance between the vehicle and the user-defined position [m]
+  "max_attitude_rad": "REAL",        # Maximum absolute roll or pitch angle [rad]
+  "saturation_fraction": "REAL",     # Fraction of control steps with at least one saturated motor thrust
+  "wall_time_seconds": "REAL",       # Wall-clock time of the run [s]
+}
+
+# Timings of the runs profiled with 'MissionConfig.profile_flag' (NULL otherwise), with their SQLite column types
+PROFILE_COLUMNS = {
+  "step_time_us": "REAL",            # Mean wall-clock time of a simulation step [us]
+  "profile_us": "TEXT",              # JSON of the mean time per call of each phase of the step [us]
+}
+
+# Iterations of the solver of the Chrono plant (NULL for the numpy plant), with their SQLite column types
+SOLVER_COLUMNS = {
+  "solver_iterations_mean": "REAL",      # Mean number of solver iterations per step of the plant
+  "solver_full_budget_fraction": "REAL", # Fraction of the steps run with the full iteration budget ('solver_policy')
+}
+
+# Roll or pitch angle beyond which the vehicle is considered flipped [rad]
+CRASH_ATTITUDE_LIMIT_RAD = np.pi / 2
+
+def crashReason(metrics: dict, vehicle_state: "VehicleState") -> str:
+  """
+  Reason why a run that ended without raising crashed ("" if it did not): a non-finite final state
+  (the plant diverged) or a roll or pitch angle beyond 'CRASH_ATTITUDE_LIMIT_RAD' (the vehicle flipped),
+  at the end of the run or in the logged attitude ('max_attitude_rad' of the metrics).
+  """
+  attitude = np.array([vehicle_state.roll, vehicle_state.pitch, vehicle_state.yaw])
+  if not (np.all(np.isfinite(attitude)) and np.all(np.isfinite(vehicle_state.position_global))
+          and np.all(np.isfinite(vehicle_state.velocity_global))):
+    return "Diverged: non-finite vehicle state at the end of the run"
+  max_attitude = np.fmax(metrics.get("max_attitude_rad", np.nan), np.max(np.abs(attitude[:2])))
+  if max_attitude > CRASH_ATTITUDE_LIMIT_RAD:
+    return f"Flipped: roll or pitch angle of {np.rad2deg(max_attitude):.1f} deg"
+  return ""
+
+def computeRunMetrics(log_dict: dict, num_control_steps: int, num_saturated_steps: int) -> dict:
+  """
+  Compute the summary metrics of a run from its log dictionary.
+  Metrics whose channel groups are not logged (see 'LoggingProfile') are NaN.
+  """
+  accumulator = RunMetricsAccumulator()
+  accumulator.update(log_dict)
+  return accumulator.metrics(num_control_steps, num_saturated_steps)
+
+class RunMetricsAccumulator:
+  """
+  Summary metrics of a run ('computeRunMetrics') accumulated over consecutive chunks of its log,
+  e.g. the chunks flushed to a log sink, so that the whole log is never held in memory.
+  """
+  def __init__(self):
+    # Sum and number of the (non-NaN) squared tracking errors
+    self.squared_error_sum = 0.0
+    self.num_squared_errors = 0
+    self.max_attitude = float("nan")
+
+  def update(self, log_dict: dict):
+    """Accumulate the log dictionary of a chunk of logged rows."""
+    if "position" in log_dict and "user_defined_position" in log_dict:
+      position = np.hstack([log_dict["position"][axis] for axis in ("x", "y", "z")])
+      position_user = np.hstack([log_dict["user_defined_position"][axis] for axis in ("x", "y", "z")])
+      squared_error = np.sum((position - position_user) ** 2, axis=1)
+      logged = ~np.isnan(squared_error)
+      self.squared_error_sum += float(np.sum(squared_error[logged]))
+      self.num_squared_errors += int(np.count_nonzero(logged))
+
+    if "euler_angles" in log_dict:
+      attitude = np.abs(np.hstack([log_dict["euler_angles"]["roll"], log_dict["euler_angles"]["pitch"]]))
+      if attitude.size and not np.all(np.isnan(attitude)):
+        self.max_attitude = float(np.fmax(self.max_attitude, np.nanmax(attitude)))
+
+  def metrics(self, num_control_steps: int, num_saturated_steps: int) -> dict:
+    return {
+      "rms_tracking_error_m": (
+        float(np.sqrt(self.squared_error_sum / self.num_squared_errors)) if self.num_squared_errors else float("nan")
+      ),
+      "max_attitude_rad": self.max_attitude,
+      "saturation_fraction": num_saturated_steps / num_control_steps if num_control_steps else float("nan"),
+    }
+
+class ResultsStore:
+  """
+  SQLite table with one summary row per run of a wrapper batch ('results.sqlite' in the batch folder).
+  Columns: run ID (content hash of the configuration), run index, status, error, one column per swept
+  parameter (named after its path, with '.' replaced by '__'), the summary metrics of the run,
+  the iterations of the solver and the timings of the profiled runs.
+  Only the process consuming the results writes to it.
+
+  Example queries:
+    SELECT wrapper_params__my_ball_density, rms_tracking_error_m FROM runs WHERE crashed = 0
+    SELECT run_id, step_time_us, json_extract(profile_us, '$.controller') FROM runs ORDER BY step_time_us DESC
+  """
+  FILENAME = "results.sqlite"
+  TABLE = "runs"
+
+  def __init__(self, wrapper_batch_dir: str, parameter_paths: list[str]):
+    self.path = os.path.join(wrapper_batch_dir, ResultsStore.FILENAME)
+    self.parameter_paths = list(parameter_paths)
+    self.connection = sqlite3.connect(self.path)
+    self.createTable()
+
+  @staticmethod
+  def parameterColumn(path: str) -> str:
+    return path.replace(".", "__")
+
+  def createTable(self):
+    metric_columns = ", ".join(f"{name} {sql_type}" for name, sql_type in METRIC_COLUMNS.items())
+    self.connection.execute(
+      f"CREATE TABLE IF NOT EXISTS {ResultsStore.TABLE} ("
+      f"run_id TEXT PRIMARY KEY, run_index INTEGER, status TEXT, error TEXT, {metric_columns})"
+    )
+    # Profile and solver columns and swept parameters are added as columns, also to the table of a resumed batch
+    existing_columns = {row[1] for row in self.connection.execute(f"PRAGMA table_info({ResultsStore.TABLE})")}
+    for column, sql_type in {**PROFILE_COLUMNS, **SOLVER_COLUMNS}.items():
+      if column not in existing_columns:
+        self.connection.execute(f"ALTER TABLE {ResultsStore.TABLE} ADD COLUMN {column} {sql_type}")
+    for path in self.parameter_paths:
+      column = ResultsStore.parameterColumn(path)
+      if column not in existing_columns:
+        self.connection.execute(f'ALTER TABLE {ResultsStore.TABLE} ADD COLUMN "{column}"')
+    self.connection.execute(f"CREATE INDEX IF NOT EXISTS idx_{ResultsStore.TABLE}_status ON {ResultsStore.TABLE} (status)")
+    self.connection.commit()
+
+  def record(self, result: dict):
+    """Insert (or replace, for a re-run) the summary row of a run result."""
+    row = {
+      "run_id": result["run_id"],
+      "run_index": result["run_index"],
+      "status": result["status"],
+      "error": result.get("error", ""),
+    }
+    for name in METRIC_COLUMNS:
+      value = result.get(name)
+      row[name] = int(value) if isinstance(value, bool) else value
+    for name in SOLVER_COLUMNS:
+      row[name] = result.get(name)
+    profile_summary = PhaseProfiler.summarize(result["profile"]) if result.get("profile") else {}
+    row["step_time_us"] = profile_summary["step"]["mean_us"] if "step" in profile_summary else None
+    row["profile_us"] = json.dumps({name: phase["mean_us"] for name, phase in profile_summary.items()}) if profile_summary else None
+    for path in self.parameter_paths:
+      value = result["overrides"].get(path)
+      # Non-scalar values (e.g., tuples) are stored as JSON text
+      row[ResultsStore.parameterColumn(path)] = value if isinstance(value, (int, float, str)) or value is None else json.dumps(value)
+
+    columns = ", ".join(f'"{column}"' for column in row)
+    placeholders = ", ".join("?" for _ in row)
+    self.connection.execute(
+      f"INSERT OR REPLACE INTO {ResultsStore.TABLE} ({columns}) VALUES ({placeholders})",
+      list(row.values())
+    )
+    self.connection.commit()
+
+  def query(self, sql: str, parameters: tuple = ()) -> list[tuple]:
+    return self.connection.execute(sql, parameters).fetchall()
+
+  def close(self):
+    self.connection.close()
@@ -1,5 +1,5 @@
 from acsl_pychrono.executor.simulate_mission import simulateMission
-from acsl_pychrono.simulation.simulation import Simulation
+from acsl_pychrono.executor.simulation_cache import instantiateSimulation
 import acsl_pychrono.config.config as Cfg
 from acsl_pychrono.control.logging import Logging
 from acsl_pychrono import update_cfg_from_cli_args 
@@ -26,5 +26,5 @@ def runSingleSimulation(cli_args):
 
   git_info = Logging.getGitRepoInfo()
 
-  sim = Simulation(sim_cfg)
+  sim = instantiateSimulation(sim_cfg)
   simulateMission(sim, git_info)
\ No newline at end of file
@@ -1,35 +1,31 @@
 import os
+import json
+import time
+import shutil
+import warnings
+import traceback
 from datetime import datetime
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from acsl_pychrono.executor.simulate_mission import simulateMission
-from acsl_pychrono.simulation.simulation import Simulation
+from acsl_pychrono.executor.parameter_sweep import SweepSpec, generateConfigFromOverrides
+from acsl_pychrono.executor.batch_manifest import BatchManifest
+from acsl_pychrono.executor.results_store import ResultsStore
+import acsl_pychrono.executor.simulation_cache as SimulationCache
 import acsl_pychrono.config.config as Cfg
 from acsl_pychrono.control.logging import Logging
+from acsl_pychrono.simulation.phase_profiler import PhaseProfiler
 
-def runWrapperSimulation(sim_cfg: Cfg.SimulationConfig, git_info: dict | None = None):
-  """Run a single wrapper simulation from a given configuration."""
-  sim = Simulation(sim_cfg)
-  simulateMission(sim, git_info)
+# Number of slowest profiled runs printed at the end of a batch
+NUM_SLOWEST_PROFILED_RUNS = 5
 
-def generateConfigForDensity(ball_density: float, wrapper_batch_dir: str) -> Cfg.SimulationConfig:
-  """Generate a 'SimulationConfig' with the specified ball density."""
-  mis_cfg = Cfg.MissionConfig()
-  veh_cfg = Cfg.VehicleConfig()
-  env_cfg = Cfg.EnvironmentConfig()
-  wrp_prms = Cfg.WrapperParams()
-
-  wrp_prms.my_ball_density = ball_density
-  mis_cfg.wrapper_batch_dir = wrapper_batch_dir
-
-  sim_cfg = Cfg.SimulationConfig(
-    mission_config=mis_cfg,
-    vehicle_config=veh_cfg,
-    environment_config=env_cfg,
-    wrapper_params=wrp_prms
-  )
-
-  return sim_cfg
+def runWrapperSimulation(sim_cfg: Cfg.SimulationConfig, git_info: dict | None = None) -> dict:
+  """Run a single wrapper simulation from a given configuration and return its summary."""
+  if sim_cfg.mission_config.reuse_simulation_template:
+    sim = SimulationCache.getSimulation(sim_cfg)
+  else:
+    sim = SimulationCache.instantiateSimulation(sim_cfg)
+  return simulateMission(sim, git_info)
 
 def getMaxParallel(user_requested_cores: int | None = None) -> int:
   """Return the safe number of parallel workers based on CPU availability."""
@@ -43,24 +39,201 @@ def generateWrapperBatchDir() -> str:
   month = datetime.now().strftime("%m")
   return os.path.join("logs", "wrapper", year, month, f"ws_{batch_timestamp}")
 
-def runParallelBatch(max_parallel: int | None = None):
-  """Generate configs and run simulations in parallel."""
+def generateSweepRuns(sweep_spec: SweepSpec, wrapper_batch_dir: str, commit_hash: str) -> list[dict]:
+  """
+  Generate one run per distinct configuration of the sweep,
+  identified by the content hash of its configuration and of the git commit.
+  """
+  runs = []
+  run_ids = set()
+  for run_index, overrides in enumerate(sweep_spec.generateSamples()):
+    sim_cfg = generateConfigFromOverrides(overrides, wrapper_batch_dir)
+    if run_index == 0:
+      BatchManifest.checkHashedPaths(sim_cfg, list(overrides))
+    run_id = BatchManifest.computeRunId(sim_cfg, commit_hash)
+    if run_id in run_ids:
+      continue # Same configuration already part of the sweep
+    run_ids.add(run_id)
+    sim_cfg.mission_config.wrapper_run_id = run_id
+    runs.append({
+      "run_index": run_index,
+      "run_id": run_id,
+      "overrides": overrides,
+      "sim_cfg": sim_cfg,
+    })
+  return runs
+
+def iterateSweepResults(runs: list[dict], max_parallel: int, git_info: dict | None = None):
+  """
+  Submit one simulation per run to a process pool
+  and yield each run's result as soon as it finishes (completion order, not submission order).
+  """
+  # Long-lived workers keep the systems they built and only reset them between runs:
+  # runs sharing a vehicle/environment/payload are submitted together to maximize reuse
+  reuse = bool(runs) and runs[0]["sim_cfg"].mission_config.reuse_simulation_template
+  if reuse:
+    runs = sorted(runs, key=lambda run: str(SimulationCache.getTemplateKey(run["sim_cfg"])))
+
+  with ProcessPoolExecutor(
+      max_workers=max_parallel,
+      initializer=SimulationCache.initWarmWorker if reuse else None,
+      initargs=(runs[0]["sim_cfg"],) if reuse else ()
+      ) as executor:
+    futures = {}
+    for run in runs:
+      future = executor.submit(
+        runWrapperSimulationWithGitInfo,
+        (run["sim_cfg"], git_info, run["run_index"], run["overrides"])
+      )
+      futures[future] = run
+
+    for future in as_completed(futures):
+      run = futures[future]
+      try:
+        result = future.result()
+      except Exception as e:
+        # The worker process itself died (e.g., killed by the OS), so no result came back
+        result = {
+          "run_index": run["run_index"],
+          "overrides": run["overrides"],
+          "status": "failed",
+          "error": f"{type(e).__name__}: {e}",
+          "wall_time_seconds": float("nan"),
+        }
+      result["run_id"] = run["run_id"]
+      yield result
+
+def reportBatchProfile(results: list[dict], wrapper_batch_dir: str):
+  """
+  Aggregate the step timings of the profiled runs of the batch (from all the workers), print them with the
+  slowest runs and their slowest phase, and save them in 'profile_summary.json' in the batch folder.
+  """
+  profiled_results = [result for result in results if result.get("profile")]
+  if not profiled_results:
+    return
+
+  merged_profile = PhaseProfiler.mergeProfiles([result["profile"] for result in profiled_results])
+  PhaseProfiler.printSummary(merged_profile, f"Profile of stepSimulation over {len(profiled_results)} runs")
+
+  runs = []
+  for result in profiled_results:
+    run_summary = PhaseProfiler.summarize(result["profile"])
+    phases = {name: phase for name, phase in run_summary.items() if name != "step"}
+    runs.append({
+      "run_id": result["run_id"],
+      "run_index": result["run_index"],
+      "overrides": result["overrides"],
+      "step_time_us": run_summary["step"]["mean_us"] if "step" in run_summary else float("nan"),
+      "slowest_phase": max(phases, key=lambda name: phases[name]["total_s"]) if phases else "",
+      "phases": run_summary,
+    })
+  runs.sort(key=lambda run: run["step_time_us"], reverse=True)
+
+  print("[INFO] Slowest profiled runs (mean step time, slowest phase):")
+  for run in runs[:NUM_SLOWEST_PROFILED_RUNS]:
+    print(f"  Run {run['run_index']} ({run['run_id']}): {run['step_time_us']:.1f} us, {run['slowest_phase']}: {run['overrides']}")
+
+  profile_path = os.path.join(wrapper_batch_dir, "profile_summary.json")
+  with open(profile_path, "w") as f:
+    json.dump({"batch": PhaseProfiler.summarize(merged_profile), "runs": runs}, f, indent=2, default=str)
+  print(f"[INFO] Profile of the runs saved in: {profile_path}")
+
+def runParallelBatch(
+    max_parallel: int | None = None,
+    sweep_file: str | None = None,
+    resume_batch_dir: str | None = None,
+    on_result=None
+    ):
+  """
+  Generate configs from the parameter sweep file and run simulations in parallel.
+  If 'resume_batch_dir' is given, the batch in that folder is resumed and the runs
+  recorded as done in its manifest are skipped.
+  'on_result', if given, is called with each run's result as soon as the run finishes.
+  """
   max_parallel = getMaxParallel(max_parallel)
-  wrapper_batch_dir = generateWrapperBatchDir()
-  print(f"Running simulations with up to {max_parallel} parallel workers.")
-  print(f"Running batch in folder: {wrapper_batch_dir}")
+  sweep_file = sweep_file or Cfg.MissionConfig.wrapper_sweep_file
+
+  if resume_batch_dir:
+    wrapper_batch_dir = resume_batch_dir
+    if not os.path.isdir(wrapper_batch_dir):
+      raise FileNotFoundError(f"Wrapper batch folder to be resumed not found at {wrapper_batch_dir}")
+  else:
+    wrapper_batch_dir = generateWrapperBatchDir()
+
+  manifest = BatchManifest(wrapper_batch_dir)
+
+  # The batch keeps its own copy of the sweep so that it can be resumed even if the params file changed
+  batch_sweep_path = os.path.join(wrapper_batch_dir, BatchManifest.SWEEP_FILENAME)
+  if not os.path.exists(batch_sweep_path):
+    shutil.copyfile(os.path.join(os.getcwd(), "params", "sweeps", sweep_file), batch_sweep_path)
+  sweep_spec = SweepSpec.fromPath(batch_sweep_path)
+  if sweep_spec.mode != "grid" and sweep_spec.seed is None:
+    warnings.warn("The sweep has no seed: its samples, hence its run IDs, cannot be reproduced when resuming.")
 
   git_info = Logging.getGitRepoInfo()
+  if git_info["dirty"]:
+    warnings.warn("The git repository has uncommitted changes, which are not part of the run IDs.")
+
+  runs = generateSweepRuns(sweep_spec, wrapper_batch_dir, git_info["commit_hash"])
+  results_store = ResultsStore(wrapper_batch_dir, [axis.path for axis in sweep_spec.axes])
+  pending_runs = [run for run in runs if not manifest.isDone(run["run_id"])]
+  num_runs = len(pending_runs)
+
+  print(f"Running simulations with up to {max_parallel} parallel workers.")
+  num_threads = max((run["sim_cfg"].mission_config.chrono_num_threads for run in pending_runs), default=0)
+  if max_parallel * max(num_threads, 1) > (os.cpu_count() or 1):
+    warnings.warn(f"{max_parallel} workers with {num_threads} Chrono threads each oversubscribe the {os.cpu_count()} CPUs.")
+  print(f"Running batch in folder: {wrapper_batch_dir}")
+  print(f"Running '{sweep_spec.mode}' sweep over {[axis.path for axis in sweep_spec.axes]}: {len(runs)} runs.")
+  if len(runs) > num_runs:
+    print(f"[INFO] Skipping {len(runs) - num_runs} runs already completed in this batch.")
 
-  # Define parameter sweep
-  densities = range(1000, 10001, 1000)
-  sim_configs = [generateConfigForDensity(d, wrapper_batch_dir) for d in densities]
+  manifest.recordMany([
+    {"run_id": run["run_id"], "status": "submitted", "run_index": run["run_index"], "overrides": run["overrides"]}
+    for run in pending_runs
+  ])
 
-  args = [(cfg, git_info) for cfg in sim_configs]
+  results = []
+  for num_finished, result in enumerate(iterateSweepResults(pending_runs, max_parallel, git_info), start=1):
+    manifest.record(
+      result["run_id"],
+      result["status"],
+      run_index=result["run_index"],
+      overrides=result["overrides"],
+      error=result["error"],
+      wall_time_seconds=result["wall_time_seconds"]
+    )
+    results_store.record(result)
+    print(
+      f"[INFO] Run {result['run_index']} ({result['run_id']}) {result['status']} "
+      f"({num_finished}/{num_runs}, {result['wall_time_seconds']:.1f} s): {result['overrides']}"
+    )
+    if result["status"] == "failed":
+      print(f"[ERROR] Run {result['run_index']} failed: {result['error']}")
+    if on_result is not None:
+      on_result(result)
+    results.append(result)
 
-  with ProcessPoolExecutor(max_workers=max_parallel) as executor:
-    executor.map(runWrapperSimulationWithGitInfo, args)
+  results_store.close()
+  reportBatchProfile(results, wrapper_batch_dir)
+  print(f"[INFO] Batch status: {manifest.countByStatus()}")
+  print(f"[INFO] Summary metrics of the runs saved in: {results_store.path}")
+  return results
 
-def runWrapperSimulationWithGitInfo(args: tuple[Cfg.SimulationConfig, dict]):
-  sim_cfg, git_info = args
-  runWrapperSimulation(sim_cfg, git_info)
\ No newline at end of file
+def runWrapperSimulationWithGitInfo(args: tuple[Cfg.SimulationConfig, dict, int, dict]) -> dict:
+  sim_cfg, git_info, run_index, overrides = args
+  result = {
+    "run_index": run_index,
+    "overrides": overrides,
+    "status": "done",
+    "error": "",
+  }
+  start_time = time.perf_counter()
+  try:
+    # Crash flag, crash error and metrics of the run
+    result.update(runWrapperSimulation(sim_cfg, git_info))
+  except Exception as e:
+    result["status"] = "failed"
+    result["error"] = f"{type(e).__name__}: {e}\n{traceback.format_exc()}"
+  result["wall_time_seconds"] = time.perf_counter() - start_time
+  return result
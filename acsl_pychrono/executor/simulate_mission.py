@@ -1,14 +1,26 @@
+import os
 import traceback
 from acsl_pychrono.simulation.simulation import Simulation
 import acsl_pychrono.user_defined_trajectory as Traj
 import acsl_pychrono.control as Ctrl
 import acsl_pychrono.uav as UAV_Module
 from acsl_pychrono.control.logging import Logging
+from acsl_pychrono.control.logging_profile import LoggingProfile
+from acsl_pychrono.control.log_sinks import createLogSink
+from acsl_pychrono.executor.results_store import computeRunMetrics, crashReason, RunMetricsAccumulator
 from acsl_pychrono.simulation.ode_input import OdeInput
 from acsl_pychrono.simulation.flight_params import FlightParams
+from acsl_pychrono.simulation.phase_profiler import PhaseProfiler
+from acsl_pychrono.simulation.scheduler import subsystemPeriod
+
+def simulateMission(sim: Simulation, git_info: dict | None = None) -> dict:
+  """
+  Run the mission and save its logs.
+  Returns the summary of the run: crash flag and error (the exception raised by the loop, or the 'crashReason'
+  of a run that ended without raising), the metrics of 'computeRunMetrics',
+  the iterations of the solver of the Chrono plant ('FixedSolverPolicy.summaryMetrics') and, if 'profile_flag' is set, the per-phase timings of 'PhaseProfiler.toDict'.
+  """
 
-def simulateMission(sim: Simulation, git_info: dict | None = None):
-  
   # Instantiation of UAV and its controller parameters
   (uav, uav_controller) = UAV_Module.instantiateUAV(
     sim.vehicle_config.uav_name,
@@ -17,6 +29,7 @@ def simulateMission(sim: Simulation, git_info: dict | None = None):
   
   # Instantiation of classes
   flight_params = FlightParams(uav, uav_controller)
+  flight_params.controller_gains_overrides = sim.mission_config.controller_gains_overrides
   ode_input = OdeInput()
   sim.setGravitationalAcceleration(flight_params)
 
@@ -28,12 +41,40 @@ def simulateMission(sim: Simulation, git_info: dict | None = None):
     sim.mfloor_Yposition
   )
 
+  # Channel groups to be logged and their rates
+  logging_profile = LoggingProfile.fromFile(sim.mission_config.logging_profile)
+
+  # Wrapper runs only keep their summary metrics, unless the full logs are requested
+  save_full_logs = not sim.mission_config.wrapper_flag or sim.mission_config.wrapper_save_full_logs
+
+  # Destination of the log: kept in memory, or flushed to disk in chunks during the run
+  full_path_log = None
+  log_sink = None
+  if save_full_logs:
+    full_path_log = Logging.getLogFilePath(sim.simulation_config, "mat")
+    log_sink = createLogSink(
+      sim.mission_config.log_sink,
+      os.path.splitext(full_path_log)[0],
+      sim.mission_config.log_chunk_rows,
+      metadata={
+        "sim_cfg": Logging.dataclassToDict(sim.simulation_config, truncate_keys=False),
+        "git_info": git_info
+      }
+    )
+
   # Instantiation of controller, gains, and logger
   (gains, controller, logger) = Ctrl.instantiateController(
     sim.mission_config.controller_type,
     ode_input,
     flight_params,
-    sim.mission_config.timestep
+    subsystemPeriod(sim.mission_config, sim.mission_config.control_period),
+    sim.mission_config.simulation_duration_seconds,
+    logging_profile,
+    log_sink,
+    sim.mission_config.controller_kernel,
+    sim.mission_config.controller_integrator,
+    sim.mission_config.gains_cache_dir,
+    subsystemPeriod(sim.mission_config, sim.mission_config.logging_period)
   )
 
   sim.assignInstances(
@@ -45,17 +86,67 @@ def simulateMission(sim: Simulation, git_info: dict | None = None):
     logger
   )
 
+  # With a sink, the summary metrics are accumulated over the flushed chunks: the log is only read back
+  # from disk for the '.mat' export
+  metrics_accumulator = None
+  if log_sink is not None:
+    metrics_accumulator = RunMetricsAccumulator()
+    logger.addFlushListener(metrics_accumulator.update)
+
+  # Per-phase timing of the simulation step
+  profiler = None
+  if sim.mission_config.profile_flag:
+    profiler = PhaseProfiler(sim.mission_config.profile_trace_max_events)
+    profiler.instrument(sim)
+
+  summary = {"crashed": False, "error": ""}
   try:
     sim.runSimulationLoop()
   except Exception as e:
     print(f"\n[ERROR] Simulation crashed: {e}")
     traceback.print_exc()
+    summary["crashed"] = True
+    summary["error"] = f"{type(e).__name__}: {e}"
   finally:
+    if profiler is not None:
+      # The simulation may be reused by the next run, without the timed methods
+      profiler.restore()
+      summary["profile"] = profiler.toDict()
+      PhaseProfiler.printSummary(summary["profile"])
+      if profiler.events:
+        trace_path = os.path.splitext(full_path_log or Logging.getLogFilePath(sim.simulation_config, "mat"))[0] + "_trace.json"
+        profiler.writeChromeTrace(trace_path)
+
     print("\n[INFO] Saving logs before exit...")
-    log_dict = logger.toDictionary()
-    Logging.saveMatlabWorkspaceLog(
-      log_dict,
-      gains,
-      sim.simulation_config,
-      git_info
-    )
\ No newline at end of file
+    logger.flush()
+    try:
+      if metrics_accumulator is None:
+        log_dict = logger.toDictionary()
+        summary.update(computeRunMetrics(log_dict, sim.num_control_steps, sim.num_saturated_steps))
+      else:
+        summary.update(metrics_accumulator.metrics(sim.num_control_steps, sim.num_saturated_steps))
+      if not summary["crashed"]:
+        crash_reason = crashReason(summary, sim.getVehicleState())
+        if crash_reason:
+          print(f"\n[WARNING] Vehicle crashed: {crash_reason}")
+          summary["crashed"] = True
+          summary["error"] = crash_reason
+      if sim.solver_policy is not None:
+        summary.update(sim.solver_policy.summaryMetrics())
+      if save_full_logs and (log_sink is None or sim.mission_config.log_export_mat):
+        if log_sink is not None:
+          log_dict = logger.toDictionary()
+        Logging.saveMatlabWorkspaceLog(
+          log_dict,
+          gains,
+          sim.simulation_config,
+          git_info,
+          logging_profile,
+          full_path_log,
+          sim.solver_policy.toDictionary() if sim.solver_policy is not None else None
+        )
+    finally:
+      if log_sink is not None:
+        log_sink.close()
+
+  return summary
\ No newline at end of file
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+
+from acsl_pychrono.simulation.simulation import Simulation
+from acsl_pychrono.simulation.surrogate_simulation import SurrogateSimulation
+import acsl_pychrono.config.config as Cfg
+
+# Simulation classes of the plant backends ('MissionConfig.plant_backend')
+simulation_classes = {
+  "chrono": Simulation,
+  "numpy": SurrogateSimulation,
+}
+
+# Built simulations of this process, keyed by the config fields used to build their Chrono system
+_simulation_templates: "OrderedDict[tuple, Simulation]" = OrderedDict()
+
+# Maximum number of built simulations kept alive per process (least recently used are dropped)
+MAX_CACHED_SIMULATIONS = 4
+
+def instantiateSimulation(sim_cfg: Cfg.SimulationConfig) -> Simulation:
+  """Build the simulation of the plant backend selected by 'sim_cfg'."""
+  plant_backend = sim_cfg.mission_config.plant_backend
+  SimulationClass = simulation_classes.get(plant_backend)
+  if SimulationClass is None:
+    raise ValueError(f"Unknown plant backend: {plant_backend}")
+  return SimulationClass(sim_cfg)
+
+def getTemplateKey(sim_cfg: Cfg.SimulationConfig) -> tuple:
+  """
+  Return the config fields read while building the Chrono system (system, solver, propellers, vehicle CAD,
+  environment, payload).
+  Runs with the same key can share the same built system: the remaining per-run parameters
+  (e.g., ball density, motor failure time, wind) are applied by 'Simulation.resetToInitialState'.
+  """
+  return (
+    sim_cfg.mission_config.plant_backend,
+    sim_cfg.mission_config.chrono_system,
+    sim_cfg.mission_config.chrono_solver,
+    sim_cfg.mission_config.propeller_mode,
+    sim_cfg.vehicle_config.uav_name,
+    sim_cfg.environment_config.include,
+    sim_cfg.environment_config.model_relative_path,
+    sim_cfg.mission_config.add_payload_flag,
+    sim_cfg.mission_config.payload_type,
+  )
+
+def getSimulation(sim_cfg: Cfg.SimulationConfig) -> Simulation:
+  """
+  Return a 'Simulation' ready to run 'sim_cfg'.
+  The first run of a vehicle/environment/payload combination builds the system (CAD import, meshes,
+  collision shapes, markers, motors); the following runs in the same process only reset it to its
+  initial conditions. Runs with visualization are always built from scratch.
+  """
+  if sim_cfg.mission_config.visualization_flag:
+    return instantiateSimulation(sim_cfg)
+
+  key = getTemplateKey(sim_cfg)
+  sim = _simulation_templates.get(key)
+  if sim is None:
+    sim = instantiateSimulation(sim_cfg)
+    _simulation_templates[key] = sim
+    if len(_simulation_templates) > MAX_CACHED_SIMULATIONS:
+      _simulation_templates.popitem(last=False)
+  else:
+    sim.resetToInitialState(sim_cfg)
+    _simulation_templates.move_to_end(key)
+    print(f"[INFO] Reusing the Chrono system built for {key}.")
+
+  return sim
+
+def initWarmWorker(sim_cfg: Cfg.SimulationConfig | None = None):
+  """
+  Initializer of the wrapper worker processes: builds the system for 'sim_cfg' once at worker startup,
+  so that the worker is warm when its first run arrives.
+  """
+  if sim_cfg is None:
+    return
+  try:
+    getSimulation(sim_cfg)
+  except Exception as e:
+    # The run itself will rebuild the system and report the error
+    print(f"[WARNING] Could not prebuild the simulation in the wrapper worker: {e}")
+
+def clearSimulationCache():
+  _simulation_templates.clear()
@@ -0,0 +1,68 @@
+import numpy as np
+
+from acsl_pychrono.simulation.flight_params import FlightParams
+
+class MotorActuators:
+  """
+  Motors of the UAV reduced to a single wrench on the drone frame.
+  The geometry is precomputed once: the thrust of the motor 'motor_index_map[i]' acts along the local y-axis at
+  'force_positions[i % number of positions]', its propeller reaction torque about the local y-axis
+  (spin direction * K_torque * omega^2, with omega^2 = thrust / K_omega). 'update' clamps the thrusts of a control
+  step to the motor limits, applies the motor efficiency and sums the thrusts and reaction torques into the net
+  local force and torque about the COG ('force', 'torque'), held until the next control step.
+  """
+  def __init__(self, flight_params: FlightParams, force_positions: np.ndarray, number_of_propellers: int):
+    uav = flight_params.uav
+    motor_index_map = getattr(uav, "motor_index_map", None)
+    if motor_index_map is None:
+      motor_index_map = list(range(number_of_propellers))
+    if len(motor_index_map) != number_of_propellers:
+      raise ValueError(f"motor_index_map length ({len(motor_index_map)}) does not match number of motors ({number_of_propellers})")
+
+    self.minimum_motor_thrust = uav.minimum_motor_thrust
+    self.maximum_motor_thrust = uav.maximum_motor_thrust
+    self.K_omega = flight_params.uav_controller.K_omega
+
+    # Wrench (local force, local torque about the COG) per unit thrust of each motor (6 x number of propellers)
+    force_positions = np.asarray(force_positions, dtype=float)
+    self.wrench_matrix = np.zeros((6, number_of_propellers))
+    for i, motor in enumerate(motor_index_map):
+      x, _, z = force_positions[i % len(force_positions)]
+      # Thrust along y at (x, y, z): force (0, 1, 0), moment (x, y, z) x (0, 1, 0) = (-z, 0, x)
+      self.wrench_matrix[1, motor] += 1.0
+      self.wrench_matrix[3, motor] -= z
+      self.wrench_matrix[5, motor] += x
+    self.wrench_matrix[4, :] = (
+      np.asarray(uav.propellers_spin_directions, dtype=float) * flight_params.uav_controller.K_torque / self.K_omega
+    )
+
+    # Efficiency matrix of the motors (as an array), converted again when it is replaced (e.g., motor failure)
+    self.efficiency_matrix = None
+    self.efficiency_array = None
+
+    # Outcome of the last control step
+    self.motor_thrusts = np.zeros((number_of_propellers, 1))
+    self.omega = np.zeros((number_of_propellers, 1))
+    self.force = np.zeros(3)
+    self.torque = np.zeros(3)
+
+  def update(self, motor_thrusts: np.ndarray, efficiency_matrix) -> bool:
+    """
+    Clamp the thrusts to the motor limits, apply the efficiency matrix and compute the net force and torque.
+    Return whether any thrust was saturated.
+    """
+    motor_thrusts = np.asarray(motor_thrusts, dtype=float)
+    saturated = bool(np.any((motor_thrusts < self.minimum_motor_thrust) | (motor_thrusts > self.maximum_motor_thrust)))
+    clamped_thrusts = np.clip(motor_thrusts, self.minimum_motor_thrust, self.maximum_motor_thrust)
+
+    if efficiency_matrix is not self.efficiency_matrix:
+      self.efficiency_matrix = efficiency_matrix
+      self.efficiency_array = np.asarray(efficiency_matrix, dtype=float)
+    self.motor_thrusts = self.efficiency_array @ clamped_thrusts
+
+    # Propeller angular velocities
+    self.omega = np.sqrt(self.motor_thrusts / self.K_omega)
+    wrench = self.wrench_matrix @ self.motor_thrusts[:, 0]
+    self.force = wrench[:3]
+    self.torque = wrench[3:]
+    return saturated
@@ -1,5 +1,4 @@
-from acsl_pychrono.uav import UAV, UAV_Controller_Params
-import yaml
+from acsl_pychrono.uav import UAV, UAV_Controller_Params, load_yaml_file
 from pathlib import Path
 import numpy as np
 
@@ -13,21 +12,44 @@ class FlightParams:
     
     # Time after the start of simulation at which the controller is switched ON
     self.controller_start_time = 0.1 #uav_cfg["controller"]["controller_start_time"]
+
+    # Controller gains replacing those of the gains YAML file (see 'MissionConfig.controller_gains_overrides')
+    self.controller_gains_overrides: dict = {}
     
-  # Function to get Controller's numerical Parameters from YAML config file
   @staticmethod
-  def get_controller_config(gains_config_filename: str, uav_name: str):
-    """Load the Controller gains from its YAML file."""
-    config_path = Path.cwd() / "acsl_pychrono/uav" / uav_name / "Controller_Gains" / gains_config_filename
+  def get_controller_config_path(gains_config_filename: str, uav_name: str) -> Path:
+    """Path of the Controller gains YAML file."""
+    return Path.cwd() / "acsl_pychrono/uav" / uav_name / "Controller_Gains" / gains_config_filename
+
+  # Function to get Controller's numerical Parameters from YAML config file
+  def get_controller_config(self, gains_config_filename: str, uav_name: str):
+    """Load the Controller gains from its YAML file, with 'controller_gains_overrides' applied."""
+    config_path = FlightParams.get_controller_config_path(gains_config_filename, uav_name)
     
     # Load and return the configuration dictionary
     try:
-      with open(config_path, "r") as f:
-        print(f"[INFO] Loading Gains from file: {config_path}")
-        return yaml.safe_load(f)
+      print(f"[INFO] Loading Gains from file: {config_path}")
+      gains_config = load_yaml_file(config_path)
     except FileNotFoundError:
       raise FileNotFoundError(f"Controller gains config file not found at {config_path}")
 
+    FlightParams.apply_gains_overrides(gains_config, self.controller_gains_overrides)
+    return gains_config
+
+  @staticmethod
+  def apply_gains_overrides(config_dict: dict, overrides: dict, prefix: str = ""):
+    """
+    Replace in place the entries of a gains config section by those of 'overrides', with the same nesting,
+    e.g. {"KP_tran": {"scaling_factor": 1.2}, "use_projection_operator": False}.
+    """
+    for key, value in overrides.items():
+      if key not in config_dict:
+        raise ValueError(f"Unknown controller gain: {prefix + key}")
+      if isinstance(value, dict) and isinstance(config_dict[key], dict):
+        FlightParams.apply_gains_overrides(config_dict[key], value, prefix + key + ".")
+      else:
+        config_dict[key] = value
+
   @staticmethod
   def get_scaled_matrix_from_config(config_dict: dict, var_name: str):
     """Utility function to get a scaled matrix from a config section."""
@@ -0,0 +1,62 @@
+import numpy as np
+import pychrono as chrono
+
+import acsl_pychrono.simulation.functions as fun
+
+def vectorToArray(vector: chrono.ChVectorD) -> np.ndarray:
+  return np.array([vector.x, vector.y, vector.z])
+
+def bodyMassProperties(body: chrono.ChBody) -> tuple[float, np.ndarray, np.ndarray]:
+  """Mass, global position of the COG and inertia tensor about the COG in global axes of a body."""
+  # Rotation matrix from the COG frame of the body (Local) to Global coordinates
+  rotmat = np.array(fun.rotmat_fromQ_Glob_to_Loc_asarray(body.GetRot())).T
+  xx = body.GetInertiaXX()
+  xy = body.GetInertiaXY()
+  inertia_local = np.array([
+    [xx.x, xy.x, xy.y],
+    [xy.x, xx.y, xy.z],
+    [xy.y, xy.z, xx.z]
+  ])
+  return body.GetMass(), vectorToArray(body.GetPos()), rotmat @ inertia_local @ rotmat.T
+
+def compositeMassProperties(bodies: list[chrono.ChBody]) -> tuple[float, np.ndarray, np.ndarray]:
+  """Mass, global position of the COG and inertia tensor about the COG in global axes of rigidly joined bodies."""
+  properties = [bodyMassProperties(body) for body in bodies]
+  mass = sum(body_mass for body_mass, _, _ in properties)
+  cog = sum(body_mass * body_cog for body_mass, body_cog, _ in properties) / mass
+  inertia = np.zeros((3, 3))
+  for body_mass, body_cog, body_inertia in properties:
+    # Parallel axis theorem
+    offset = body_cog - cog
+    inertia += body_inertia + body_mass * (offset.dot(offset) * np.eye(3) - np.outer(offset, offset))
+  return mass, cog, inertia
+
+def mergeMassProperties(body: chrono.ChBodyAuxRef, attached_bodies: list[chrono.ChBody]) -> chrono.ChVectorD:
+  """
+  Give 'body' the mass properties of itself plus 'attached_bodies' rigidly attached to it.
+  Its COG is moved, keeping its orientation, while its reference frame and its markers stay in place.
+  Return the previous COG in the new COG frame: the offset to add to the points local to the previous COG frame.
+  Raises a RuntimeError if, once moved, the COG is not at the composite COG or the reference frame moved.
+  """
+  mass, cog, inertia = compositeMassProperties([body, *attached_bodies])
+  previous_cog = chrono.ChVectorD(body.GetPos())
+  ref_position = vectorToArray(body.GetFrame_REF_to_abs().GetPos())
+
+  cog_rot = chrono.ChQuaternionD(body.GetFrame_COG_to_REF().GetRot())
+  cog_REF = body.GetFrame_REF_to_abs().GetCoord().TransformParentToLocal(chrono.ChVectorD(*cog.tolist()))
+  body.SetFrame_COG_to_REF(chrono.ChFrameD(cog_REF, cog_rot))
+  if not np.allclose(vectorToArray(body.GetPos()), cog, rtol=0.0, atol=1e-9) or \
+     not np.allclose(vectorToArray(body.GetFrame_REF_to_abs().GetPos()), ref_position, rtol=0.0, atol=1e-9):
+    raise RuntimeError(
+      f"Moving the COG of '{body.GetName()}' did not keep its reference frame in place: "
+      f"COG {vectorToArray(body.GetPos())} (expected {cog}), reference frame "
+      f"{vectorToArray(body.GetFrame_REF_to_abs().GetPos())} (expected {ref_position})"
+    )
+
+  # Inertia tensor in the axes of the (unrotated) COG frame
+  rotmat = np.array(fun.rotmat_fromQ_Glob_to_Loc_asarray(body.GetRot()))
+  inertia_local = rotmat @ inertia @ rotmat.T
+  body.SetMass(mass)
+  body.SetInertiaXX(chrono.ChVectorD(inertia_local[0, 0], inertia_local[1, 1], inertia_local[2, 2]))
+  body.SetInertiaXY(chrono.ChVectorD(inertia_local[0, 1], inertia_local[0, 2], inertia_local[1, 2]))
+  return body.GetCoord().TransformParentToLocal(previous_cog)
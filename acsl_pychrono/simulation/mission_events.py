@@ -0,0 +1,33 @@
+import heapq
+import itertools
+from typing import Callable
+
+# Event types of 'MissionConfig.mission_events'
+EVENT_TYPES = ("drop_balls", "motor_failure", "wind")
+
+# Time [s] for which the collisions of a dropped ball are disabled, so that it falls through the box
+BALL_DROP_DISABLE_DURATION = 0.15
+
+class MissionEventQueue:
+  """
+  Timed events of a mission (payload drops, motor failures, wind changes) in a heap keyed by their time.
+  Each event fires exactly once, at the first step of the plant at or after its time; events with the same
+  time fire in the order they were scheduled. Checking for due events costs a single comparison per step.
+  """
+  def __init__(self):
+    # Events: (time, scheduling order, name, action(time_now))
+    self.heap: list[tuple[float, int, str, Callable[[float], None]]] = []
+    self.counter = itertools.count()
+
+  def __len__(self) -> int:
+    return len(self.heap)
+
+  def schedule(self, time: float, name: str, action: Callable[[float], None]):
+    heapq.heappush(self.heap, (time, next(self.counter), name, action))
+
+  def fireDue(self, time_now: float):
+    """Fire, in time order, the events whose time has come."""
+    heap = self.heap
+    while heap and heap[0][0] <= time_now:
+      _, _, _, action = heapq.heappop(heap)
+      action(time_now)
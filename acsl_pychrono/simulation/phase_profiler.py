@@ -0,0 +1,195 @@
+import os
+import json
+import time
+
+# Phases of 'Simulation.stepSimulation': (name, owner of the timed method, method name).
+# The owners are attributes of the simulation ("" for the simulation itself).
+# "step" is the whole step, the other phases are timed inside it
+PHASES = (
+  ("step",               "",                        "stepSimulation"),
+  ("advance_plant",      "",                        "advancePlant"),
+  ("update_com",         "",                        "updateCOMcomputationOfSystemWithPayload"),
+  ("update_pixhawk",     "",                        "updatePixhawkState"),
+  ("trajectory",         "user_defined_trajectory", "compute"),
+  ("mission_events",     "",                        "handleMissionEvents"),
+  ("external_forces",    "",                        "applyExternalForces"),
+  ("controller",         "controller",              "run"),
+  ("thrust_limits",      "",                        "applyMotorThrustLimitsAndEfficiency"),
+  ("motor_wrench",       "",                        "applyMotorWrench"),
+  ("propeller_velocity", "",                        "setPropellerRotationalVelocity"),
+  ("logger",             "logger",                  "collectData"),
+  ("debug_prints",       "",                        "debugPrints"),
+)
+
+# Buckets of the timing histograms: bucket b holds the durations d [ns] with d.bit_length() == b,
+# i.e., 2**(b-1) <= d < 2**b
+NUM_HISTOGRAM_BUCKETS = 64
+
+class PhaseProfiler:
+  """
+  Per-phase timing of 'Simulation.stepSimulation' ('MissionConfig.profile_flag').
+  'instrument' replaces the methods of 'PHASES' of one simulation (and of its trajectory, controller and logger)
+  by timed wrappers set on the instances, 'restore' removes them: the simulation runs unchanged, at no cost,
+  when it is not instrumented.
+  Each phase accumulates its number of calls, total and maximum time and a log2 histogram of its durations
+  (perf_counter_ns); the first 'trace_max_events' timed calls are also kept for a Chrome trace-event file.
+  """
+  def __init__(self, trace_max_events: int = 0):
+    self.trace_max_events = trace_max_events
+    self.phase_names = [name for name, _, _ in PHASES]
+    self.calls = [0] * len(PHASES)
+    self.total_ns = [0] * len(PHASES)
+    self.max_ns = [0] * len(PHASES)
+    self.histograms = [[0] * NUM_HISTOGRAM_BUCKETS for _ in PHASES]
+    # Timed calls (phase index, start [ns], duration [ns]) of the trace
+    self.events: list[tuple[int, int, int]] = []
+    # Wrapped methods: (owner, method name, whether the owner had its own attribute, that attribute)
+    self.wrapped: list[tuple[object, str, bool, object]] = []
+
+  def instrument(self, sim):
+    """Time the phases of 'sim' (after 'Simulation.assignInstances')."""
+    self.restore()
+    for phase_index, (_, owner_name, method_name) in enumerate(PHASES):
+      owner = getattr(sim, owner_name) if owner_name else sim
+      if owner is None or not hasattr(owner, method_name):
+        continue
+      had_own_attribute = method_name in vars(owner)
+      self.wrapped.append((owner, method_name, had_own_attribute, vars(owner).get(method_name)))
+      setattr(owner, method_name, self.timed(phase_index, getattr(owner, method_name)))
+
+  def restore(self):
+    """Give back to the instances their original methods."""
+    for owner, method_name, had_own_attribute, attribute in reversed(self.wrapped):
+      if had_own_attribute:
+        setattr(owner, method_name, attribute)
+      else:
+        delattr(owner, method_name)
+    self.wrapped = []
+
+  def timed(self, phase_index: int, method):
+    calls = self.calls
+    total_ns = self.total_ns
+    max_ns = self.max_ns
+    histogram = self.histograms[phase_index]
+    events = self.events
+    trace_max_events = self.trace_max_events
+    perf_counter_ns = time.perf_counter_ns
+
+    def timedMethod(*args, **kwargs):
+      start = perf_counter_ns()
+      try:
+        return method(*args, **kwargs)
+      finally:
+        duration = perf_counter_ns() - start
+        calls[phase_index] += 1
+        total_ns[phase_index] += duration
+        if duration > max_ns[phase_index]:
+          max_ns[phase_index] = duration
+        histogram[duration.bit_length()] += 1
+        if len(events) < trace_max_events:
+          events.append((phase_index, start, duration))
+
+    return timedMethod
+
+  def toDict(self) -> dict:
+    """Timings of every phase, picklable and JSON serializable (see 'mergeProfiles')."""
+    return {
+      name: {
+        "calls": self.calls[i],
+        "total_ns": self.total_ns[i],
+        "max_ns": self.max_ns[i],
+        "histogram": list(self.histograms[i]),
+      }
+      for i, name in enumerate(self.phase_names)
+    }
+
+  def writeChromeTrace(self, path: str):
+    """Write the timed calls as Chrome trace events (chrome://tracing, https://ui.perfetto.dev)."""
+    pid = os.getpid()
+    trace_events = [
+      {
+        "name": self.phase_names[phase_index],
+        "cat": "stepSimulation",
+        "ph": "X",
+        "ts": start / 1e3,
+        "dur": duration / 1e3,
+        "pid": pid,
+        "tid": 0,
+      }
+      for phase_index, start, duration in self.events
+    ]
+    with open(path, "w") as f:
+      json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+    print(f"[INFO] Profiler trace ({len(trace_events)} events) saved in: {path}")
+
+  @staticmethod
+  def mergeProfiles(profiles: list[dict]) -> dict:
+    """Sum the timings of several runs (e.g., the runs of a wrapper batch, from any worker)."""
+    merged = {}
+    for profile in profiles:
+      for name, timings in profile.items():
+        phase = merged.setdefault(name, {"calls": 0, "total_ns": 0, "max_ns": 0, "histogram": [0] * NUM_HISTOGRAM_BUCKETS})
+        phase["calls"] += timings["calls"]
+        phase["total_ns"] += timings["total_ns"]
+        phase["max_ns"] = max(phase["max_ns"], timings["max_ns"])
+        phase["histogram"] = [a + b for a, b in zip(phase["histogram"], timings["histogram"])]
+    return merged
+
+  @staticmethod
+  def percentileNs(histogram: list[int], percentile: float) -> float:
+    """Upper bound of the histogram bucket holding the given percentile of the durations [ns]."""
+    num_calls = sum(histogram)
+    if num_calls == 0:
+      return float("nan")
+    threshold = percentile / 100.0 * num_calls
+    cumulative = 0
+    for bucket, count in enumerate(histogram):
+      cumulative += count
+      if cumulative >= threshold:
+        return float(2 ** bucket)
+    return float(2 ** (len(histogram) - 1))
+
+  @staticmethod
+  def summarize(profile: dict) -> dict:
+    """Per-phase mean, p50, p99 and max time [us] and share of the step time, plus the untimed rest of the step."""
+    step_total_ns = profile.get("step", {}).get("total_ns", 0)
+    timed_total_ns = 0
+    summary = {}
+    for name, timings in profile.items():
+      calls = timings["calls"]
+      if calls == 0:
+        continue
+      if name != "step":
+        timed_total_ns += timings["total_ns"]
+      summary[name] = {
+        "calls": calls,
+        "total_s": timings["total_ns"] / 1e9,
+        "mean_us": timings["total_ns"] / calls / 1e3,
+        "p50_us": min(PhaseProfiler.percentileNs(timings["histogram"], 50), timings["max_ns"]) / 1e3,
+        "p99_us": min(PhaseProfiler.percentileNs(timings["histogram"], 99), timings["max_ns"]) / 1e3,
+        "max_us": timings["max_ns"] / 1e3,
+        "step_share": timings["total_ns"] / step_total_ns if step_total_ns else float("nan"),
+      }
+    if "step" in summary:
+      rest_ns = max(step_total_ns - timed_total_ns, 0)
+      summary["other"] = {
+        "calls": summary["step"]["calls"],
+        "total_s": rest_ns / 1e9,
+        "mean_us": rest_ns / summary["step"]["calls"] / 1e3,
+        "p50_us": float("nan"),
+        "p99_us": float("nan"),
+        "max_us": float("nan"),
+        "step_share": rest_ns / step_total_ns,
+      }
+    return summary
+
+  @staticmethod
+  def printSummary(profile: dict, title: str = "Profile of stepSimulation"):
+    summary = PhaseProfiler.summarize(profile)
+    print(f"[INFO] {title} (p50/p99: upper bounds of their log2 histogram bucket)")
+    print(f"{'phase':<20} {'calls':>9} {'total [s]':>10} {'mean [us]':>10} {'p50 [us]':>10} {'p99 [us]':>10} {'max [us]':>10} {'step %':>7}")
+    for name, row in summary.items():
+      print(
+        f"{name:<20} {row['calls']:>9d} {row['total_s']:>10.3f} {row['mean_us']:>10.1f} {row['p50_us']:>10.1f} "
+        f"{row['p99_us']:>10.1f} {row['max_us']:>10.1f} {100 * row['step_share']:>7.1f}"
+      )
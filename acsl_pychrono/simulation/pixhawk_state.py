@@ -52,6 +52,25 @@ class PixhawkState:
   # 321 sequence of euler angle (roll, pitch, yaw)
   euler321: chrono.ChVectorD = field(default_factory=lambda: chrono.ChVectorD(0, 0, 0))
 
+@dataclass
+class PixhawkStateBuffers:
+  """
+  Preallocated arrays of the pixhawk quantities read at every step (written in place by 'Simulation.updatePixhawkState'),
+  named after the fields of 'PixhawkState'
+  """
+  # Global position of pixhawk in NED convention
+  pos_LOC_to_GLOB_NED: np.ndarray = field(default_factory=lambda: np.zeros((3, 1)))
+  # Global velocity of pixhawk in NED convention
+  vel_LOC_to_GLOB_NED: np.ndarray = field(default_factory=lambda: np.zeros((3, 1)))
+  # Rotation matrix from Global to Local coordinates
+  rotmat_F: np.ndarray = field(default_factory=lambda: np.eye(3))
+  # Local velocities of the pixhawk
+  vel_LOC: np.ndarray = field(default_factory=lambda: np.zeros((3, 1)))
+  # Local Angular velocity of the pixhawk
+  Wvel_LOC: np.ndarray = field(default_factory=lambda: np.zeros((3, 1)))
+  # 321 sequence of euler angle (roll, pitch, yaw)
+  euler321: np.ndarray = field(default_factory=lambda: np.zeros(3))
+
 @dataclass
 class VehicleState:
   roll: float = field(default_factory=lambda: 0.0)
@@ -0,0 +1,207 @@
+import numpy as np
+
+from acsl_pychrono.simulation.pixhawk_state import VehicleState
+
+# Rotation of PI/2 rad around the X-axis: from the Y-up frames of Chrono (x-front, y-up, z-right)
+# to the NED frames of the pixhawk (x-front, y-right, z-down)
+ROTMAT_YUP_TO_NED = np.array([[1.0,  0.0, 0.0],
+                              [0.0,  0.0, 1.0],
+                              [0.0, -1.0, 0.0]])
+
+def quaternionToRotationMatrix(quaternions: np.ndarray) -> np.ndarray:
+  """Rotation matrices (N x 3 x 3) of unit quaternions (N x 4, scalar first)."""
+  e0, e1, e2, e3 = np.asarray(quaternions, dtype=float).T
+  R = np.empty((e0.shape[0], 3, 3))
+  R[:, 0, 0] = e0**2 + e1**2 - e2**2 - e3**2
+  R[:, 0, 1] = 2 * (e1*e2 - e0*e3)
+  R[:, 0, 2] = 2 * (e1*e3 + e0*e2)
+  R[:, 1, 0] = 2 * (e1*e2 + e0*e3)
+  R[:, 1, 1] = e0**2 - e1**2 + e2**2 - e3**2
+  R[:, 1, 2] = 2 * (e2*e3 - e0*e1)
+  R[:, 2, 0] = 2 * (e1*e3 - e0*e2)
+  R[:, 2, 1] = 2 * (e2*e3 + e0*e1)
+  R[:, 2, 2] = e0**2 - e1**2 - e2**2 + e3**2
+  return R
+
+class RigidBodyPlant:
+  """
+  6-DOF rigid-body model of the vehicle integrated in NumPy: surrogate of the Chrono system for early-stage
+  gain screening (no contacts, CAD meshes, payload or propeller bodies). The 'batch_size' vehicles are
+  advanced by the same NumPy calls.
+
+  The state is the one of the center of mass: position and velocity in the inertial NED frame, attitude
+  quaternion (from body to inertial frame) and angular velocity in the body frame (x-front, y-right, z-down).
+  Forces and torques are accumulated with the conventions of 'chrono.ChBody.Accumulate_force' and
+  'Accumulate_torque' (Y-up components, local or absolute), so that they are applied as in 'Simulation':
+  the local loads are expressed in the body frame of the drone frame of the CAD model, whose initial
+  orientation in the Y-up absolute frame is 'frame_orientation'.
+  The integration is semi-implicit Euler, as the default timestepper of 'chrono.ChSystemNSC'.
+  A horizontal ground plane at the initial altitude holds the vehicle before the take-off.
+  """
+  def __init__(self,
+               mass: float,
+               inertia_matrix: np.ndarray,
+               G_acc: float,
+               batch_size: int = 1,
+               initial_position: tuple[float, float, float] = (0.0, 0.0, 0.0), # [m] NED
+               frame_orientation: tuple[float, float, float, float] = (1.0, 0.0, 0.0, 0.0)
+               ):
+    self.mass = float(mass)
+    self.inertia_matrix = np.asarray(inertia_matrix, dtype=float)
+    self.inertia_matrix_inv = np.linalg.inv(self.inertia_matrix)
+    self.G_acc = float(G_acc)
+    self.batch_size = batch_size
+    self.initial_position = np.asarray(initial_position, dtype=float).reshape(3)
+    # The ground plane is at the initial altitude (NED: positive downwards)
+    self.ground_altitude = self.initial_position[2]
+    # From the local frame of the drone frame (CAD model) to the body frame
+    self.local_to_body = ROTMAT_YUP_TO_NED @ quaternionToRotationMatrix(np.reshape(frame_orientation, (1, 4)))[0]
+
+    self.reset()
+
+  def reset(self):
+    """Bring every vehicle back to rest at the initial position."""
+    N = self.batch_size
+    self.time = 0.0
+    self.position = np.tile(self.initial_position, (N, 1))
+    self.velocity = np.zeros((N, 3))
+    self.quaternion = np.tile(np.array([1.0, 0.0, 0.0, 0.0]), (N, 1))
+    self.rotmat = np.tile(np.eye(3), (N, 1, 1))
+    self.angular_velocity = np.zeros((N, 3))
+    self.emptyForcesAccumulators()
+
+  def emptyForcesAccumulators(self):
+    # Total force in the inertial frame and total torque around the center of mass in the body frame
+    self.force = np.zeros((self.batch_size, 3))
+    self.torque = np.zeros((self.batch_size, 3))
+
+  def toBody(self, vectors: np.ndarray) -> np.ndarray:
+    """Inertial (N x 3) -> body (N x 3) components."""
+    return np.einsum("nji,nj->ni", self.rotmat, vectors)
+
+  def toInertial(self, vectors: np.ndarray) -> np.ndarray:
+    """Body (N x 3) -> inertial (N x 3) components."""
+    return np.einsum("nij,nj->ni", self.rotmat, vectors)
+
+  def accumulateForce(self, force, application_point, local: bool):
+    """
+    Add 'force' applied at 'application_point' (Y-up components, (3,) or (N x 3)), as 'Accumulate_force':
+    if 'local', both are expressed in the local frame (point relative to the center of mass),
+    otherwise in the absolute frame.
+    """
+    N = self.batch_size
+    rotmat = self.local_to_body if local else ROTMAT_YUP_TO_NED
+    force = np.broadcast_to(np.asarray(force, dtype=float) @ rotmat.T, (N, 3))
+    point = np.broadcast_to(np.asarray(application_point, dtype=float) @ rotmat.T, (N, 3))
+
+    if local:
+      force_in_body = force
+      arm_in_body = point
+      self.force += self.toInertial(force_in_body)
+    else:
+      force_in_body = self.toBody(force)
+      arm_in_body = self.toBody(point - self.position)
+      self.force += force
+
+    self.torque += np.cross(arm_in_body, force_in_body)
+
+  def accumulateLocalForces(self, forces: np.ndarray, application_points: np.ndarray):
+    """
+    Add M forces expressed in the local frame ((M x 3) or (N x M x 3), Y-up components)
+    applied at 'application_points' (M x 3, local, relative to the center of mass).
+    Same as M calls to 'accumulateForce(..., local=True)'.
+    """
+    forces = np.asarray(forces, dtype=float) @ self.local_to_body.T
+    points = np.asarray(application_points, dtype=float) @ self.local_to_body.T
+    self.force += self.toInertial(np.broadcast_to(forces.sum(axis=-2), (self.batch_size, 3)))
+    self.torque += np.cross(points, forces).sum(axis=-2)
+
+  def accumulateTorque(self, torque, local: bool):
+    """Add 'torque' (Y-up components, (3,) or (N x 3)), as 'Accumulate_torque'."""
+    rotmat = self.local_to_body if local else ROTMAT_YUP_TO_NED
+    torque = np.broadcast_to(np.asarray(torque, dtype=float) @ rotmat.T, (self.batch_size, 3))
+    self.torque += torque if local else self.toBody(torque)
+
+  def doStepDynamics(self, timestep: float):
+    """Advance every vehicle by 'timestep' under the accumulated forces and torques and the gravity."""
+    # Translation (gravity along the NED z-axis)
+    acceleration = self.force / self.mass
+    acceleration[:, 2] += self.G_acc
+    self.velocity += timestep * acceleration
+    self.position += timestep * self.velocity
+
+    # Rotation: Euler's equations in the body frame
+    angular_momentum = self.angular_velocity @ self.inertia_matrix.T
+    angular_acceleration = (self.torque - np.cross(self.angular_velocity, angular_momentum)) @ self.inertia_matrix_inv.T
+    self.angular_velocity += timestep * angular_acceleration
+    self.rotateQuaternion(timestep * self.angular_velocity)
+
+    self.applyGroundPlane()
+    self.time += timestep
+
+  def rotateQuaternion(self, rotation_vector: np.ndarray):
+    """Compose the attitude with the rotation 'rotation_vector' (N x 3) of the body frame."""
+    angle = np.linalg.norm(rotation_vector, axis=1, keepdims=True)
+    # sin(angle/2) / angle, also at angle = 0
+    half_sinc = 0.5 * np.sinc(angle / (2.0 * np.pi))
+    dq0 = np.cos(0.5 * angle)[:, 0]
+    dq = half_sinc * rotation_vector
+
+    q0 = self.quaternion[:, 0]
+    q = self.quaternion[:, 1:]
+    quaternion = np.empty_like(self.quaternion)
+    quaternion[:, 0] = q0 * dq0 - np.sum(q * dq, axis=1)
+    quaternion[:, 1:] = q0[:, np.newaxis] * dq + dq0[:, np.newaxis] * q + np.cross(q, dq)
+    self.quaternion = quaternion / np.linalg.norm(quaternion, axis=1, keepdims=True)
+    self.updateRotationMatrix()
+
+  def updateRotationMatrix(self):
+    """Rotation matrix from body to inertial frame of the attitude quaternion."""
+    self.rotmat = quaternionToRotationMatrix(self.quaternion)
+
+  def applyGroundPlane(self):
+    """The vehicles below the ground plane are put back on it, at rest (no bouncing, no sliding)."""
+    on_ground = self.position[:, 2] >= self.ground_altitude
+    if not np.any(on_ground):
+      return
+    self.position[on_ground, 2] = self.ground_altitude
+    self.velocity[on_ground, 0:2] = 0.0
+    self.velocity[on_ground, 2] = np.minimum(self.velocity[on_ground, 2], 0.0)
+    self.angular_velocity[on_ground] = 0.0
+
+  def getEulerAngles321(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """321 sequence of euler angles (roll, pitch, yaw) of every vehicle, (N,) each."""
+    R = self.rotmat
+    roll = np.arctan2(R[:, 2, 1], R[:, 2, 2])
+    pitch = np.arctan2(-R[:, 2, 0], np.sqrt(np.clip(1 - R[:, 2, 0] ** 2, 0.0, None)))
+    yaw = np.arctan2(R[:, 1, 0], R[:, 0, 0])
+    return roll, pitch, yaw
+
+  def getBodyVelocity(self) -> np.ndarray:
+    """Velocity of every vehicle (N x 3) in its body frame."""
+    return self.toBody(self.velocity)
+
+  def getVehicleState(self, index: int | None = None) -> VehicleState:
+    """
+    State of the vehicle 'index' as read by the controller (vectors 3 x 1),
+    or of every vehicle with a leading batch dimension if 'index' is None (angles (N,), vectors N x 3 x 1).
+    """
+    roll, pitch, yaw = self.getEulerAngles321()
+    if index is None:
+      return VehicleState(
+        roll=roll,
+        pitch=pitch,
+        yaw=yaw,
+        position_global=self.position.reshape(-1, 3, 1).copy(),
+        velocity_global=self.velocity.reshape(-1, 3, 1).copy(),
+        angular_velocity_local=self.angular_velocity.reshape(-1, 3, 1).copy()
+      )
+
+    return VehicleState(
+      roll=float(roll[index]),
+      pitch=float(pitch[index]),
+      yaw=float(yaw[index]),
+      position_global=self.position[index].reshape(3, 1).copy(),
+      velocity_global=self.velocity[index].reshape(3, 1).copy(),
+      angular_velocity_local=self.angular_velocity[index].reshape(3, 1).copy()
+    )
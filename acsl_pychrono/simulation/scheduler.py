@@ -0,0 +1,45 @@
+from typing import Callable
+
+import acsl_pychrono.config.config as Cfg
+
+# Tolerance on a period being an integer multiple of the physics timestep (relative to the timestep)
+PERIOD_TOLERANCE = 1e-6
+
+def periodSteps(period: float, timestep: float) -> int:
+  """Number of physics timesteps in 'period' (1 if 'period' is 0, i.e. every physics step)."""
+  if period == 0:
+    return 1
+  steps = round(period / timestep)
+  if steps < 1 or abs(steps * timestep - period) > PERIOD_TOLERANCE * timestep:
+    raise ValueError(f"Period {period} is not a positive integer multiple of the timestep {timestep}")
+  return steps
+
+def subsystemPeriod(mission_config: Cfg.MissionConfig, period: float) -> float:
+  """Period [s] of a subsystem of the mission, with 0 resolved to the physics timestep."""
+  return periodSteps(period, mission_config.timestep) * mission_config.timestep
+
+class MultiRateScheduler:
+  """
+  Dispatch of the subsystems of the simulation step, each one at its own period.
+  The periods are integer multiples of the physics timestep (0: every physics step). A subsystem whose period
+  is n timesteps runs after the physics steps whose index is a multiple of n (the first physics step has
+  index 1), so that all the subsystems run together at the multiples of their common period.
+  At each physics step, the due subsystems run in the order they were added.
+  """
+  def __init__(self, timestep: float):
+    self.timestep = timestep
+    # Subsystems: (name, period in physics steps, callback(time_now, simulation_time))
+    self.tasks: list[tuple[str, int, Callable[[float, float], None]]] = []
+    # Index of the last dispatched physics step
+    self.step_index = 0
+
+  def addTask(self, name: str, period: float, callback: Callable[[float, float], None]):
+    self.tasks.append((name, periodSteps(period, self.timestep), callback))
+
+  def dispatch(self, time_now: float, simulation_time: float):
+    """Run the subsystems due after the next physics step."""
+    self.step_index += 1
+    step_index = self.step_index
+    for _, steps, callback in self.tasks:
+      if step_index % steps == 0:
+        callback(time_now, simulation_time)
@@ -1,15 +1,23 @@
 import time
 import sys
+import math
 from pathlib import Path 
+from typing import TYPE_CHECKING
 import numpy as np
 from numpy import linalg as LA
 
 import pychrono as chrono
-import pychrono.irrlicht as irr
 
 import acsl_pychrono.simulation.functions as fun
 from acsl_pychrono.simulation.visualization import Visualization
-from acsl_pychrono.simulation.pixhawk_state import PixhawkState, VehicleState
+from acsl_pychrono.simulation.pixhawk_state import PixhawkState, PixhawkStateBuffers, VehicleState
+from acsl_pychrono.simulation.system_snapshot import SystemSnapshot
+from acsl_pychrono.simulation.scheduler import MultiRateScheduler
+from acsl_pychrono.simulation.solver_policy import instantiateSolverPolicy
+from acsl_pychrono.simulation.mission_events import MissionEventQueue, EVENT_TYPES, BALL_DROP_DISABLE_DURATION
+from acsl_pychrono.simulation.wind_field import instantiateWindField
+from acsl_pychrono.simulation.mass_properties import mergeMassProperties
+from acsl_pychrono.simulation.actuators import MotorActuators
 from acsl_pychrono.simulation.flight_params import FlightParams
 from acsl_pychrono.simulation.ode_input import OdeInput
 import acsl_pychrono.config.config as Cfg
@@ -18,12 +26,38 @@ from acsl_pychrono.simulation.utils import Utils
 from acsl_pychrono.control.control import Control
 import acsl_pychrono.uav as UAV_Module
 
+if TYPE_CHECKING:
+  import pychrono.irrlicht as irr
+
+class KinematicPropeller:
+  """
+  Propeller of the "kinematic" propeller mode: a fixed body posed on the drone frame at every render,
+  spun about the Z axis of its motor marker (the axis of 'ChLinkMotorRotationSpeed') at 'spin_rate' [rad/s].
+  """
+  def __init__(self, prop: chrono.ChBodyAuxRef, marker: chrono.ChMarker, frame_coord: chrono.ChCoordsysD):
+    self.prop = prop
+    self.spin_rate = 0.0
+    self.angle = 0.0
+    self.time = 0.0
+    # Spin center and axis, position and rotation of the propeller in the reference frame of the drone frame
+    marker_coord = marker.GetAbsCoord()
+    self.center = frame_coord.TransformParentToLocal(marker_coord.pos)
+    self.axis = frame_coord.rot.RotateBack(marker_coord.rot.Rotate(chrono.ChVectorD(0, 0, 1)))
+    prop_coord = prop.GetFrame_REF_to_abs().GetCoord()
+    self.pos = frame_coord.TransformParentToLocal(prop_coord.pos)
+    self.rot = frame_coord.rot.GetConjugate() * prop_coord.rot
+
+  def update(self, time_now: float, frame_coord: chrono.ChCoordsysD):
+    self.angle = math.fmod(self.angle + self.spin_rate * (time_now - self.time), chrono.CH_C_2PI)
+    self.time = time_now
+    q_spin = chrono.Q_from_AngAxis(self.angle, self.axis)
+    pos = self.center + q_spin.Rotate(self.pos - self.center)
+    rot = q_spin * self.rot
+    self.prop.SetFrame_REF_to_abs(chrono.ChFrameD(frame_coord.TransformLocalToParent(pos), frame_coord.rot * rot))
+
 class Simulation:
   def __init__(self, sim_cfg: Cfg.SimulationConfig = Cfg.SimulationConfig()) -> None:
-    # Chrono settings
-    self.m_sys = chrono.ChSystemNSC()
-    self.vis: irr.ChVisualSystemIrrlicht | None = None
-    self.visualization = Visualization(self)
+    self.vis: "irr.ChVisualSystemIrrlicht | None" = None
     
     # Chrono features
     self.m_ground = None
@@ -32,17 +66,27 @@ class Simulation:
     self.m_props: list[chrono.ChBody] = []
     self.m_markers = []
     self.m_motors = []
+    self.m_motor_functions = []
+    # Propellers posed and spun by 'animatePropellers' ("kinematic" propeller mode with visualization)
+    self.kinematic_propellers: list[KinematicPropeller] = []
+    # Offset of the local force application points of the drone frame when its COG is moved by the propeller merge
+    self.frame_cog_offset = chrono.ChVectorD(0, 0, 0)
 
     # Vehicle state
     self.vehicle_state: VehicleState = VehicleState()
-    self.pixhawk_state: PixhawkState = PixhawkState()
+    # Pixhawk quantities read at every step (the full 'PixhawkState' is computed on demand, see 'pixhawk_state')
+    self.pixhawk_buffers: PixhawkStateBuffers = PixhawkStateBuffers()
 
     # Config members
-    self.simulation_config: Cfg.SimulationConfig = sim_cfg
-    self.mission_config: Cfg.MissionConfig = sim_cfg.mission_config
-    self.vehicle_config: Cfg.VehicleConfig = sim_cfg.vehicle_config
-    self.environment_config: Cfg.EnvironmentConfig = sim_cfg.environment_config
-    self.wrapper_params: Cfg.WrapperParams = sim_cfg.wrapper_params
+    self.setConfigMembers(sim_cfg)
+
+    # Chrono settings
+    self.m_sys = self.createChronoSystem()
+
+    # Headless runs (no rendering) never create the visualization nor import Irrlicht
+    self.visualization: Visualization | None = (
+      Visualization(self) if self.mission_config.visualization_flag else None
+    )
     
     # UAV specific parameters
     self.setUpUAVParams()
@@ -50,6 +94,13 @@ class Simulation:
     # Additional initialization
     self.setUpSimulation()
 
+  def setConfigMembers(self, sim_cfg: Cfg.SimulationConfig):
+    self.simulation_config: Cfg.SimulationConfig = sim_cfg
+    self.mission_config: Cfg.MissionConfig = sim_cfg.mission_config
+    self.vehicle_config: Cfg.VehicleConfig = sim_cfg.vehicle_config
+    self.environment_config: Cfg.EnvironmentConfig = sim_cfg.environment_config
+    self.wrapper_params: Cfg.WrapperParams = sim_cfg.wrapper_params
+
   def setUpSimulation(self):
     """
     Function to include in __init__() that sets additional simulation settings and performs the setup of the simulation
@@ -59,11 +110,61 @@ class Simulation:
     self.setSolverAndCollisionModel()
     self.loadBodies()
     self.loadMarkers()
+    self.setUpKinematicPropellers()
     self.createAuxillaryCoordinateSystems()
     self.createFloor()
     self.addPayload()
     self.addMotors()
     self.m_frame.Accumulate_force(chrono.ChVectorD(0, 0, 0), chrono.VNULL, True)
+    # Initial conditions, restored when the built system is reused for another run
+    self.initial_state = SystemSnapshot(self.m_sys, self.getSnapshotBodies())
+
+  def resetToInitialState(self, sim_cfg: Cfg.SimulationConfig):
+    """
+    Bring the already built system back to its initial conditions so that it can be reused for a new run.
+    'sim_cfg' must use the same vehicle, environment and payload the system was built with.
+    """
+    self.setConfigMembers(sim_cfg)
+    self.initial_state.restore()
+    self.applyRunParameters()
+
+    # The motor links integrate the rotation of the propellers, so they are rebuilt from the restored bodies
+    for motor in self.m_motors:
+      self.m_sys.RemoveLink(motor)
+    self.addMotors()
+
+    # The trajectory of the previous run is drawn on the floor, so a clean floor is created
+    self.m_sys.RemoveBody(self.mfloor)
+    self.createFloor()
+
+    self.m_frame.Accumulate_force(chrono.ChVectorD(0, 0, 0), chrono.VNULL, True)
+    self.vehicle_state = VehicleState()
+    self.pixhawk_buffers = PixhawkStateBuffers()
+
+  def applyRunParameters(self):
+    """
+    Apply to the built system the parameters that may change between runs sharing it (wrapper mode).
+    Parameters read at every step (e.g., motor failure time, wind force) need no action.
+    """
+    if (self.mission_config.add_payload_flag and self.mission_config.payload_type == "two_steel_balls"):
+      my_ball_density = getattr(self.wrapper_params, "my_ball_density", 7850)
+      # Same mass properties computed by ChBodyEasySphere
+      ball_mass = my_ball_density * ((4.0 / 3.0) * chrono.CH_C_PI * self.ball_radius ** 3)
+      ball_inertia = (2.0 / 5.0) * ball_mass * self.ball_radius ** 2
+      for ball in (self.m_ball1, self.m_ball2):
+        ball.SetMass(ball_mass)
+        ball.SetInertiaXX(chrono.ChVectorD(ball_inertia, ball_inertia, ball_inertia))
+      self.setupCOMcomputationOfSystemWithPayload()
+    self.setNumThreads()
+
+  def getSnapshotBodies(self) -> list[chrono.ChBody]:
+    """Return the movable bodies of the system (vehicle, environment and payload)."""
+    exported_items = list(self.exported_items) + list(getattr(self, "exported_items_env", []))
+    bodies = [item for item in exported_items if isinstance(item, chrono.ChBody)]
+    if self.mission_config.add_payload_flag and self.mission_config.payload_type == "two_steel_balls":
+      bodies += [self.m_ball1, self.m_ball2]
+    bodies += getattr(self, "m_spheres", [])
+    return bodies
     
   def setUpUAVParams(self):
     """
@@ -167,6 +268,7 @@ class Simulation:
       sys.exit("[ERROR] Frame and markers must be loaded before adding motors!")
 
     self.m_motors = []
+    self.m_motor_functions = []
 
     # If we have real propeller CAD models
     if self.m_props != []:
@@ -177,9 +279,15 @@ class Simulation:
         motor = chrono.ChLinkMotorRotationSpeed()
         motor.Initialize(self.m_props[i], self.m_frame, frame)
         motor.SetSpindleConstraint(chrono.ChLinkMotorRotationSpeed.SpindleConstraint_CYLINDRICAL)
-        # motor.SetMotorFunction(chrono.ChFunction_Const(5.0 * chrono.CH_C_2PI))  # Uncomment if needed
+        # Speed function updated in place by 'setPropellerRotationalVelocity'
+        motor_function = chrono.ChFunction_Const(0.0)
+        motor.SetMotorFunction(motor_function)
         self.m_sys.Add(motor)
         self.m_motors.append(motor)
+        self.m_motor_functions.append(motor_function)
+
+    elif self.mission_config.propeller_mode == "kinematic":
+      print("[INFO] Kinematic propellers: no motor links added.")
 
     # Otherwise, skip CAD model
     else:
@@ -187,6 +295,66 @@ class Simulation:
 
     print(f"[INFO] Added {len(self.m_motors)} motors to the UAV.")
     
+  def getExportedBody(self, body: chrono.ChBody) -> chrono.ChBodyAuxRef:
+    """Body imported from the CAD model, with its ChBodyAuxRef type (the bodies found by SearchBody are plain ChBody)."""
+    for item in self.exported_items:
+      if isinstance(item, chrono.ChBodyAuxRef) and item.GetName() == body.GetName():
+        return item
+    sys.exit(f'[ERROR] Cannot find body "{body.GetName()}" in the CAD model!')
+
+  def setUpKinematicPropellers(self):
+    """
+    Propeller mode of the CAD propellers ('MissionConfig.propeller_mode'). In "kinematic" mode, the mass properties
+    of the propellers are merged into the drone frame, their CAD mates are removed and no motor link is added
+    ('addMotors'): the solver has neither propeller bodies nor propeller constraints. With visualization, the
+    propellers are kept as fixed bodies without collisions, posed on the drone frame and spun at every render;
+    otherwise they are removed.
+    """
+    self.kinematic_propellers = []
+    self.frame_cog_offset = chrono.ChVectorD(0, 0, 0)
+    propeller_mode = self.mission_config.propeller_mode
+    if propeller_mode == "dynamic":
+      return
+    if propeller_mode != "kinematic":
+      raise ValueError(f"Unknown propeller mode: {propeller_mode}")
+    if self.m_props == []:
+      return
+
+    # CAD mates holding the propellers on the drone frame, found by the identifiers of their bodies
+    prop_ids = {prop.GetIdentifier() for prop in self.m_props}
+    num_removed_mates = 0
+    for item in self.exported_items:
+      if isinstance(item, chrono.ChLink) and (
+        item.GetBody1().GetIdentifier() in prop_ids or item.GetBody2().GetIdentifier() in prop_ids
+      ):
+        self.m_sys.RemoveLink(item)
+        num_removed_mates += 1
+    if num_removed_mates == 0:
+      print("[WARNING] No CAD mate found on the propellers: check that the exported links are matched to them.")
+    else:
+      print(f"[INFO] {num_removed_mates} CAD mates of the propellers removed.")
+
+    m_frame = self.getExportedBody(self.m_frame)
+    # The motor and aerodynamic force application points are local to the COG frame of the drone frame
+    self.frame_cog_offset = mergeMassProperties(m_frame, self.m_props)
+    print(f"[INFO] Propeller masses merged into the drone frame: {m_frame.GetMass()} [kg]")
+
+    frame_coord = m_frame.GetFrame_REF_to_abs().GetCoord()
+    for prop, marker in zip(self.m_props, self.m_markers):
+      prop.SetCollide(False)
+      if self.visualization is None:
+        self.m_sys.RemoveBody(prop)
+        continue
+      prop.SetBodyFixed(True)
+      self.kinematic_propellers.append(KinematicPropeller(self.getExportedBody(prop), marker, frame_coord))
+    self.m_props = []
+
+  def animatePropellers(self, time_now: float):
+    """Pose the kinematic propellers on the drone frame, spun by their speed since the previous render."""
+    frame_coord = self.m_frame.GetFrame_REF_to_abs().GetCoord()
+    for kinematic_propeller in self.kinematic_propellers:
+      kinematic_propeller.update(time_now, frame_coord)
+
   def getBodies(self):
     return (
       self.m_frame,
@@ -231,12 +399,43 @@ class Simulation:
     self.m_environment = bodies[0]
     print(f"[INFO] Environment body loaded: {self.m_environment.GetName()}")
 
+  def createChronoSystem(self) -> chrono.ChSystem:
+    """Chrono system of the contact method of 'MissionConfig.chrono_system'."""
+    chrono_system = self.mission_config.chrono_system
+    if chrono_system == "NSC":
+      return chrono.ChSystemNSC()
+    if chrono_system == "SMC":
+      return chrono.ChSystemSMC()
+    raise ValueError(f"Unknown Chrono system: {chrono_system}")
+
+  def createContactMaterial(self) -> chrono.ChMaterialSurface:
+    """Contact material of the contact method of the Chrono system."""
+    if self.mission_config.chrono_system == "SMC":
+      return chrono.ChMaterialSurfaceSMC()
+    return chrono.ChMaterialSurfaceNSC()
+
+  def createSolver(self) -> chrono.ChIterativeSolverVI:
+    chrono_solver = self.mission_config.chrono_solver
+    if chrono_solver == "PSOR":
+      return chrono.ChSolverPSOR() # same solver as 'demo_MBS_collisionNSC'
+    if chrono_solver == "APGD":
+      return chrono.ChSolverAPGD()
+    if chrono_solver == "BB":
+      return chrono.ChSolverBB() # default solver set by the solidworks pychrono module
+    raise ValueError(f"Unknown Chrono solver: {chrono_solver}")
+
+  def setNumThreads(self):
+    """Threads used by Chrono, by the collision detection and by Eigen in this process ('chrono_num_threads')."""
+    num_threads = self.mission_config.chrono_num_threads
+    if num_threads > 0:
+      self.m_sys.SetNumThreads(num_threads, num_threads, num_threads)
+
   def setSolverAndCollisionModel(self):
-    # self.m_solver = chrono.ChSolverBB() # default solver set by the solidworks pychrono module
-    self.m_solver = chrono.ChSolverPSOR() # same solver as 'demo_MBS_collisionNSC'
+    self.m_solver = self.createSolver()
     self.m_sys.SetSolver(self.m_solver)
-    self.m_solver.SetMaxIterations(1000) #600 #1000
+    self.m_solver.SetMaxIterations(self.mission_config.solver_max_iterations) #600 #1000
     self.m_solver.EnableWarmStart(True)
+    self.setNumThreads()
     chrono.ChCollisionModel.SetDefaultSuggestedEnvelope(0.001) #0.003 #0.001
     chrono.ChCollisionModel.SetDefaultSuggestedMargin(0.0005) #0.003 #0.0005
     chrono.ChCollisionSystemBullet.SetContactBreakingThreshold(0.001) #0.002 #0.001
@@ -286,9 +485,10 @@ class Simulation:
     self.m_box_csys = self.m_box.GetFrame_REF_to_abs().GetCoord() # Identify Local reference system of Box
 
   def createFloor(self):
-    contact_material_floor = chrono.ChMaterialSurfaceNSC()
+    contact_material_floor = self.createContactMaterial()
     contact_material_floor.SetFriction(1) # 1
-    contact_material_floor.SetDampingF(0.5) # 0.5
+    if self.mission_config.chrono_system == "NSC":
+      contact_material_floor.SetDampingF(0.5) # 0.5
     self.mfloor = chrono.ChBodyEasyBox(50, 0.1, 50, 1000,True,True, contact_material_floor)
     self.mfloor.SetName('Floor')
     self.mfloor.SetBodyFixed(True)
@@ -299,8 +499,9 @@ class Simulation:
 
   def addTwoSteelBallsPayload(self):
     if (self.mission_config.add_payload_flag and self.mission_config.payload_type == "two_steel_balls"):
-      contact_material_ball = chrono.ChMaterialSurfaceNSC()
+      contact_material_ball = self.createContactMaterial()
       ball_radius = 0.0254 # 0.0254 - 0.01905 - 0.015875
+      self.ball_radius = ball_radius
       # my_ball_density = 7850
       my_ball_density = getattr(self.wrapper_params, "my_ball_density", 7850)
       self.m_ball1 = chrono.ChBodyEasySphere(
@@ -428,7 +629,7 @@ class Simulation:
       and self.mission_config.payload_type == "ten_steel_balls_in_two_lines"
       ):
       self.m_spheres: list[chrono.ChBody] = []  # Store sphere bodies
-      contact_material_ball = chrono.ChMaterialSurfaceNSC()
+      contact_material_ball = self.createContactMaterial()
       radius = 0.015875
       density = 7850
       sphere_number = 10
@@ -453,7 +654,7 @@ class Simulation:
       and self.mission_config.payload_type == "many_steel_balls_in_random_position"
       ):
       self.m_spheres: list[chrono.ChBody] = []  # Store sphere bodies
-      contact_material_ball = chrono.ChMaterialSurfaceNSC()
+      contact_material_ball = self.createContactMaterial()
       radius = 0.015875
       density = 7850
       sphere_number = 10
@@ -482,6 +683,67 @@ class Simulation:
     self.addRandomSpheres()
 
   def updatePixhawkState(self):
+    """
+    Read the pixhawk quantities used at every step (NED position and velocity, local velocity and angular velocity,
+    321 euler angles) straight from the markers into 'pixhawk_buffers', with the same formulas as 'computePixhawkState'
+    evaluated on scalars: no intermediate Chrono vectors and matrices, nor accelerations.
+    """
+    coord_GLOB = self.marker_pixhawk.GetAbsCoord()
+    pos = coord_GLOB.pos
+    vel = self.marker_pixhawk.GetAbsCoord_dt().pos
+    Wvel = self.marker_pixhawk.GetAbsWvel()
+    q = coord_GLOB.rot
+    e0, e1, e2, e3 = q.e0, q.e1, q.e2, q.e3
+
+    # Rotation matrix from Global to Local coordinates (rotmat_F, see 'fun.rotmat_fromQ_Glob_to_Loc_asChMatrix33')
+    F00 = e0*e0 + e1*e1 - e2*e2 - e3*e3
+    F01 = 2*(e1*e2 + e0*e3)
+    F02 = 2*(e1*e3 - e0*e2)
+    F10 = 2*(e1*e2 - e0*e3)
+    F11 = e0*e0 - e1*e1 + e2*e2 - e3*e3
+    F12 = 2*(e2*e3 + e0*e1)
+    F20 = 2*(e1*e3 + e0*e2)
+    F21 = 2*(e2*e3 - e0*e1)
+    F22 = e0*e0 - e1*e1 - e2*e2 + e3*e3
+
+    buffers = self.pixhawk_buffers
+    # Local to Global and back is the identity: the global vectors are only rotated from Y-up to NED (RR)
+    buffers.pos_LOC_to_GLOB_NED[:, 0] = (pos.x, pos.z, -pos.y)
+    buffers.vel_LOC_to_GLOB_NED[:, 0] = (vel.x, vel.z, -vel.y)
+    buffers.rotmat_F[:] = (
+      (F00, F01, F02),
+      (F10, F11, F12),
+      (F20, F21, F22)
+    )
+    buffers.vel_LOC[:, 0] = (
+      F00*vel.x + F01*vel.y + F02*vel.z,
+      F10*vel.x + F11*vel.y + F12*vel.z,
+      F20*vel.x + F21*vel.y + F22*vel.z
+    )
+    buffers.Wvel_LOC[:, 0] = (
+      F00*Wvel.x + F01*Wvel.y + F02*Wvel.z,
+      F10*Wvel.x + F11*Wvel.y + F12*Wvel.z,
+      F20*Wvel.x + F21*Wvel.y + F22*Wvel.z
+    )
+
+    # Euler angles of the Y-up pixhawk marker, with y and z components of its quaternion flipped (quat_fixed):
+    # 'fun.euler321_from_rotmat' of its Global to Local rotation matrix
+    quat = self.marker_pixhawk_2.GetAbsCoord().rot
+    e0, e1, e2, e3 = quat.e0, -quat.e1, -quat.e3, quat.e2
+    R20 = 2*(e1*e3 + e0*e2)
+    if abs(R20 - 1) < 0.01:
+      buffers.euler321[:] = (math.atan2(-2*(e1*e2 + e0*e3), e0*e0 - e1*e1 + e2*e2 - e3*e3), -math.pi/2, 0)
+    elif abs(R20 + 1) < 0.01:
+      buffers.euler321[:] = (-math.atan2(-2*(e1*e2 + e0*e3), e0*e0 - e1*e1 + e2*e2 - e3*e3), math.pi/2, 0)
+    else:
+      buffers.euler321[:] = (
+        math.atan2(2*(e2*e3 - e0*e1), e0*e0 - e1*e1 - e2*e2 + e3*e3),
+        math.atan2(-R20, math.sqrt(1 - R20 ** 2)),
+        math.atan2(2*(e1*e2 - e0*e3), e0*e0 + e1*e1 - e2*e2 - e3*e3)
+      )
+
+  def computePixhawkState(self) -> PixhawkState:
+    """Full state of the pixhawk (positions, velocities and accelerations in every frame), e.g., for debugging."""
     coord_GLOB = self.marker_pixhawk.GetAbsCoord()
     coord_dt_GLOB = self.marker_pixhawk.GetAbsCoord_dt()
     coord_dtdt_GLOB = self.marker_pixhawk.GetAbsCoord_dtdt()
@@ -509,7 +771,7 @@ class Simulation:
     rotmat_euler321 = fun.rotmat_fromQ_Glob_to_Loc_asChMatrix33(quat_fixed)
     euler321 = fun.euler321_from_rotmat(rotmat_euler321)
 
-    self.pixhawk_state = PixhawkState(
+    return PixhawkState(
       coord_GLOB=coord_GLOB,
       coord_dt_GLOB=coord_dt_GLOB,
       coord_dtdt_GLOB=coord_dtdt_GLOB,
@@ -530,19 +792,23 @@ class Simulation:
       Wvel_LOC_to_GLOB_NED=Wvel_LOC_to_GLOB_NED,
       quat_fixed=quat_fixed,
       euler321=euler321
-    )  
+    )
+
+  @property
+  def pixhawk_state(self) -> PixhawkState:
+    """Full state of the pixhawk at the current time, computed on demand (see 'computePixhawkState')."""
+    return self.computePixhawkState()
 
   def getVehicleState(self) -> VehicleState:
     """
     Return the current vehicle state with attitude, position, and velocity data.
     """
-    roll = self.pixhawk_state.euler321.x
-    pitch = self.pixhawk_state.euler321.y
-    yaw = self.pixhawk_state.euler321.z
-    translational_position_in_I = np.array(fun.chvector_to_list(self.pixhawk_state.pos_LOC_to_GLOB_NED)).reshape(3,1)
-    translational_velocity_in_I = np.array(fun.chvector_to_list(self.pixhawk_state.vel_LOC_to_GLOB_NED)).reshape(3,1)
-    angular_velocity = np.array(fun.chvector_to_list(self.pixhawk_state.Wvel_LOC)).reshape(3,1)
-    # angular_acceleration = np.array(fun.chvector_to_list(self.pixhawk_state.Wacc_LOC)).reshape(3,1)
+    buffers = self.pixhawk_buffers
+    roll, pitch, yaw = buffers.euler321.tolist()
+    # Copies: the buffers are overwritten at the next step
+    translational_position_in_I = buffers.pos_LOC_to_GLOB_NED.copy()
+    translational_velocity_in_I = buffers.vel_LOC_to_GLOB_NED.copy()
+    angular_velocity = buffers.Wvel_LOC.copy()
 
     return VehicleState(
       roll=roll,
@@ -554,7 +820,12 @@ class Simulation:
     )
   
   def applyAerodynamicForce(self, flight_params: FlightParams):
-    aerodynamic_velocity = np.array(fun.chvector_to_list(self.pixhawk_state.vel_LOC)).reshape(3,1)
+    aerodynamic_velocity = self.pixhawk_buffers.vel_LOC
+    if self.wind_field is not None:
+      # Velocity relative to the wind (airspeed), in local coordinates
+      pos = self.pixhawk_buffers.pos_LOC_to_GLOB_NED[:, 0]
+      wind_velocity = self.wind_field.getVelocity(self.getTime(), (pos[0], -pos[2], pos[1]))
+      aerodynamic_velocity = aerodynamic_velocity - self.pixhawk_buffers.rotmat_F @ wind_velocity.reshape(3, 1)
     aerodynamic_force = (
       -0.5 * flight_params.uav_controller.air_density_estimated * 
       flight_params.uav_controller.surface_area_estimated * 
@@ -564,7 +835,7 @@ class Simulation:
 
     self.m_frame.Accumulate_force(
       chrono.ChVectorD(aerodynamic_force[0].item(), aerodynamic_force[1].item(), aerodynamic_force[2].item()),
-      flight_params.uav.aerodynamic_force_application_point,
+      flight_params.uav.aerodynamic_force_application_point + self.frame_cog_offset,
       True
     )
 
@@ -588,67 +859,30 @@ class Simulation:
     )
 
   def applyMotorThrustLimitsAndEfficiency(self, controller, flight_params: FlightParams):
-    """Clamp motor thrusts to physical limits and apply motor efficiency."""
-    # Thrust saturation
-    for i in range(len(controller.motor_thrusts)):
-      if controller.motor_thrusts[i][0] < flight_params.uav.minimum_motor_thrust:
-        # if some component of the thrust force is smaller than the min thrust that can physically
-        # be generated set it to flight_params.minimum_motor_thrust
-        controller.motor_thrusts[i][0] = flight_params.uav.minimum_motor_thrust 
-      if controller.motor_thrusts[i][0] > flight_params.uav.maximum_motor_thrust:
-        # if some component of the thrust force is greater than the max thrust that can physically
-        # be generated set it to flight_params.maximum_motor_thrust
-        controller.motor_thrusts[i][0] = flight_params.uav.maximum_motor_thrust 
-
-    # Accounting for motor efficiency
-    controller.motor_thrusts = np.array(flight_params.uav.motor_efficiency_matrix * controller.motor_thrusts)
-
-  # TODO: Generalize for arbitrary number of propellers (DONE!)
-  def applyMotorForces(self, controller, flight_params: FlightParams):
-    """
-    Apply thrust forces from motors at predefined local positions with respect to the drone frame.
-    Generalized to support any number of motors/propellers.
-    """
-    # Get list of predefined force application points from FlightParams
-    force_positions = flight_params.uav.motor_force_positions  # List of ChVectorD
-    num_positions = len(force_positions)
-
-    # If you have a custom mapping, you can define it in flight_params.uav.motor_index_map
-    # Otherwise, assume 1:1 mapping
-    if hasattr(flight_params.uav, "motor_index_map"):
-      motor_index_map = flight_params.uav.motor_index_map
-      if len(motor_index_map) != self.number_of_propellers:
-          raise ValueError(f"motor_index_map length ({len(motor_index_map)}) does not match number of motors ({self.number_of_propellers})")
-    else:
-      motor_index_map = list(range(self.number_of_propellers))
-      
-    for i, motor_idx in enumerate(motor_index_map):
-      thrust_value = controller.motor_thrusts[motor_idx][0]
-      force_vec = chrono.ChVectorD(0, thrust_value, 0)
-      # force_vec = chrono.ChVectorD(0, 0, 0) # For debugging
+    """
+    Clamp motor thrusts to physical limits and apply motor efficiency, then reduce the thrusts and the propeller
+    reaction torques to the net wrench applied to the drone frame until the next control step.
+    """
+    self.updateActuators(controller, flight_params)
+    self.motor_force = chrono.ChVectorD(*self.actuators.force.tolist())
+    self.motor_torque = chrono.ChVectorD(*self.actuators.torque.tolist())
 
-      # Pick the position corresponding to this motor
-      # If fewer positions are defined (e.g., symmetrical pairs), cycle through them
-      force_pos = force_positions[i % num_positions]
-      # print(f"\n[DEBUG] Applying thrust {thrust_value} at position {force_pos} for motor {motor_idx}\nForce vector: {force_vec}") ############################################################################################################
+  def updateActuators(self, controller, flight_params: FlightParams):
+    """Saturate the motor thrusts of the controller and update the net motor wrench of 'MotorActuators'."""
+    saturated = self.actuators.update(controller.motor_thrusts, flight_params.uav.motor_efficiency_matrix)
+    self.num_control_steps += 1
+    self.num_saturated_steps += saturated
 
-      # Apply physical force
-      self.m_frame.Accumulate_force(force_vec, force_pos, True)
+    controller.motor_thrusts = self.actuators.motor_thrusts
+    self.omega = self.actuators.omega
 
-  def applyPropellerReactionTorques(self, controller, flight_params: FlightParams):
+  def applyMotorWrench(self):
     """
-    Computes and applies the individual reaction torques generated by each of the n propellers
-    based on their angular velocities and spin direction.
+    Apply the net force and torque of the motors (see 'MotorActuators') to the drone frame, in local coordinates:
+    the force at the COG, the torque of the thrusts about the COG plus the propeller reaction torques.
     """
-    # Compute angular velocities for each motor
-    self.omega = np.sqrt(controller.motor_thrusts / flight_params.uav_controller.K_omega)
-
-     # Compute and apply torques
-    for i in range(self.number_of_propellers):
-      omega_squared = self.omega[i][0] ** 2
-      torque_y = flight_params.uav.propellers_spin_directions[i] * omega_squared * flight_params.uav_controller.K_torque
-      torque = chrono.ChVectorD(0, torque_y, 0)
-      self.m_frame.Accumulate_torque(torque, True)
+    self.m_frame.Accumulate_force(self.motor_force, chrono.VNULL, True)
+    self.m_frame.Accumulate_torque(self.motor_torque, True)
 
   def setPropellerRotationalVelocity(self, flight_params: FlightParams):
     """
@@ -656,7 +890,7 @@ class Simulation:
     based on the signed angular velocities.
     """
     # Simulate the rotation of the propellers only if a CAD model was provided
-    if self.m_motors != []:
+    if self.m_motors != [] or self.kinematic_propellers != []:
       # Compute the signed angular velocities
       omega_signed = [
           flight_params.uav.propellers_spin_directions[i] * self.omega[i][0]
@@ -666,87 +900,89 @@ class Simulation:
       reducing_factor = 10.0  # To slow down the visualization of the propellers
       for i in range(self.number_of_propellers):
         omega_reduced = omega_signed[i] / reducing_factor
-        self.m_motors[i].SetMotorFunction(chrono.ChFunction_Const(omega_reduced))
-
-  def handlePayloadDroppingBalls12(self, time_now: float,
-                                   apply: bool=False, 
-                                   drop_time: float=3.7,        # Time at which payloads should be dropped.
-                                   disable_duration: float=0.15 # Time duration for which collisions are disabled after the drop.
-                                   ): 
-    """
-    Temporarily disables and then re-enables collisions for the payloads to simulate dropping them if `apply` is True.
-
-    Parameters:
-    - time_now (float):         The current simulation time.
-    - apply (bool):             Whether or not to apply the payload dropping.
-    - drop_time (float):        Time at which payloads should be dropped.
-    - disable_duration (float): Time duration for which collisions are disabled after the drop.
-    """
-    if not apply:
-      return
-    
-    if (self.mission_config.add_payload_flag and self.mission_config.payload_type == "two_steel_balls"):
+        if self.kinematic_propellers != []:
+          self.kinematic_propellers[i].spin_rate = omega_reduced
+        else:
+          self.m_motor_functions[i].Set_yconst(omega_reduced)
 
-      if (time_now > drop_time):
-        self.m_ball1.SetCollide(False)
-        self.m_ball2.SetCollide(False) 
-      if (time_now > (drop_time + disable_duration)):
-        self.m_ball1.SetCollide(True)
-        self.m_ball2.SetCollide(True)
+  def getPayloadBalls(self) -> list[chrono.ChBody]:
+    """Balls of the payload, in the order of their indices in the "drop_balls" mission events."""
+    if not self.mission_config.add_payload_flag:
+      return []
+    if self.mission_config.payload_type == "two_steel_balls":
+      return [self.m_ball1, self.m_ball2]
+    return list(getattr(self, "m_spheres", []))
 
-  def handleMotorFailure(self, time_now: float, flight_params: FlightParams, apply: bool=False, failure_time: float=4.5):
+  def getMissionEventSpecs(self) -> list[dict]:
     """
-    Modifies the motor efficiency matrix that simulates motor failure after a given time.
-
-    Parameters:
-    - time_now (float):     The current simulation time.
-    - apply (bool):         Whether or not to apply the motor failure.
-    - failure_time (float): Time at which the motor failure occurs.
+    Events of the mission: those of the payload dropping, motor failure and wind fields of the mission config,
+    followed by 'MissionConfig.mission_events'.
     """
-    if not apply:
-      return
+    mission_config = self.mission_config
+    event_specs = []
+    if mission_config.add_payload_flag:
+      if mission_config.payload_type == "two_steel_balls":
+        if mission_config.drop_two_steel_balls:
+          event_specs.append({"type": "drop_balls", "time": mission_config.two_steel_balls_drop_time, "balls": [0, 1]})
+      elif mission_config.sequentially_drop_multiple_balls:
+        # Dropping multiple balls one after the other
+        event_specs += [
+          {"type": "drop_balls", "time": mission_config.sequentially_drop_start_time + i * mission_config.sequentially_drop_interval, "balls": [i]}
+          for i in range(len(self.getPayloadBalls()))
+        ]
+    if mission_config.apply_motor_failure:
+      event_specs.append({"type": "motor_failure", "time": mission_config.motor_failure_time})
+    if mission_config.apply_wind_force:
+      event_specs.append({"type": "wind", "time": 0.0, "force": mission_config.wind_force_vector})
+    return event_specs + list(mission_config.mission_events)
+
+  def setUpMissionEvents(self):
+    """Queue of the timed events of the mission (see 'MissionEventQueue')."""
+    # Constant wind force [N] applied from the last "wind" event on (None: no wind)
+    self.wind_force_vector = None
+    # A reused system may have been left with balls being dropped
+    self.setBallsCollide(self.getPayloadBalls(), True)
+    self.mission_events = MissionEventQueue()
+    for event_spec in self.getMissionEventSpecs():
+      self.scheduleMissionEvent(event_spec)
+
+  def scheduleMissionEvent(self, event_spec: dict):
+    event_type = event_spec["type"]
+    time = event_spec["time"]
+    if event_type == "drop_balls":
+      # Collisions of the balls disabled for a while, so that they fall through the box, then re-enabled
+      balls = self.getPayloadBalls()
+      if not balls:
+        return # No payload simulated
+      dropped_balls = [balls[i] for i in event_spec.get("balls", range(len(balls)))]
+      disable_duration = event_spec.get("disable_duration", BALL_DROP_DISABLE_DURATION)
+      self.mission_events.schedule(time, "drop_balls", lambda time_now: self.setBallsCollide(dropped_balls, False))
+      self.mission_events.schedule(time + disable_duration, "reenable_balls", lambda time_now: self.setBallsCollide(dropped_balls, True))
+    elif event_type == "motor_failure":
+      self.mission_events.schedule(time, "motor_failure", lambda time_now: self.applyMotorFailure(self.flight_params, event_spec.get("motor"), event_spec.get("efficiency", 0.0)))
+    elif event_type == "wind":
+      self.mission_events.schedule(time, "wind", lambda time_now: setattr(self, "wind_force_vector", tuple(event_spec["force"])))
+    else:
+      raise ValueError(f"Unknown mission event type: {event_type}. Available types: {list(EVENT_TYPES)}")
 
-    
-    if (time_now > failure_time):
-      flight_params.uav.motor_efficiency_matrix = flight_params.uav.motor_efficiency_matrix_after_failure
+  def setBallsCollide(self, balls: list[chrono.ChBody], collide: bool):
+    for ball in balls:
+      ball.SetCollide(collide)
 
-  def sequentiallyDropBalls(self, time_now: float,
-                            apply: bool = False,
-                            drop_start_time: float=3.0,     # Time at which the first ball starts dropping
-                            drop_interval: float=0.10,      # Time delay between successive ball drops
-                            disable_duration: float=0.15    # How long each ball should stay non-collidable
-                            ):
+  def applyMotorFailure(self, flight_params: FlightParams, motor: int | None = None, efficiency: float = 0.0):
     """
-    Toggles collision state of balls one by one to simulate sequential payload dropping.
-
-    Parameters:
-    - time_now (float):         Current simulation time.
-    - apply (bool):             Whether or not to apply the payload dropping.
-    - drop_start_time (float):  Time at which the first ball starts dropping
-    - drop_interval (float):    Time delay between successive ball drops.
-    - disable_duration (float): How long each ball should stay non-collidable
+    Modify the motor efficiency matrix to simulate a motor failure: the efficiency of 'motor' is set to
+    'efficiency', or, if 'motor' is None, the matrix becomes the one after failure of the UAV parameters.
     """
-    if not apply:
+    if motor is None:
+      flight_params.uav.motor_efficiency_matrix = flight_params.uav.motor_efficiency_matrix_after_failure
       return
+    motor_efficiency_matrix = flight_params.uav.motor_efficiency_matrix.copy()
+    motor_efficiency_matrix[motor, motor] = efficiency
+    flight_params.uav.motor_efficiency_matrix = motor_efficiency_matrix
 
-    if (self.mission_config.add_payload_flag and self.mission_config.payload_type != "two_steel_balls"):
-
-      if not hasattr(self, "m_spheres") or len(self.m_spheres) == 0:
-        return  # No spheres to drop
-      
-      for i, ball in enumerate(self.m_spheres):
-        drop_time_i = drop_start_time + i * drop_interval
-        reenable_time_i = drop_time_i + disable_duration
-
-        if time_now < drop_time_i:
-          # Ball hasn't dropped yet — keep collision on
-          ball.SetCollide(True)
-        elif drop_time_i <= time_now < reenable_time_i:
-          # Ball is in its disabled phase — collision off
-          ball.SetCollide(False)
-        else:
-          # Disable duration passed — re-enable collision
-          ball.SetCollide(True)
+  def handleMissionEvents(self, time_now: float):
+    self.mission_events.fireDue(time_now)
 
   def assignInstances(
     self,
@@ -765,38 +1001,128 @@ class Simulation:
     self.controller = controller
     self.logger = logger
 
+    # Counters of the run, used for its summary metrics
+    self.num_control_steps = 0
+    self.num_saturated_steps = 0
+
+    # Motor thrusts of the controller, held between its steps once it has started (zero-order hold)
+    self.controller_running = False
+    self.new_motor_thrusts = False
+    self.setUpMissionEvents()
+    self.setUpWindField()
+    self.setUpActuators(flight_params)
+    self.setUpSolverPolicy()
+    self.setUpScheduler()
+
+  def setUpActuators(self, flight_params: FlightParams):
+    """Motor geometry of the run, reducing the motor thrusts to a single wrench on the drone frame."""
+    self.actuators = MotorActuators(flight_params, self.getMotorForcePositions(flight_params), self.number_of_propellers)
+    self.motor_force = chrono.ChVectorD(0, 0, 0)
+    self.motor_torque = chrono.ChVectorD(0, 0, 0)
+
+  def getMotorForcePositions(self, flight_params: FlightParams) -> np.ndarray:
+    """Thrust application points of the UAV in the local COG frame of the drone frame."""
+    offset = self.frame_cog_offset
+    return np.array([
+      (pos.x + offset.x, pos.y + offset.y, pos.z + offset.z) for pos in flight_params.uav.motor_force_positions
+    ])
+
+  def setUpWindField(self):
+    """Turbulent wind of the run ('MissionConfig.wind_model'), generated once, before the first step."""
+    self.wind_field = instantiateWindField(self.mission_config)
+
+  def setUpSolverPolicy(self):
+    """Iteration budget of the solver at each step of the plant ('MissionConfig.solver_policy')."""
+    self.solver_policy = instantiateSolverPolicy(
+      self.m_sys, self.m_solver, self.mission_config, self.getContactEventTimes(), self.getPayloadReleaseTime()
+    )
+
+  def getContactEventTimes(self) -> list[float]:
+    """Scheduled times at which the contacts of the system change: start, takeoff, payload drops, motor failures."""
+    event_times = [0.0, self.flight_params.controller_start_time]
+    for event_spec in self.getMissionEventSpecs():
+      if event_spec["type"] == "drop_balls":
+        event_times += [event_spec["time"], event_spec["time"] + event_spec.get("disable_duration", BALL_DROP_DISABLE_DURATION)]
+      elif event_spec["type"] == "motor_failure":
+        event_times.append(event_spec["time"])
+    return event_times
+
+  def getPayloadReleaseTime(self) -> float:
+    """
+    Time from which no ball of the payload is aboard anymore: the last ball dropped, with its collisions
+    re-enabled (-inf without payload, inf if some ball is never dropped).
+    """
+    balls = self.getPayloadBalls()
+    if not balls:
+      return -math.inf
+    release_times = [math.inf] * len(balls)
+    for event_spec in self.getMissionEventSpecs():
+      if event_spec["type"] == "drop_balls":
+        release_time = event_spec["time"] + event_spec.get("disable_duration", BALL_DROP_DISABLE_DURATION)
+        for i in event_spec.get("balls", range(len(balls))):
+          release_times[i] = min(release_times[i], release_time)
+    return max(release_times)
+
+  def setUpScheduler(self):
+    """
+    Subsystems run after each step of the plant, each one at its period in the mission config.
+    The plant state, the mission events, the external forces and the held motor thrusts
+    are updated at every physics step.
+    """
+    mission_config = self.mission_config
+    self.scheduler = MultiRateScheduler(mission_config.timestep)
+    self.scheduler.addTask("states", 0, lambda time_now, simulation_time: self.updateSystemStates(time_now))
+    self.scheduler.addTask("mission_events", 0, lambda time_now, simulation_time: self.handleMissionEvents(time_now))
+    self.scheduler.addTask("external_forces", 0, lambda time_now, simulation_time: self.applyExternalForces(self.mission_config))
+    self.scheduler.addTask("control", mission_config.control_period, lambda time_now, simulation_time: self.runControlStep(time_now, simulation_time))
+    self.scheduler.addTask("actuation", 0, lambda time_now, simulation_time: self.applyHeldMotorThrusts())
+    self.scheduler.addTask("logging", mission_config.logging_period, lambda time_now, simulation_time: self.collectLogData(simulation_time))
+    self.scheduler.addTask("console", mission_config.console_period, lambda time_now, simulation_time: self.debugPrints(time_now, simulation_time))
+    if self.visualization is not None:
+      self.scheduler.addTask("render", mission_config.render_period, lambda time_now, simulation_time: self.render())
+
   def runSimulationLoop(self):
-    self.visualization.setup()
+    self.visualization_open = True
+    if self.visualization is not None:
+      self.visualization.setup()
     start_sim_time = time.time() # Time acquired in order to measure the execution time of the simulation
 
-    # Simulation loop
-    while self.m_sys.GetChTime() < self.mission_config.simulation_duration_seconds:
-      if not self.visualization.update():
-        break # Exit loop if visualization window is closed
-
+    # Simulation loop, until the end of the mission or until the visualization window is closed
+    while self.getTime() < self.mission_config.simulation_duration_seconds and self.visualization_open:
       self.stepSimulation(start_sim_time)
 
-  def stepSimulation(self, start_sim_time: float):
+  def render(self):
+    if self.kinematic_propellers != []:
+      self.animatePropellers(self.getTime())
+    self.visualization_open = self.visualization.update()
+
+  def getTime(self) -> float:
+    return self.m_sys.GetChTime()
+
+  def advancePlant(self):
+    """Advance the plant by one timestep under the forces and torques applied during the previous step."""
+    self.solver_policy.beforeStep(self.m_sys.GetChTime())
     self.m_sys.DoStepDynamics(self.mission_config.timestep)
+    self.solver_policy.afterStep(self.m_sys.GetChTime())
     # Empty_forces_accumulators() MUST be used in conjunction with 
     # Accumulate_force() and Accumulate_torque() used to apply forces and torques
     self.m_frame.Empty_forces_accumulators()
 
-    time_now = self.m_sys.GetChTime() # Time "inside" the simulation
-    simulation_time = time.time() - start_sim_time # Time that the simulation is taking
+  def stepSimulation(self, start_sim_time: float):
+    self.advancePlant()
 
-    self.updateSystemStates(time_now)
-    self.applyExternalForces(self.mission_config)
-    self.handlePayloadMechanisms(time_now, self.mission_config)
-    self.handleFaults(time_now, self.mission_config)
-    self.runControllerIfStarted(time_now, simulation_time)
+    time_now = self.getTime() # Time "inside" the simulation
+    simulation_time = time.time() - start_sim_time # Time that the simulation is taking
 
-    self.debugPrints(time_now, simulation_time)
+    # Subsystems due after this step of the plant (see 'setUpScheduler')
+    self.scheduler.dispatch(time_now, simulation_time)
 
   def updateSystemStates(self, time_now: float):
     # Computing Center Of Mass (COM) of the system: drone frame + box + propellers + balls
     self.updateCOMcomputationOfSystemWithPayload()
     self.updatePixhawkState()
+
+  def updateControllerInputs(self, time_now: float):
     # Compute user-defined trajectory
     user_defined_trajectory_state = self.user_defined_trajectory.compute(time_now)
     # Collect vehicle state
@@ -811,8 +1137,13 @@ class Simulation:
   def applyExternalForces(self, mission_config: Cfg.MissionConfig):
     # Applying AERODYNAMIC FORCE to the drone
     self.applyAerodynamicForce(self.flight_params)
-    # Applying a constant WIND FORCE to the drone, expressed in pychrono global coordinate
-    self.applyWindForce(self.flight_params, wind_force_vector=mission_config.wind_force_vector, apply=mission_config.apply_wind_force)
+    # Applying the constant WIND FORCE of the last wind event to the drone, expressed in pychrono global coordinate
+    if self.wind_force_vector is not None:
+      self.applyWindForce(self.flight_params, wind_force_vector=self.wind_force_vector, apply=True)
+
+  def runControlStep(self, time_now: float, simulation_time: float):
+    self.updateControllerInputs(time_now)
+    self.runControllerIfStarted(time_now, simulation_time)
 
   def runControllerIfStarted(self, time_now: float, simulation_time: float):
     if time_now <= self.flight_params.controller_start_time:
@@ -823,29 +1154,31 @@ class Simulation:
 
     # Thrust saturation
     self.applyMotorThrustLimitsAndEfficiency(self.controller, self.flight_params)
-    # Applying motor thrust forces
-    self.applyMotorForces(self.controller, self.flight_params)
-    # Apply propellers reaction torques around local yaw-axis
-    self.applyPropellerReactionTorques(self.controller, self.flight_params)
-    # Setting the propeller rotational velocities
-    self.setPropellerRotationalVelocity(self.flight_params)
+    self.controller_running = True
+    self.new_motor_thrusts = True
+
+  def applyHeldMotorThrusts(self):
+    """
+    Apply the motor thrusts of the last control step at every physics step (zero-order hold),
+    since the forces accumulated on the drone frame are emptied after each step of the plant.
+    """
+    if not self.controller_running:
+      return
+
+    # Applying the net motor thrust force and torque (thrusts and propeller reaction torques)
+    self.applyMotorWrench()
+    # Setting the propeller rotational velocities, only when the thrusts changed
+    if self.new_motor_thrusts:
+      self.setPropellerRotationalVelocity(self.flight_params)
+      self.new_motor_thrusts = False
+
+  def collectLogData(self, simulation_time: float):
+    if not self.controller_running:
+      return
 
     # Collect the log data
     self.logger.collectData(self.controller, simulation_time, self.number_of_propellers)
 
-  def handlePayloadMechanisms(self, time_now: float, mission_config: Cfg.MissionConfig):
-    # Payload Dropping
-    self.handlePayloadDroppingBalls12(time_now, apply=mission_config.drop_two_steel_balls, drop_time=mission_config.two_steel_balls_drop_time)
-    # Dropping multiple balls one after the other
-    self.sequentiallyDropBalls(time_now,
-                               apply=mission_config.sequentially_drop_multiple_balls,
-                               drop_start_time=mission_config.sequentially_drop_start_time,
-                               drop_interval=mission_config.sequentially_drop_interval)
-
-  def handleFaults(self, time_now: float, mission_config: Cfg.MissionConfig):
-    # Motor failure
-    self.handleMotorFailure(time_now, self.flight_params, apply=mission_config.apply_motor_failure, failure_time=mission_config.motor_failure_time)
-
   def debugPrints(self, time_now: float, simulation_time: float):
     # Print data to Console
     Utils.printSimulationTimeInline(
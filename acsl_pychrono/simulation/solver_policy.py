@@ -0,0 +1,122 @@
+import numpy as np
+import pychrono as chrono
+
+import acsl_pychrono.config.config as Cfg
+from acsl_pychrono.control.log_buffer import LogBuffer
+
+# Channels of the solver log, one row per step of the plant
+SOLVER_LOG_CHANNELS = ("time", "num_contacts", "max_iterations", "iterations", "residual")
+
+class FixedSolverPolicy:
+  """
+  Iteration budget of the solver of the Chrono plant ('MissionConfig.solver_policy' "fixed"):
+  'solver_max_iterations' at every step.
+  After each step of the plant, the number of contacts, the iteration cap, the iterations used and the
+  constraint residual reached by the solver are logged (see 'toDictionary').
+  """
+  def __init__(self, m_sys: chrono.ChSystem, m_solver: chrono.ChIterativeSolverVI, mission_config: Cfg.MissionConfig):
+    self.m_sys = m_sys
+    self.m_solver = m_solver
+    self.max_iterations = mission_config.solver_max_iterations
+    self.iteration_cap = self.max_iterations
+    self.m_solver.SetMaxIterations(self.iteration_cap)
+
+    # Outcome of the last step of the plant
+    self.num_contacts = 0
+    self.residual = 0.0
+
+    expected_rows = LogBuffer.expectedRows(mission_config.simulation_duration_seconds, mission_config.timestep)
+    self.buffer = LogBuffer(len(SOLVER_LOG_CHANNELS), expected_rows)
+
+  def beforeStep(self, time_now: float):
+    """Set the iteration cap of the next step of the plant."""
+    pass
+
+  def afterStep(self, time_now: float):
+    """Read and log the outcome of the step of the plant."""
+    self.num_contacts = self.m_sys.GetNcontacts()
+    self.residual = self.m_solver.GetError()
+    row = self.buffer.nextRow()
+    row[0] = time_now
+    row[1] = self.num_contacts
+    row[2] = self.iteration_cap
+    row[3] = self.m_solver.GetIterations()
+    row[4] = self.residual
+
+  def toDictionary(self) -> dict:
+    data = self.buffer.getData()
+    return {name: data[:, i].reshape(-1, 1) for i, name in enumerate(SOLVER_LOG_CHANNELS)}
+
+  def summaryMetrics(self) -> dict:
+    """Mean iterations used per step and fraction of the steps run with the full iteration budget."""
+    data = self.buffer.getData()
+    if data.shape[0] == 0:
+      return {"solver_iterations_mean": float("nan"), "solver_full_budget_fraction": float("nan")}
+    return {
+      "solver_iterations_mean": float(np.mean(data[:, 3])),
+      "solver_full_budget_fraction": float(np.mean(data[:, 2] == self.max_iterations)),
+    }
+
+class ContactAwareSolverPolicy(FixedSolverPolicy):
+  """
+  Iteration budget of the solver of the Chrono plant following the contacts ('MissionConfig.solver_policy' "contact_aware").
+  The full budget 'solver_max_iterations' is used within 'solver_event_window_seconds' of a contact event:
+  - a scheduled event (start, takeoff, payload drops, motor failure), before and after it;
+  - a change of the number of contacts (e.g., landing, balls hitting the box or the floor), after it;
+  - a step whose constraint residual is above 'solver_residual_tolerance', after it.
+  The cap is shrunk to 'solver_min_iterations' only when airborne with no payload contacts: no contact at the
+  last step and no payload aboard (before 'payload_release_time', the loose balls in the box can hit it at any step).
+  Experimental: the deviation of the flights from those of the "fixed" policy is not measured yet
+  (see 'benchmarks/bench_solver_policy.py'), "fixed" stays the default.
+  """
+  def __init__(
+    self,
+    m_sys: chrono.ChSystem,
+    m_solver: chrono.ChIterativeSolverVI,
+    mission_config: Cfg.MissionConfig,
+    event_times: list[float],
+    payload_release_time: float = -np.inf
+  ):
+    super().__init__(m_sys, m_solver, mission_config)
+    self.min_iterations = mission_config.solver_min_iterations
+    self.event_window = mission_config.solver_event_window_seconds
+    self.residual_tolerance = mission_config.solver_residual_tolerance
+    self.event_times = np.sort(np.asarray(event_times, dtype=float))
+    self.payload_release_time = payload_release_time
+    # End of the full budget after the last observed contact event
+    self.hold_until = -np.inf
+
+  def isNearScheduledEvent(self, time_now: float) -> bool:
+    i = np.searchsorted(self.event_times, time_now - self.event_window)
+    return i < self.event_times.size and self.event_times[i] <= time_now + self.event_window
+
+  def isAirborneWithoutPayload(self, time_now: float) -> bool:
+    return self.num_contacts == 0 and time_now >= self.payload_release_time
+
+  def beforeStep(self, time_now: float):
+    if time_now < self.hold_until or self.isNearScheduledEvent(time_now) or not self.isAirborneWithoutPayload(time_now):
+      iteration_cap = self.max_iterations
+    else:
+      iteration_cap = self.min_iterations
+    if iteration_cap != self.iteration_cap:
+      self.m_solver.SetMaxIterations(iteration_cap)
+      self.iteration_cap = iteration_cap
+
+  def afterStep(self, time_now: float):
+    previous_num_contacts = self.num_contacts
+    super().afterStep(time_now)
+    if self.num_contacts != previous_num_contacts or self.residual > self.residual_tolerance:
+      self.hold_until = time_now + self.event_window
+
+def instantiateSolverPolicy(
+  m_sys: chrono.ChSystem,
+  m_solver: chrono.ChIterativeSolverVI,
+  mission_config: Cfg.MissionConfig,
+  event_times: list[float],
+  payload_release_time: float = -np.inf
+) -> FixedSolverPolicy:
+  if mission_config.solver_policy == "fixed":
+    return FixedSolverPolicy(m_sys, m_solver, mission_config)
+  if mission_config.solver_policy == "contact_aware":
+    return ContactAwareSolverPolicy(m_sys, m_solver, mission_config, event_times, payload_release_time)
+  raise ValueError(f"Unknown solver policy: {mission_config.solver_policy}")
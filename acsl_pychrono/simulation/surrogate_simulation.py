@@ -0,0 +1,146 @@
+import numpy as np
+from numpy import linalg as LA
+
+from acsl_pychrono.simulation.simulation import Simulation
+from acsl_pychrono.simulation.rigid_body_plant import RigidBodyPlant, ROTMAT_YUP_TO_NED
+from acsl_pychrono.simulation.pixhawk_state import VehicleState
+from acsl_pychrono.simulation.flight_params import FlightParams
+from acsl_pychrono.simulation.ode_input import OdeInput
+import acsl_pychrono.config.config as Cfg
+import acsl_pychrono.user_defined_trajectory as Traj
+from acsl_pychrono.control.control import Control
+import acsl_pychrono.uav as UAV_Module
+
+class SurrogateSimulation(Simulation):
+  """
+  'Simulation' whose plant is the NumPy 'RigidBodyPlant' instead of the Chrono system (plant_backend "numpy").
+  Same loop, controller, thrust saturation, force application, faults and logging; the CAD model, contacts,
+  payload, environment and visualization are not simulated.
+  The plant is built from the UAV YAML file and the UAV parameters, the state is read at the center of mass.
+  """
+  def __init__(self, sim_cfg: Cfg.SimulationConfig = Cfg.SimulationConfig()) -> None:
+    self.m_motors = []
+    self.kinematic_propellers = []
+    self.vehicle_state: VehicleState = VehicleState()
+    self.plant: RigidBodyPlant | None = None
+
+    # Config members
+    self.setConfigMembers(sim_cfg)
+
+    if self.mission_config.visualization_flag:
+      print("[INFO] The numpy plant backend has no visualization: running headless.")
+    self.visualization = None
+
+    # UAV specific parameters
+    self.setUpUAVParams()
+
+    # No floor body: the user-defined trajectories are not drawn
+    self.mfloor = None
+    self.mfloor_Yposition = 0.0
+
+    if self.mission_config.add_payload_flag or self.environment_config.include:
+      print("[INFO] The payload and the environment are not simulated by the numpy plant backend.")
+
+  def resetToInitialState(self, sim_cfg: Cfg.SimulationConfig):
+    """Bring the simulation back to its initial conditions (the plant is rebuilt by 'assignInstances')."""
+    self.setConfigMembers(sim_cfg)
+    self.vehicle_state = VehicleState()
+    self.plant = None
+
+  def setGravitationalAcceleration(self, flight_params: FlightParams):
+    self.G_acc = flight_params.uav.G_acc
+
+  def assignInstances(
+    self,
+    flight_params: FlightParams,
+    ode_input: OdeInput,
+    user_defined_trajectory: Traj.BaseUserDefinedTrajectory,
+    gains,
+    controller: Control,
+    logger
+    ):
+    self.setUpPlant(flight_params)
+    super().assignInstances(flight_params, ode_input, user_defined_trajectory, gains, controller, logger)
+
+  def setUpSolverPolicy(self):
+    # No constraint solver
+    self.solver_policy = None
+
+  def setUpPlant(self, flight_params: FlightParams):
+    """Build the rigid-body plant and the force application points from the UAV YAML file."""
+    uav_cfg = UAV_Module.get_uav_config(self.uav_name)["uav"]
+
+    # The vehicle starts at rest at the position of the pixhawk
+    self.plant = RigidBodyPlant(
+      flight_params.uav.mass_total,
+      flight_params.uav.Inertia_mat_pixhawk,
+      flight_params.uav.G_acc,
+      initial_position=ROTMAT_YUP_TO_NED @ np.asarray(self.pixhawk_local_pos, dtype=float),
+      frame_orientation=uav_cfg["cad"].get("frame_orientation", (1.0, 0.0, 0.0, 0.0))
+    )
+    self.motor_force_positions = np.asarray(uav_cfg["force_positions"], dtype=float)
+    self.aerodynamic_force_application_point = np.asarray(uav_cfg["aerodynamic_force_application_point"], dtype=float)
+
+  def getTime(self) -> float:
+    return self.plant.time
+
+  def advancePlant(self):
+    self.plant.doStepDynamics(self.mission_config.timestep)
+    self.plant.emptyForcesAccumulators()
+
+  def updateCOMcomputationOfSystemWithPayload(self):
+    pass
+
+  def getPayloadBalls(self) -> list:
+    # No payload: the "drop_balls" events drop nothing
+    return []
+
+  def updatePixhawkState(self):
+    # The plant has no pixhawk marker: the state is the one of the center of mass
+    self.vehicle_state = self.plant.getVehicleState(0)
+
+  def getVehicleState(self) -> VehicleState:
+    return self.vehicle_state
+
+  def applyAerodynamicForce(self, flight_params: FlightParams):
+    if self.wind_field is None:
+      aerodynamic_velocity = self.plant.getBodyVelocity()[0].reshape(3, 1)
+    else:
+      # Velocity relative to the wind (airspeed), in the body frame
+      position = ROTMAT_YUP_TO_NED.T @ self.plant.position[0]
+      wind_velocity = ROTMAT_YUP_TO_NED @ self.wind_field.getVelocity(self.getTime(), position)
+      aerodynamic_velocity = self.plant.toBody(self.plant.velocity - wind_velocity)[0].reshape(3, 1)
+    aerodynamic_force = (
+      -0.5 * flight_params.uav_controller.air_density_estimated *
+      flight_params.uav_controller.surface_area_estimated *
+      flight_params.uav_controller.drag_coefficient_matrix_estimated *
+      aerodynamic_velocity * LA.norm(aerodynamic_velocity)
+    )
+
+    # Same components as in 'Simulation.applyAerodynamicForce', applied in the local frame of the drone frame
+    self.plant.accumulateForce(
+      np.asarray(aerodynamic_force).ravel(),
+      self.aerodynamic_force_application_point,
+      True
+    )
+
+  def applyWindForce(self, flight_params: FlightParams,
+                     wind_force_vector: tuple[float, float, float] = (1.0, 0.0, 0.0),
+                     apply: bool = False):
+    if not apply:
+      return
+
+    self.plant.accumulateForce(wind_force_vector, self.aerodynamic_force_application_point, False)
+
+  def getMotorForcePositions(self, flight_params: FlightParams) -> np.ndarray:
+    # Local points relative to the center of mass of the plant
+    return self.motor_force_positions
+
+  def applyMotorThrustLimitsAndEfficiency(self, controller, flight_params: FlightParams):
+    # The wrench is read from 'MotorActuators' by 'applyMotorWrench': no ChVectorD conversion
+    self.updateActuators(controller, flight_params)
+
+  def applyMotorWrench(self):
+    """Apply the net force and torque of the motors (see 'MotorActuators') in the local frame of the drone frame."""
+    self.plant.accumulateForce(self.actuators.force, np.zeros(3), True)
+    self.plant.accumulateTorque(self.actuators.torque, True)
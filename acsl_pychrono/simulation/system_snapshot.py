@@ -0,0 +1,42 @@
+import pychrono as chrono
+
+class BodySnapshot:
+  """Kinematic state, mass properties and collision flag of a body at a given instant."""
+  def __init__(self, body: chrono.ChBody):
+    self.body = body
+    # Copies, since the getters return references to the body's internal data
+    self.coord = chrono.ChCoordsysD(body.GetCoord())
+    self.coord_dt = chrono.ChCoordsysD(body.GetCoord_dt())
+    self.coord_dtdt = chrono.ChCoordsysD(body.GetCoord_dtdt())
+    self.mass = body.GetMass()
+    self.inertia_xx = chrono.ChVectorD(body.GetInertiaXX())
+    self.inertia_xy = chrono.ChVectorD(body.GetInertiaXY())
+    self.collide = body.GetCollide()
+
+  def restore(self):
+    self.body.SetCoord(self.coord)
+    self.body.SetCoord_dt(self.coord_dt)
+    self.body.SetCoord_dtdt(self.coord_dtdt)
+    self.body.SetMass(self.mass)
+    self.body.SetInertiaXX(self.inertia_xx)
+    self.body.SetInertiaXY(self.inertia_xy)
+    self.body.SetCollide(self.collide)
+    self.body.Empty_forces_accumulators()
+
+class SystemSnapshot:
+  """
+  Initial conditions of the bodies of a built ChSystem.
+  Restoring it brings the bodies back to the state they had when the snapshot was taken,
+  so that a system built once can be reused for many runs.
+  """
+  def __init__(self, m_sys: chrono.ChSystem, bodies: list[chrono.ChBody]):
+    self.m_sys = m_sys
+    self.time = m_sys.GetChTime()
+    self.body_snapshots = [BodySnapshot(body) for body in bodies]
+
+  def restore(self):
+    self.m_sys.SetChTime(self.time)
+    for body_snapshot in self.body_snapshots:
+      body_snapshot.restore()
+    # Propagate the restored states to markers and auxiliary frames
+    self.m_sys.Update()
@@ -1,14 +1,22 @@
 import pychrono as chrono
-import pychrono.irrlicht as irr
 
 class Visualization:
+  """
+  Real-time rendering of the simulation with Irrlicht.
+  'pychrono.irrlicht' is imported only when the visualization is set up,
+  so headless runs never load the render stack.
+  """
   def __init__(self, sim):
     self.sim = sim
+    self.irr = None
 
   def setup(self):
     if not self.sim.mission_config.visualization_flag:
       return # Exit early if visualization is disabled
     
+    import pychrono.irrlicht as irr
+    self.irr = irr
+
     # Create the Irrlicht visualization
     vis = irr.ChVisualSystemIrrlicht()
     vis.AttachSystem(self.sim.m_sys)
@@ -62,8 +70,8 @@ class Visualization:
 
     self.sim.vis.Render()
     # Draw coordinate systems
-    irr.drawCoordsys(self.sim.vis, self.sim.marker_pixhawk.GetAbsCoord(), 0.5)  # Pixhawk NED
-    irr.drawCoordsys(self.sim.vis, self.sim.global_coord, 1.0)                  # Global frame
+    self.irr.drawCoordsys(self.sim.vis, self.sim.marker_pixhawk.GetAbsCoord(), 0.5)  # Pixhawk NED
+    self.irr.drawCoordsys(self.sim.vis, self.sim.global_coord, 1.0)                  # Global frame
     self.sim.vis.EndScene()
     return True # Continue simulation
   
@@ -95,5 +103,6 @@ class Visualization:
 
   def _add_camera_fpv(self):
     if self.sim.m_sys.GetChTime() > 0.1:
-      fpv_pos = self.sim.pixhawk_state.rotmat * (self.sim.pixhawk_state.pos_LOC + chrono.ChVectorD(-0.4, 0, -0.1))
+      pixhawk_state = self.sim.computePixhawkState()
+      fpv_pos = pixhawk_state.rotmat * (pixhawk_state.pos_LOC + chrono.ChVectorD(-0.4, 0, -0.1))
       self.sim.vis.AddCamera(fpv_pos, self.sim.m_frame.GetPos() + chrono.ChVectorD(0, 0.05, 0))
\ No newline at end of file
@@ -0,0 +1,121 @@
+import math
+import numpy as np
+
+import acsl_pychrono.config.config as Cfg
+
+# Wind models ('MissionConfig.wind_model') whose turbulence is pre-generated
+TURBULENCE_MODELS = ("dryden", "von_karman")
+
+# Speed [m/s] carrying the turbulence (frozen turbulence) when the mean wind is weaker than it
+MIN_TURBULENCE_SPEED = 1.0
+
+# Minimum period of the wind table, in correlation times (length scale / speed) of the turbulence: the
+# frequencies below 1/period are not synthesized, a period of 20 correlation times keeps most of their variance
+MIN_TABLE_CORRELATION_TIMES = 20.0
+
+def turbulencePSD(model: str, omega: np.ndarray, sigma: float, length_scale: float, speed: float, longitudinal: bool) -> np.ndarray:
+  """
+  One-sided power spectral density [(m/s)^2/(rad/s)] of a turbulence component at the angular frequencies 'omega'
+  (MIL-HDBK-1797), for a turbulence carried at 'speed': its integral over [0, inf) is sigma^2.
+  """
+  scaled_omega = length_scale * omega / speed
+  if model == "dryden":
+    if longitudinal:
+      return sigma**2 * 2 * length_scale / (math.pi * speed) / (1 + scaled_omega**2)
+    return sigma**2 * length_scale / (math.pi * speed) * (1 + 3 * scaled_omega**2) / (1 + scaled_omega**2)**2
+  if model == "von_karman":
+    scaled_omega = 1.339 * scaled_omega
+    if longitudinal:
+      return sigma**2 * 2 * length_scale / (math.pi * speed) / (1 + scaled_omega**2)**(5 / 6)
+    return sigma**2 * length_scale / (math.pi * speed) * (1 + 8 / 3 * scaled_omega**2) / (1 + scaled_omega**2)**(11 / 6)
+  raise ValueError(f"Unknown wind model: {model}")
+
+class TurbulentWindField:
+  """
+  Wind velocity in the global pychrono coordinate system: mean wind plus a turbulence with the Dryden or
+  von Karman spectra, along the mean wind (longitudinal), across it (lateral) and along the vertical.
+  The whole turbulence is generated once, seeded, by spectral synthesis (random phases, inverse real FFT) into a
+  periodic table of 'table_timestep' samples covering at least 'duration' (and 'MIN_TABLE_CORRELATION_TIMES');
+  'getVelocity' is a linear interpolation in that table.
+  With 'spatial_variation', the turbulence is frozen and carried by the mean wind (Taylor's hypothesis): the wind
+  at a position is the one at the origin delayed by the time the wind takes to travel its longitudinal distance.
+  """
+  def __init__(
+    self,
+    model: str,
+    mean_velocity: tuple[float, float, float],
+    intensity: tuple[float, float, float],
+    length_scale: tuple[float, float, float],
+    duration: float,
+    table_timestep: float = 0.01,
+    seed: int = 0,
+    spatial_variation: bool = False
+  ):
+    self.mean_velocity = np.asarray(mean_velocity, dtype=float)
+    self.table_timestep = table_timestep
+    self.spatial_variation = spatial_variation
+    self.speed = max(float(np.linalg.norm(self.mean_velocity)), MIN_TURBULENCE_SPEED)
+
+    # Longitudinal, lateral and vertical directions (y-up): the longitudinal one is the horizontal mean wind
+    vertical = np.array([0.0, 1.0, 0.0])
+    horizontal_mean = self.mean_velocity - self.mean_velocity.dot(vertical) * vertical
+    if np.linalg.norm(horizontal_mean) > 0:
+      longitudinal = horizontal_mean / np.linalg.norm(horizontal_mean)
+    else:
+      longitudinal = np.array([1.0, 0.0, 0.0])
+    self.longitudinal = longitudinal
+    self.axes = np.stack([longitudinal, np.cross(vertical, longitudinal), vertical])
+
+    turbulence = self.generateTurbulence(model, intensity, length_scale, duration, seed)
+    # Wind velocity at each sample of the table (num_samples x 3)
+    self.velocity_table = self.mean_velocity + turbulence @ self.axes
+    self.num_samples = self.velocity_table.shape[0]
+
+  def generateTurbulence(self, model: str, intensity, length_scale, duration: float, seed: int) -> np.ndarray:
+    """Longitudinal, lateral and vertical turbulence (num_samples x 3), periodic over the table."""
+    period = max(duration, MIN_TABLE_CORRELATION_TIMES * max(length_scale) / self.speed)
+    num_samples = 2 ** math.ceil(math.log2(max(period / self.table_timestep + 1, 2)))
+    omega = 2 * math.pi * np.fft.rfftfreq(num_samples, self.table_timestep)
+    d_omega = omega[1]
+    rng = np.random.default_rng(seed)
+
+    turbulence = np.empty((num_samples, 3))
+    for axis in range(3):
+      psd = turbulencePSD(model, omega[1:], intensity[axis], length_scale[axis], self.speed, longitudinal=(axis == 0))
+      # Sum of cosines of amplitudes sqrt(2 PSD d_omega) and random phases, by inverse real FFT
+      amplitude = np.sqrt(2 * psd * d_omega)
+      phase = rng.uniform(0.0, 2 * math.pi, omega.size - 1)
+      spectrum = np.zeros(omega.size, dtype=complex)
+      spectrum[1:] = 0.5 * num_samples * amplitude * np.exp(1j * phase)
+      turbulence[:, axis] = np.fft.irfft(spectrum, n=num_samples)
+    return turbulence
+
+  def getVelocity(self, time_now: float, position=None) -> np.ndarray:
+    """Wind velocity [m/s] at 'time_now' (and at 'position' in the global pychrono coordinate system)."""
+    if self.spatial_variation and position is not None:
+      time_now -= (
+        self.longitudinal[0] * position[0] + self.longitudinal[1] * position[1] + self.longitudinal[2] * position[2]
+      ) / self.speed
+    sample = time_now / self.table_timestep
+    i = math.floor(sample)
+    fraction = sample - i
+    i %= self.num_samples
+    table = self.velocity_table
+    return table[i] + fraction * (table[(i + 1) % self.num_samples] - table[i])
+
+def instantiateWindField(mission_config: Cfg.MissionConfig) -> TurbulentWindField | None:
+  """Turbulent wind field of the mission ('MissionConfig.wind_model'), or None for the "constant" wind model."""
+  if mission_config.wind_model == "constant":
+    return None
+  if mission_config.wind_model not in TURBULENCE_MODELS:
+    raise ValueError(f"Unknown wind model: {mission_config.wind_model}")
+  return TurbulentWindField(
+    mission_config.wind_model,
+    mission_config.wind_mean_velocity,
+    mission_config.wind_turbulence_intensity,
+    mission_config.wind_turbulence_length_scale,
+    mission_config.simulation_duration_seconds,
+    mission_config.wind_table_timestep,
+    mission_config.wind_seed,
+    mission_config.wind_spatial_variation
+  )
@@ -1,5 +1,7 @@
 # acsl_pychrono/uav/__init__.py
 from pathlib import Path
+import copy
+import hashlib
 import importlib
 import pkgutil
 import yaml
@@ -14,6 +16,9 @@ _discovered_uavs = {                  # Map of UAV type to module name
   if not m.name.startswith("_")
 }
 
+# Parsed YAML files, keyed by the hash of their content
+_parsed_yaml_files: dict[str, dict] = {}
+
 def instantiateUAV(uav_name: str, controller_name: str):
   """Dynamically instantiate a UAV and its controller parameters based on the UAV type."""
   # Normalize UAV type to uppercase
@@ -49,5 +54,17 @@ def get_uav_config(uav_name: str):
     raise FileNotFoundError(f"Config not found for {uav_name} at {config_path}")
 
  # Load and return the configuration dictionary
-  with open(config_path, "r") as f:
-    return yaml.safe_load(f)
+  return load_yaml_file(config_path)
+
+def load_yaml_file(config_path) -> dict:
+  """
+  Load a YAML file, parsing it only once per content in each process
+  (the UAV and gains files are read several times per run). Returns a copy the caller can modify.
+  """
+  with open(config_path, "rb") as f:
+    content = f.read()
+
+  content_hash = hashlib.sha256(content).hexdigest()
+  if content_hash not in _parsed_yaml_files:
+    _parsed_yaml_files[content_hash] = yaml.safe_load(content)
+  return copy.deepcopy(_parsed_yaml_files[content_hash])
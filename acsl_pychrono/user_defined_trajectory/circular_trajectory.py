@@ -77,6 +77,8 @@ class CircularTrajectory(BaseUserDefinedTrajectory):
   
   def addVisualization(self, mfloor, mfloor_Yposition):
     "Add circular trajectory visualization to the Chrono body (mfloor)"
+    if mfloor is None: # No floor body to draw on (e.g., plant_backend "numpy")
+      return
     # Create a ChLinePath geometry, and insert sub-paths 
     mpath = chrono.ChLinePath()
     marc1 = chrono.ChLineArc(
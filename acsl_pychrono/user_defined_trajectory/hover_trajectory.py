@@ -48,6 +48,8 @@ class HoverTrajectory(BaseUserDefinedTrajectory):
   
   def addVisualization(self, mfloor, mfloor_Yposition):
     "Add hover point visualization to the Chrono body (mfloor)"
+    if mfloor is None: # No floor body to draw on (e.g., plant_backend "numpy")
+      return
 
     # Define the position of the hover point in absolute coordinates
     hover_position = chrono.ChVectorD(0, abs(self.altitude_trajectory) + mfloor_Yposition, 0)
@@ -6,11 +6,18 @@ from typing import Tuple
 from numpy.polynomial import polynomial
 import pychrono as chrono
 from acsl_pychrono.config.config import MissionConfig
+from acsl_pychrono.simulation.scheduler import periodSteps
 from acsl_pychrono.simulation.flight_params import FlightParams
 from acsl_pychrono.user_defined_trajectory.trajectory_auxillary import TrajectoryAuxillary
-from acsl_pychrono.user_defined_trajectory.base_user_defined_trajectory import BaseUserDefinedTrajectory
+from acsl_pychrono.user_defined_trajectory.base_user_defined_trajectory import BaseUserDefinedTrajectory, UserDefinedTrajectoryState
 from acsl_pychrono.user_defined_trajectory.landing import LandingPolynomials
 
+# Scalar functions of the per-step yaw evaluation applied to arrays, so that the precomputed yaw is
+# identical to it: the SIMD 'np.arctan2', 'np.sin' and 'np.square' may differ in the last bit
+_atan2 = np.vectorize(math.atan2, otypes=[float])
+_sin = np.vectorize(math.sin, otypes=[float])
+_norm2D = np.vectorize(lambda x, y: math.sqrt(x**2 + y**2), otypes=[float])
+
 class PiecewisePolynomialTrajectory(BaseUserDefinedTrajectory):
   def __init__(
       self, 
@@ -38,9 +45,20 @@ class PiecewisePolynomialTrajectory(BaseUserDefinedTrajectory):
 
     self.landing_polynomials = LandingPolynomials()
 
+    # Reference precomputed at the times of the control steps (None: evaluated at every step)
+    self.precomputed_times = None
+    self.precomputed_next_step = 0
+
     self.setParameters()
     self.addVisualization(mfloor, mfloor_Yposition)
 
+    if mission_config.precompute_trajectory:
+      self.precomputeReference(
+        mission_config.timestep,
+        mission_config.simulation_duration_seconds,
+        periodSteps(mission_config.control_period, mission_config.timestep)
+      )
+
   def setParameters(self):
     # Define path to the JSON file
     # Prepend working directory and "/params/user_defined_trajectory"
@@ -81,6 +99,121 @@ class PiecewisePolynomialTrajectory(BaseUserDefinedTrajectory):
       self.landing_start_time_seconds + self.landing_polynomials.get("1meterIn4seconds", "meta", "duration_seconds")
     )
 
+  # Largest difference [s] between the simulation time and the time of a precomputed step
+  PRECOMPUTED_TIME_TOLERANCE = 1e-9
+
+  def compute(self, t: float) -> UserDefinedTrajectoryState:
+    step = self.precomputed_next_step
+    if self.precomputed_times is not None:
+      if step < self.precomputed_times.size and abs(t - self.precomputed_times[step]) <= self.PRECOMPUTED_TIME_TOLERANCE:
+        self.precomputed_next_step += 1
+        # Keep the state of the per-step evaluation, which holds the previous values
+        self.translational_position_in_I_user_previous = self.precomputed_position[step]
+        self.psi_ref_previous = self.precomputed_yaw[step]
+        return UserDefinedTrajectoryState(
+          position=self.precomputed_position[step],
+          velocity=self.precomputed_velocity[step],
+          acceleration=self.precomputed_acceleration[step],
+          yaw=self.precomputed_yaw[step],
+          yaw_dot=self.precomputed_yaw_dot[step],
+          yaw_dot_dot=self.precomputed_yaw_dot_dot[step]
+        )
+      # Off the precomputed steps (e.g., a different timestep): evaluate at every step from now on
+      print(f"[INFO] Time {t} is not a precomputed step of the trajectory. Evaluating the trajectory at every step.")
+      self.precomputed_times = None
+    return super().compute(t)
+
+  def precomputeReference(self, timestep: float, simulation_duration_seconds: float, control_steps: int = 1):
+    """
+    Evaluate the whole reference (position, velocity, acceleration, yaw and its derivatives) once,
+    at the times of all the control steps (every 'control_steps' timesteps), with batched Horner evaluations.
+    Identical to calling 'computeUserDefinedTrajectory' and 'computeUserDefinedYaw' at every step
+    from the current state on: the hover, landing and yaw holds keep the previous values as those do.
+    """
+    num_steps = int(np.ceil(simulation_duration_seconds / (control_steps * timestep))) + 1
+    # Times of the control steps, accumulated as the Chrono time is (t += timestep)
+    times = np.cumsum(np.full(num_steps * control_steps, timestep))[control_steps - 1::control_steps]
+
+    # Account for the delay introduced by controller_start_time, as in 'computeUserDefinedTrajectory'
+    time_minus_takeoff = (times - self.controller_start_time) - self.controller_start_time
+    (t_adjusted, segment) = TrajectoryAuxillary.PolyTimeAdjustedVector(self.waypointTimes, time_minus_takeoff)
+
+    landing_start = self.landing_start_time_seconds
+    landing_end = self.landing_end_times_seconds
+    last_waypoint_time = self.waypointTimes[-1]
+
+    # Phases in the same order of precedence as in 'computeUserDefinedTrajectory'
+    hover = (time_minus_takeoff >= last_waypoint_time) & (time_minus_takeoff < landing_start)
+    landing = ~hover & (landing_start <= time_minus_takeoff) & (time_minus_takeoff < landing_end)
+    landed = ~hover & ~landing & (time_minus_takeoff >= landing_end)
+    piecewise = ~(hover | landing | landed)
+
+    coefs = [
+      [self.position_coef_x, self.position_coef_y, self.position_coef_z],
+      [self.velocity_coef_x, self.velocity_coef_y, self.velocity_coef_z],
+      [self.acceleration_coef_x, self.acceleration_coef_y, self.acceleration_coef_z],
+    ]
+    outputs = [np.zeros((num_steps, 3, 1)) for _ in range(3)]
+
+    for k in range(3):
+      for i in range(3):
+        outputs[k][:, i, 0] = np.where(
+          piecewise, TrajectoryAuxillary.PolyvalSegments(coefs[k][i], segment, t_adjusted), 0.0
+        )
+
+    # Landing along z
+    t_landing = time_minus_takeoff[landing] - landing_start
+    for k, type_ in enumerate(["position", "velocity", "acceleration"]):
+      outputs[k][landing, 2, 0] = polynomial.polyval(t_landing, self.landing_polynomials.get("1meterIn4seconds", type_, "z"))
+
+    # Hold the previous position: x and y are only set by the piecewise polynomials, z also by the landing
+    (position, velocity, acceleration) = outputs
+    for i, is_set in enumerate([piecewise, piecewise, piecewise | landing]):
+      hold = TrajectoryAuxillary.HoldIndex(is_set)
+      position[:, i, 0] = np.where(hold >= 0, position[hold, i, 0], self.translational_position_in_I_user_previous[i].item())
+
+    # Yaw, as in 'computeUserDefinedYaw'
+    Vx = TrajectoryAuxillary.PolyvalSegments(self.velocity_coef_x, segment, t_adjusted)
+    Vy = TrajectoryAuxillary.PolyvalSegments(self.velocity_coef_y, segment, t_adjusted)
+    velocity_norm2D = _norm2D(Vx, Vy)
+    is_set = ~(
+      ((t_adjusted >= 0) & (velocity_norm2D < 1e-5)) |
+      (time_minus_takeoff >= last_waypoint_time)
+    )
+
+    (Vx, Vy, t_set, segment_set) = (Vx[is_set], Vy[is_set], t_adjusted[is_set], segment[is_set])
+    Ax = TrajectoryAuxillary.PolyvalSegments(self.acceleration_coef_x, segment_set, t_set)
+    Ay = TrajectoryAuxillary.PolyvalSegments(self.acceleration_coef_y, segment_set, t_set)
+    Jx = TrajectoryAuxillary.PolyvalSegments(self.jerk_coef_x, segment_set, t_set)
+    Jy = TrajectoryAuxillary.PolyvalSegments(self.jerk_coef_y, segment_set, t_set)
+    velocity_norm = velocity_norm2D[is_set]
+    velocity_norm_prime = (Vx * Ax + Vy * Ay) / velocity_norm
+
+    yaw = _atan2(Vy, Vx)
+    yaw_dot = (_norm2D(Ax, Ay) / velocity_norm) * _sin(_atan2(Ay, Ax) - yaw)
+    yaw_dot_dot = (_norm2D(Jx, Jy) * _sin(_atan2(Jy, Jx) - yaw) - 2*velocity_norm_prime*yaw_dot) / velocity_norm
+
+    psi_ref = np.zeros(num_steps)
+    psi_ref_dot = np.zeros(num_steps)
+    psi_ref_ddot = np.zeros(num_steps)
+    psi_ref[is_set] = yaw
+    psi_ref_dot[is_set] = yaw_dot
+    psi_ref_ddot[is_set] = yaw_dot_dot
+
+    # Hold the previous yaw
+    hold = TrajectoryAuxillary.HoldIndex(is_set)
+    psi_ref = np.where(hold >= 0, psi_ref[hold], self.psi_ref_previous)
+
+    self.precomputed_times = times
+    self.precomputed_next_step = 0
+    self.precomputed_position = position
+    self.precomputed_velocity = velocity
+    self.precomputed_acceleration = acceleration
+    # Lists of floats, as returned by the per-step evaluation
+    self.precomputed_yaw = psi_ref.tolist()
+    self.precomputed_yaw_dot = psi_ref_dot.tolist()
+    self.precomputed_yaw_dot_dot = psi_ref_ddot.tolist()
+
   def computeUserDefinedTrajectory(self, t: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Piecewise polynomial trajectory.
@@ -223,6 +356,8 @@ class PiecewisePolynomialTrajectory(BaseUserDefinedTrajectory):
   
   def addVisualization(self, mfloor, mfloor_Yposition):
     "Add circular trajectory visualization to the Chrono body (mfloor)"
+    if mfloor is None: # No floor body to draw on (e.g., plant_backend "numpy")
+      return
      # Create a ChLinePath geometry, and insert sub-paths
     mpath = chrono.ChLinePath()
     (pos_x, pos_y, pos_z) = self.computePositionVector(0.01)
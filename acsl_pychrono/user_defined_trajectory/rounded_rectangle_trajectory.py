@@ -313,6 +313,8 @@ class RoundedRectangleTrajectory(BaseUserDefinedTrajectory):
   
   def addVisualization(self, mfloor, mfloor_Yposition):
     "Add circular trajectory visualization to the Chrono body (mfloor)"
+    if mfloor is None: # No floor body to draw on (e.g., plant_backend "numpy")
+      return
     # Create a ChLinePath geometry, and insert sub-paths # ROUNDED RECTANGLE TRAJECTORY
     mpath = chrono.ChLinePath()
 
@@ -59,6 +59,43 @@ class TrajectoryAuxillary:
     
     return [t_adjusted, segment]
   
+  @staticmethod
+  def PolyTimeAdjustedVector(time_waypoint_vector, t):
+    """Vectorized 'PolyTimeAdjusted': adjusted times and segments of an array
+    of times (segment 0 and adjusted time 0 outside of the waypoint times)"""
+    
+    # First waypoint time not smaller than t: a time equal to a waypoint time
+    # belongs to the segment ending there, as in 'PolyTimeAdjusted'
+    upper = np.searchsorted(time_waypoint_vector, t, side='left')
+    in_range = (t >= time_waypoint_vector[0]) & (t <= time_waypoint_vector[-1])
+    
+    segment = np.where(in_range, np.maximum(upper - 1, 0), 0)
+    t_adjusted = np.where(in_range, t - time_waypoint_vector[segment], 0.0)
+    
+    return [t_adjusted, segment]
+  
+  @staticmethod
+  def PolyvalSegments(poly_coeff_matrix, segment, t):
+    """Batched Horner evaluation of the rows 'segment' of the piecewise
+    polynomial coefficient matrix at the times 't' (same operations as
+    'polynomial.polyval', so that the values are identical)"""
+    
+    poly_coeff = poly_coeff_matrix[segment]
+    
+    value = poly_coeff[:, -1] + t*0
+    for i in range(2, poly_coeff.shape[1] + 1):
+      value = poly_coeff[:, -i] + value*t
+    
+    return value
+  
+  @staticmethod
+  def HoldIndex(is_source):
+    """Index of the last source row at or before each row (-1 if none), used
+    to hold the previous value of a trajectory over an array of times"""
+    
+    index = np.where(is_source, np.arange(is_source.size), -1)
+    return np.maximum.accumulate(index)
+  
   @staticmethod
   def Norm2D(poly_coef_x,poly_coef_y,t):
     """Computes the 2D norm from polynomial coefficients of the components of
@@ -0,0 +1,129 @@
+"""
+Actuator benchmark: per-motor force application vs. the single wrench of 'MotorActuators'.
+
+For each UAV, random motor thrusts (some beyond the motor limits) are applied to a Chrono body with:
+- "per_motor": the former path, i.e. at every control step a Python loop clamping the thrusts and the product
+  with the efficiency 'np.matrix'; at every physics step one 'Accumulate_force' per motor (new 'ChVectorD' each)
+  and one 'Accumulate_torque' per propeller reaction torque;
+- "wrench": 'MotorActuators.update' at every control step, one 'Accumulate_force' and one 'Accumulate_torque'
+  at every physics step.
+For each path: time per control step and per physics step, and the largest difference of the force and torque
+accumulated on the body by the two paths.
+
+Requires pychrono.
+
+Run from the repository root:
+  python benchmarks/bench_actuators.py
+  python benchmarks/bench_actuators.py --uav_names X8 --num_steps 50000 --physics_steps_per_control_step 5
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+import pychrono as chrono
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import acsl_pychrono.uav as UAV_Module
+from acsl_pychrono.simulation.flight_params import FlightParams
+from acsl_pychrono.simulation.actuators import MotorActuators
+
+def perMotorControlStep(motor_thrusts: np.ndarray, flight_params: FlightParams) -> tuple[np.ndarray, np.ndarray]:
+  """Former thrust saturation and efficiency of 'Simulation.applyMotorThrustLimitsAndEfficiency'."""
+  for i in range(len(motor_thrusts)):
+    if motor_thrusts[i][0] < flight_params.uav.minimum_motor_thrust:
+      motor_thrusts[i][0] = flight_params.uav.minimum_motor_thrust
+    if motor_thrusts[i][0] > flight_params.uav.maximum_motor_thrust:
+      motor_thrusts[i][0] = flight_params.uav.maximum_motor_thrust
+  motor_thrusts = np.array(flight_params.uav.motor_efficiency_matrix * motor_thrusts)
+  omega = np.sqrt(motor_thrusts / flight_params.uav_controller.K_omega)
+  return motor_thrusts, omega
+
+def perMotorPhysicsStep(body: chrono.ChBody, motor_thrusts: np.ndarray, flight_params: FlightParams):
+  """Former 'Simulation.applyMotorForces' and 'Simulation.applyPropellerReactionTorques'."""
+  force_positions = flight_params.uav.motor_force_positions
+  for i, motor_idx in enumerate(flight_params.uav.motor_index_map):
+    force_vec = chrono.ChVectorD(0, motor_thrusts[motor_idx][0], 0)
+    body.Accumulate_force(force_vec, force_positions[i % len(force_positions)], True)
+  omega = np.sqrt(motor_thrusts / flight_params.uav_controller.K_omega)
+  for i in range(flight_params.uav.number_of_propellers):
+    torque_y = flight_params.uav.propellers_spin_directions[i] * omega[i][0] ** 2 * flight_params.uav_controller.K_torque
+    body.Accumulate_torque(chrono.ChVectorD(0, torque_y, 0), True)
+
+def accumulatedWrench(body: chrono.ChBody) -> np.ndarray:
+  force = body.Get_accumulated_force()
+  torque = body.Get_accumulated_torque()
+  return np.array([force.x, force.y, force.z, torque.x, torque.y, torque.z])
+
+def benchmarkUAV(uav_name: str, args) -> dict:
+  uav, uav_controller = UAV_Module.instantiateUAV(uav_name, "PID")
+  flight_params = FlightParams(uav, uav_controller)
+  number_of_propellers = uav.number_of_propellers
+  force_positions = np.array([(pos.x, pos.y, pos.z) for pos in uav.motor_force_positions])
+  actuators = MotorActuators(flight_params, force_positions, number_of_propellers)
+  body = chrono.ChBody()
+
+  rng = np.random.default_rng(args.seed)
+  span = uav.maximum_motor_thrust - uav.minimum_motor_thrust
+  thrusts = rng.uniform(uav.minimum_motor_thrust - 0.1 * span, uav.maximum_motor_thrust + 0.1 * span, (args.num_steps, number_of_propellers, 1))
+  num_control_steps = args.num_steps // args.physics_steps_per_control_step
+
+  # Per-motor path
+  control_time = physics_time = 0.0
+  max_difference = 0.0
+  for step in range(num_control_steps):
+    t0 = time.perf_counter()
+    motor_thrusts, _ = perMotorControlStep(thrusts[step].copy(), flight_params)
+    control_time += time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(args.physics_steps_per_control_step):
+      body.Empty_forces_accumulators()
+      perMotorPhysicsStep(body, motor_thrusts, flight_params)
+    physics_time += time.perf_counter() - t0
+    per_motor_wrench = accumulatedWrench(body)
+
+    body.Empty_forces_accumulators()
+    actuators.update(thrusts[step], uav.motor_efficiency_matrix)
+    body.Accumulate_force(chrono.ChVectorD(*actuators.force.tolist()), chrono.VNULL, True)
+    body.Accumulate_torque(chrono.ChVectorD(*actuators.torque.tolist()), True)
+    max_difference = max(max_difference, float(np.abs(accumulatedWrench(body) - per_motor_wrench).max()))
+  per_motor = (control_time / num_control_steps, physics_time / (num_control_steps * args.physics_steps_per_control_step))
+
+  # Single-wrench path
+  control_time = physics_time = 0.0
+  for step in range(num_control_steps):
+    t0 = time.perf_counter()
+    actuators.update(thrusts[step], uav.motor_efficiency_matrix)
+    force = chrono.ChVectorD(*actuators.force.tolist())
+    torque = chrono.ChVectorD(*actuators.torque.tolist())
+    control_time += time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(args.physics_steps_per_control_step):
+      body.Empty_forces_accumulators()
+      body.Accumulate_force(force, chrono.VNULL, True)
+      body.Accumulate_torque(torque, True)
+    physics_time += time.perf_counter() - t0
+  wrench = (control_time / num_control_steps, physics_time / (num_control_steps * args.physics_steps_per_control_step))
+
+  return {"per_motor": per_motor, "wrench": wrench, "max_difference": max_difference, "num_motors": number_of_propellers}
+
+def main():
+  parser = argparse.ArgumentParser(description="Per-motor force application vs. single wrench of the motors.")
+  parser.add_argument("--uav_names", type=str, nargs="+", default=["X8", "QUAD1"], help="UAVs whose motors are applied.")
+  parser.add_argument("--num_steps", type=int, default=20000, help="Physics steps timed per path.")
+  parser.add_argument("--physics_steps_per_control_step", type=int, default=1, help="Physics steps holding each control step.")
+  parser.add_argument("--seed", type=int, default=0, help="Seed of the random thrusts.")
+  args = parser.parse_args()
+
+  print(f"{'UAV':>8} {'motors':>7} {'path':>10} {'control step [us]':>18} {'physics step [us]':>18}")
+  for uav_name in args.uav_names:
+    result = benchmarkUAV(uav_name, args)
+    for path in ("per_motor", "wrench"):
+      control_time, physics_time = result[path]
+      print(f"{uav_name:>8} {result['num_motors']:>7d} {path:>10} {1e6 * control_time:>18.2f} {1e6 * physics_time:>18.2f}")
+    print(f"{'':>8} largest force/torque difference: {result['max_difference']:.2e}")
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,110 @@
+"""
+Batched controller benchmark: one batched controller (<ControllerType>Batch) vs. N instances
+of the controller, each with its own gain set.
+
+The gain sets are the gains of the UAV with randomly scaled (seeded) position and attitude gains.
+Every instance is fed the synthetic sequence of vehicle states and references of
+'bench_controller_kernels.py'. Checks that the batched controller matches the N instances at
+every step (ODE state and motor thrusts, relative to their largest magnitude; the batched
+equations use NumPy instead of 'math' functions, so they agree to rounding) and reports the
+throughput of both, in instance-steps per second.
+
+Run from the repository root:
+  python benchmarks/bench_batch_controllers.py --batch_sizes 1 16 256 --steps 200
+  python benchmarks/bench_batch_controllers.py --controller MRAC --batch_sizes 1024 --check_steps 0
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import acsl_pychrono.uav as UAV_Module
+import acsl_pychrono.control as Ctrl
+from acsl_pychrono.simulation.ode_input import OdeInput
+from acsl_pychrono.simulation.flight_params import FlightParams
+from bench_controller_kernels import syntheticOdeInput
+
+CONTROLLERS = ("PID", "MRAC", "TwoLayerMRAC")
+# Gains scaled differently in each gain set
+SCALED_GAINS = ("KP_tran", "KD_tran", "KP_rot", "KI_rot")
+
+def buildBatch(controller_type: str, batch_size: int, args):
+  """Batched controller and the N controllers with the same gain sets."""
+  uav, uav_controller = UAV_Module.instantiateUAV(args.uav_name, controller_type)
+  flight_params = FlightParams(uav, uav_controller)
+  gains_list, batch_controller = Ctrl.instantiateBatchController(
+    controller_type, OdeInput(), flight_params, args.timestep, batch_size=batch_size
+  )
+  rng = np.random.default_rng(args.seed)
+  for gains in gains_list:
+    for name in SCALED_GAINS:
+      setattr(gains, name, getattr(gains, name) * rng.uniform(0.8, 1.2))
+
+  module = sys.modules[type(batch_controller).__module__.rsplit(".", 1)[0]]
+  ControllerClass = getattr(module, controller_type)
+  controllers = [ControllerClass(gains, OdeInput(), flight_params, args.timestep) for gains in gains_list]
+  return batch_controller, controllers
+
+def maxRelativeDifference(batch_values: np.ndarray, values: np.ndarray) -> float:
+  scale = max(float(np.max(np.abs(values))), 1e-300)
+  return float(np.max(np.abs(batch_values - values))) / scale
+
+def main():
+  parser = argparse.ArgumentParser(description="Throughput and equivalence of the batched controllers.")
+  parser.add_argument("--controller", choices=CONTROLLERS, default="", help="Controller to benchmark. Default: all of them.")
+  parser.add_argument("--uav_name", type=str, default="X8", help="UAV whose parameters and gains are used.")
+  parser.add_argument("--batch_sizes", type=int, nargs="+", default=[1, 16, 256], help="Numbers of instances N.")
+  parser.add_argument("--steps", type=int, default=200, help="Number of control steps.")
+  parser.add_argument("--check_steps", type=int, default=200, help="Steps compared with the N instances (0: timing only).")
+  parser.add_argument("--timestep", type=float, default=0.005, help="Control timestep [s].")
+  parser.add_argument("--seed", type=int, default=0, help="Seed of the scaling of the gains.")
+  parser.add_argument("--tolerance", type=float, default=1e-9, help="Largest relative difference allowed.")
+  args = parser.parse_args()
+
+  ode_inputs = [syntheticOdeInput(step, args.timestep) for step in range(args.steps)]
+
+  print(f"{'controller':<14} {'N':>6} {'instances [steps/s]':>20} {'batch [steps/s]':>16} {'speedup':>8} {'max rel diff':>13}")
+  for controller_type in ([args.controller] if args.controller else CONTROLLERS):
+    for batch_size in args.batch_sizes:
+      # Equivalence, step by step
+      difference = 0.0
+      if args.check_steps:
+        batch_controller, controllers = buildBatch(controller_type, batch_size, args)
+        for odein in ode_inputs[:args.check_steps]:
+          batch_controller.run(odein)
+          for controller in controllers:
+            controller.run(odein)
+          states = np.stack([controller.y for controller in controllers])
+          motor_thrusts = np.stack([np.asarray(controller.motor_thrusts) for controller in controllers])
+          difference = max(
+            difference,
+            maxRelativeDifference(batch_controller.y, states),
+            maxRelativeDifference(batch_controller.motor_thrusts, motor_thrusts)
+          )
+
+      # Throughput
+      batch_controller, controllers = buildBatch(controller_type, batch_size, args)
+      t0 = time.perf_counter()
+      for odein in ode_inputs:
+        batch_controller.run(odein)
+      batch_rate = batch_size * len(ode_inputs) / (time.perf_counter() - t0)
+
+      timed_instances = controllers[:min(batch_size, 16)]
+      t0 = time.perf_counter()
+      for odein in ode_inputs:
+        for controller in timed_instances:
+          controller.run(odein)
+      instances_rate = len(timed_instances) * len(ode_inputs) / (time.perf_counter() - t0)
+
+      print(
+        f"{controller_type:<14} {batch_size:>6} {instances_rate:>20.0f} {batch_rate:>16.0f} "
+        f"{batch_rate / instances_rate:>8.1f} {difference:>13.1e}"
+      )
+      if not difference <= args.tolerance:
+        raise AssertionError(f"{controller_type} (N={batch_size}): the batch differs from the instances by {difference} (tolerance {args.tolerance})")
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,172 @@
+"""
+Controller kernel benchmark: "reference" (shared array-generic equations) vs. "flat" (preallocated views into the ODE state)
+implementations of the MRAC controllers.
+
+Both kernels are fed the same synthetic, smooth sequence of vehicle states and user-defined
+trajectory references (a climbing circle flown with small attitude and velocity oscillations).
+At every step, checks that both kernels have the same ODE state, motor thrusts and logged
+quantities, and reports the time per control step ('run') and the memory allocated
+per step (peak traced by 'tracemalloc' above the memory in use before the step).
+Fails if the flat kernel keeps memory allocated by the control package across its steps
+(after a few warm-up steps): everything it uses at a step must be preallocated.
+
+Run from the repository root:
+  python benchmarks/bench_controller_kernels.py --steps 2000
+  python benchmarks/bench_controller_kernels.py --controller TwoLayerMRAC --tolerance 1e-12
+"""
+import os
+import sys
+import math
+import time
+import argparse
+import tracemalloc
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import acsl_pychrono.uav as UAV_Module
+import acsl_pychrono.control as Ctrl
+from acsl_pychrono.simulation.ode_input import OdeInput
+from acsl_pychrono.simulation.flight_params import FlightParams
+
+CONTROLLERS = ("MRAC", "TwoLayerMRAC")
+
+# Controller quantities compared at every step (those read by the loggers)
+COMPARED_ATTRIBUTES = (
+  "x_ref_tran", "omega_ref", "r_tran", "r_rot", "mu_PD_baseline_tran", "mu_adaptive_tran",
+  "omega_cmd", "omega_cmd_dot", "omega_ref_dot", "angular_position_dot",
+  "angular_position_ref_dot", "angular_position_ref_ddot",
+  "Moment_baseline_PI", "Moment_baseline", "Moment_adaptive",
+  "K_hat_x_tran", "K_hat_r_tran", "Theta_hat_tran", "K_hat_x_rot", "K_hat_r_rot", "Theta_hat_rot",
+  "mu_x", "mu_y", "mu_z", "u1", "u2", "u3", "u4", "roll_ref", "pitch_ref",
+  "dead_zone_value_tran", "dead_zone_value_rot",
+)
+TWO_LAYER_ATTRIBUTES = ("K_hat_g_tran", "K_hat_g_rot", "mu_adaptive_mrac_tran", "Moment_adaptive_mrac")
+
+def syntheticOdeInput(step: int, timestep: float) -> OdeInput:
+  """Vehicle state and user-defined reference at a control step (a new object, as in the simulation)."""
+  t = (step + 1) * timestep
+  odein = OdeInput()
+  odein.time_now = t
+  radius = 1.5
+  w = 0.6
+  odein.translational_position_in_I_user = np.array([[radius * math.cos(w * t)], [radius * math.sin(w * t)], [0.5 + 0.05 * t]])
+  odein.translational_velocity_in_I_user = np.array([[-radius * w * math.sin(w * t)], [radius * w * math.cos(w * t)], [0.05]])
+  odein.translational_acceleration_in_I_user = np.array([[-radius * w**2 * math.cos(w * t)], [-radius * w**2 * math.sin(w * t)], [0.0]])
+  odein.yaw_ref = 0.2 * math.sin(0.3 * t)
+  odein.yaw_ref_dot = 0.06 * math.cos(0.3 * t)
+  odein.yaw_ref_ddot = -0.018 * math.sin(0.3 * t)
+
+  # Vehicle state: the reference with small oscillating tracking errors
+  odein.translational_position_in_I = odein.translational_position_in_I_user + 0.05 * np.array([[math.sin(3.1 * t)], [math.cos(2.3 * t)], [math.sin(1.7 * t)]])
+  odein.translational_velocity_in_I = odein.translational_velocity_in_I_user + 0.1 * np.array([[math.cos(3.1 * t)], [-math.sin(2.3 * t)], [math.cos(1.7 * t)]])
+  odein.roll = 0.08 * math.sin(2.0 * t)
+  odein.pitch = -0.06 * math.cos(1.4 * t)
+  odein.yaw = odein.yaw_ref + 0.02 * math.sin(4.0 * t)
+  odein.angular_velocity = np.array([[0.16 * math.cos(2.0 * t)], [0.084 * math.sin(1.4 * t)], [0.06 * math.cos(0.3 * t) + 0.08 * math.cos(4.0 * t)]])
+  return odein
+
+def buildController(controller_type: str, kernel: str, args):
+  uav, uav_controller = UAV_Module.instantiateUAV(args.uav_name, controller_type)
+  flight_params = FlightParams(uav, uav_controller)
+  _, controller, _ = Ctrl.instantiateController(
+    controller_type, OdeInput(), flight_params, args.timestep, controller_kernel=kernel
+  )
+  return controller
+
+def snapshot(controller, attributes: tuple[str, ...]) -> dict:
+  values = {name: np.array(getattr(controller, name), dtype=float) for name in attributes}
+  values["y"] = np.array(controller.y)
+  values["motor_thrusts"] = np.array(controller.motor_thrusts)
+  return values
+
+def maxRelativeDifference(a: dict, b: dict) -> tuple[float, str]:
+  worst = (0.0, "")
+  for name in a:
+    scale = max(float(np.max(np.abs(a[name]), initial=0.0)), 1e-300)
+    difference = float(np.max(np.abs(a[name] - b[name]), initial=0.0)) / scale
+    if not difference <= worst[0]:
+      worst = (difference, name)
+  return worst
+
+def timeSteps(controller, ode_inputs: list[OdeInput]) -> float:
+  t0 = time.perf_counter()
+  for odein in ode_inputs:
+    controller.run(odein)
+  return (time.perf_counter() - t0) / len(ode_inputs)
+
+def allocatedPerStep(controller, ode_inputs: list[OdeInput]) -> float:
+  """Average of the memory allocated during a step, above the memory in use before it [bytes]."""
+  total = 0
+  tracemalloc.start()
+  for odein in ode_inputs:
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    controller.run(odein)
+    total += tracemalloc.get_traced_memory()[1] - current
+  tracemalloc.stop()
+  return total / len(ode_inputs)
+
+def retainedPerStep(controller, ode_inputs: list[OdeInput], warmup_steps: int = 10) -> float:
+  """
+  Average of the memory allocated by the control package during the steps that is still in use after them [bytes],
+  measured after 'warmup_steps' steps (first-step caches are not counted).
+  """
+  for odein in ode_inputs[:warmup_steps]:
+    controller.run(odein)
+  control_package = tracemalloc.Filter(True, os.path.join("*", "acsl_pychrono", "control", "*"))
+  tracemalloc.start()
+  before = tracemalloc.take_snapshot().filter_traces([control_package])
+  for odein in ode_inputs[warmup_steps:]:
+    controller.run(odein)
+  after = tracemalloc.take_snapshot().filter_traces([control_package])
+  tracemalloc.stop()
+  retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+  return retained / max(len(ode_inputs) - warmup_steps, 1)
+
+def main():
+  parser = argparse.ArgumentParser(description="Time per step and equivalence of the reference and flat MRAC kernels.")
+  parser.add_argument("--controller", choices=CONTROLLERS, default="", help="Controller to benchmark. Default: all of them.")
+  parser.add_argument("--uav_name", type=str, default="X8", help="UAV whose parameters and gains are used.")
+  parser.add_argument("--steps", type=int, default=2000, help="Number of control steps.")
+  parser.add_argument("--timestep", type=float, default=0.005, help="Control timestep [s].")
+  parser.add_argument("--tolerance", type=float, default=0.0, help="Largest relative difference allowed between the kernels (default: identical).")
+  args = parser.parse_args()
+
+  ode_inputs = [syntheticOdeInput(step, args.timestep) for step in range(args.steps)]
+
+  print(f"{'controller':<14} {'reference [us]':>15} {'flat [us]':>10} {'speedup':>8} {'ref alloc [kB]':>15} {'flat alloc [kB]':>16} {'flat kept [B]':>14} {'max rel diff':>13}")
+  for controller_type in ([args.controller] if args.controller else CONTROLLERS):
+    attributes = COMPARED_ATTRIBUTES + (TWO_LAYER_ATTRIBUTES if controller_type == "TwoLayerMRAC" else ())
+
+    # Equivalence, step by step
+    reference = buildController(controller_type, "reference", args)
+    flat = buildController(controller_type, "flat", args)
+    worst = (0.0, "", 0)
+    for step, odein in enumerate(ode_inputs):
+      reference.run(odein)
+      flat.run(odein)
+      difference, name = maxRelativeDifference(snapshot(reference, attributes), snapshot(flat, attributes))
+      if not difference <= worst[0]:
+        worst = (difference, name, step)
+
+    reference_time = timeSteps(buildController(controller_type, "reference", args), ode_inputs)
+    flat_time = timeSteps(buildController(controller_type, "flat", args), ode_inputs)
+    reference_alloc = allocatedPerStep(buildController(controller_type, "reference", args), ode_inputs)
+    flat_alloc = allocatedPerStep(buildController(controller_type, "flat", args), ode_inputs)
+    flat_retained = retainedPerStep(buildController(controller_type, "flat", args), ode_inputs)
+    print(
+      f"{controller_type:<14} {reference_time * 1e6:>15.1f} {flat_time * 1e6:>10.1f} {reference_time / flat_time:>8.2f} "
+      f"{reference_alloc / 1e3:>15.2f} {flat_alloc / 1e3:>16.2f} {flat_retained:>14.1f} {worst[0]:>13.1e}"
+    )
+    if not worst[0] <= args.tolerance:
+      raise AssertionError(
+        f"{controller_type}: the kernels differ by {worst[0]} (relative) in '{worst[1]}' at step {worst[2]} (tolerance {args.tolerance})"
+      )
+    if flat_retained > 0:
+      raise AssertionError(
+        f"{controller_type}: the flat kernel keeps {flat_retained:.1f} bytes per step allocated by the control package"
+      )
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,74 @@
+"""
+Gains cache benchmark: time to obtain the controller gains, compiled vs. cached.
+
+For each controller the gains are obtained by compiling them ('GainsClass(flight_params)': YAML parse,
+Lyapunov solves, projection-operator ellipsoids), from the in-memory cache and from the on-disk cache
+of a fresh process (the memory cache is cleared), and the cached gains are checked against the compiled ones.
+
+Run from the repository root:
+  python benchmarks/bench_gains_cache.py --repeats 10
+  python benchmarks/bench_gains_cache.py --controllers TwoLayerMRAC --uav_name X8
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import statistics
+import importlib
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import acsl_pychrono.uav as UAV_Module
+import acsl_pychrono.control.gains_cache as GainsCache
+from acsl_pychrono.simulation.flight_params import FlightParams
+
+CONTROLLERS = ("PID", "MRAC", "TwoLayerMRAC")
+
+def timeCall(function, repeats: int) -> tuple[float, object]:
+  """Median time of 'repeats' calls of 'function' and the result of the last one."""
+  timings = []
+  for _ in range(repeats):
+    t0 = time.perf_counter()
+    result = function()
+    timings.append(time.perf_counter() - t0)
+  return statistics.median(timings), result
+
+def sameGains(gains, reference) -> bool:
+  return vars(gains).keys() == vars(reference).keys() and all(
+    np.array_equal(np.asarray(value), np.asarray(getattr(gains, name))) for name, value in vars(reference).items()
+  )
+
+def main():
+  parser = argparse.ArgumentParser(description="Controller gains: compiled vs. in-memory and on-disk cache.")
+  parser.add_argument("--controllers", choices=CONTROLLERS, nargs="+", default=list(CONTROLLERS), help="Controllers whose gains are obtained.")
+  parser.add_argument("--uav_name", type=str, default="X8", help="UAV of the gains.")
+  parser.add_argument("--repeats", type=int, default=5, help="Number of timed calls per case.")
+  args = parser.parse_args()
+
+  cache_dir = tempfile.mkdtemp(prefix="gains_cache_")
+  print(f"{'controller':<14} {'compile [ms]':>13} {'memory [ms]':>12} {'disk [ms]':>10} {'speedup':>8}  same gains")
+  for controller_type in args.controllers:
+    uav, uav_controller = UAV_Module.instantiateUAV(args.uav_name, controller_type)
+    flight_params = FlightParams(uav, uav_controller)
+    GainsClass = getattr(importlib.import_module(f"acsl_pychrono.control.{controller_type}"), f"{controller_type}Gains")
+
+    compile_time, reference = timeCall(lambda: GainsClass(flight_params), args.repeats)
+    # First call compiles and writes the disk cache
+    GainsCache.getGains(GainsClass, flight_params, cache_dir)
+    memory_time, memory_gains = timeCall(lambda: GainsCache.getGains(GainsClass, flight_params, cache_dir), args.repeats)
+
+    def getFromDisk():
+      GainsCache.clearGainsCache()
+      return GainsCache.getGains(GainsClass, flight_params, cache_dir)
+    disk_time, disk_gains = timeCall(getFromDisk, args.repeats)
+
+    same = sameGains(memory_gains, reference) and sameGains(disk_gains, reference)
+    print(
+      f"{controller_type:<14} {compile_time * 1e3:>13.2f} {memory_time * 1e3:>12.2f} {disk_time * 1e3:>10.2f} "
+      f"{compile_time / disk_time:>8.1f}  {same}"
+    )
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,86 @@
+"""
+Integrator benchmark: accuracy vs. cost of the integrators of the ODE of the controllers
+("held_rk4", "euler", "rk4", "exact_filters", see 'acsl_pychrono.control.control.INTEGRATORS').
+
+Every controller is fed the synthetic sequence of vehicle states and references of
+'bench_controller_kernels.py', held over each control step. The accuracy is measured against a
+reference solution of the same ODE: classic RK4 with 'substeps' substeps per control step.
+Reports, for each controller and integrator, the time per control step ('run'), the largest
+error of the ODE state (relative to its largest magnitude) and of the motor thrusts [N].
+
+Run from the repository root:
+  python benchmarks/bench_integrators.py --steps 1000
+  python benchmarks/bench_integrators.py --controller MRAC --controller_kernel flat
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import acsl_pychrono.uav as UAV_Module
+import acsl_pychrono.control as Ctrl
+from acsl_pychrono.control.control import INTEGRATORS
+from acsl_pychrono.simulation.ode_input import OdeInput
+from acsl_pychrono.simulation.flight_params import FlightParams
+from bench_controller_kernels import syntheticOdeInput
+
+CONTROLLERS = ("PID", "MRAC", "TwoLayerMRAC")
+
+def buildController(controller_type: str, integrator: str, timestep: float, args):
+  uav, uav_controller = UAV_Module.instantiateUAV(args.uav_name, controller_type)
+  flight_params = FlightParams(uav, uav_controller)
+  _, controller, _ = Ctrl.instantiateController(
+    controller_type, OdeInput(), flight_params, timestep,
+    controller_kernel=args.controller_kernel, controller_integrator=integrator
+  )
+  return controller
+
+def simulate(controller, ode_inputs: list[OdeInput], substeps: int = 1) -> tuple[np.ndarray, np.ndarray, float]:
+  """
+  ODE state at the end of every control step, motor thrusts of every control step and time per control step.
+  With 'substeps' > 1, the controller runs 'substeps' times per control step with the same input.
+  """
+  states = []
+  motor_thrusts = []
+  t0 = time.perf_counter()
+  for odein in ode_inputs:
+    for substep in range(substeps):
+      controller.run(odein)
+      if substep == 0:
+        motor_thrusts.append(np.array(controller.motor_thrusts).ravel())
+    states.append(np.array(controller.y).ravel())
+  elapsed = (time.perf_counter() - t0) / len(ode_inputs)
+  return np.array(states), np.array(motor_thrusts), elapsed
+
+def main():
+  parser = argparse.ArgumentParser(description="Accuracy vs. cost of the integrators of the controller ODE.")
+  parser.add_argument("--controller", choices=CONTROLLERS, default="", help="Controller to benchmark. Default: all of them.")
+  parser.add_argument("--controller_kernel", choices=["reference", "flat"], default="reference", help="Execution kernel of the MRAC controllers.")
+  parser.add_argument("--uav_name", type=str, default="X8", help="UAV whose parameters and gains are used.")
+  parser.add_argument("--steps", type=int, default=1000, help="Number of control steps.")
+  parser.add_argument("--timestep", type=float, default=0.005, help="Control timestep [s].")
+  parser.add_argument("--substeps", type=int, default=16, help="RK4 substeps per control step of the reference solution.")
+  args = parser.parse_args()
+
+  ode_inputs = [syntheticOdeInput(step, args.timestep) for step in range(args.steps)]
+
+  print(f"{'controller':<14} {'integrator':<14} {'time [us]':>10} {'state rel err':>14} {'thrust err [N]':>15}")
+  for controller_type in ([args.controller] if args.controller else CONTROLLERS):
+    exact_states, exact_thrusts, _ = simulate(
+      buildController(controller_type, "rk4", args.timestep / args.substeps, args),
+      ode_inputs,
+      args.substeps
+    )
+    scale = max(float(np.max(np.abs(exact_states))), 1e-300)
+
+    for integrator in INTEGRATORS:
+      states, thrusts, elapsed = simulate(buildController(controller_type, integrator, args.timestep, args), ode_inputs)
+      state_error = float(np.max(np.abs(states - exact_states))) / scale
+      thrust_error = float(np.max(np.abs(thrusts - exact_thrusts)))
+      print(f"{controller_type:<14} {integrator:<14} {elapsed * 1e6:>10.1f} {state_error:>14.2e} {thrust_error:>15.2e}")
+
+if __name__ == '__main__':
+  main()
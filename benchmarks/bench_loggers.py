@@ -0,0 +1,145 @@
+"""
+Logger benchmark: preallocated 'LogBuffer' vs. the former per-step list of arrays,
+and optionally a logging profile (channel selection and decimation).
+
+The former loggers allocated a new (size_DATA x 1) array every control step, appended its
+flattened copy to a Python list and stacked the list with 'np.array' in 'toDictionary',
+so that the whole log was held twice. That strategy is reproduced by 'ListLogBuffer' below
+and plugged into the same logger, so that only the storage strategy differs.
+
+For each controller, reports the time per 'collectData' call, the peak memory of logging
+a whole simulation and exporting it with 'toDictionary', the size of the exported log,
+and checks that the list and buffer strategies export identical logs.
+
+Run from the repository root:
+  python benchmarks/bench_loggers.py --duration 17.0 --timestep 0.005
+  python benchmarks/bench_loggers.py --logging_profile monte_carlo.yaml
+"""
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import acsl_pychrono.control as Ctrl
+import acsl_pychrono.uav as UAV_Module
+from acsl_pychrono.control.log_buffer import LogBuffer
+from acsl_pychrono.control.logging_profile import LoggingProfile
+from acsl_pychrono.simulation.ode_input import OdeInput
+from acsl_pychrono.simulation.flight_params import FlightParams
+
+CONTROLLER_TYPES = ("PID", "MRAC", "TwoLayerMRAC")
+
+class ListLogBuffer:
+  """Former logging strategy: a new (n x 1) array per step, flattened and appended to a list."""
+  def __init__(self, num_columns: int):
+    self.num_columns = num_columns
+    self.data_list = []
+    self.pending = None
+
+  def nextRow(self) -> np.ndarray:
+    self.flushPending()
+    self.pending = np.zeros((self.num_columns, 1))
+    return self.pending[:, 0]
+
+  def flushPending(self):
+    if self.pending is not None:
+      self.data_list.append(self.pending.flatten())
+      self.pending = None
+
+  def getData(self) -> np.ndarray:
+    self.flushPending()
+    return np.array(self.data_list)
+
+def buildLogger(controller_type: str, uav_name: str, timestep: float, duration: float, logging_profile: LoggingProfile | None):
+  """Instantiate a controller and run one control step, so that all the logged quantities exist."""
+  uav, uav_controller = UAV_Module.instantiateUAV(uav_name, controller_type)
+  flight_params = FlightParams(uav, uav_controller)
+  ode_input = OdeInput()
+  gains, controller, logger = Ctrl.instantiateController(
+    controller_type, ode_input, flight_params, timestep, duration, logging_profile
+  )
+  controller.run(ode_input)
+  return controller, logger, uav.number_of_propellers
+
+def newBuffer(strategy: str, logger):
+  """Empty buffer of the given strategy, with the same number of columns as the one of the logger."""
+  if strategy == "list":
+    return ListLogBuffer(logger.size_DATA)
+  return LogBuffer(logger.buffer.num_columns, logger.buffer.capacity)
+
+def logWholeSimulation(logger, controller, number_of_propellers: int, num_steps: int):
+  """Log 'num_steps' rows and export them. Returns the time per step and the exported dictionary."""
+  t0 = time.perf_counter()
+  for step in range(num_steps):
+    logger.collectData(controller, step * 1e-3, number_of_propellers)
+  t1 = time.perf_counter()
+  return (t1 - t0) / num_steps, logger.toDictionary()
+
+def measure(controller_type: str, strategy: str, args) -> dict:
+  """Strategies: "list" (former loggers), "buffer" (every channel at every step), "profile" (args.logging_profile)."""
+  logging_profile = LoggingProfile.fromFile(args.logging_profile) if strategy == "profile" else None
+  num_steps = LogBuffer.expectedRows(args.duration, args.timestep)
+
+  # Time per step, without the tracing overhead
+  controller, logger, number_of_propellers = buildLogger(
+    controller_type, args.uav_name, args.timestep, args.duration, logging_profile
+  )
+  logger.buffer = newBuffer(strategy, logger)
+  time_per_step, log_dict = logWholeSimulation(logger, controller, number_of_propellers, num_steps)
+
+  # Peak memory of a fresh buffer allocated, filled and exported
+  controller, logger, number_of_propellers = buildLogger(
+    controller_type, args.uav_name, args.timestep, args.duration, logging_profile
+  )
+  tracemalloc.start()
+  logger.buffer = newBuffer(strategy, logger)
+  logWholeSimulation(logger, controller, number_of_propellers, num_steps)
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+
+  exported_bytes = sum(value.nbytes for _, value in flattenDictionary(log_dict))
+  return {
+    "time_per_step_us": time_per_step * 1e6,
+    "peak_MB": peak / 2**20,
+    "exported_MB": exported_bytes / 2**20,
+    "log_dict": log_dict,
+  }
+
+def flattenDictionary(log_dict: dict, prefix: str = ""):
+  for key, value in log_dict.items():
+    if isinstance(value, dict):
+      yield from flattenDictionary(value, prefix + key + ".")
+    else:
+      yield prefix + key, value
+
+def logsAreIdentical(log_dict_a: dict, log_dict_b: dict) -> bool:
+  a = dict(flattenDictionary(log_dict_a))
+  b = dict(flattenDictionary(log_dict_b))
+  return a.keys() == b.keys() and all(np.array_equal(a[key], b[key], equal_nan=True) for key in a)
+
+def main():
+  parser = argparse.ArgumentParser(description="Time per step and memory of the controller loggers.")
+  parser.add_argument("--duration", type=float, default=17.0, help="Simulated duration [s].")
+  parser.add_argument("--timestep", type=float, default=0.005, help="Control timestep [s].")
+  parser.add_argument("--uav_name", type=str, default="X8", help="UAV whose parameters are used by the controllers.")
+  parser.add_argument("--logging_profile", type=str, default="", help="Also measure this logging profile (path relative to 'params/logging_profiles').")
+  args = parser.parse_args()
+
+  strategies = ("list", "buffer", "profile") if args.logging_profile else ("list", "buffer")
+  print(f"{'controller':<14} {'strategy':<8} {'time/step [us]':>15} {'peak [MB]':>10} {'exported [MB]':>14}")
+  for controller_type in CONTROLLER_TYPES:
+    results = {strategy: measure(controller_type, strategy, args) for strategy in strategies}
+    for strategy, result in results.items():
+      print(
+        f"{controller_type:<14} {strategy:<8} {result['time_per_step_us']:>15.2f} "
+        f"{result['peak_MB']:>10.2f} {result['exported_MB']:>14.2f}"
+      )
+    if not logsAreIdentical(results["list"]["log_dict"], results["buffer"]["log_dict"]):
+      raise AssertionError(f"{controller_type}: the two logging strategies exported different logs")
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,112 @@
+"""
+Multi-rate scheduler benchmark: cost of a finer physics step with and without slower subsystems.
+
+The same mission is flown with the physics at 'timestep' and every subsystem at that rate (single rate),
+then with the controller, the logger and the console at their own periods (multi rate, motor thrusts held
+between two control steps), and with every subsystem at the control period (reference at the control rate).
+For each case: wall-clock time of the loop, time per physics step, number of control steps and logged rows,
+and the largest position difference with the single-rate flight, at the common logged times.
+
+Run from the repository root:
+  python benchmarks/bench_multirate.py
+  python benchmarks/bench_multirate.py --timestep 0.0005 --control_period 0.0025 --logging_period 0.01
+  python benchmarks/bench_multirate.py --plant_backend chrono --controller_type TwoLayerMRAC --duration 5.0
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import acsl_pychrono.config.config as Cfg
+import acsl_pychrono.control as Ctrl
+import acsl_pychrono.uav as UAV_Module
+import acsl_pychrono.user_defined_trajectory as Traj
+from acsl_pychrono.executor.simulation_cache import instantiateSimulation
+from acsl_pychrono.simulation.scheduler import subsystemPeriod
+from acsl_pychrono.simulation.ode_input import OdeInput
+from acsl_pychrono.simulation.flight_params import FlightParams
+
+def flyMission(args, timestep: float, control_period: float, logging_period: float, console_period: float) -> dict:
+  sim_cfg = Cfg.SimulationConfig()
+  mission_config = sim_cfg.mission_config
+  mission_config.plant_backend = args.plant_backend
+  mission_config.controller_type = args.controller_type
+  mission_config.visualization_flag = False
+  mission_config.add_payload_flag = False
+  mission_config.simulation_duration_seconds = args.duration
+  mission_config.timestep = timestep
+  mission_config.control_period = control_period
+  mission_config.logging_period = logging_period
+  mission_config.console_period = console_period
+  sim_cfg.vehicle_config.uav_name = args.uav_name
+  sim = instantiateSimulation(sim_cfg)
+
+  uav, uav_controller = UAV_Module.instantiateUAV(args.uav_name, args.controller_type)
+  flight_params = FlightParams(uav, uav_controller)
+  ode_input = OdeInput()
+  sim.setGravitationalAcceleration(flight_params)
+  user_defined_trajectory = Traj.instantiateTrajectory(mission_config, flight_params, sim.mfloor, sim.mfloor_Yposition)
+  gains, controller, logger = Ctrl.instantiateController(
+    args.controller_type,
+    ode_input,
+    flight_params,
+    subsystemPeriod(mission_config, mission_config.control_period),
+    mission_config.simulation_duration_seconds,
+    logging_period=subsystemPeriod(mission_config, mission_config.logging_period)
+  )
+  sim.assignInstances(flight_params, ode_input, user_defined_trajectory, gains, controller, logger)
+
+  t0 = time.perf_counter()
+  sim.runSimulationLoop()
+  loop_time = time.perf_counter() - t0
+
+  log = logger.toDictionary()
+  return {
+    "loop_time": loop_time,
+    "num_steps": int(round(sim.getTime() / timestep)),
+    "num_control_steps": sim.num_control_steps,
+    "time": np.ravel(log["time"]),
+    "position": np.column_stack([np.ravel(log["position"][axis]) for axis in "xyz"]),
+  }
+
+def maxPositionDifference(flight: dict, reference: dict) -> float:
+  """Largest position difference at the logged times common to both flights."""
+  common, index, reference_index = np.intersect1d(
+    np.round(flight["time"], 9), np.round(reference["time"], 9), return_indices=True
+  )
+  if common.size == 0:
+    return float("nan")
+  return float(np.abs(flight["position"][index] - reference["position"][reference_index]).max())
+
+def main():
+  parser = argparse.ArgumentParser(description="Single-rate vs. multi-rate simulation loop.")
+  parser.add_argument("--plant_backend", choices=("numpy", "chrono"), default="numpy", help="Plant flying the mission.")
+  parser.add_argument("--controller_type", type=str, default="PID", help="Controller flying the mission.")
+  parser.add_argument("--uav_name", type=str, default="X8", help="UAV flying the mission.")
+  parser.add_argument("--duration", type=float, default=10.0, help="Duration of the mission [s].")
+  parser.add_argument("--timestep", type=float, default=0.0005, help="Physics timestep [s].")
+  parser.add_argument("--control_period", type=float, default=0.0025, help="Control period of the multi-rate case [s].")
+  parser.add_argument("--logging_period", type=float, default=0.01, help="Logging period of the multi-rate case [s].")
+  parser.add_argument("--console_period", type=float, default=0.5, help="Console period of the multi-rate case [s].")
+  args = parser.parse_args()
+
+  cases = {
+    "single rate": (args.timestep, 0.0, 0.0, 0.0),
+    "multi rate": (args.timestep, args.control_period, args.logging_period, args.console_period),
+    "control rate": (args.control_period, 0.0, 0.0, 0.0),
+  }
+  flights = {name: flyMission(args, *periods) for name, periods in cases.items()}
+
+  print(f"\n{'case':<14} {'loop [s]':>9} {'step [us]':>10} {'physics steps':>14} {'control steps':>14} {'log rows':>9} {'max dpos [m]':>13}")
+  for name, flight in flights.items():
+    print(
+      f"{name:<14} {flight['loop_time']:>9.3f} {1e6 * flight['loop_time'] / max(flight['num_steps'], 1):>10.1f} "
+      f"{flight['num_steps']:>14d} {flight['num_control_steps']:>14d} {flight['time'].size:>9d} "
+      f"{maxPositionDifference(flight, flights['single rate']):>13.2e}"
+    )
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,157 @@
+"""
+Parallel throughput benchmark: wall time of a batch of payload missions across workers x Chrono threads.
+
+The same batch ('--num_runs' payload-drop missions, run as in "wrapper" mode, without full logs) is run by the
+process pool of the wrapper with every combination of the number of workers ('wrapper_max_parallel') and of
+Chrono threads per worker ('chrono_num_threads'). For each combination: wall time of the batch, throughput,
+mean wall time of a run and number of failed runs. Combinations using more threads than CPUs are skipped,
+unless '--oversubscribe' is given. '--markdown' writes the batch wall time as a workers x threads table, with the
+fastest combination; it is only written if every run of every combination completed (the script exits with
+status 1 otherwise), so that a table of failed batches (e.g., without Chrono in the workers) is not committed.
+
+Requires the Chrono plant (pychrono).
+
+Run from the repository root:
+  python benchmarks/bench_parallel_matrix.py
+  python benchmarks/bench_parallel_matrix.py --workers 1 5 10 20 --threads 1 2 4 --num_runs 40 --report parallel.json
+  python benchmarks/bench_parallel_matrix.py --chrono_solver APGD --payload_type two_steel_balls
+  python benchmarks/bench_parallel_matrix.py --markdown benchmarks/results/parallel_matrix.md
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import acsl_pychrono.config.config as Cfg
+from acsl_pychrono.executor.run_wrapper_simulations import iterateSweepResults
+
+PAYLOAD_TYPES = ("two_steel_balls", "ten_steel_balls_in_two_lines", "many_steel_balls_in_random_position")
+
+def buildRuns(num_threads: int, args) -> list[dict]:
+  """Runs of the batch, as generated from a sweep (same mission, different ball drop times)."""
+  runs = []
+  for run_index in range(args.num_runs):
+    sim_cfg = Cfg.SimulationConfig()
+    mission_config = sim_cfg.mission_config
+    mission_config.wrapper_flag = True
+    mission_config.visualization_flag = False
+    mission_config.wrapper_save_full_logs = False
+    mission_config.controller_type = args.controller_type
+    mission_config.simulation_duration_seconds = args.duration
+    mission_config.add_payload_flag = True
+    mission_config.payload_type = args.payload_type
+    mission_config.drop_two_steel_balls = args.payload_type == "two_steel_balls"
+    mission_config.sequentially_drop_multiple_balls = args.payload_type != "two_steel_balls"
+    drop_time = args.drop_time + 0.01 * run_index
+    mission_config.two_steel_balls_drop_time = drop_time
+    mission_config.sequentially_drop_start_time = drop_time
+    mission_config.chrono_solver = args.chrono_solver
+    mission_config.chrono_num_threads = num_threads
+    sim_cfg.vehicle_config.uav_name = args.uav_name
+    runs.append({
+      "run_index": run_index,
+      "run_id": f"run_{run_index}",
+      "overrides": {"drop_time": drop_time},
+      "sim_cfg": sim_cfg,
+    })
+  return runs
+
+def runBatch(num_workers: int, num_threads: int, args) -> dict:
+  runs = buildRuns(num_threads, args)
+  t0 = time.perf_counter()
+  results = list(iterateSweepResults(runs, num_workers))
+  batch_time = time.perf_counter() - t0
+  run_times = [result["wall_time_seconds"] for result in results if result["status"] == "done"]
+  return {
+    "workers": num_workers,
+    "threads": num_threads,
+    "batch_time_seconds": batch_time,
+    "runs_per_minute": 60.0 * len(run_times) / batch_time,
+    "mean_run_time_seconds": statistics.mean(run_times) if run_times else float("nan"),
+    "num_failed": len(results) - len(run_times),
+  }
+
+def writeMarkdown(path: str, rows: list[dict], num_cpus: int, args):
+  """Batch wall time [s] (runs per minute) of each workers x threads combination, skipped ones as "-"."""
+  cells = {(row["workers"], row["threads"]): row for row in rows}
+  lines = [
+    "# Parallel throughput benchmark",
+    "",
+    f"Output of `benchmarks/bench_parallel_matrix.py`: {args.num_runs} x {args.payload_type} missions of {args.duration} s "
+    f"({args.uav_name}, {args.controller_type}, solver {args.chrono_solver}), {num_cpus} CPUs.",
+    "Batch wall time [s] (runs per minute).",
+    "",
+    "| workers \\ threads | " + " | ".join(str(num_threads) for num_threads in args.threads) + " |",
+    "|" + "---|" * (len(args.threads) + 1),
+  ]
+  for num_workers in args.workers:
+    row_cells = []
+    for num_threads in args.threads:
+      row = cells.get((num_workers, num_threads))
+      if row is None:
+        row_cells.append("-")
+        continue
+      row_cells.append(f"{row['batch_time_seconds']:.1f} ({row['runs_per_minute']:.2f})")
+    lines.append(f"| {num_workers} | " + " | ".join(row_cells) + " |")
+  fastest = min(rows, key=lambda row: row["batch_time_seconds"])
+  lines += [
+    "",
+    f"Fastest: {fastest['workers']} workers x {fastest['threads']} threads "
+    f"('wrapper_max_parallel' = {fastest['workers']}, 'chrono_num_threads' = {fastest['threads']}).",
+  ]
+  with open(path, "w") as f:
+    f.write("\n".join(lines) + "\n")
+
+def main():
+  parser = argparse.ArgumentParser(description="Wall time of a batch of payload missions across workers x Chrono threads.")
+  parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 5, 10, 20], help="Numbers of worker processes.")
+  parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4], help="Numbers of Chrono threads per worker.")
+  parser.add_argument("--num_runs", type=int, default=20, help="Number of missions of the batch.")
+  parser.add_argument("--payload_type", choices=PAYLOAD_TYPES, default="ten_steel_balls_in_two_lines", help="Payload dropped during the missions.")
+  parser.add_argument("--chrono_solver", type=str, default="PSOR", help="Solver of the Chrono system.")
+  parser.add_argument("--controller_type", type=str, default="TwoLayerMRAC", help="Controller flying the missions.")
+  parser.add_argument("--uav_name", type=str, default="X8", help="UAV flying the missions.")
+  parser.add_argument("--duration", type=float, default=10.0, help="Duration of each mission [s].")
+  parser.add_argument("--drop_time", type=float, default=3.0, help="Time of the (first) payload drop of the first run [s].")
+  parser.add_argument("--oversubscribe", action="store_true", help="Also run the combinations using more threads than CPUs.")
+  parser.add_argument("--report", type=str, default="", help="Save the results to this JSON file.")
+  parser.add_argument("--markdown", type=str, default="", help="Write the workers x threads table to this Markdown file.")
+  args = parser.parse_args()
+
+  num_cpus = os.cpu_count() or 1
+  rows = []
+  for num_workers in args.workers:
+    for num_threads in args.threads:
+      if num_workers * num_threads > num_cpus and not args.oversubscribe:
+        print(f"[INFO] Skipping {num_workers} workers x {num_threads} threads: more threads than the {num_cpus} CPUs.")
+        continue
+      print(f"[INFO] Running {args.num_runs} missions with {num_workers} workers x {num_threads} threads...")
+      rows.append(runBatch(num_workers, num_threads, args))
+
+  print(f"\n{args.num_runs} x {args.payload_type} missions of {args.duration} s, solver {args.chrono_solver}, {num_cpus} CPUs")
+  print(f"{'workers':>8} {'threads':>8} {'batch [s]':>10} {'runs/min':>9} {'run [s]':>8} {'failed':>7}")
+  for row in sorted(rows, key=lambda row: row["batch_time_seconds"]):
+    print(
+      f"{row['workers']:>8d} {row['threads']:>8d} {row['batch_time_seconds']:>10.1f} {row['runs_per_minute']:>9.2f} "
+      f"{row['mean_run_time_seconds']:>8.1f} {row['num_failed']:>7d}"
+    )
+
+  if args.report:
+    with open(args.report, "w") as f:
+      json.dump({"num_cpus": num_cpus, "args": vars(args), "results": rows}, f, indent=2)
+    print(f"[INFO] Results saved in: {args.report}")
+  failed = [row for row in rows if row["num_failed"]]
+  if failed or not rows:
+    combinations = ", ".join(f"{row['workers']}x{row['threads']}" for row in failed)
+    print(f"[ERROR] Failed runs ({combinations or 'no combination run'}): the table is not written.")
+    sys.exit(1)
+  if args.markdown:
+    writeMarkdown(args.markdown, rows, num_cpus, args)
+    print(f"[INFO] Table saved in: {args.markdown}")
+
+if __name__ == '__main__':
+  main()
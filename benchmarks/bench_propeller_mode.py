@@ -0,0 +1,200 @@
+"""
+Propeller mode benchmark: "dynamic" (propeller bodies and motor links) vs. "kinematic" (propellers merged into the frame).
+
+Each UAV flies the same headless mission with both propeller modes. For each mode: bodies and links in the Chrono
+system, wall-clock time of the loop and mean time of a step of the plant (solver included). The mass properties
+of the merged drone frame ("kinematic") are compared with the ones of the drone frame plus the propeller bodies
+("dynamic"): mass, COG position and inertia tensor about the COG, right after the system is built.
+'mergeMassProperties' is also checked on the exported bodies of a "dynamic" system: merging the propellers
+into the drone frame must give the mass properties of 'compositeMassProperties' of the frame and the
+propellers, and the force application points shifted by the returned offset (the motor thrust points and
+the aerodynamic force point, local to the COG frame) must stay at the same global positions.
+
+'--markdown' writes the plant step times and the residuals of both checks, one section per UAV.
+
+Requires the Chrono plant (pychrono).
+
+Run from the repository root:
+  python benchmarks/bench_propeller_mode.py
+  python benchmarks/bench_propeller_mode.py --uav_names X8 --duration 10.0 --controller_type PID
+  python benchmarks/bench_propeller_mode.py --markdown benchmarks/results/propeller_mode.md
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+import pychrono as chrono
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import acsl_pychrono.config.config as Cfg
+import acsl_pychrono.control as Ctrl
+import acsl_pychrono.uav as UAV_Module
+import acsl_pychrono.user_defined_trajectory as Traj
+from acsl_pychrono.simulation.simulation import Simulation
+from acsl_pychrono.simulation.ode_input import OdeInput
+from acsl_pychrono.simulation.flight_params import FlightParams
+from acsl_pychrono.simulation.mass_properties import bodyMassProperties, compositeMassProperties, mergeMassProperties
+
+PROPELLER_MODES = ("dynamic", "kinematic")
+
+def flyMission(uav_name: str, propeller_mode: str, args) -> dict:
+  sim_cfg = Cfg.SimulationConfig()
+  mission_config = sim_cfg.mission_config
+  mission_config.visualization_flag = False
+  mission_config.controller_type = args.controller_type
+  mission_config.simulation_duration_seconds = args.duration
+  mission_config.add_payload_flag = False
+  mission_config.propeller_mode = propeller_mode
+  sim_cfg.vehicle_config.uav_name = uav_name
+  sim = Simulation(sim_cfg)
+
+  # Drone frame plus the propeller bodies (none left in "kinematic" mode)
+  mass, cog, inertia = compositeMassProperties([sim.m_frame, *sim.m_props])
+  num_bodies = sim.m_sys.GetNbodies()
+  num_links = sim.m_sys.GetNlinks()
+
+  uav, uav_controller = UAV_Module.instantiateUAV(uav_name, args.controller_type)
+  flight_params = FlightParams(uav, uav_controller)
+  ode_input = OdeInput()
+  sim.setGravitationalAcceleration(flight_params)
+  user_defined_trajectory = Traj.instantiateTrajectory(mission_config, flight_params, sim.mfloor, sim.mfloor_Yposition)
+  gains, controller, logger = Ctrl.instantiateController(
+    args.controller_type, ode_input, flight_params, mission_config.timestep, mission_config.simulation_duration_seconds
+  )
+  sim.assignInstances(flight_params, ode_input, user_defined_trajectory, gains, controller, logger)
+
+  # Time spent in the steps of the plant
+  plant_times = []
+  advancePlant = sim.advancePlant
+  def timedAdvancePlant():
+    t0 = time.perf_counter()
+    advancePlant()
+    plant_times.append(time.perf_counter() - t0)
+  sim.advancePlant = timedAdvancePlant
+
+  t0 = time.perf_counter()
+  sim.runSimulationLoop()
+  loop_time = time.perf_counter() - t0
+
+  return {
+    "num_bodies": num_bodies,
+    "num_links": num_links,
+    "loop_time": loop_time,
+    "plant_step_time": float(np.mean(plant_times)),
+    "mass": mass,
+    "cog": cog,
+    "inertia": inertia,
+  }
+
+def globalPoints(body, points: list, offset) -> np.ndarray:
+  """Global positions of points local to the COG frame of 'body', shifted by 'offset'."""
+  coord = body.GetCoord()
+  global_points = [coord.TransformPointLocalToParent(point + offset) for point in points]
+  return np.array([[point.x, point.y, point.z] for point in global_points])
+
+def checkMergedMassProperties(uav_name: str) -> dict:
+  """
+  Merge the propellers of a "dynamic" system into its drone frame with 'mergeMassProperties' and compare
+  with 'compositeMassProperties' of the exported bodies before the merge.
+  """
+  sim_cfg = Cfg.SimulationConfig()
+  sim_cfg.mission_config.visualization_flag = False
+  sim_cfg.mission_config.add_payload_flag = False
+  sim_cfg.mission_config.propeller_mode = "dynamic"
+  sim_cfg.vehicle_config.uav_name = uav_name
+  sim = Simulation(sim_cfg)
+  uav, _ = UAV_Module.instantiateUAV(uav_name, "PID")
+
+  m_frame = sim.getExportedBody(sim.m_frame)
+  m_props = [sim.getExportedBody(prop) for prop in sim.m_props]
+  mass, cog, inertia = compositeMassProperties([m_frame, *m_props])
+  points = [*uav.motor_force_positions, uav.aerodynamic_force_application_point]
+  points_before = globalPoints(m_frame, points, chrono.ChVectorD(0, 0, 0))
+
+  frame_cog_offset = mergeMassProperties(m_frame, m_props)
+  merged_mass, merged_cog, merged_inertia = bodyMassProperties(m_frame)
+  points_after = globalPoints(m_frame, points, frame_cog_offset)
+
+  return {
+    "mass": abs(merged_mass - mass),
+    "cog": float(np.linalg.norm(merged_cog - cog)),
+    "inertia": float(np.abs(merged_inertia - inertia).max()),
+    "inertia_scale": float(np.abs(inertia).max()),
+    "points": float(np.linalg.norm(points_after - points_before, axis=1).max()),
+    "cog_shift": frame_cog_offset.Length(),
+  }
+
+def main():
+  parser = argparse.ArgumentParser(description="Dynamic vs. kinematic propellers: solver cost and mass properties.")
+  parser.add_argument("--uav_names", type=str, nargs="+", default=["X8", "QUAD1"], help="UAVs flying the mission.")
+  parser.add_argument("--controller_type", type=str, default="TwoLayerMRAC", help="Controller flying the mission.")
+  parser.add_argument("--duration", type=float, default=5.0, help="Duration of the mission [s].")
+  parser.add_argument("--markdown", type=str, default="", help="Write the results to this Markdown file.")
+  args = parser.parse_args()
+
+  lines = [
+    "# Propeller mode benchmark",
+    "",
+    f"Output of `benchmarks/bench_propeller_mode.py --uav_names {' '.join(args.uav_names)}` "
+    f"({args.controller_type}, {args.duration} s headless missions, no payload).",
+  ]
+  for uav_name in args.uav_names:
+    results = {propeller_mode: flyMission(uav_name, propeller_mode, args) for propeller_mode in PROPELLER_MODES}
+    dynamic, kinematic = results["dynamic"], results["kinematic"]
+
+    print(f"\n{uav_name}, {args.duration} s mission")
+    print(f"{'mode':>10} {'bodies':>7} {'links':>6} {'loop [s]':>9} {'plant step [ms]':>16}")
+    for propeller_mode, result in results.items():
+      print(
+        f"{propeller_mode:>10} {result['num_bodies']:>7d} {result['num_links']:>6d} {result['loop_time']:>9.2f} "
+        f"{1e3 * result['plant_step_time']:>16.3f}"
+      )
+    print(f"Plant step speedup: {dynamic['plant_step_time'] / kinematic['plant_step_time']:.2f}x")
+    print(
+      f"Mass properties (kinematic - dynamic): mass {kinematic['mass'] - dynamic['mass']:+.2e} kg, "
+      f"COG {np.linalg.norm(kinematic['cog'] - dynamic['cog']):.2e} m, "
+      f"inertia {np.abs(kinematic['inertia'] - dynamic['inertia']).max():.2e} kg m^2 "
+      f"(of {np.abs(dynamic['inertia']).max():.2e})"
+    )
+
+    check = checkMergedMassProperties(uav_name)
+    print(
+      f"mergeMassProperties - compositeMassProperties: mass {check['mass']:.2e} kg, COG {check['cog']:.2e} m, "
+      f"inertia {check['inertia']:.2e} kg m^2 (of {check['inertia_scale']:.2e}); "
+      f"force application points moved by {check['points']:.2e} m (COG shift {check['cog_shift']:.2e} m)"
+    )
+
+    lines += [
+      "",
+      f"## {uav_name}",
+      "",
+      "| mode | bodies | links | loop [s] | plant step [ms] |",
+      "|---|---|---|---|---|",
+      *(
+        f"| {propeller_mode} | {result['num_bodies']} | {result['num_links']} | {result['loop_time']:.2f} | "
+        f"{1e3 * result['plant_step_time']:.3f} |" for propeller_mode, result in results.items()
+      ),
+      "",
+      f"Plant step speedup: {dynamic['plant_step_time'] / kinematic['plant_step_time']:.2f}x",
+      "",
+      "| residual | mass [kg] | COG [m] | inertia [kg m^2] | force points [m] |",
+      "|---|---|---|---|---|",
+      f"| kinematic - dynamic system | {abs(kinematic['mass'] - dynamic['mass']):.2e} | "
+      f"{np.linalg.norm(kinematic['cog'] - dynamic['cog']):.2e} | "
+      f"{np.abs(kinematic['inertia'] - dynamic['inertia']).max():.2e} | - |",
+      f"| mergeMassProperties - compositeMassProperties | {check['mass']:.2e} | {check['cog']:.2e} | "
+      f"{check['inertia']:.2e} | {check['points']:.2e} |",
+      "",
+      f"Largest inertia component {check['inertia_scale']:.2e} kg m^2, COG shift of the merge {check['cog_shift']:.2e} m.",
+    ]
+
+  if args.markdown:
+    with open(args.markdown, "w") as file:
+      file.write("\n".join(lines) + "\n")
+    print(f"[INFO] Results written to {args.markdown}")
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,157 @@
+"""
+Solver policy benchmark: fixed vs. contact-aware iteration budget of the ChSolverPSOR on payload-drop missions.
+
+Each mission (payload dropped during the flight) is flown with the "fixed" policy ('solver_max_iterations' at
+every step) and with the "contact_aware" policy (reduced budget only when airborne, with no contacts and no payload aboard). For each policy:
+wall-clock time of the loop, mean solver iterations per step, fraction of the steps with the full budget,
+and the largest and RMS position difference of the vehicle with the "fixed" flight, over the whole flight and
+after the payload is released (where the reduced budget applies). The flights whose largest post-release
+difference exceeds '--tolerance' are reported: the budgets default to the ones of 'MissionConfig'.
+The "contact_aware" policy stays experimental (and "fixed" the default of 'MissionConfig.solver_policy') until
+this benchmark shows its post-release deviation within the tolerance.
+
+Requires the Chrono plant (pychrono).
+
+Run from the repository root:
+  python benchmarks/bench_solver_policy.py
+  python benchmarks/bench_solver_policy.py --payload_types two_steel_balls --duration 8.0 --min_iterations 100
+  python benchmarks/bench_solver_policy.py --markdown benchmarks/results/solver_policy.md
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import acsl_pychrono.config.config as Cfg
+import acsl_pychrono.control as Ctrl
+import acsl_pychrono.uav as UAV_Module
+import acsl_pychrono.user_defined_trajectory as Traj
+from acsl_pychrono.simulation.simulation import Simulation
+from acsl_pychrono.simulation.ode_input import OdeInput
+from acsl_pychrono.simulation.flight_params import FlightParams
+
+PAYLOAD_TYPES = ("two_steel_balls", "ten_steel_balls_in_two_lines", "many_steel_balls_in_random_position")
+POLICIES = ("fixed", "contact_aware")
+
+def buildSimulationConfig(payload_type: str, solver_policy: str, args) -> Cfg.SimulationConfig:
+  sim_cfg = Cfg.SimulationConfig()
+  mission_config = sim_cfg.mission_config
+  mission_config.visualization_flag = False
+  mission_config.controller_type = args.controller_type
+  mission_config.simulation_duration_seconds = args.duration
+  mission_config.add_payload_flag = True
+  mission_config.payload_type = payload_type
+  mission_config.drop_two_steel_balls = payload_type == "two_steel_balls"
+  mission_config.two_steel_balls_drop_time = args.drop_time
+  mission_config.sequentially_drop_multiple_balls = payload_type != "two_steel_balls"
+  mission_config.sequentially_drop_start_time = args.drop_time
+  mission_config.solver_policy = solver_policy
+  mission_config.solver_max_iterations = args.max_iterations
+  mission_config.solver_min_iterations = args.min_iterations
+  sim_cfg.vehicle_config.uav_name = args.uav_name
+  return sim_cfg
+
+def flyMission(payload_type: str, solver_policy: str, args) -> dict:
+  sim_cfg = buildSimulationConfig(payload_type, solver_policy, args)
+  mission_config = sim_cfg.mission_config
+  sim = Simulation(sim_cfg)
+
+  uav, uav_controller = UAV_Module.instantiateUAV(args.uav_name, args.controller_type)
+  flight_params = FlightParams(uav, uav_controller)
+  ode_input = OdeInput()
+  sim.setGravitationalAcceleration(flight_params)
+  user_defined_trajectory = Traj.instantiateTrajectory(mission_config, flight_params, sim.mfloor, sim.mfloor_Yposition)
+  gains, controller, logger = Ctrl.instantiateController(
+    args.controller_type, ode_input, flight_params, mission_config.timestep, mission_config.simulation_duration_seconds
+  )
+  sim.assignInstances(flight_params, ode_input, user_defined_trajectory, gains, controller, logger)
+
+  t0 = time.perf_counter()
+  sim.runSimulationLoop()
+  loop_time = time.perf_counter() - t0
+
+  log = logger.toDictionary()
+  return {
+    "loop_time": loop_time,
+    "payload_release_time": getattr(sim.solver_policy, "payload_release_time", np.nan),
+    "time": np.ravel(log["time"]),
+    "position": np.column_stack([np.ravel(log["position"][axis]) for axis in "xyz"]),
+    **sim.solver_policy.summaryMetrics(),
+  }
+
+def positionDifference(flight: dict, reference: dict, start_time: float = -np.inf) -> tuple[float, float]:
+  """Largest and RMS position difference [m] of 'flight' with 'reference' on their common logged steps from 'start_time'."""
+  num_rows = min(len(flight["position"]), len(reference["position"]))
+  difference = np.linalg.norm(flight["position"][:num_rows] - reference["position"][:num_rows], axis=1)
+  difference = difference[reference["time"][:num_rows] >= start_time]
+  if difference.size == 0:
+    return np.nan, np.nan
+  return float(np.nanmax(difference)), float(np.sqrt(np.nanmean(difference ** 2)))
+
+def main():
+  default_mission_config = Cfg.MissionConfig()
+  parser = argparse.ArgumentParser(description="Fixed vs. contact-aware iteration budget of the solver on payload-drop missions.")
+  parser.add_argument("--payload_types", choices=PAYLOAD_TYPES, nargs="+", default=list(PAYLOAD_TYPES), help="Payloads dropped during the missions.")
+  parser.add_argument("--controller_type", type=str, default="TwoLayerMRAC", help="Controller flying the missions.")
+  parser.add_argument("--uav_name", type=str, default="X8", help="UAV flying the missions.")
+  parser.add_argument("--duration", type=float, default=10.0, help="Duration of each mission [s].")
+  parser.add_argument("--drop_time", type=float, default=3.0, help="Time of the (first) payload drop [s].")
+  parser.add_argument("--max_iterations", type=int, default=default_mission_config.solver_max_iterations, help="Full iteration budget of the solver.")
+  parser.add_argument("--min_iterations", type=int, default=default_mission_config.solver_min_iterations, help="Iteration budget away from the contact events.")
+  parser.add_argument("--tolerance", type=float, default=0.01, help="Largest post-release position difference with the fixed budget [m].")
+  parser.add_argument("--markdown", type=str, default="", help="Write the result table to this Markdown file.")
+  args = parser.parse_args()
+
+  rows = []
+  for payload_type in args.payload_types:
+    flights = {policy: flyMission(payload_type, policy, args) for policy in POLICIES}
+    reference = flights["fixed"]
+    release_time = flights["contact_aware"]["payload_release_time"]
+    for policy, flight in flights.items():
+      saved = 1.0 - flight["loop_time"] / reference["loop_time"]
+      max_difference, rms_difference = positionDifference(flight, reference)
+      max_post_release, rms_post_release = positionDifference(flight, reference, release_time)
+      rows.append([
+        payload_type, policy, flight["loop_time"], 100 * saved, flight["solver_iterations_mean"],
+        100 * flight["solver_full_budget_fraction"], max_difference, rms_difference, max_post_release, rms_post_release
+      ])
+
+  header = ["payload", "policy", "loop [s]", "saved [%]", "iterations", "full budget [%]",
+            "max dpos [m]", "rms dpos [m]", "max dpos post-release [m]", "rms dpos post-release [m]"]
+  print(f"\n{args.uav_name}, {args.controller_type}, {args.duration} s missions, budget {args.min_iterations}-{args.max_iterations} iterations")
+  print(
+    f"{'payload':<36} {'policy':<14} {'loop [s]':>9} {'saved':>7} {'iterations':>11} {'full budget':>12} "
+    f"{'max dpos [m]':>13} {'rms dpos [m]':>13} {'max post [m]':>13} {'rms post [m]':>13}"
+  )
+  for payload_type, policy, loop_time, saved, iterations, full_budget, *differences in rows:
+    print(
+      f"{payload_type:<36} {policy:<14} {loop_time:>9.2f} {saved:>6.1f}% {iterations:>11.1f} {full_budget:>11.1f}% "
+      + " ".join(f"{difference:>13.2e}" for difference in differences)
+    )
+  exceeded = [row[0] for row in rows if row[1] == "contact_aware" and not row[8] <= args.tolerance]
+  if exceeded:
+    print(f"[WARNING] Post-release position difference above {args.tolerance} m: {', '.join(exceeded)}")
+  else:
+    print(f"[INFO] Post-release position differences within {args.tolerance} m.")
+
+  if args.markdown:
+    lines = [
+      "# Solver policy benchmark",
+      "",
+      f"Output of `benchmarks/bench_solver_policy.py` ({args.uav_name}, {args.controller_type}, {args.duration} s missions, "
+      f"drop at {args.drop_time} s, budget {args.min_iterations}-{args.max_iterations} iterations, tolerance {args.tolerance} m).",
+      "",
+      "| " + " | ".join(header) + " |",
+      "|" + "---|" * len(header),
+    ]
+    for row in rows:
+      lines.append("| " + " | ".join(f"{value:.4g}" if isinstance(value, float) else str(value) for value in row) + " |")
+    with open(args.markdown, "w") as file:
+      file.write("\n".join(lines) + "\n")
+    print(f"[INFO] Table written to {args.markdown}")
+
+if __name__ == '__main__':
+  main()
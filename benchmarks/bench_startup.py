@@ -0,0 +1,85 @@
+"""
+Startup benchmark of a wrapper worker: headless vs. rendering simulation.
+
+Each sample is measured in a fresh interpreter, as a new worker process would be,
+and reports the time spent importing the simulation module, importing the Irrlicht
+render stack and building the 'Simulation' (vehicle, floor, payload, motors).
+
+Run from the repository root:
+  python benchmarks/bench_startup.py --repeats 5
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Script executed in a fresh interpreter for each sample
+_WORKER_SCRIPT = """
+import sys, time, json
+t0 = time.perf_counter()
+import acsl_pychrono.simulation.simulation as Sim
+import acsl_pychrono.config.config as Cfg
+t1 = time.perf_counter()
+if {visualization}:
+  import pychrono.irrlicht
+t2 = time.perf_counter()
+sim_cfg = Cfg.SimulationConfig()
+sim_cfg.mission_config.visualization_flag = {visualization}
+sim = Sim.Simulation(sim_cfg)
+if {visualization}:
+  sim.visualization.setup()
+t3 = time.perf_counter()
+print(json.dumps({{
+  "import_simulation_s": t1 - t0,
+  "import_irrlicht_s": t2 - t1,
+  "build_simulation_s": t3 - t2,
+  "total_s": t3 - t0,
+  "irrlicht_loaded": "pychrono.irrlicht" in sys.modules,
+}}))
+"""
+
+def measureStartup(visualization: bool) -> dict:
+  """Run one startup sample in a fresh interpreter and return its timings."""
+  output = subprocess.check_output(
+    [sys.executable, "-c", _WORKER_SCRIPT.format(visualization=visualization)],
+    cwd=REPO_DIR,
+    stderr=subprocess.DEVNULL,
+    env={**os.environ, "PYTHONPATH": REPO_DIR + os.pathsep + os.environ.get("PYTHONPATH", "")}
+  )
+  # The simulation prints info messages: the timings are the last line
+  return json.loads(output.decode().strip().splitlines()[-1])
+
+def summarize(samples: list[dict]) -> dict:
+  keys = ("import_simulation_s", "import_irrlicht_s", "build_simulation_s", "total_s")
+  summary = {key: statistics.median(sample[key] for sample in samples) for key in keys}
+  summary["irrlicht_loaded"] = any(sample["irrlicht_loaded"] for sample in samples)
+  return summary
+
+def main():
+  parser = argparse.ArgumentParser(description="Per-worker startup cost, headless vs. rendering.")
+  parser.add_argument("--repeats", type=int, default=5, help="Number of fresh interpreters per mode.")
+  parser.add_argument("--headless_only", action="store_true", help="Skip the rendering mode (e.g., no display available).")
+  args = parser.parse_args()
+
+  modes = [False] if args.headless_only else [False, True]
+  results = {}
+  for visualization in modes:
+    name = "rendering" if visualization else "headless"
+    results[name] = summarize([measureStartup(visualization) for _ in range(args.repeats)])
+
+  print(f"{'mode':<10} {'import sim [s]':>15} {'import irr [s]':>15} {'build [s]':>10} {'total [s]':>10}  irrlicht loaded")
+  for name, summary in results.items():
+    print(
+      f"{name:<10} {summary['import_simulation_s']:>15.3f} {summary['import_irrlicht_s']:>15.3f} "
+      f"{summary['build_simulation_s']:>10.3f} {summary['total_s']:>10.3f}  {summary['irrlicht_loaded']}"
+    )
+  if "rendering" in results:
+    saving = results["rendering"]["total_s"] - results["headless"]["total_s"]
+    print(f"Headless saving per worker: {saving:.3f} s")
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,316 @@
+"""
+Surrogate plant benchmark: Chrono system vs. NumPy rigid-body plant (plant_backend "numpy").
+
+Fidelity: the same mission (controller, trajectory, headless, no payload) is flown on both plant
+backends and the logged position and attitude are compared along the flight (largest and RMS
+difference), with the tracking error of each backend, the time at which each flight flipped (roll or pitch
+beyond the crash limit of the results store), the time at which the numpy flight diverged (non-finite state)
+and the number of steps with saturated motor thrusts (NaN times if the flight did not flip or diverge).
+A flip that follows saturated steps comes from the motor thrust limits (e.g., "circular_trajectory", which starts
+away from the vehicle, with the thrust limits of the X8): compare it with the flip time of the Chrono flight before
+attributing it to the surrogate. A flipped MRAC flight may then diverge, seconds later, as its adaptive laws wind up
+on the moments the motors cannot produce.
+Speed: time per step of the plant ('advancePlant') and of the whole control step on both backends,
+and the throughput of the batched plant in vehicle-steps per second. The plant step speedup is given
+for one vehicle (Chrono plant step / numpy plant step) and for each batch size (Chrono plant step /
+time per vehicle-step of the batched plant); the smallest batch size reaching '--target_speedup' is reported,
+the speedup of one vehicle alone being far below it.
+
+The Chrono plant includes the contacts, the CAD bodies and the links of the vehicle, the surrogate
+only the rigid body of the whole vehicle: its results are meant for early-stage gain screening.
+
+Run from the repository root:
+  python benchmarks/bench_surrogate_plant.py --controllers MRAC --duration 10.0
+  python benchmarks/bench_surrogate_plant.py --uav_names X8 QUAD1 SIMPLE_QUAD --markdown benchmarks/results/surrogate_plant.md
+  python benchmarks/bench_surrogate_plant.py --trajectories hover_trajectory bean_trajectory0p2.json --report surrogate.json
+  python benchmarks/bench_surrogate_plant.py --numpy_only --batch_sizes 1 64 1024
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import acsl_pychrono.config.config as Cfg
+import acsl_pychrono.control as Ctrl
+import acsl_pychrono.uav as UAV_Module
+import acsl_pychrono.user_defined_trajectory as Traj
+from acsl_pychrono.executor.simulation_cache import instantiateSimulation
+from acsl_pychrono.executor.results_store import CRASH_ATTITUDE_LIMIT_RAD
+from acsl_pychrono.simulation.rigid_body_plant import RigidBodyPlant
+from acsl_pychrono.simulation.ode_input import OdeInput
+from acsl_pychrono.simulation.flight_params import FlightParams
+from acsl_pychrono.simulation.utils import Utils
+
+CONTROLLERS = ("PID", "MRAC", "TwoLayerMRAC")
+# Trajectories given by their type, the others are files of the piecewise polynomial trajectory
+TRAJECTORY_TYPES = ("hover_trajectory", "circular_trajectory", "square_trajectory", "rounded_rectangle_trajectory")
+
+def buildSimulationConfig(plant_backend: str, uav_name: str, controller_type: str, trajectory: str, args) -> Cfg.SimulationConfig:
+  sim_cfg = Cfg.SimulationConfig()
+  mission_config = sim_cfg.mission_config
+  mission_config.plant_backend = plant_backend
+  mission_config.controller_type = controller_type
+  mission_config.visualization_flag = False
+  mission_config.add_payload_flag = False
+  mission_config.simulation_duration_seconds = args.duration
+  mission_config.timestep = args.timestep
+  if trajectory in TRAJECTORY_TYPES:
+    mission_config.trajectory_type = trajectory
+  else:
+    mission_config.trajectory_type = "piecewise_polynomial_trajectory"
+    mission_config.trajectory_data_path = trajectory
+  sim_cfg.vehicle_config.uav_name = uav_name
+  sim_cfg.environment_config.include = False
+  return sim_cfg
+
+def flyMission(plant_backend: str, uav_name: str, controller_type: str, trajectory: str, args) -> dict:
+  """Fly the mission on one plant backend. Returns the logged flight and the time spent per step."""
+  sim_cfg = buildSimulationConfig(plant_backend, uav_name, controller_type, trajectory, args)
+  mission_config = sim_cfg.mission_config
+  sim = instantiateSimulation(sim_cfg)
+
+  uav, uav_controller = UAV_Module.instantiateUAV(uav_name, controller_type)
+  flight_params = FlightParams(uav, uav_controller)
+  ode_input = OdeInput()
+  sim.setGravitationalAcceleration(flight_params)
+  user_defined_trajectory = Traj.instantiateTrajectory(mission_config, flight_params, sim.mfloor, sim.mfloor_Yposition)
+  gains, controller, logger = Ctrl.instantiateController(
+    controller_type, ode_input, flight_params, mission_config.timestep, mission_config.simulation_duration_seconds
+  )
+  sim.assignInstances(flight_params, ode_input, user_defined_trajectory, gains, controller, logger)
+
+  # Time spent in the plant, out of the whole loop
+  plant_time = [0.0]
+  advancePlant = sim.advancePlant
+  def timedAdvancePlant():
+    t0 = time.perf_counter()
+    advancePlant()
+    plant_time[0] += time.perf_counter() - t0
+  sim.advancePlant = timedAdvancePlant
+
+  t0 = time.perf_counter()
+  sim.runSimulationLoop()
+  loop_time = time.perf_counter() - t0
+  num_steps = int(round(sim.getTime() / mission_config.timestep))
+
+  log = logger.toDictionary()
+  position = np.column_stack([np.ravel(log["position"][axis]) for axis in "xyz"])
+  position_ref = np.column_stack([np.ravel(log["user_defined_position"][axis]) for axis in "xyz"])
+  attitude = np.column_stack([np.ravel(log["euler_angles"][angle]) for angle in ("roll", "pitch", "yaw")])
+  return {
+    "time": np.ravel(log["time"]),
+    "position": position,
+    "tracking_error": np.linalg.norm(position - position_ref, axis=1),
+    "attitude": attitude,
+    "plant_step_s": plant_time[0] / num_steps,
+    "control_step_s": loop_time / num_steps,
+    "saturated_steps": sim.num_saturated_steps,
+  }
+
+def rms(values: np.ndarray) -> float:
+  return float(np.sqrt(np.mean(values ** 2))) if values.size else float("nan")
+
+def compareFlights(chrono_flight: dict, numpy_flight: dict) -> dict:
+  """Differences of the numpy flight from the Chrono flight, on their common logged steps."""
+  n = min(len(chrono_flight["time"]), len(numpy_flight["time"]))
+  position_difference = np.linalg.norm(numpy_flight["position"][:n] - chrono_flight["position"][:n], axis=1)
+  # Wrapped difference of the angles
+  attitude_difference = np.angle(np.exp(1j * (numpy_flight["attitude"][:n] - chrono_flight["attitude"][:n])))
+  attitude_difference_norm = np.linalg.norm(attitude_difference, axis=1)
+  return {
+    "position_difference_rms_m": rms(position_difference),
+    "position_difference_max_m": float(np.nanmax(position_difference)) if n else float("nan"),
+    "attitude_difference_rms_deg": float(np.rad2deg(rms(attitude_difference_norm))),
+    "attitude_difference_max_deg": float(np.rad2deg(np.nanmax(np.abs(attitude_difference)))) if n else float("nan"),
+  }
+
+def divergenceTime(flight: dict) -> float:
+  """Time [s] of the first logged step whose position is not finite (the flight diverged), NaN if none."""
+  diverged = np.flatnonzero(~np.all(np.isfinite(flight["position"]), axis=1))
+  return float(flight["time"][diverged[0]]) if diverged.size else float("nan")
+
+def flipTime(flight: dict) -> float:
+  """Time [s] of the first logged step whose roll or pitch is beyond 'CRASH_ATTITUDE_LIMIT_RAD' (flipped), NaN if none."""
+  with np.errstate(invalid="ignore"):
+    flipped = np.flatnonzero(np.any(np.abs(flight["attitude"][:, :2]) > CRASH_ATTITUDE_LIMIT_RAD, axis=1))
+  return float(flight["time"][flipped[0]]) if flipped.size else float("nan")
+
+def summarizeFlight(flight: dict) -> dict:
+  return {
+    "tracking_error_rms_m": rms(flight["tracking_error"]),
+    "flipped_at_s": flipTime(flight),
+    "diverged_at_s": divergenceTime(flight),
+    "plant_step_us": flight["plant_step_s"] * 1e6,
+    "control_step_us": flight["control_step_s"] * 1e6,
+    "saturated_steps": flight["saturated_steps"],
+  }
+
+def batchThroughput(uav_name: str, batch_size: int, args) -> float:
+  """Vehicle-steps per second of the batched plant, hovering with its weight shared by the thrust points."""
+  uav, uav_controller = UAV_Module.instantiateUAV(uav_name, "PID")
+  uav_cfg = UAV_Module.get_uav_config(uav_name)["uav"]
+  plant = RigidBodyPlant(
+    uav.mass_total, uav.Inertia_mat_pixhawk, uav.G_acc, batch_size=batch_size,
+    initial_position=(0.0, 0.0, -1.0),
+    frame_orientation=uav_cfg["cad"].get("frame_orientation", (1.0, 0.0, 0.0, 0.0))
+  )
+  force_positions = np.asarray(uav_cfg["force_positions"], dtype=float)
+  forces = np.zeros((batch_size, len(force_positions), 3))
+  forces[:, :, 1] = uav.mass_total * uav.G_acc / len(force_positions) * np.random.default_rng(args.seed).uniform(0.95, 1.05, (batch_size, len(force_positions)))
+
+  t0 = time.perf_counter()
+  for _ in range(args.batch_steps):
+    plant.accumulateLocalForces(forces, force_positions)
+    plant.doStepDynamics(args.timestep)
+    plant.emptyForcesAccumulators()
+  return batch_size * args.batch_steps / (time.perf_counter() - t0)
+
+def formatTable(header: list[str], rows: list[list]) -> list[str]:
+  """Markdown table of the rows, the floats with 4 significant digits."""
+  lines = ["| " + " | ".join(header) + " |", "|" + "---|" * len(header)]
+  for row in rows:
+    lines.append("| " + " | ".join(f"{value:.4g}" if isinstance(value, float) else str(value) for value in row) + " |")
+  return lines
+
+def targetBatchSize(batches: list[dict], target_speedup: float) -> int | None:
+  """Smallest batch size whose speedup reaches 'target_speedup', None if none does (or without Chrono timing)."""
+  reached = [batch["batch_size"] for batch in batches if batch["speedup"] >= target_speedup]
+  return min(reached) if reached else None
+
+def targetSummary(batches: list[dict], target_speedup: float) -> str:
+  if not any(np.isfinite(batch["speedup"]) for batch in batches):
+    return f"{target_speedup:g}x target: no Chrono plant step timed (--numpy_only), not evaluated."
+  batch_size = targetBatchSize(batches, target_speedup)
+  if batch_size is None:
+    return f"{target_speedup:g}x target: not reached at the batch sizes run ({', '.join(str(batch['batch_size']) for batch in batches)})."
+  return f"{target_speedup:g}x target: reached from N = {batch_size} vehicles per batched plant step, not by a single vehicle."
+
+def writeMarkdown(path: str, report: dict, args):
+  """Fidelity and speedup tables of the report, one section per UAV."""
+  lines = [
+    "# Surrogate plant benchmark",
+    "",
+    f"Output of `benchmarks/bench_surrogate_plant.py --uav_names {' '.join(args.uav_names)}` "
+    f"({args.duration} s missions, timestep {args.timestep} s, no payload).",
+  ]
+  for uav_name in args.uav_names:
+    missions = [mission for mission in report["missions"] if mission["uav_name"] == uav_name]
+    batches = [batch for batch in report["batch"] if batch["uav_name"] == uav_name]
+    lines += ["", f"## {uav_name}", "", "Fidelity against the Chrono plant:", ""]
+    lines += formatTable(
+      ["controller", "trajectory", "pos diff rms [m]", "pos diff max [m]", "att diff rms [deg]", "att diff max [deg]",
+       "track rms chrono [m]", "track rms numpy [m]", "chrono flipped [s]", "numpy flipped [s]", "numpy diverged [s]",
+       "saturated steps chrono", "saturated steps numpy"],
+      [[mission["controller"], mission["trajectory"],
+        *(mission.get("difference", {}).get(key, float("nan")) for key in (
+          "position_difference_rms_m", "position_difference_max_m", "attitude_difference_rms_deg", "attitude_difference_max_deg")),
+        mission.get("chrono", {}).get("tracking_error_rms_m", float("nan")),
+        mission["numpy"]["tracking_error_rms_m"], mission.get("chrono", {}).get("flipped_at_s", float("nan")),
+        mission["numpy"]["flipped_at_s"], mission["numpy"]["diverged_at_s"],
+        mission.get("chrono", {}).get("saturated_steps", float("nan")), mission["numpy"]["saturated_steps"]] for mission in missions]
+    )
+    lines += ["", "Plant step time, one vehicle:", ""]
+    lines += formatTable(
+      ["controller", "trajectory", "chrono [us]", "numpy [us]", "speedup"],
+      [[mission["controller"], mission["trajectory"],
+        mission.get("chrono", {}).get("plant_step_us", float("nan")), mission["numpy"]["plant_step_us"],
+        mission.get("plant_step_speedup", float("nan"))] for mission in missions]
+    )
+    lines += ["", "Batched plant, against the mean Chrono plant step of the missions:", ""]
+    lines += formatTable(
+      ["N", "vehicle-steps/s", "us per vehicle-step", "speedup"],
+      [[batch["batch_size"], batch["vehicle_steps_per_s"], 1e6 / batch["vehicle_steps_per_s"],
+        batch.get("speedup", float("nan"))] for batch in batches]
+    )
+    if batches:
+      lines += ["", targetSummary(batches, args.target_speedup)]
+  with open(path, "w") as file:
+    file.write("\n".join(lines) + "\n")
+
+def main():
+  parser = argparse.ArgumentParser(description="Fidelity and speed of the NumPy surrogate plant against the Chrono system.")
+  parser.add_argument("--controllers", choices=CONTROLLERS, nargs="+", default=list(CONTROLLERS), help="Controllers flying the missions.")
+  parser.add_argument("--trajectories", type=str, nargs="+", default=["hover_trajectory", "circular_trajectory", "bean_trajectory0p2.json", "stadium.json"],
+                      help="Trajectory types, or files of the piecewise polynomial trajectory.")
+  parser.add_argument("--uav_names", type=str, nargs="+", default=["X8"], help="UAVs flying the missions.")
+  parser.add_argument("--duration", type=float, default=10.0, help="Duration of each mission [s].")
+  parser.add_argument("--timestep", type=float, default=0.005, help="Simulation timestep [s].")
+  parser.add_argument("--numpy_only", action="store_true", help="Fly the missions on the numpy plant only (e.g., no Chrono install).")
+  parser.add_argument("--batch_sizes", type=int, nargs="*", default=[1, 64, 1024], help="Numbers of vehicles of the batched plant.")
+  parser.add_argument("--batch_steps", type=int, default=1000, help="Steps of the batched plant.")
+  parser.add_argument("--seed", type=int, default=0, help="Seed of the thrusts of the batched plant.")
+  parser.add_argument("--target_speedup", type=float, default=100.0, help="Plant step speedup whose smallest batch size is reported.")
+  parser.add_argument("--report", type=str, default="", help="Write the results to this JSON file.")
+  parser.add_argument("--markdown", type=str, default="", help="Write the result tables to this Markdown file.")
+  args = parser.parse_args()
+
+  # Silence the progress line of the simulation loop
+  Utils.printSimulationTimeInline = staticmethod(lambda *args, **kwargs: None)
+
+  report = {"missions": [], "batch": []}
+  for uav_name in args.uav_names:
+    print(f"[{uav_name}]")
+    print(
+      f"{'controller':<14} {'trajectory':<30} {'track rms chrono':>17} {'track rms numpy':>16} "
+      f"{'pos diff rms':>13} {'pos diff max':>13} {'att diff rms [deg]':>19} {'att diff max [deg]':>19} "
+      f"{'plant step speedup':>19} {'numpy flipped [s]':>18} {'numpy diverged [s]':>19}"
+    )
+    chrono_plant_steps_s = []
+    for controller_type in args.controllers:
+      for trajectory in args.trajectories:
+        numpy_flight = flyMission("numpy", uav_name, controller_type, trajectory, args)
+        mission = {"uav_name": uav_name, "controller": controller_type, "trajectory": trajectory, "numpy": summarizeFlight(numpy_flight)}
+        row = {"chrono_track": float("nan"), "position_difference_rms_m": float("nan"), "position_difference_max_m": float("nan"),
+               "attitude_difference_rms_deg": float("nan"), "attitude_difference_max_deg": float("nan"), "speedup": float("nan")}
+        if not args.numpy_only:
+          chrono_flight = flyMission("chrono", uav_name, controller_type, trajectory, args)
+          chrono_plant_steps_s.append(chrono_flight["plant_step_s"])
+          mission["chrono"] = summarizeFlight(chrono_flight)
+          mission["difference"] = compareFlights(chrono_flight, numpy_flight)
+          mission["plant_step_speedup"] = chrono_flight["plant_step_s"] / numpy_flight["plant_step_s"]
+          row.update(mission["difference"])
+          row["chrono_track"] = mission["chrono"]["tracking_error_rms_m"]
+          row["speedup"] = mission["plant_step_speedup"]
+        report["missions"].append(mission)
+        print(
+          f"{controller_type:<14} {trajectory:<30} {row['chrono_track']:>17.4f} {mission['numpy']['tracking_error_rms_m']:>16.4f} "
+          f"{row['position_difference_rms_m']:>13.4f} {row['position_difference_max_m']:>13.4f} "
+          f"{row['attitude_difference_rms_deg']:>19.2f} {row['attitude_difference_max_deg']:>19.2f} "
+          f"{row['speedup']:>19.1f} {mission['numpy']['flipped_at_s']:>18.3f} {mission['numpy']['diverged_at_s']:>19.3f}"
+        )
+
+    for mission in report["missions"]:
+      if mission["uav_name"] != uav_name:
+        continue
+      timings = [f"numpy plant {mission['numpy']['plant_step_us']:.1f} us/step, control step {mission['numpy']['control_step_us']:.1f} us"]
+      if "chrono" in mission:
+        timings.insert(0, f"chrono plant {mission['chrono']['plant_step_us']:.1f} us/step, control step {mission['chrono']['control_step_us']:.1f} us")
+      print(f"[{mission['controller']}, {mission['trajectory']}] " + "; ".join(timings))
+
+    # Speedup of the batched plant against the mean Chrono plant step of the missions of the UAV
+    chrono_plant_step_s = float(np.mean(chrono_plant_steps_s)) if chrono_plant_steps_s else float("nan")
+    if args.batch_sizes:
+      print(f"{'N':>6} {'batched plant [vehicle-steps/s]':>32} {'speedup':>9}")
+    for batch_size in args.batch_sizes:
+      rate = batchThroughput(uav_name, batch_size, args)
+      speedup = chrono_plant_step_s * rate
+      report["batch"].append({"uav_name": uav_name, "batch_size": batch_size, "vehicle_steps_per_s": rate, "speedup": speedup})
+      print(f"{batch_size:>6} {rate:>32.0f} {speedup:>9.1f}")
+    batches = [batch for batch in report["batch"] if batch["uav_name"] == uav_name]
+    if batches:
+      print(targetSummary(batches, args.target_speedup))
+
+  if args.report:
+    with open(args.report, "w") as file:
+      json.dump(report, file, indent=2)
+    print(f"[INFO] Report written to {args.report}")
+  if args.markdown:
+    writeMarkdown(args.markdown, report, args)
+    print(f"[INFO] Tables written to {args.markdown}")
+
+if __name__ == '__main__':
+  main()
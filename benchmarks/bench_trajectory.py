@@ -0,0 +1,114 @@
+"""
+Trajectory benchmark: precomputed vs. per-step evaluation of the piecewise polynomial trajectory.
+
+The per-step evaluation finds the segment with a Python loop and calls 'polyval' once per
+component and derivative at every control step. The precomputed mode evaluates the whole
+reference once, batched over all the control steps, and only indexes it at every step.
+
+For each trajectory file, reports the time spent precomputing, the time per 'compute' call
+of both modes, and checks that both modes return the same reference at every step
+(position, velocity, acceleration, yaw and its derivatives), over the whole simulation
+including the hover and landing phases.
+
+Run from the repository root:
+  python benchmarks/bench_trajectory.py --duration 40.0 --timestep 0.005
+  python benchmarks/bench_trajectory.py --trajectory_file stadium.json
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+import pychrono as chrono
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import acsl_pychrono.uav as UAV_Module
+from acsl_pychrono.config.config import MissionConfig
+from acsl_pychrono.simulation.flight_params import FlightParams
+from acsl_pychrono.user_defined_trajectory import PiecewisePolynomialTrajectory
+
+REFERENCE_FIELDS = ("position", "velocity", "acceleration", "yaw", "yaw_dot", "yaw_dot_dot")
+
+def buildTrajectory(trajectory_file: str, precompute: bool, args) -> tuple[PiecewisePolynomialTrajectory, float]:
+  """Instantiate the trajectory. Returns it with the time spent precomputing its reference."""
+  uav, uav_controller = UAV_Module.instantiateUAV(args.uav_name, "PID")
+  flight_params = FlightParams(uav, uav_controller)
+  mission_config = MissionConfig(
+    simulation_duration_seconds=args.duration,
+    timestep=args.timestep,
+    trajectory_data_path=trajectory_file,
+    precompute_trajectory=False,
+  )
+  trajectory = PiecewisePolynomialTrajectory(flight_params, chrono.ChBody(), 0.0, mission_config)
+  if not precompute:
+    return trajectory, 0.0
+  t0 = time.perf_counter()
+  trajectory.precomputeReference(args.timestep, args.duration)
+  return trajectory, time.perf_counter() - t0
+
+def stepTimes(args):
+  """Times at which 'compute' is called, accumulated as in the simulation loop."""
+  t_now = 0.0
+  while t_now < args.duration:
+    t_now += args.timestep
+    yield t_now
+
+def timeReference(trajectory: PiecewisePolynomialTrajectory, args) -> float:
+  """Time per 'compute' call over the whole simulation."""
+  num_steps = 0
+  t0 = time.perf_counter()
+  for t_now in stepTimes(args):
+    trajectory.compute(t_now)
+    num_steps += 1
+  return (time.perf_counter() - t0) / num_steps
+
+def collectReference(trajectory: PiecewisePolynomialTrajectory, args) -> list[dict]:
+  """Reference returned at every step (copied, since the per-step evaluation updates its outputs in place)."""
+  return [
+    {name: np.copy(getattr(state, name)) for name in REFERENCE_FIELDS}
+    for state in (trajectory.compute(t_now) for t_now in stepTimes(args))
+  ]
+
+def maxDifference(states_a: list[dict], states_b: list[dict]) -> float:
+  return max(
+    float(np.max(np.abs(a[name] - b[name])))
+    for a, b in zip(states_a, states_b, strict=True)
+    for name in REFERENCE_FIELDS
+  )
+
+def main():
+  parser = argparse.ArgumentParser(description="Time per step and exactness of the precomputed piecewise polynomial trajectory.")
+  parser.add_argument("--duration", type=float, default=MissionConfig.simulation_duration_seconds, help="Simulated duration [s].")
+  parser.add_argument("--timestep", type=float, default=MissionConfig.timestep, help="Control timestep [s].")
+  parser.add_argument("--uav_name", type=str, default="X8", help="UAV whose controller start time is used.")
+  parser.add_argument("--trajectory_file", type=str, default="", help="Trajectory file (path relative to 'params/user_defined_trajectory'). Default: all of them.")
+  parser.add_argument("--tolerance", type=float, default=0.0, help="Largest difference allowed between the two modes (default: identical).")
+  args = parser.parse_args()
+
+  if args.trajectory_file:
+    trajectory_files = [args.trajectory_file]
+  else:
+    trajectory_dir = os.path.join(os.getcwd(), "params", "user_defined_trajectory")
+    trajectory_files = sorted(f for f in os.listdir(trajectory_dir) if f.endswith(".json"))
+
+  print(f"{'trajectory':<26} {'precompute [ms]':>16} {'per-step [us]':>14} {'precomputed [us]':>17} {'max diff':>10}")
+  for trajectory_file in trajectory_files:
+    per_step_time = timeReference(buildTrajectory(trajectory_file, False, args)[0], args)
+    precomputed, precompute_time = buildTrajectory(trajectory_file, True, args)
+    precomputed_time = timeReference(precomputed, args)
+
+    per_step_states = collectReference(buildTrajectory(trajectory_file, False, args)[0], args)
+    precomputed_states = collectReference(buildTrajectory(trajectory_file, True, args)[0], args)
+    difference = maxDifference(per_step_states, precomputed_states)
+    print(
+      f"{trajectory_file:<26} {precompute_time * 1e3:>16.2f} {per_step_time * 1e6:>14.2f} "
+      f"{precomputed_time * 1e6:>17.2f} {difference:>10.1e}"
+    )
+    if precomputed.precomputed_times is None:
+      raise AssertionError(f"{trajectory_file}: the precomputed trajectory fell back to the per-step evaluation")
+    if not difference <= args.tolerance:
+      raise AssertionError(f"{trajectory_file}: the two modes differ by {difference} (tolerance {args.tolerance})")
+
+if __name__ == '__main__':
+  main()
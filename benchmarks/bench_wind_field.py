@@ -0,0 +1,100 @@
+"""
+Turbulent wind benchmark: cost of the pre-generated wind table and statistics of the generated turbulence.
+
+For each wind model ("dryden", "von_karman"):
+- generation time of the table of a mission of '--duration' seconds (once per run, before the first step);
+- time of a lookup ('TurbulentWindField.getVelocity', once per step of the plant), compared to summing at every
+  step the sinusoids the table is synthesized from (what a per-step generation would cost);
+- RMS of the longitudinal, lateral and vertical turbulence over '--num_seeds' seeds, against the one expected from
+  the frequencies resolved by the table (the requested intensity, less the variance below 1/period of the table).
+
+Run from the repository root:
+  python benchmarks/bench_wind_field.py
+  python benchmarks/bench_wind_field.py --duration 60 --num_seeds 50 --spatial_variation
+"""
+import os
+import sys
+import math
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from acsl_pychrono.simulation.wind_field import TurbulentWindField, TURBULENCE_MODELS, turbulencePSD
+
+def expectedRMS(model: str, wind_field: TurbulentWindField, args) -> np.ndarray:
+  """RMS of the turbulence synthesized over the frequencies resolved by the table."""
+  omega = 2 * math.pi * np.fft.rfftfreq(wind_field.num_samples, wind_field.table_timestep)[1:]
+  return np.array([
+    math.sqrt(np.sum(turbulencePSD(model, omega, sigma, length_scale, wind_field.speed, axis == 0)) * omega[0])
+    for axis, (sigma, length_scale) in enumerate(zip(args.intensity, args.length_scale))
+  ])
+
+def timeLookups(wind_field: TurbulentWindField, num_lookups: int, timestep: float) -> float:
+  """Mean time [s] of a lookup at successive steps of the plant."""
+  position = (1.0, 2.0, 3.0)
+  t0 = time.perf_counter()
+  for step in range(num_lookups):
+    wind_field.getVelocity(step * timestep, position)
+  return (time.perf_counter() - t0) / num_lookups
+
+def timeSumOfSinusoids(args, num_lookups: int) -> float:
+  """Mean time [s] of the per-step alternative: summing the sinusoids of the three components at every step."""
+  num_samples = 2 ** math.ceil(math.log2(max(args.duration / args.table_timestep + 1, 2)))
+  omega = 2 * math.pi * np.fft.rfftfreq(num_samples, args.table_timestep)[1:]
+  # Sinusoids of a table covering the mission only (shorter than the one of 'TurbulentWindField')
+  rng = np.random.default_rng(0)
+  amplitudes = [
+    np.sqrt(2 * turbulencePSD("dryden", omega, sigma, length_scale, args.mean_speed, axis == 0) * omega[0])
+    for axis, (sigma, length_scale) in enumerate(zip(args.intensity, args.length_scale))
+  ]
+  phases = [rng.uniform(0.0, 2 * math.pi, omega.size) for _ in range(3)]
+  t0 = time.perf_counter()
+  for step in range(num_lookups):
+    time_now = step * args.timestep
+    [float(np.sum(amplitude * np.cos(omega * time_now + phase))) for amplitude, phase in zip(amplitudes, phases)]
+  return (time.perf_counter() - t0) / num_lookups
+
+def main():
+  parser = argparse.ArgumentParser(description="Cost and statistics of the pre-generated turbulent wind.")
+  parser.add_argument("--duration", type=float, default=30.0, help="Duration of the mission [s].")
+  parser.add_argument("--timestep", type=float, default=0.005, help="Timestep of the plant [s] (one lookup per step).")
+  parser.add_argument("--table_timestep", type=float, default=0.01, help="Timestep of the wind table [s].")
+  parser.add_argument("--mean_speed", type=float, default=2.0, help="Mean wind speed [m/s].")
+  parser.add_argument("--intensity", type=float, nargs=3, default=[1.0, 1.0, 0.5], help="Turbulence RMS [m/s].")
+  parser.add_argument("--length_scale", type=float, nargs=3, default=[65.0, 65.0, 10.0], help="Turbulence length scales [m].")
+  parser.add_argument("--num_seeds", type=int, default=20, help="Seeds over which the turbulence RMS is measured.")
+  parser.add_argument("--num_lookups", type=int, default=20000, help="Lookups timed per model.")
+  parser.add_argument("--spatial_variation", action="store_true", help="Frozen turbulence varying with the position.")
+  args = parser.parse_args()
+
+  print(f"Mission of {args.duration} s, table timestep {args.table_timestep} s, plant timestep {args.timestep} s")
+  print(f"Requested turbulence RMS (long., lat., vert.) [m/s]: {args.intensity}")
+  print(f"{'model':>12} {'samples':>8} {'generate [ms]':>14} {'lookup [us]':>12} {'RMS (long., lat., vert.)':>26} {'expected':>22}")
+  for model in TURBULENCE_MODELS:
+    generation_times = []
+    rms = []
+    for seed in range(args.num_seeds):
+      t0 = time.perf_counter()
+      wind_field = TurbulentWindField(
+        model, (args.mean_speed, 0.0, 0.0), args.intensity, args.length_scale, args.duration,
+        args.table_timestep, seed, args.spatial_variation
+      )
+      generation_times.append(time.perf_counter() - t0)
+      turbulence = (wind_field.velocity_table - wind_field.mean_velocity) @ wind_field.axes.T
+      rms.append(np.sqrt(np.mean(turbulence**2, axis=0)))
+    rms = np.mean(rms, axis=0)
+    lookup_time = timeLookups(wind_field, args.num_lookups, args.timestep)
+    expected_rms = expectedRMS(model, wind_field, args)
+    print(
+      f"{model:>12} {wind_field.num_samples:>8d} {1e3 * np.median(generation_times):>14.2f} {1e6 * lookup_time:>12.2f} "
+      f"{np.array2string(rms, precision=3):>26} {np.array2string(expected_rms, precision=3):>22}"
+    )
+
+  sinusoids_time = timeSumOfSinusoids(args, min(args.num_lookups, 2000))
+  print(f"\nPer-step sum of sinusoids (no table): {1e6 * sinusoids_time:.1f} us per step")
+
+if __name__ == '__main__':
+  main()
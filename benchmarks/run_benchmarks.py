@@ -0,0 +1,338 @@
+"""
+Microbenchmark suite of the hot functions of the simulation step, compared against a stored baseline.
+
+Each case times one call of a function on fixed inputs (seeded or synthetic, the same at every run):
+  functions.rk4singlestep                     RK4 step of the ODE of the MRAC controller
+  projection_operator.projectionMatrix        Ellipsoid projection of the MRAC gain K_hat_x_tran (activated)
+  outerloop_safetymech.apply                  Outer-loop safety mechanism of the MRAC controller
+  controller.<type>[<kernel>].computeControlAlgorithm
+  trajectory.<type>.compute                   Every user-defined trajectory type (piecewise polynomial: per-step and precomputed)
+  logger.<type>.collectData / .toDictionary   Loggers of every controller ('toDictionary' of a log of 'log_rows' rows)
+  simulation.<uav>.updatePixhawkState / .stepSimulation
+                                              Headless Chrono simulation (default mission), after the controller started
+
+The time of a case is the smallest time per call over 'repeats' rounds of calls lasting at least 'min_time'
+each (the least noisy estimate). A case is a regression if it is slower than its baseline by more than
+'threshold' (relative); the script then exits with status 1, as it does if a case raises.
+Baselines depend on the machine: store one per machine (e.g., '--baseline benchmarks/baseline_<host>.json').
+Without a baseline, the cases are only timed ("new"), unless '--require_baseline' is given: the script then
+exits with status 1 if the baseline file is missing or has no timing for a case that ran (e.g., in CI).
+
+Run from the repository root:
+  python benchmarks/run_benchmarks.py --save_baseline
+  python benchmarks/run_benchmarks.py --require_baseline
+  python benchmarks/run_benchmarks.py --filter controller. trajectory. --threshold 0.1 --report benchmarks.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import datetime
+import numpy as np
+import pychrono as chrono
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import acsl_pychrono.config.config as Cfg
+import acsl_pychrono.control as Ctrl
+import acsl_pychrono.uav as UAV_Module
+import acsl_pychrono.user_defined_trajectory as Traj
+from acsl_pychrono.simulation.functions import rk4singlestep
+from acsl_pychrono.control.projection_operator import ProjectionOperator
+from acsl_pychrono.simulation.simulation import Simulation
+from acsl_pychrono.simulation.ode_input import OdeInput
+from acsl_pychrono.simulation.flight_params import FlightParams
+from acsl_pychrono.simulation.utils import Utils
+from bench_controller_kernels import syntheticOdeInput
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+CONTROLLERS = ("PID", "MRAC", "TwoLayerMRAC")
+# Execution kernels benchmarked for each controller
+CONTROLLER_KERNELS = {"PID": ("reference",), "MRAC": ("reference", "flat"), "TwoLayerMRAC": ("reference", "flat")}
+TRAJECTORY_TYPES = ("hover_trajectory", "circular_trajectory", "square_trajectory", "rounded_rectangle_trajectory")
+SIMULATION_UAVS = ("SIMPLE_QUAD", "X8")
+# Synthetic control steps fed to the controllers, cycled through by the controller cases
+NUM_SYNTHETIC_STEPS = 200
+
+def buildController(controller_type: str, args, kernel: str = "reference"):
+  """Controller (and its gains and logger) of 'args.uav_name' that already ran one control step."""
+  uav, uav_controller = UAV_Module.instantiateUAV(args.uav_name, controller_type)
+  flight_params = FlightParams(uav, uav_controller)
+  ode_input = syntheticOdeInput(0, args.timestep)
+  gains, controller, logger = Ctrl.instantiateController(
+    controller_type, ode_input, flight_params, args.timestep, args.log_rows * args.timestep, controller_kernel=kernel
+  )
+  controller.run(ode_input)
+  return gains, controller, logger, uav.number_of_propellers
+
+def cycled(function, values: list, on_wrap=None):
+  """Call of 'function' on the next of the fixed 'values' at every call ('on_wrap' is called when they start over)."""
+  index = [0]
+  def call():
+    i = index[0]
+    if i == len(values):
+      i = 0
+      if on_wrap is not None:
+        on_wrap()
+    index[0] = i + 1
+    return function(values[i])
+  return call
+
+def setUpRK4(args):
+  _, controller, _, _ = buildController("MRAC", args)
+  y0 = np.array(controller.y)
+  t0 = controller.odein.time_now
+  return lambda: rk4singlestep(controller.ode, args.timestep, t0, y0)
+
+def setUpProjectionMatrix(args):
+  gains, controller, _, _ = buildController("MRAC", args)
+  rng = np.random.default_rng(args.seed)
+  shape = np.shape(controller.K_hat_x_tran)
+  # A gain outside of the ellipsoid moving outwards: the projection is activated
+  x_e = np.asarray(gains.x_e_x_tran).reshape(shape, order="F")
+  matrix = x_e + 1e3 * rng.standard_normal(shape)
+  matrix_d = matrix - x_e
+  return lambda: ProjectionOperator.Ellipsoid.projectionMatrix(matrix, matrix_d, gains.x_e_x_tran, gains.S_x_tran, gains.epsilon_x_tran)
+
+def setUpSafetyMechanism(args):
+  _, controller, _, _ = buildController("MRAC", args)
+  mu_tran_raw = np.array([[2.0], [-1.5], [3.0]])
+  return lambda: controller.safety_mechanism.apply(mu_tran_raw)
+
+def setUpControlAlgorithm(controller_type: str, kernel: str):
+  def setUp(args):
+    _, controller, _, _ = buildController(controller_type, args, kernel)
+    ode_inputs = [syntheticOdeInput(step, args.timestep) for step in range(NUM_SYNTHETIC_STEPS)]
+    return cycled(controller.computeControlAlgorithm, ode_inputs)
+  return setUp
+
+def setUpTrajectory(trajectory_type: str, precompute: bool = False):
+  def setUp(args):
+    uav, uav_controller = UAV_Module.instantiateUAV(args.uav_name, "PID")
+    flight_params = FlightParams(uav, uav_controller)
+    mission_config = Cfg.MissionConfig(
+      trajectory_type=trajectory_type,
+      timestep=args.timestep,
+      precompute_trajectory=precompute,
+    )
+    trajectory = Traj.instantiateTrajectory(mission_config, flight_params, chrono.ChBody(), 0.0)
+    # Control steps of the whole mission
+    num_steps = int(mission_config.simulation_duration_seconds / args.timestep)
+    if trajectory_type == "square_trajectory":
+      # Only defined over its first two sides
+      num_steps = int((flight_params.controller_start_time + 2 * trajectory.time_side) / args.timestep)
+    times = [(step + 1) * args.timestep for step in range(num_steps)]
+    if precompute:
+      times = trajectory.precomputed_times.tolist()
+
+    def restart():
+      # The precomputed reference is read step after step
+      trajectory.precomputed_next_step = 0
+    return cycled(trajectory.compute, times, restart if precompute else None)
+  return setUp
+
+def setUpCollectData(controller_type: str):
+  def setUp(args):
+    _, controller, logger, number_of_propellers = buildController(controller_type, args)
+    return lambda: logger.collectData(controller, 0.0, number_of_propellers)
+  return setUp
+
+def setUpToDictionary(controller_type: str):
+  def setUp(args):
+    _, controller, logger, number_of_propellers = buildController(controller_type, args)
+    for step in range(args.log_rows):
+      logger.collectData(controller, step * args.timestep, number_of_propellers)
+    return logger.toDictionary
+  return setUp
+
+def buildSimulation(uav_name: str, args) -> Simulation:
+  """Headless simulation of the default mission of 'uav_name', stepped until its controller started."""
+  sim_cfg = Cfg.SimulationConfig()
+  sim_cfg.mission_config.visualization_flag = False
+  sim_cfg.vehicle_config.uav_name = uav_name
+  sim = Simulation(sim_cfg)
+
+  controller_type = sim_cfg.mission_config.controller_type
+  uav, uav_controller = UAV_Module.instantiateUAV(uav_name, controller_type)
+  flight_params = FlightParams(uav, uav_controller)
+  ode_input = OdeInput()
+  sim.setGravitationalAcceleration(flight_params)
+  user_defined_trajectory = Traj.instantiateTrajectory(sim_cfg.mission_config, flight_params, sim.mfloor, sim.mfloor_Yposition)
+  gains, controller, logger = Ctrl.instantiateController(
+    controller_type, ode_input, flight_params, sim_cfg.mission_config.timestep, sim_cfg.mission_config.simulation_duration_seconds
+  )
+  sim.assignInstances(flight_params, ode_input, user_defined_trajectory, gains, controller, logger)
+
+  start_sim_time = time.time()
+  while sim.getTime() < flight_params.controller_start_time + args.warmup_seconds:
+    sim.stepSimulation(start_sim_time)
+  return sim
+
+def setUpPixhawkState(uav_name: str):
+  def setUp(args):
+    return buildSimulation(uav_name, args).updatePixhawkState
+  return setUp
+
+def setUpStepSimulation(uav_name: str):
+  def setUp(args):
+    sim = buildSimulation(uav_name, args)
+    start_sim_time = time.time()
+    return lambda: sim.stepSimulation(start_sim_time)
+  return setUp
+
+def buildCases() -> dict:
+  """Name -> setup of every case. A setup returns the call to be timed."""
+  cases = {
+    "functions.rk4singlestep": setUpRK4,
+    "projection_operator.projectionMatrix": setUpProjectionMatrix,
+    "outerloop_safetymech.apply": setUpSafetyMechanism,
+  }
+  for controller_type in CONTROLLERS:
+    for kernel in CONTROLLER_KERNELS[controller_type]:
+      cases[f"controller.{controller_type}[{kernel}].computeControlAlgorithm"] = setUpControlAlgorithm(controller_type, kernel)
+  for trajectory_type in TRAJECTORY_TYPES:
+    cases[f"trajectory.{trajectory_type}.compute"] = setUpTrajectory(trajectory_type)
+  cases["trajectory.piecewise_polynomial_trajectory.compute"] = setUpTrajectory("piecewise_polynomial_trajectory")
+  cases["trajectory.piecewise_polynomial_trajectory[precomputed].compute"] = setUpTrajectory("piecewise_polynomial_trajectory", True)
+  for controller_type in CONTROLLERS:
+    cases[f"logger.{controller_type}.collectData"] = setUpCollectData(controller_type)
+    cases[f"logger.{controller_type}.toDictionary"] = setUpToDictionary(controller_type)
+  for uav_name in SIMULATION_UAVS:
+    cases[f"simulation.{uav_name}.updatePixhawkState"] = setUpPixhawkState(uav_name)
+    cases[f"simulation.{uav_name}.stepSimulation"] = setUpStepSimulation(uav_name)
+  return cases
+
+def timeCall(call, min_time: float, repeats: int) -> dict:
+  """Smallest and median time per call [us] over 'repeats' rounds of at least 'min_time' seconds."""
+  # Number of calls per round, doubled until a round lasts 'min_time'
+  number = 1
+  while True:
+    t0 = time.perf_counter()
+    for _ in range(number):
+      call()
+    elapsed = time.perf_counter() - t0
+    if elapsed >= min_time:
+      break
+    number *= 2
+
+  times = []
+  for _ in range(repeats):
+    t0 = time.perf_counter()
+    for _ in range(number):
+      call()
+    times.append((time.perf_counter() - t0) / number)
+  return {"time_us": min(times) * 1e6, "median_us": float(np.median(times)) * 1e6, "calls_per_round": number}
+
+def machineInfo() -> dict:
+  return {
+    "platform": platform.platform(),
+    "processor": platform.processor() or platform.machine(),
+    "python": platform.python_version(),
+    "numpy": np.__version__,
+  }
+
+def compare(result: dict, baseline_case: dict | None, threshold: float) -> tuple[float, str]:
+  """Ratio to the baseline and status of a case."""
+  if "error" in result:
+    return float("nan"), "ERROR"
+  if baseline_case is None:
+    return float("nan"), "new"
+  ratio = result["time_us"] / baseline_case["time_us"]
+  if ratio > 1.0 + threshold:
+    return ratio, "REGRESSION"
+  if ratio < 1.0 / (1.0 + threshold):
+    return ratio, "faster"
+  return ratio, "ok"
+
+def main():
+  parser = argparse.ArgumentParser(description="Microbenchmarks of the hot functions, compared against a stored baseline.")
+  parser.add_argument("--baseline", type=str, default=DEFAULT_BASELINE, help="Baseline JSON file.")
+  parser.add_argument("--save_baseline", action="store_true", help="Store the timings of this run as the baseline (cases run only are updated).")
+  parser.add_argument("--require_baseline", action="store_true", help="Fail if the baseline file is missing or lacks a case that ran.")
+  parser.add_argument("--threshold", type=float, default=0.2, help="Relative slowdown over the baseline reported as a regression.")
+  parser.add_argument("--filter", type=str, nargs="*", default=[], help="Run only the cases whose name contains one of these strings.")
+  parser.add_argument("--list", action="store_true", help="List the cases and exit.")
+  parser.add_argument("--min_time", type=float, default=0.1, help="Minimum duration of a round of calls [s].")
+  parser.add_argument("--repeats", type=int, default=5, help="Rounds of calls per case.")
+  parser.add_argument("--uav_name", type=str, default="X8", help="UAV of the controller, trajectory and logger cases.")
+  parser.add_argument("--timestep", type=float, default=0.005, help="Control timestep [s].")
+  parser.add_argument("--log_rows", type=int, default=3400, help="Rows of the logs exported by the 'toDictionary' cases.")
+  parser.add_argument("--warmup_seconds", type=float, default=0.5, help="Simulated time after the controller start before timing the simulation cases [s].")
+  parser.add_argument("--seed", type=int, default=0, help="Seed of the random inputs.")
+  parser.add_argument("--report", type=str, default="", help="Write the results to this JSON file.")
+  args = parser.parse_args()
+
+  cases = buildCases()
+  if args.filter:
+    cases = {name: setUp for name, setUp in cases.items() if any(pattern in name for pattern in args.filter)}
+  if args.list:
+    print("\n".join(cases))
+    return
+
+  baseline = {"cases": {}}
+  if os.path.exists(args.baseline):
+    with open(args.baseline, "r") as f:
+      baseline = json.load(f)
+    if baseline.get("machine") != machineInfo():
+      print(f"[WARNING] The baseline was recorded on another machine or environment: {baseline.get('machine')}")
+  elif args.require_baseline and not args.save_baseline:
+    print(f"[ERROR] No baseline at {args.baseline}: run with --save_baseline to store one.")
+    sys.exit(1)
+  elif not args.save_baseline:
+    print(f"[INFO] No baseline at {args.baseline}: run with --save_baseline to store one.")
+
+  # Silence the progress line of the simulation loop
+  Utils.printSimulationTimeInline = staticmethod(lambda *args, **kwargs: None)
+
+  results = {}
+  print(f"{'case':<66} {'time [us]':>11} {'median [us]':>12} {'baseline [us]':>14} {'ratio':>7}  status")
+  for name, setUp in cases.items():
+    try:
+      results[name] = timeCall(setUp(args), args.min_time, args.repeats)
+    except Exception as e:
+      results[name] = {"error": f"{type(e).__name__}: {e}"}
+    baseline_case = baseline["cases"].get(name)
+    ratio, status = compare(results[name], baseline_case, args.threshold)
+    results[name]["status"] = status
+    if "error" in results[name]:
+      print(f"{name:<66} {'':>11} {'':>12} {'':>14} {'':>7}  {status}: {results[name]['error']}")
+      continue
+    baseline_time = baseline_case["time_us"] if baseline_case else float("nan")
+    print(
+      f"{name:<66} {results[name]['time_us']:>11.2f} {results[name]['median_us']:>12.2f} "
+      f"{baseline_time:>14.2f} {ratio:>7.2f}  {status}"
+    )
+
+  regressions = [name for name, result in results.items() if result["status"] == "REGRESSION"]
+  errors = [name for name, result in results.items() if result["status"] == "ERROR"]
+  missing = [name for name, result in results.items() if result["status"] == "new"] if args.require_baseline and not args.save_baseline else []
+
+  if args.report:
+    with open(args.report, "w") as f:
+      json.dump({"machine": machineInfo(), "threshold": args.threshold, "cases": results}, f, indent=2)
+    print(f"[INFO] Report written to {args.report}")
+
+  if args.save_baseline:
+    baseline["machine"] = machineInfo()
+    baseline["created"] = datetime.datetime.now().isoformat(timespec="seconds")
+    for name, result in results.items():
+      if "error" not in result:
+        baseline["cases"][name] = {"time_us": result["time_us"], "median_us": result["median_us"]}
+    os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+    with open(args.baseline, "w") as f:
+      json.dump(baseline, f, indent=2, sort_keys=True)
+    print(f"[INFO] Baseline saved in {args.baseline}")
+
+  if regressions:
+    print(f"[ERROR] {len(regressions)} regression(s) over {100 * args.threshold:.0f}%: {regressions}")
+  if errors:
+    print(f"[ERROR] {len(errors)} case(s) failed: {errors}")
+  if missing:
+    print(f"[ERROR] {len(missing)} case(s) without baseline in {args.baseline}: {missing}")
+  if regressions or errors or missing:
+    sys.exit(1)
+
+if __name__ == '__main__':
+  main()